@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the local operations on a folder with a very large number of
+children (loading it from the local database, then creating, stating and
+removing entries in it).
+
+Usage: python misc/bench_large_folder.py [children count]
+"""
+
+import sys
+from tempfile import TemporaryDirectory
+from pathlib import Path as FilePath
+from time import perf_counter
+
+from parsec.types import DeviceID, BackendOrganizationAddr
+from parsec.crypto import SigningKey, export_root_verify_key
+from parsec.logging import configure_logging
+from parsec.event_bus import EventBus
+from parsec.core.local_db import LocalDB
+from parsec.core.devices_manager import generate_new_device
+from parsec.core.fs.local_folder_fs import LocalFolderFS
+from parsec.core.fs.types import Path
+from parsec.core.fs.utils import new_access
+
+
+def main(children_count=1_000_000, number=10):
+    configure_logging("WARNING")
+    rvk = export_root_verify_key(SigningKey.generate().verify_key)
+    device = generate_new_device(
+        DeviceID("alice@dev1"), BackendOrganizationAddr(f"ws://localhost/org?rvk={rvk}")
+    )
+
+    with TemporaryDirectory() as tmpdir:
+        local_db = LocalDB(FilePath(tmpdir))
+        fs = LocalFolderFS(device, local_db, EventBus())
+        fs.workspace_create(Path("/w"))
+        fs.mkdir(Path("/w/big"))
+        access, manifest = fs.get_entry(Path("/w/big"))
+        manifest["children"] = {f"file{i}.txt": new_access() for i in range(children_count)}
+        fs.set_manifest(access, manifest)
+
+        def _bench(name, fn):
+            start = perf_counter()
+            for i in range(number):
+                fn(i)
+            duration = (perf_counter() - start) / number
+            print(f"{name:<30} {duration * 1000:.2f}ms")
+
+        print(f"{children_count} children")
+
+        def _load(i):
+            # Reload the folder from the local database
+            fresh_fs = LocalFolderFS(device, local_db, EventBus())
+            fresh_fs.get_access(Path("/w/big"))
+
+        _bench("load", _load)
+        _bench("touch", lambda i: fs.touch(Path(f"/w/big/new{i}.txt")))
+        _bench("stat child", lambda i: fs.stat(Path(f"/w/big/new{i}.txt")))
+        _bench("unlink", lambda i: fs.unlink(Path(f"/w/big/new{i}.txt")))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
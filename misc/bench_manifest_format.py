@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the size and (de)serialization time of large manifests in the
+different formats.
+
+Usage: python misc/bench_manifest_format.py [blocks/children count]
+"""
+
+import sys
+from timeit import timeit
+from contextlib import contextmanager
+
+from parsec.types import DeviceID
+from parsec.utils import ejson_dumps, ejson_loads
+from parsec.core import schemas
+from parsec.core.fs.utils import new_access, new_block_access, local_to_remote_manifest
+from parsec.core.fs.utils import new_local_file_manifest, new_local_folder_manifest
+
+
+@contextmanager
+def manifest_format(format):
+    previous_format = schemas.MANIFEST_FORMAT
+    schemas.MANIFEST_FORMAT = format
+    try:
+        yield
+    finally:
+        schemas.MANIFEST_FORMAT = previous_format
+
+
+def build_manifests(count):
+    author = DeviceID("alice@dev1")
+
+    file_manifest = new_local_file_manifest(author)
+    file_manifest["blocks"] = [new_block_access(b"x", i) for i in range(count)]
+    file_manifest["size"] = count
+    file_manifest = local_to_remote_manifest(file_manifest)
+    file_manifest["version"] = 1
+
+    folder_manifest = new_local_folder_manifest(author)
+    folder_manifest["children"] = {f"file{i}.txt": new_access() for i in range(count)}
+    folder_manifest = local_to_remote_manifest(folder_manifest)
+    folder_manifest["version"] = 1
+
+    return {"file manifest": file_manifest, "folder manifest": folder_manifest}
+
+
+def main(count=10000, number=10):
+    schema = schemas.typed_manifest_schema
+
+    def _marshmallow_dumps(manifest):
+        return ejson_dumps(schema.dump(manifest).data).encode("utf8")
+
+    def _marshmallow_loads(raw):
+        return schema.load(ejson_loads(raw.decode("utf8"))).data
+
+    print(f"{count} blocks/children")
+    for name, manifest in build_manifests(count).items():
+        print(name)
+
+        def _bench(title, dumps, loads):
+            raw = dumps(manifest)
+            assert loads(raw) == _marshmallow_loads(_marshmallow_dumps(manifest))
+            dumps_duration = timeit(lambda: dumps(manifest), number=number) / number
+            loads_duration = timeit(lambda: loads(raw), number=number) / number
+            print(
+                f"  {title:<25} size: {len(raw) / 1024:.0f}KB"
+                f"  dumps: {dumps_duration * 1000:.1f}ms  loads: {loads_duration * 1000:.1f}ms"
+            )
+
+        _bench("format 1 (marshmallow)", _marshmallow_dumps, _marshmallow_loads)
+        for format in (1, 2):
+            with manifest_format(format):
+                _bench(f"format {format}", schemas.dumps_manifest, schemas.loads_manifest)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the 3-ways merge of big folders with few concurrent changes.
+
+Usage: python misc/bench_merge_folders.py [children count] [changes count]
+"""
+
+import sys
+from timeit import timeit
+
+from parsec.core.fs.utils import new_access
+from parsec.core.fs.merge_folders import merge_children
+
+
+def build_children(children_count, changes_count):
+    base = {f"file{i}.txt": new_access() for i in range(children_count)}
+
+    diverged = base.copy()
+    diverged_changes = set()
+    for i in range(changes_count):
+        diverged[f"diverged{i}.txt"] = new_access()
+        diverged_changes.add(f"diverged{i}.txt")
+        del diverged[f"file{i}.txt"]
+        diverged_changes.add(f"file{i}.txt")
+
+    target = base.copy()
+    for i in range(changes_count):
+        target[f"target{i}.txt"] = new_access()
+        del target[f"file{children_count - i - 1}.txt"]
+
+    return base, diverged, target, diverged_changes
+
+
+def main(children_count=100_000, changes_count=10, number=10):
+    base, diverged, target, diverged_changes = build_children(children_count, changes_count)
+
+    def _bench(name, stmt):
+        duration = timeit(stmt, number=number) / number
+        print(f"{name:<30} {duration * 1000:.2f}ms")
+
+    print(f"{children_count} children, {changes_count} changes on each side")
+    _bench("merge (computed changes)", lambda: merge_children(base, diverged, target))
+    _bench(
+        "merge (local changes)", lambda: merge_children(base, diverged, target, diverged_changes)
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
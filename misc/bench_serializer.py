@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the commands (de)serialization, through marshmallow and through
+the compiled schemas.
+
+Usage: python misc/bench_serializer.py [iterations]
+"""
+
+import sys
+from contextlib import contextmanager
+from uuid import uuid4
+from timeit import timeit
+
+from parsec.api.protocole import (
+    ping_serializer,
+    vlob_read_serializer,
+    vlob_group_check_serializer,
+    blockstore_create_serializer,
+)
+
+
+COMMANDS = {
+    "ping": (ping_serializer, {"cmd": "ping", "ping": "foo"}, {"status": "ok", "pong": "foo"}),
+    "vlob_read": (
+        vlob_read_serializer,
+        {"cmd": "vlob_read", "id": uuid4(), "rts": "<rts>", "known_version": 2},
+        {"status": "ok", "version": 3, "blob": None, "deltas": [b"x" * 1024]},
+    ),
+    "vlob_group_check": (
+        vlob_group_check_serializer,
+        {
+            "cmd": "vlob_group_check",
+            "to_check": [{"id": uuid4(), "rts": "<rts>", "version": 1} for _ in range(100)],
+        },
+        {"status": "ok", "changed": [{"id": uuid4(), "version": 2} for _ in range(10)]},
+    ),
+    "blockstore_create": (
+        blockstore_create_serializer,
+        {"cmd": "blockstore_create", "id": uuid4(), "block": b"x" * 2 ** 16},
+        {"status": "ok"},
+    ),
+}
+
+
+def bench_command(serializer, req, rep, number):
+    raw_req = serializer.req_dumps(req)
+    raw_rep = serializer.rep_dumps(rep)
+
+    # Round trip of a command: client dumps the request, backend loads it and
+    # dumps the reply, which is finally loaded by the client
+    def _round_trip():
+        serializer.req_loads(serializer.req_dumps(req))
+        serializer.rep_loads(serializer.rep_dumps(rep))
+
+    assert serializer.req_loads(raw_req) and serializer.rep_loads(raw_rep)
+    return timeit(_round_trip, number=number) / number
+
+
+@contextmanager
+def marshmallow_only(serializer):
+    attrs = ("_compiled_req_load", "_compiled_req_dump", "_compiled_rep_load", "_compiled_rep_dump")
+    compiled = {attr: getattr(serializer, attr) for attr in attrs}
+    for attr in attrs:
+        setattr(serializer, attr, None)
+    try:
+        yield
+    finally:
+        for attr, fn in compiled.items():
+            setattr(serializer, attr, fn)
+
+
+def main(number=1000):
+    for name, (serializer, req, rep) in COMMANDS.items():
+        compiled = bench_command(serializer, req, rep, number)
+        with marshmallow_only(serializer):
+            marshmallow = bench_command(serializer, req, rep, number)
+        print(
+            f"{name:<20} marshmallow: {marshmallow * 1e6:.1f}us"
+            f"  compiled: {compiled * 1e6:.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
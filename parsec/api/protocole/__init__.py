@@ -4,12 +4,14 @@ from parsec.api.protocole.base import (
     InvalidMessageError,
     packb,
     unpackb,
+    read_stream,
 )
 from parsec.api.protocole.handshake import (
     HandshakeError,
     HandshakeFormatError,
     HandshakeBadIdentity,
     HandshakeRevokedDevice,
+    HandshakeBadSession,
     ServerHandshake,
     ClientHandshake,
     AnonymousClientHandshake,
@@ -18,11 +20,21 @@ from parsec.api.protocole.organization import (
     organization_create_serializer,
     organization_bootstrap_serializer,
 )
-from parsec.api.protocole.events import events_subscribe_serializer, events_listen_serializer
+from parsec.api.protocole.events import (
+    events_subscribe_serializer,
+    events_subscribe_add_serializer,
+    events_subscribe_remove_serializer,
+    events_listen_serializer,
+)
 from parsec.api.protocole.ping import ping_serializer
-from parsec.api.protocole.beacon import beacon_read_serializer
+from parsec.api.protocole.beacon import beacon_read_serializer, beacon_get_changes_serializer
 from parsec.api.protocole.message import message_send_serializer, message_get_serializer
-from parsec.api.protocole.blockstore import blockstore_create_serializer, blockstore_read_serializer
+from parsec.api.protocole.blockstore import (
+    blockstore_create_serializer,
+    blockstore_create_stream_serializer,
+    blockstore_read_serializer,
+    blockstore_read_stream_serializer,
+)
 from parsec.api.protocole.vlob import (
     vlob_group_check_serializer,
     vlob_create_serializer,
@@ -52,10 +64,12 @@ __all__ = (
     "InvalidMessageError",
     "packb",
     "unpackb",
+    "read_stream",
     "HandshakeError",
     "HandshakeFormatError",
     "HandshakeBadIdentity",
     "HandshakeRevokedDevice",
+    "HandshakeBadSession",
     "ServerHandshake",
     "ClientHandshake",
     "AnonymousClientHandshake",
@@ -64,17 +78,22 @@ __all__ = (
     "organization_bootstrap_serializer",
     # Events
     "events_subscribe_serializer",
+    "events_subscribe_add_serializer",
+    "events_subscribe_remove_serializer",
     "events_listen_serializer",
     # Ping
     "ping_serializer",
     # Beacon
     "beacon_read_serializer",
+    "beacon_get_changes_serializer",
     # Message
     "message_send_serializer",
     "message_get_serializer",
     # Blockstore
     "blockstore_create_serializer",
+    "blockstore_create_stream_serializer",
     "blockstore_read_serializer",
+    "blockstore_read_stream_serializer",
     # Vlob
     "vlob_group_check_serializer",
     "vlob_create_serializer",
@@ -2,9 +2,18 @@ from msgpack import packb as msgpack_packb, unpackb as msgpack_unpackb
 from msgpack.exceptions import ExtraData, FormatError, StackError
 
 from parsec.schema import fields, UnknownCheckedSchema, OneOfSchema, post_load, ValidationError
+from parsec.api.protocole.compiler import compile_schema_load, compile_schema_dump
 
 
-__all__ = ("ProtocoleError", "BaseReqSchema", "BaseRepSchema", "CmdSerializer", "packb", "unpackb")
+__all__ = (
+    "ProtocoleError",
+    "BaseReqSchema",
+    "BaseRepSchema",
+    "CmdSerializer",
+    "packb",
+    "unpackb",
+    "read_stream",
+)
 
 
 class ProtocoleError(Exception):
@@ -69,34 +78,83 @@ def unpackb(raw_data: bytes) -> dict:
         raise MessageSerializationError(f"Invalid msgpack data: {exc}") from exc
 
 
+async def read_stream(stream, size: int, max_size: int) -> bytes:
+    """
+    Read the payload of a streamed message, the announced size being checked
+    before anything is read and never exceeded.
+
+    Raises:
+        ProtocoleError: if `size` is not between 0 and `max_size`, or if the
+            stream doesn't contain exactly `size` bytes.
+    """
+    if not isinstance(size, int) or not 0 <= size <= max_size:
+        raise ProtocoleError(f"Invalid stream size {size!r} (max is {max_size} bytes)")
+    chunks = []
+    received = 0
+    async for chunk in stream:
+        received += len(chunk)
+        # Don't keep more than announced in memory
+        if received > size:
+            raise ProtocoleError(f"Stream is bigger than the announced {size} bytes")
+        chunks.append(chunk)
+    if received != size:
+        raise ProtocoleError(f"Stream is smaller than the announced {size} bytes")
+    return b"".join(chunks)
+
+
+def _load_with_schema(schema, compiled_load, data):
+    if compiled_load:
+        try:
+            return compiled_load(data)
+
+        except ValidationError:
+            # Marshmallow provides the actual result or errors
+            pass
+
+    try:
+        return schema.load(data).data
+
+    except ValidationError as exc:
+        raise InvalidMessageError(exc.messages) from exc
+
+
+def _dump_with_schema(schema, compiled_dump, data):
+    if compiled_dump:
+        try:
+            return compiled_dump(data)
+
+        except ValidationError:
+            pass
+
+    try:
+        return schema.dump(data).data
+
+    except ValidationError as exc:
+        raise InvalidMessageError(exc.messages) from exc
+
+
 class Serializer:
     def __repr__(self):
         return f"{self.__class__.__name__}({self.req_schema.__class__.__name__})"
 
     def __init__(self, schema_cls):
         self.schema = schema_cls(strict=True)
+        self._compiled_load = compile_schema_load(self.schema)
+        self._compiled_dump = compile_schema_dump(self.schema)
 
     def load(self, data: dict):
         """
         Raises:
             ProtocoleError
         """
-        try:
-            return self.schema.load(data).data
-
-        except (ValidationError,) as exc:
-            raise InvalidMessageError(exc.messages) from exc
+        return _load_with_schema(self.schema, self._compiled_load, data)
 
     def dump(self, data) -> dict:
         """
         Raises:
             ProtocoleError
         """
-        try:
-            return self.schema.dump(data).data
-
-        except ValidationError as exc:
-            raise InvalidMessageError(exc.messages) from exc
+        return _dump_with_schema(self.schema, self._compiled_dump, data)
 
     def loads(self, data: bytes) -> dict:
         """
@@ -140,50 +198,38 @@ class CmdSerializer:
 
         self.req_schema = req_schema_cls(strict=True)
         self.rep_schema = RepWithErrorSchema(strict=True)
+        self._compiled_req_load = compile_schema_load(self.req_schema)
+        self._compiled_req_dump = compile_schema_dump(self.req_schema)
+        self._compiled_rep_load = compile_schema_load(self.rep_schema)
+        self._compiled_rep_dump = compile_schema_dump(self.rep_schema)
 
     def req_load(self, data: dict) -> dict:
         """
         Raises:
             ProtocoleError
         """
-        try:
-            return self.req_schema.load(data).data
-
-        except (ValidationError,) as exc:
-            raise InvalidMessageError(exc.messages) from exc
+        return _load_with_schema(self.req_schema, self._compiled_req_load, data)
 
     def req_dump(self, data: dict) -> dict:
         """
         Raises:
             ProtocoleError
         """
-        try:
-            return self.req_schema.dump(data).data
-
-        except ValidationError as exc:
-            raise InvalidMessageError(exc.messages) from exc
+        return _dump_with_schema(self.req_schema, self._compiled_req_dump, data)
 
     def rep_load(self, data: dict) -> dict:
         """
         Raises:
             ProtocoleError
         """
-        try:
-            return self.rep_schema.load(data).data
-
-        except ValidationError as exc:
-            raise InvalidMessageError(exc.messages) from exc
+        return _load_with_schema(self.rep_schema, self._compiled_rep_load, data)
 
     def rep_dump(self, data: dict) -> dict:
         """
         Raises:
             ProtocoleError
         """
-        try:
-            return self.rep_schema.dump(data).data
-
-        except ValidationError as exc:
-            raise InvalidMessageError(exc.messages) from exc
+        return _dump_with_schema(self.rep_schema, self._compiled_rep_dump, data)
 
     def req_loads(self, data: bytes) -> dict:
         """
@@ -1,8 +1,11 @@
-from parsec.schema import UnknownCheckedSchema, fields
+from parsec.schema import UnknownCheckedSchema, fields, validate
 from parsec.api.protocole.base import BaseReqSchema, BaseRepSchema, CmdSerializer
 
 
-__all__ = "beacon_read_serializer"
+__all__ = ("beacon_read_serializer", "beacon_get_changes_serializer")
+
+
+BEACON_GET_CHANGES_MAX_LIMIT = 1000
 
 
 class BeaconReadReqSchema(BaseReqSchema):
@@ -20,3 +23,21 @@ class BeaconReadRepSchema(BaseRepSchema):
 
 
 beacon_read_serializer = CmdSerializer(BeaconReadReqSchema, BeaconReadRepSchema)
+
+
+class BeaconGetChangesReqSchema(BaseReqSchema):
+    id = fields.UUID(required=True)
+    offset = fields.Integer(required=True, validate=validate.Range(min=0))
+    limit = fields.Integer(
+        missing=BEACON_GET_CHANGES_MAX_LIMIT,
+        validate=validate.Range(min=1, max=BEACON_GET_CHANGES_MAX_LIMIT),
+    )
+
+
+class BeaconGetChangesRepSchema(BaseRepSchema):
+    changes = fields.List(fields.Nested(BeaconItemSchema), required=True)
+    offset = fields.Integer(required=True)
+    has_more = fields.Boolean(required=True)
+
+
+beacon_get_changes_serializer = CmdSerializer(BeaconGetChangesReqSchema, BeaconGetChangesRepSchema)
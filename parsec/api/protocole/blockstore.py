@@ -1,8 +1,13 @@
-from parsec.schema import fields
+from parsec.schema import fields, validate
 from parsec.api.protocole.base import BaseReqSchema, BaseRepSchema, CmdSerializer
 
 
-__all__ = ("blockstore_create_serializer", "blockstore_read_serializer")
+__all__ = (
+    "blockstore_create_serializer",
+    "blockstore_create_stream_serializer",
+    "blockstore_read_serializer",
+    "blockstore_read_stream_serializer",
+)
 
 
 class BlockstoreCreateReqSchema(BaseReqSchema):
@@ -17,6 +22,25 @@ class BlockstoreCreateRepSchema(BaseRepSchema):
 blockstore_create_serializer = CmdSerializer(BlockstoreCreateReqSchema, BlockstoreCreateRepSchema)
 
 
+# Streamed variants: the block is not part of the message, but directly follows
+# it on the connection as a chunked message of `stream_size` bytes
+
+# Blocks are held in memory as a whole by both sides, hence the bound
+BLOCKSTORE_MAX_BLOCK_SIZE = 2 ** 24  # 16Mo
+
+
+class BlockstoreCreateStreamReqSchema(BaseReqSchema):
+    id = fields.UUID(required=True)
+    stream_size = fields.Integer(
+        required=True, validate=validate.Range(min=0, max=BLOCKSTORE_MAX_BLOCK_SIZE)
+    )
+
+
+blockstore_create_stream_serializer = CmdSerializer(
+    BlockstoreCreateStreamReqSchema, BlockstoreCreateRepSchema
+)
+
+
 class BlockstoreReadReqSchema(BaseReqSchema):
     id = fields.UUID(required=True)
 
@@ -26,3 +50,19 @@ class BlockstoreReadRepSchema(BaseRepSchema):
 
 
 blockstore_read_serializer = CmdSerializer(BlockstoreReadReqSchema, BlockstoreReadRepSchema)
+
+
+class BlockstoreReadStreamReqSchema(BaseReqSchema):
+    id = fields.UUID(required=True)
+    stream = fields.CheckedConstant(True, required=True)
+
+
+class BlockstoreReadStreamRepSchema(BaseRepSchema):
+    stream_size = fields.Integer(
+        required=True, validate=validate.Range(min=0, max=BLOCKSTORE_MAX_BLOCK_SIZE)
+    )
+
+
+blockstore_read_stream_serializer = CmdSerializer(
+    BlockstoreReadStreamReqSchema, BlockstoreReadStreamRepSchema
+)
@@ -0,0 +1,468 @@
+from uuid import UUID
+from pendulum import Pendulum
+from marshmallow import Schema, missing, fields as marshmallow_fields
+from marshmallow.decorators import (
+    PRE_DUMP,
+    POST_DUMP,
+    PRE_LOAD,
+    POST_LOAD,
+    VALIDATES,
+    VALIDATES_SCHEMA,
+)
+
+from parsec.schema import ValidationError, UnknownCheckedSchema, OneOfSchema, fields
+
+
+__all__ = ("compile_schema_load", "compile_schema_dump")
+
+
+# Marshmallow's load/dump go through its generic machinery (error stores,
+# processors lookups, fields rebinding on each dump etc.) even if most of
+# the messages are valid. Schemas are instead compiled into plain functions
+# only handling the data in the form it is expected, anything else raising
+# `ValidationError`. In such case the data must be processed again by the
+# marshmallow schema, which is the one providing the actual result and
+# errors.
+
+
+class NotCompilable(Exception):
+    pass
+
+
+class _FastPathFailed(ValidationError):
+    def __init__(self):
+        super().__init__("Fast path failed")
+
+
+# Fields whose serialization doesn't change values of the given type
+_DUMP_PASSTHROUGH_FIELDS = {
+    marshmallow_fields.String: str,
+    marshmallow_fields.Integer: int,
+    marshmallow_fields.Boolean: bool,
+    fields.Bytes: bytes,
+}
+# Fields whose deserialization doesn't change values of the given type
+_LOAD_PASSTHROUGH_FIELDS = {
+    **_DUMP_PASSTHROUGH_FIELDS,
+    marshmallow_fields.UUID: UUID,
+    fields.UUID: UUID,
+    fields.DateTime: Pendulum,
+}
+
+
+def _get_processors(schema, tag, pass_many=False):
+    processors = []
+    for attr_name in schema.__processors__[(tag, pass_many)]:
+        processor = getattr(schema, attr_name)
+        processor_kwargs = processor.__marshmallow_kwargs__[(tag, pass_many)]
+        processors.append((processor, processor_kwargs.get("pass_original", False)))
+    return processors
+
+
+def _check_compilable_schema(schema):
+    # Note `many` is handled by the caller given it comes from the nested field.
+    # Options are looked up defensively given they vary across marshmallow
+    # versions (e.g. `extra` is gone from the one bundled by toastedmarshmallow)
+    if not hasattr(schema, "opts") or not hasattr(schema, "__processors__"):
+        raise NotCompilable(f"{schema!r}: cannot inspect schema")
+    for option in ("partial", "ordered", "prefix", "extra"):
+        if getattr(schema, option, None):
+            raise NotCompilable(f"{schema!r}: unsupported schema option {option}")
+    if getattr(schema.opts, "fields", None) or getattr(schema.opts, "additional", None):
+        raise NotCompilable(f"{schema!r}: implicit fields are not supported")
+
+
+def _get_nested_schema(field):
+    if isinstance(field.only, str):
+        raise NotCompilable(f"{field!r}: plucked nested field is not supported")
+    schema = field.schema
+    if not isinstance(schema, Schema):
+        raise NotCompilable(f"{field!r}: invalid nested schema")
+    return schema
+
+
+def _compile_field_deserialize(field):
+    """
+    Returns: A function with the signature of `field.deserialize`, minus the
+    handling of missing values.
+    """
+    field_cls = type(field)
+    deserialize = field._deserialize
+
+    passthrough_type = _LOAD_PASSTHROUGH_FIELDS.get(field_cls)
+    if passthrough_type:
+
+        def _deserialize(value, attr, data):
+            if type(value) is passthrough_type:
+                return value
+            return deserialize(value, attr, data)
+
+    elif field_cls is fields.CheckedConstant:
+        constant = field.constant
+
+        def _deserialize(value, attr, data):
+            if value != constant:
+                raise _FastPathFailed()
+            return value
+
+    elif field_cls is marshmallow_fields.List:
+        container_deserialize = _compile_field_deserialize(field.container)
+
+        def _deserialize(value, attr, data):
+            if type(value) is not list:
+                return deserialize(value, attr, data)
+            return [container_deserialize(item, None, None) for item in value]
+
+    elif field_cls is fields.Map:
+        key_deserialize = _compile_field_deserialize(field.key_field)
+        value_deserialize = _compile_field_deserialize(field.nested_field)
+
+        def _deserialize(value, attr, data):
+            if type(value) is not dict:
+                return deserialize(value, attr, data)
+            return {
+                key_deserialize(key, None, None): value_deserialize(item, None, None)
+                for key, item in value.items()
+            }
+
+    elif field_cls is marshmallow_fields.Nested:
+        try:
+            schema_load = _compile_schema_load(_get_nested_schema(field))
+        except NotCompilable:
+            schema_load = None
+
+        if not schema_load:
+            _deserialize = deserialize
+
+        elif field.many:
+
+            def _deserialize(value, attr, data):
+                if type(value) is not list:
+                    raise _FastPathFailed()
+                return [schema_load(item) for item in value]
+
+        else:
+
+            def _deserialize(value, attr, data):
+                return schema_load(value)
+
+    else:
+        _deserialize = deserialize
+
+    allow_none = field.allow_none is True
+    validate = field._validate if field.validators else None
+
+    def _load(value, attr, data):
+        if value is None:
+            if allow_none:
+                return None
+            raise _FastPathFailed()
+        output = _deserialize(value, attr, data)
+        if validate:
+            validate(output)
+        return output
+
+    return _load
+
+
+def _compile_field_serialize(field, native):
+    """
+    Returns: A function with the signature of `field._serialize`.
+    """
+    field_cls = type(field)
+    serialize = field._serialize
+
+    if native:
+        passthrough_type = _LOAD_PASSTHROUGH_FIELDS.get(field_cls)
+    else:
+        passthrough_type = _DUMP_PASSTHROUGH_FIELDS.get(field_cls)
+    if passthrough_type and not getattr(field, "as_string", False):
+
+        def _serialize(value, attr, obj):
+            if type(value) is passthrough_type:
+                return value
+            return serialize(value, attr, obj)
+
+    elif field_cls in (fields.CheckedConstant, marshmallow_fields.Field):
+
+        def _serialize(value, attr, obj):
+            return value
+
+    elif field_cls is fields.Map:
+        key_serialize = _compile_field_serialize(field.key_field, native)
+        value_serialize = _compile_field_serialize(field.nested_field, native)
+
+        def _serialize(value, attr, obj):
+            if type(value) is not dict:
+                return serialize(value, attr, obj)
+            return {
+                key_serialize(key, attr, obj): value_serialize(item, key, value)
+                for key, item in value.items()
+            }
+
+    elif field_cls is marshmallow_fields.List:
+        container_serialize = _compile_field_serialize(field.container, native)
+
+        def _serialize(value, attr, obj):
+            if type(value) is not list:
+                return serialize(value, attr, obj)
+            return [container_serialize(item, attr, obj) for item in value]
+
+    elif field_cls is marshmallow_fields.Nested:
+        try:
+            schema_dump = _compile_schema_dump(_get_nested_schema(field), native)
+        except NotCompilable:
+            schema_dump = None
+
+        if not schema_dump:
+            _serialize = serialize
+
+        elif field.many:
+
+            def _serialize(value, attr, obj):
+                if type(value) is not list:
+                    return serialize(value, attr, obj)
+                return [schema_dump(item) for item in value]
+
+        else:
+
+            def _serialize(value, attr, obj):
+                if type(value) is not dict:
+                    return serialize(value, attr, obj)
+                return schema_dump(value)
+
+    else:
+        _serialize = serialize
+
+    return _serialize
+
+
+def _compile_one_of_schema_load(schema):
+    type_field = schema.type_field
+    type_field_remove = schema.type_field_remove
+    type_schemas_load = {
+        data_type: _compile_schema_load(
+            type_schema if isinstance(type_schema, Schema) else type_schema()
+        )
+        for data_type, type_schema in schema.type_schemas.items()
+    }
+    if schema.fallback_type_schema:
+        fallback_type_schema = schema.fallback_type_schema
+        if not isinstance(fallback_type_schema, Schema):
+            fallback_type_schema = fallback_type_schema()
+        fallback_load = _compile_schema_load(fallback_type_schema)
+    else:
+        fallback_load = None
+
+    def _load(data):
+        if type(data) is not dict:
+            raise _FastPathFailed()
+        data_type = data.get(type_field)
+        if not data_type or type(data_type) is not str:
+            raise _FastPathFailed()
+        if type_field_remove:
+            data = data.copy()
+            del data[type_field]
+        type_schema_load = type_schemas_load.get(data_type, fallback_load)
+        if not type_schema_load:
+            raise _FastPathFailed()
+        return type_schema_load(data)
+
+    return _load
+
+
+def _compile_schema_load(schema):
+    if isinstance(schema, OneOfSchema):
+        return _compile_one_of_schema_load(schema)
+
+    _check_compilable_schema(schema)
+    if (
+        schema.__processors__[(PRE_LOAD, False)]
+        or schema.__processors__[(PRE_LOAD, True)]
+        or schema.__processors__[(POST_LOAD, True)]
+        or schema.__processors__[(VALIDATES, False)]
+        or schema.__processors__[(VALIDATES_SCHEMA, True)]
+    ):
+        raise NotCompilable(f"{schema!r}: unsupported processors")
+
+    known_fields = None
+    validators = []
+    for validator, pass_original in _get_processors(schema, VALIDATES_SCHEMA):
+        if validator.__func__ is UnknownCheckedSchema.check_unknown_fields:
+            known_fields = {name for name, field in schema.fields.items() if not field.dump_only}
+        else:
+            validators.append((validator, pass_original))
+    post_loads = _get_processors(schema, POST_LOAD)
+
+    fields_load = []
+    for name, field in schema.fields.items():
+        if field.dump_only:
+            continue
+        key = field.attribute or name
+        if getattr(field, "load_from", None) or getattr(field, "data_key", None) or "." in key:
+            raise NotCompilable(f"{schema!r}: unsupported field {name} options")
+        fields_load.append(
+            (name, key, _compile_field_deserialize(field), field.missing, field.required)
+        )
+
+    def _load(data):
+        if type(data) is not dict:
+            raise _FastPathFailed()
+
+        result = {}
+        for name, key, field_load, field_missing, required in fields_load:
+            value = data.get(name, missing)
+            if value is missing:
+                value = field_missing() if callable(field_missing) else field_missing
+                if value is missing:
+                    if required:
+                        raise _FastPathFailed()
+                    continue
+            result[key] = field_load(value, name, data)
+
+        if known_fields is not None and not data.keys() <= known_fields:
+            raise _FastPathFailed()
+        for validator, pass_original in validators:
+            if pass_original:
+                ret = validator(result, data)
+            else:
+                ret = validator(result)
+            if ret is False:
+                raise _FastPathFailed()
+        for post_load, pass_original in post_loads:
+            if pass_original:
+                ret = post_load(result, data)
+            else:
+                ret = post_load(result)
+            if ret is not None:
+                result = ret
+
+        return result
+
+    return _load
+
+
+def _compile_one_of_schema_dump(schema, native):
+    type_field = schema.type_field
+    get_obj_type = schema.get_obj_type
+    type_schemas_dump = {
+        obj_type: _compile_schema_dump(
+            type_schema if isinstance(type_schema, Schema) else type_schema(), native
+        )
+        for obj_type, type_schema in schema.type_schemas.items()
+    }
+    if schema.fallback_type_schema:
+        fallback_type_schema = schema.fallback_type_schema
+        if not isinstance(fallback_type_schema, Schema):
+            fallback_type_schema = fallback_type_schema()
+        fallback_dump = _compile_schema_dump(fallback_type_schema, native)
+    else:
+        fallback_dump = None
+
+    def _dump(obj):
+        obj_type = get_obj_type(obj)
+        if not obj_type or type(obj_type) is not str:
+            raise _FastPathFailed()
+        type_schema_dump = type_schemas_dump.get(obj_type, fallback_dump)
+        if not type_schema_dump:
+            raise _FastPathFailed()
+        result = type_schema_dump(obj)
+        if result:
+            result[type_field] = obj_type
+        return result
+
+    return _dump
+
+
+def _compile_schema_dump(schema, native):
+    if isinstance(schema, OneOfSchema):
+        return _compile_one_of_schema_dump(schema, native)
+
+    _check_compilable_schema(schema)
+    if schema._has_processors and (
+        schema.__processors__[(PRE_DUMP, False)]
+        or schema.__processors__[(PRE_DUMP, True)]
+        or schema.__processors__[(POST_DUMP, False)]
+        or schema.__processors__[(POST_DUMP, True)]
+    ):
+        raise NotCompilable(f"{schema!r}: unsupported processors")
+    if schema.get_attribute.__func__ is not Schema.get_attribute:
+        raise NotCompilable(f"{schema!r}: custom attribute getter is not supported")
+
+    fields_dump = []
+    for name, field in schema.fields.items():
+        if field.load_only:
+            continue
+        if not getattr(field, "_CHECK_ATTRIBUTE", True):
+            raise NotCompilable(f"{schema!r}: unsupported field {name}")
+        attr = field.attribute or name
+        if getattr(field, "data_key", None) or "." in attr:
+            raise NotCompilable(f"{schema!r}: unsupported field {name} options")
+        # Marshmallow falls back on the object's attributes for missing keys
+        shadowed_attr = hasattr(dict, attr)
+        fields_dump.append(
+            (
+                name,
+                getattr(field, "dump_to", None) or name,
+                attr,
+                _compile_field_serialize(field, native),
+                field.default,
+                shadowed_attr,
+            )
+        )
+
+    def _dump(obj):
+        if type(obj) is not dict:
+            raise _FastPathFailed()
+
+        result = {}
+        for name, key, attr, field_dump, default, shadowed_attr in fields_dump:
+            value = obj.get(attr, missing)
+            if value is missing:
+                if shadowed_attr:
+                    raise _FastPathFailed()
+                value = default() if callable(default) else default
+                if value is not missing:
+                    result[key] = value
+                continue
+            if callable(value):
+                # The schema dump calls the value instead (e.g. bound methods)
+                raise _FastPathFailed()
+            result[key] = field_dump(value, name, obj)
+
+        return result
+
+    return _dump
+
+
+def compile_schema_load(schema: Schema):
+    """
+    Returns: A function loading the data like `schema.load(data).data`, or None
+    if the schema cannot be compiled. The function raises `ValidationError`
+    for any data it doesn't handle (not only the invalid ones).
+    """
+    if schema.many:
+        return None
+    try:
+        return _compile_schema_load(schema)
+
+    except NotCompilable:
+        return None
+
+
+def compile_schema_dump(schema: Schema, native: bool = False):
+    """
+    Returns: A function dumping the data like `schema.dump(data).data`, or None
+    if the schema cannot be compiled. The function raises `ValidationError`
+    for any data it doesn't handle (not only the invalid ones).
+
+    If `native` is set, UUIDs and datetimes are kept as is (to be serialized
+    by a format supporting them) instead of being converted to strings.
+    """
+    if schema.many:
+        return None
+    try:
+        return _compile_schema_dump(schema, native)
+
+    except NotCompilable:
+        return None
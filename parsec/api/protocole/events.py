@@ -57,3 +57,7 @@ class EventsSubscribeRepSchema(BaseRepSchema):
 
 
 events_subscribe_serializer = CmdSerializer(EventsSubscribeReqSchema, EventsSubscribeRepSchema)
+events_subscribe_add_serializer = CmdSerializer(EventsSubscribeReqSchema, EventsSubscribeRepSchema)
+events_subscribe_remove_serializer = CmdSerializer(
+    EventsSubscribeReqSchema, EventsSubscribeRepSchema
+)
@@ -1,7 +1,10 @@
 import attr
+import pendulum
 from secrets import token_bytes
+from nacl.secret import SecretBox
 
 from parsec.crypto import CryptoError
+from parsec.compression import COMPRESSION_ALGORITHMS, choose_compression
 from parsec.schema import UnknownCheckedSchema, fields
 from parsec.api.protocole.base import ProtocoleError, Serializer
 
@@ -22,6 +25,10 @@ class HandshakeRevokedDevice(HandshakeError):
     pass
 
 
+class HandshakeBadSession(HandshakeError):
+    pass
+
+
 class HandshakeChallengeSchema(UnknownCheckedSchema):
     handshake = fields.CheckedConstant("challenge", required=True)
     challenge = fields.Bytes(required=True)
@@ -34,6 +41,12 @@ class HandshakeAnswerSchema(UnknownCheckedSchema):
     handshake = fields.CheckedConstant("answer", required=True)
     identity = fields.DeviceID(allow_none=True, missing=None)
     answer = fields.Bytes(allow_none=True, missing=None)
+    # Compression algorithms supported by the client, by order of preference
+    compressions = fields.List(fields.String(), missing=None)
+    # Token of a previous session to resume instead of answering the challenge
+    session_token = fields.Bytes(allow_none=True, missing=None)
+    # Ask for a token to resume the session in a later handshake
+    new_session = fields.Boolean(missing=False)
 
 
 handshake_answer_serializer = Serializer(HandshakeAnswerSchema)
@@ -42,11 +55,24 @@ handshake_answer_serializer = Serializer(HandshakeAnswerSchema)
 class HandshakeResultSchema(UnknownCheckedSchema):
     handshake = fields.CheckedConstant("result", required=True)
     result = fields.String(required=True)
+    # Compression algorithm to use for the payloads, if any
+    compression = fields.String(allow_none=True, missing=None)
+    session_token = fields.Bytes(allow_none=True, missing=None)
 
 
 handshake_result_serializer = Serializer(HandshakeResultSchema)
 
 
+class HandshakeSessionTokenSchema(UnknownCheckedSchema):
+    device_id = fields.DeviceID(required=True)
+    expires_on = fields.DateTime(required=True)
+
+
+# Session tokens are encrypted with a key only known by the backend, hence
+# they cannot be forged
+handshake_session_token_serializer = Serializer(HandshakeSessionTokenSchema)
+
+
 @attr.s
 class ServerHandshake:
     challenge_size = attr.ib(default=48)
@@ -54,10 +80,40 @@ class ServerHandshake:
     answer = attr.ib(default=None)
     identity = attr.ib(default=None)
     state = attr.ib(default="stalled")
+    supported_compressions = attr.ib(default=COMPRESSION_ALGORITHMS)
+    compression = attr.ib(default=None)
+    # Key used to issue and check the session tokens (no sessions if None)
+    session_key = attr.ib(default=None)
+    session_lifetime = attr.ib(default=3600)
+    session_resumed = attr.ib(default=False)
+    new_session = attr.ib(default=False)
 
     def is_anonymous(self):
         return self.identity is None
 
+    def is_session_rejected(self):
+        return self.state == "bad_session"
+
+    def _build_session_token(self) -> bytes:
+        expires_on = pendulum.now().add(seconds=self.session_lifetime)
+        raw = handshake_session_token_serializer.dumps(
+            {"device_id": self.identity, "expires_on": expires_on}
+        )
+        return SecretBox(self.session_key).encrypt(raw)
+
+    def _check_session_token(self, token: bytes) -> bool:
+        if not self.session_key:
+            return False
+
+        try:
+            raw = SecretBox(self.session_key).decrypt(token)
+            data = handshake_session_token_serializer.loads(raw)
+
+        except (CryptoError, ValueError, ProtocoleError):
+            return False
+
+        return data["device_id"] == self.identity and data["expires_on"] > pendulum.now()
+
     def build_challenge_req(self) -> bytes:
         if not self.state == "stalled":
             raise HandshakeError("Invalid state.")
@@ -77,15 +133,36 @@ class ServerHandshake:
 
         self.answer = data["answer"] or b""
         self.identity = data["identity"]
+        self.compression = choose_compression(
+            self.supported_compressions, data["compressions"] or ()
+        )
+        self.new_session = data["new_session"]
+        if data["session_token"] is not None:
+            self.session_resumed = self._check_session_token(data["session_token"])
+            if not self.session_resumed:
+                self.state = "bad_session"
+                return
+
         self.state = "answer"
 
     def build_bad_format_result_req(self) -> bytes:
-        if self.state not in ("answer", "challenge"):
+        if self.state not in ("answer", "challenge", "bad_session"):
             raise HandshakeError("Invalid state.")
 
         self.state = "result"
         return handshake_result_serializer.dumps({"handshake": "result", "result": "bad_format"})
 
+    def build_bad_session_result_req(self) -> bytes:
+        """
+        The client is then expected to answer the challenge instead of
+        resuming its session.
+        """
+        if not self.state == "bad_session":
+            raise HandshakeError("Invalid state.")
+
+        self.state = "challenge"
+        return handshake_result_serializer.dumps({"handshake": "result", "result": "bad_session"})
+
     def build_bad_identity_result_req(self) -> bytes:
         if not self.state == "answer":
             raise HandshakeError("Invalid state.")
@@ -106,7 +183,8 @@ class ServerHandshake:
         if not self.state == "answer":
             raise HandshakeError("Invalid state.")
 
-        if verify_key:
+        # Identity of a resumed session has already been checked
+        if verify_key and not self.session_resumed:
             try:
                 returned_challenge = verify_key.verify(self.answer)
                 if returned_challenge != self.challenge:
@@ -116,19 +194,58 @@ class ServerHandshake:
                 raise HandshakeFormatError("Invalid answer signature") from exc
 
         self.state = "result"
-        return handshake_result_serializer.dumps({"handshake": "result", "result": "ok"})
+        result = {"handshake": "result", "result": "ok"}
+        # Clients not supporting compression don't know about this field
+        if self.compression:
+            result["compression"] = self.compression
+        if self.new_session and self.session_key and self.identity:
+            result["session_token"] = self._build_session_token()
+        return handshake_result_serializer.dumps(result)
 
 
 @attr.s
 class ClientHandshake:
     user_id = attr.ib()
     user_signkey = attr.ib()
+    # Compression is opt-in given older backends reject the field announcing it
+    supported_compressions = attr.ib(default=())
+    # Token provided by the backend to resume the session in a later handshake
+    session_token = attr.ib(default=None)
+    # Sessions are opt-in given older backends reject the field asking for them
+    # (and their tokens must only be exchanged over TLS)
+    new_session = attr.ib(default=False)
+    compression = attr.ib(default=None, init=False)
 
     def process_challenge_req(self, req: bytes) -> bytes:
         data = handshake_challenge_serializer.loads(req)
         answer = self.user_signkey.sign(data["challenge"])
         return handshake_answer_serializer.dumps(
-            {"handshake": "answer", "identity": self.user_id, "answer": answer}
+            self._with_options({"handshake": "answer", "identity": self.user_id, "answer": answer})
+        )
+
+    def _with_options(self, answer: dict) -> dict:
+        if self.supported_compressions:
+            answer["compressions"] = list(self.supported_compressions)
+        if self.new_session:
+            answer["new_session"] = True
+        return answer
+
+    def build_session_answer_req(self) -> bytes:
+        """
+        Resuming a session doesn't require the challenge, hence this answer
+        can be sent without waiting for it.
+        """
+        if not self.session_token:
+            raise HandshakeError("No session to resume")
+
+        return handshake_answer_serializer.dumps(
+            self._with_options(
+                {
+                    "handshake": "answer",
+                    "identity": self.user_id,
+                    "session_token": self.session_token,
+                }
+            )
         )
 
     def process_result_req(self, req: bytes) -> bytes:
@@ -138,10 +255,18 @@ class ClientHandshake:
                 raise HandshakeBadIdentity("Backend didn't recognized our identity")
             if data["result"] == "revoked_device":
                 raise HandshakeRevokedDevice("Backend rejected revoked device")
+            if data["result"] == "bad_session":
+                self.session_token = None
+                raise HandshakeBadSession("Backend rejected our session")
 
             else:
                 raise HandshakeFormatError(f"Bad result for `result` handshake: {data['result']}")
 
+        if data["compression"] and data["compression"] not in self.supported_compressions:
+            raise HandshakeFormatError(f"Unsupported compression `{data['compression']}`")
+        self.compression = data["compression"]
+        self.session_token = data["session_token"]
+
 
 @attr.s
 class AnonymousClientHandshake:
@@ -157,3 +282,7 @@ class AnonymousClientHandshake:
 
             else:
                 raise HandshakeFormatError(f"Bad result for `result` handshake: {data['result']}")
+
+        # Anonymous clients never announce compressions
+        if data["compression"]:
+            raise HandshakeFormatError(f"Unsupported compression `{data['compression']}`")
@@ -1,4 +1,4 @@
-from parsec.schema import UnknownCheckedSchema, fields, validate
+from parsec.schema import UnknownCheckedSchema, ValidationError, fields, validate, validates_schema
 from parsec.api.protocole.base import BaseReqSchema, BaseRepSchema, CmdSerializer
 
 
@@ -55,11 +55,25 @@ class VlobReadReqSchema(BaseReqSchema):
     id = fields.UUID(required=True)
     rts = fields.String(required=True, validate=_validate_trust_seed)
     version = fields.Integer(validate=lambda n: n is None or _validate_version(n), missing=None)
+    timestamp = fields.DateTime(allow_none=True, missing=None)
+    # Version already known by the client, allow to only retrieve the deltas
+    known_version = fields.Integer(
+        validate=lambda n: n is None or _validate_version(n), missing=None
+    )
+
+    @validates_schema
+    def validate_version_or_timestamp(self, data):
+        if data.get("version") is not None and data.get("timestamp") is not None:
+            raise ValidationError("Fields `version` and `timestamp` are mutually exclusive")
 
 
 class VlobReadRepSchema(BaseRepSchema):
     version = fields.Integer(required=True, validate=_validate_version)
-    blob = fields.Bytes(required=True)
+    # Last snapshot up to `version` (None if it is older than `known_version`)
+    # followed by the deltas leading to `version`, the latter being omitted
+    # when there is none given older clients reject this field
+    blob = fields.Bytes(required=True, allow_none=True)
+    deltas = fields.List(fields.Bytes(), missing=list)
 
 
 vlob_read_serializer = CmdSerializer(VlobReadReqSchema, VlobReadRepSchema)
@@ -70,6 +84,8 @@ class VlobUpdateReqSchema(BaseReqSchema):
     version = fields.Integer(required=True, validate=_validate_version)
     wts = fields.String(required=True, validate=_validate_trust_seed)
     blob = fields.Bytes(required=True)
+    # Blob only contains the changes since the previous version
+    is_delta = fields.Boolean(missing=False)
     notify_beacon = fields.UUID(missing=None)
 
 
@@ -0,0 +1,125 @@
+"""
+Sampled tracing of the protocol, summarizing the traffic (bytes sent and
+received) and the commands (status and latency) instead of dumping the raw
+payloads.
+
+Tracing is disabled by default, in which case `tracer` is None. Callers must
+check it before doing anything else, this way a disabled trace costs a single
+attribute lookup on the hot path:
+
+    if trace.tracer:
+        trace.tracer.net_send(transport, len(data))
+"""
+
+import attr
+from time import monotonic
+from random import random
+from typing import Dict, Optional
+from structlog import get_logger
+
+
+__all__ = ("tracer", "configure_protocol_trace", "ProtocolTracer", "CommandStats")
+
+
+logger = get_logger()
+
+
+@attr.s(slots=True)
+class CommandStats:
+    count = attr.ib(default=0)
+    total_duration = attr.ib(default=0.0)
+    max_duration = attr.ib(default=0.0)
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.count if self.count else 0.0
+
+
+class ProtocolTracer:
+    def __init__(self, sample_rate: float = 1.0):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("Sample rate must be in ]0, 1]")
+        self.sample_rate = sample_rate
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        # Only the sampled commands are accounted for
+        self.commands: Dict[str, CommandStats] = {}
+
+    def sampled(self) -> bool:
+        return self.sample_rate >= 1 or random() < self.sample_rate
+
+    def net_send(self, transport, size: int) -> None:
+        self.bytes_sent += size
+        if self.sampled():
+            transport.logger.debug("Sending", size=size)
+
+    def net_recv(self, transport, size: int) -> None:
+        self.bytes_received += size
+        if self.sampled():
+            transport.logger.debug("Receiving", size=size)
+
+    def request_start(self) -> Optional[float]:
+        """
+        Returns: The start time of the request to provide to `request_done`,
+        None if the request is not sampled.
+        """
+        return monotonic() if self.sampled() else None
+
+    def request_done(
+        self,
+        logger,
+        cmd: str,
+        started: Optional[float],
+        status: str = None,
+        req_size: int = None,
+        rep_size: int = None,
+    ) -> None:
+        if started is None:
+            return
+
+        duration = monotonic() - started
+        try:
+            stats = self.commands[cmd]
+        except KeyError:
+            stats = self.commands[cmd] = CommandStats()
+        stats.count += 1
+        stats.total_duration += duration
+        stats.max_duration = max(stats.max_duration, duration)
+
+        logger.debug(
+            "Request traced",
+            cmd=cmd,
+            status=status,
+            duration_ms=round(duration * 1000, 3),
+            req_size=req_size,
+            rep_size=rep_size,
+        )
+
+    def log_summary(self) -> None:
+        logger.info(
+            "Protocol trace summary",
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            commands={
+                cmd: {
+                    "count": stats.count,
+                    "mean_duration_ms": round(stats.mean_duration * 1000, 3),
+                    "max_duration_ms": round(stats.max_duration * 1000, 3),
+                }
+                for cmd, stats in self.commands.items()
+            },
+        )
+
+
+tracer: Optional[ProtocolTracer] = None
+
+
+def configure_protocol_trace(sample_rate: Optional[float]) -> Optional[ProtocolTracer]:
+    """
+    Enable the protocol trace, sampling the given ratio of the network
+    operations and commands (e.g. 0.01 for 1%), or disable it if `sample_rate`
+    is None or zero.
+    """
+    global tracer
+    tracer = ProtocolTracer(sample_rate) if sample_rate else None
+    return tracer
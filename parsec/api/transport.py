@@ -1,4 +1,6 @@
+import trio
 from uuid import uuid4
+from typing import AsyncIterator
 from trio import BrokenResourceError
 from structlog import get_logger
 from wsproto.frame_protocol import CloseReason
@@ -9,8 +11,11 @@ from wsproto.events import (
     ConnectionRequested,
     BytesReceived,
     PingReceived,
+    PongReceived,
 )
 
+from parsec.api import trace
+
 
 __all__ = ("TransportError", "Transport")
 
@@ -32,13 +37,21 @@ class TransportClosedByPeer(TransportError):
 
 class Transport:
     RECEIVE_BYTES = 2 ** 20  # 1Mo
+    STREAM_CHUNK_SIZE = 2 ** 16  # 64Ko
 
     def __init__(self, stream, ws):
         self.stream = stream
         self.ws = ws
         self.conn_id = uuid4().hex
         self.logger = logger.bind(conn_id=self.conn_id)
+        # Compression negotiated during the handshake for the payloads
+        # (see `parsec.compression`)
+        self.compression = None
+        # Times (see `trio.current_time`) used to detect stale and dead connections
+        self.created_on = self.last_recv = trio.current_time()
         self._ws_events = ws.events()
+        # Multiplexed connections have concurrent senders
+        self._send_lock = trio.Lock()
 
     async def _next_ws_event(self):
         while True:
@@ -63,12 +76,31 @@ class Transport:
             # need to pass None to wsproto to update its internal state.
             self.ws.receive_bytes(None)
         else:
-            self.logger.debug("Receiving", data=in_data)
+            self.last_recv = trio.current_time()
+            if trace.tracer:
+                trace.tracer.net_recv(self, len(in_data))
             self.ws.receive_bytes(in_data)
 
+    async def _acquire_send_lock(self):
+        # Only wait for the lock if there is a concurrent sender, this way
+        # not multiplexed connections behave as if there was no lock at all
+        try:
+            self._send_lock.acquire_nowait()
+        except trio.WouldBlock:
+            await self._send_lock.acquire()
+
     async def _net_send(self):
+        await self._acquire_send_lock()
+        try:
+            await self._net_flush()
+
+        finally:
+            self._send_lock.release()
+
+    async def _net_flush(self):
         out_data = self.ws.bytes_to_send()
-        self.logger.debug("Sending", data=out_data)
+        if trace.tracer:
+            trace.tracer.net_send(self, len(out_data))
         try:
             await self.stream.send_all(out_data)
 
@@ -125,14 +157,43 @@ class Transport:
         Raises:
             TransportError
         """
-        self.ws.send_data(msg)
-        await self._net_send()
+        # Message must be queued with the lock held, otherwise it could end up
+        # in the middle of a concurrent stream
+        await self._acquire_send_lock()
+        try:
+            self.ws.send_data(msg)
+            await self._net_flush()
 
-    async def recv(self) -> bytes:
+        finally:
+            self._send_lock.release()
+
+    async def send_stream(self, header: bytes, payload: bytes) -> None:
         """
+        Send `header` immediately followed by `payload`, the latter being
+        fragmented into frames of at most `STREAM_CHUNK_SIZE` bytes so that
+        it is never copied as a whole.
+
         Raises:
             TransportError
         """
+        await self._acquire_send_lock()
+        try:
+            self.ws.send_data(header)
+            payload = memoryview(payload)
+            offset = 0
+            while True:
+                chunk = payload[offset : offset + self.STREAM_CHUNK_SIZE]
+                offset += len(chunk)
+                final = offset >= len(payload)
+                self.ws.send_data(chunk, final=final)
+                await self._net_flush()
+                if final:
+                    break
+
+        finally:
+            self._send_lock.release()
+
+    async def _next_bytes_event(self, expect_pong: bool = False):
         while True:
             event = await self._next_ws_event()
 
@@ -141,7 +202,15 @@ class Transport:
                 raise TransportClosedByPeer("Peer has closed connection")
 
             elif isinstance(event, BytesReceived):
-                return event.data
+                if expect_pong:
+                    raise TransportError("Unexpected data while waiting for pong")
+                return event
+
+            elif isinstance(event, PongReceived):
+                if expect_pong:
+                    return event
+                # Reply to a `send_ping`, receiving it already updated `last_recv`
+                self.logger.debug("Received pong")
 
             elif isinstance(event, PingReceived):
                 # wsproto handles ping events for you by placing a pong frame in
@@ -153,3 +222,57 @@ class Transport:
             else:
                 self.logger.warning("Unexpected event", ws_event=event)
                 raise TransportError("Unexpected event: {event}")
+
+    async def send_ping(self) -> None:
+        """
+        Send a WebSocket ping without waiting for the pong, which is received
+        (and ignored) along with the messages.
+
+        Raises:
+            TransportError
+        """
+        self.ws.ping()
+        await self._net_send()
+
+    async def ping(self) -> None:
+        """
+        Send a WebSocket ping and wait for the pong, hence the connection must
+        be idle (i.e. no message should be received in the meantime).
+
+        Raises:
+            TransportError
+        """
+        await self.send_ping()
+        await self._next_bytes_event(expect_pong=True)
+
+    async def recv(self) -> bytes:
+        """
+        Raises:
+            TransportError
+        """
+        event = await self._next_bytes_event()
+        if event.message_finished:
+            return event.data
+
+        # wsproto provides the message as it is received, hence a big message
+        # comes in multiple parts
+        chunks = [event.data]
+        while not event.message_finished:
+            event = await self._next_bytes_event()
+            chunks.append(event.data)
+        return b"".join(chunks)
+
+    async def recv_stream(self) -> AsyncIterator[bytes]:
+        """
+        Iterate over the next message as it is received, so that it never
+        has to be held in memory as a whole.
+
+        Raises:
+            TransportError
+        """
+        while True:
+            event = await self._next_bytes_event()
+            if event.data:
+                yield event.data
+            if event.message_finished:
+                return
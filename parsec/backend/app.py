@@ -3,6 +3,8 @@ import attr
 from structlog import get_logger
 
 from parsec.event_bus import EventBus
+from parsec.crypto import generate_secret_key
+from parsec.api import trace
 from parsec.api.transport import TransportError, TransportClosedByPeer, Transport
 from parsec.api.protocole import (
     packb,
@@ -11,6 +13,7 @@ from parsec.api.protocole import (
     MessageSerializationError,
     InvalidMessageError,
     ServerHandshake,
+    HandshakeFormatError,
 )
 from parsec.backend.events import EventsComponent
 from parsec.backend.utils import check_anonymous_api_allowed
@@ -32,7 +35,7 @@ from parsec.backend.drivers.postgresql import (
     PGBeaconComponent,
     PGPingComponent,
 )
-from parsec.backend.user import UserNotFoundError
+from parsec.backend.user import UserNotFoundError, DeviceKeysCache
 
 
 logger = get_logger()
@@ -49,6 +52,7 @@ class LoggedClientContext:
     logger = attr.ib(init=False)
     subscribed_events = attr.ib(factory=dict)
     events = attr.ib(factory=lambda: trio.Queue(100))
+    pending_raw_req = attr.ib(default=None)
 
     def __attrs_post_init__(self):
         self.conn_id = self.transport.conn_id
@@ -72,20 +76,18 @@ class AnonymousClientContext:
     logger = attr.ib(init=False)
     device_id = None
     anonymous = True
+    pending_raw_req = None
 
     def __attrs_post_init__(self):
         self.conn_id = self.transport.conn_id
         self.logger = self.transport.logger = self.transport.logger.bind(client_id="<anonymous>")
 
 
-def _filter_binary_fields(data):
-    return {k: v if not isinstance(v, bytes) else b"[...]" for k, v in data.items()}
-
-
 class BackendApp:
     def __init__(self, config, event_bus=None):
         self.event_bus = event_bus or EventBus()
         self.config = config
+        self.session_key = config.handshake_session_key or generate_secret_key()
         self.nursery = None
         self.dbh = None
         self.events = EventsComponent(self.event_bus)
@@ -111,11 +113,21 @@ class BackendApp:
                 self.config.blockstore_config, postgresql_dbh=self.dbh
             )
 
+        self.device_keys = DeviceKeysCache(
+            self.user,
+            self.event_bus,
+            self.config.handshake_cache_size,
+            self.config.handshake_cache_ttl,
+        )
+
         self.logged_cmds = {
             "events_subscribe": self.events.api_events_subscribe,
+            "events_subscribe_add": self.events.api_events_subscribe_add,
+            "events_subscribe_remove": self.events.api_events_subscribe_remove,
             "events_listen": self.events.api_events_listen,
             "ping": self.ping.api_ping,
             "beacon_read": self.beacon.api_beacon_read,
+            "beacon_get_changes": self.beacon.api_beacon_get_changes,
             # Message
             "message_get": self.message.api_message_get,
             "message_send": self.message.api_message_send,
@@ -159,36 +171,50 @@ class BackendApp:
         if self.dbh:
             await self.dbh.teardown()
 
-    async def _do_handshake(self, transport):
+    async def _do_handshake(self, transport, secure=False):
         context = None
         try:
-            hs = ServerHandshake(self.config.handshake_challenge_size)
+            hs = ServerHandshake(
+                self.config.handshake_challenge_size,
+                supported_compressions=self.config.compressions,
+                # Session tokens are bearer credentials, hence they are neither
+                # issued nor accepted over a clear connection
+                session_key=self.session_key if secure else None,
+                session_lifetime=self.config.handshake_session_lifetime,
+            )
             challenge_req = hs.build_challenge_req()
             await transport.send(challenge_req)
             answer_req = await transport.recv()
 
             hs.process_answer_req(answer_req)
+            if hs.is_session_rejected():
+                # Client falls back on answering the challenge
+                await transport.send(hs.build_bad_session_result_req())
+                answer_req = await transport.recv()
+                hs.process_answer_req(answer_req)
+                if hs.is_session_rejected():
+                    raise HandshakeFormatError("Session rejected twice")
+
             if hs.is_anonymous():
                 context = AnonymousClientContext(transport)
                 result_req = hs.build_result_req()
 
             else:
                 try:
-                    user = await self.user.get_user(hs.identity.user_id)
-                    device = user.devices[hs.identity.device_name]
+                    public_key, verify_key, revocated_on = await self.device_keys.get(hs.identity)
 
-                except (UserNotFoundError, KeyError):
+                except UserNotFoundError:
                     result_req = hs.build_bad_identity_result_req()
 
                 else:
-                    if device.revocated_on:
+                    if revocated_on:
                         result_req = hs.build_revoked_device_result_req()
 
                     else:
                         context = LoggedClientContext(
-                            transport, hs.identity, user.public_key, device.verify_key
+                            transport, hs.identity, public_key, verify_key
                         )
-                        result_req = hs.build_result_req(device.verify_key)
+                        result_req = hs.build_result_req(verify_key)
 
         except ProtocoleError:
             result_req = hs.build_bad_format_result_req()
@@ -196,7 +222,14 @@ class BackendApp:
         await transport.send(result_req)
         return context
 
-    async def handle_client(self, stream):
+    async def handle_client(self, stream, secure=None):
+        """
+        Args:
+            secure: whether the stream is encrypted, guessed from its type if
+                    not provided
+        """
+        if secure is None:
+            secure = isinstance(stream, trio.ssl.SSLStream)
         try:
             transport = await Transport.init_for_server(stream)
 
@@ -231,7 +264,7 @@ class BackendApp:
 
         try:
             transport.logger.debug("start handshake")
-            client_ctx = await self._do_handshake(transport)
+            client_ctx = await self._do_handshake(transport, secure)
             if not client_ctx:
                 # Invalid handshake
                 logger.debug("bad handshake")
@@ -256,38 +289,96 @@ class BackendApp:
 
     async def _handle_client_loop(self, transport, client_ctx):
         transport.logger.info("Client handshake done")
-        while True:
-            raw_req = await transport.recv()
-            req = unpackb(raw_req)
-            client_ctx.logger.debug("req", req=_filter_binary_fields(req))
-            try:
-                cmd = req.get("cmd", "<missing>")
-                if not isinstance(cmd, str):
-                    raise KeyError()
-                if client_ctx.anonymous:
-                    cmd_func = self.anonymous_cmds[cmd]
+        # Requests with an id are processed concurrently (the id being part of
+        # the reply), the others are processed one after another
+        requests_limiter = trio.Semaphore(self.config.max_requests_per_connection)
+        async with trio.open_nursery() as nursery:
+            while True:
+                if client_ctx.pending_raw_req is not None:
+                    # Request received while processing the previous one
+                    raw_req, client_ctx.pending_raw_req = client_ctx.pending_raw_req, None
+                else:
+                    raw_req = await transport.recv()
+                req = unpackb(raw_req)
+                req_id = req.pop("req_id", None)
+                if "stream_size" in req:
+                    # The payload of a streamed request directly follows it on
+                    # the connection, hence it must be consumed before the next
+                    # request can be read
+                    stream = transport.recv_stream()
+                    rep = await self._handle_req(client_ctx, {**req, "stream": stream})
+                    async for _ in stream:
+                        pass
+
+                # Waiting for events monitors the connection, hence the next
+                # requests cannot be read in the meantime
+                elif req_id is not None and req.get("cmd") != "events_listen":
+                    # Stop reading requests until a slot is available
+                    await requests_limiter.acquire()
+                    nursery.start_soon(
+                        self._handle_multiplexed_req,
+                        transport,
+                        client_ctx,
+                        req,
+                        req_id,
+                        requests_limiter,
+                    )
+                    continue
+
                 else:
-                    cmd_func = self.logged_cmds[cmd]
+                    rep = await self._handle_req(client_ctx, req)
 
-            except KeyError:
-                client_ctx.logger.info("Invalid request", bad_cmd=cmd)
-                rep = {"status": "unknown_command", "reason": "Unknown command"}
+                if req_id is not None:
+                    rep["req_id"] = req_id
+                await self._send_rep(transport, rep)
 
+    async def _handle_multiplexed_req(self, transport, client_ctx, req, req_id, requests_limiter):
+        try:
+            rep = await self._handle_req(client_ctx, req)
+            rep["req_id"] = req_id
+            try:
+                await self._send_rep(transport, rep)
+            except TransportError:
+                # Connection lost, this is going to be handled by the main loop
+                pass
+        finally:
+            requests_limiter.release()
+
+    async def _send_rep(self, transport, rep):
+        # Payload of a streamed reply is sent right after it
+        stream = rep.pop("stream", None)
+        if stream is None:
+            await transport.send(packb(rep))
+        else:
+            await transport.send_stream(packb(rep), stream)
+
+    async def _handle_req(self, client_ctx, req):
+        tracer = trace.tracer
+        started = tracer.request_start() if tracer else None
+        try:
+            cmd = req.get("cmd", "<missing>")
+            if not isinstance(cmd, str):
+                raise KeyError()
+            if client_ctx.anonymous:
+                cmd_func = self.anonymous_cmds[cmd]
             else:
-                client_ctx.logger.info("Request", cmd=cmd)
-                try:
-                    rep = await cmd_func(client_ctx, req)
+                cmd_func = self.logged_cmds[cmd]
+
+        except KeyError:
+            client_ctx.logger.info("Invalid request", bad_cmd=cmd)
+            rep = {"status": "unknown_command", "reason": "Unknown command"}
+
+        else:
+            client_ctx.logger.info("Request", cmd=cmd)
+            try:
+                rep = await cmd_func(client_ctx, req)
 
-                except InvalidMessageError as exc:
-                    rep = {
-                        "status": "bad_message",
-                        "errors": exc.errors,
-                        "reason": "Invalid message.",
-                    }
+            except InvalidMessageError as exc:
+                rep = {"status": "bad_message", "errors": exc.errors, "reason": "Invalid message."}
 
-                except ProtocoleError as exc:
-                    rep = {"status": "bad_message", "reason": str(exc)}
+            except ProtocoleError as exc:
+                rep = {"status": "bad_message", "reason": str(exc)}
 
-            client_ctx.logger.debug("rep", rep=_filter_binary_fields(rep))
-            raw_rep = packb(rep)
-            await transport.send(raw_rep)
+        if started is not None:
+            tracer.request_done(client_ctx.logger, cmd, started, rep.get("status"))
+        return rep
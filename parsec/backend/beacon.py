@@ -2,7 +2,7 @@ from uuid import UUID
 from typing import List, Tuple
 
 from parsec.types import DeviceID
-from parsec.api.protocole import beacon_read_serializer
+from parsec.api.protocole import beacon_read_serializer, beacon_get_changes_serializer
 from parsec.backend.utils import catch_protocole_errors
 
 
@@ -23,10 +23,41 @@ class BaseBeaconComponent:
             }
         )
 
-    async def read(self, id: UUID, offset: int) -> List[Tuple[UUID, int]]:
+    @catch_protocole_errors
+    async def api_beacon_get_changes(self, client_ctx, msg):
+        msg = beacon_get_changes_serializer.req_load(msg)
+
+        items = await self.read(msg["id"], msg["offset"], msg["limit"] + 1)
+        has_more = len(items) > msg["limit"]
+        items = items[: msg["limit"]]
+
+        # Only the last version of each vlob is useful to the client
+        changes = {}
+        for src_id, src_version in items:
+            if changes.get(src_id, 0) < src_version:
+                changes[src_id] = src_version
+
+        return beacon_get_changes_serializer.rep_dump(
+            {
+                "status": "ok",
+                "changes": [
+                    {"src_id": src_id, "src_version": src_version}
+                    for src_id, src_version in changes.items()
+                ],
+                "offset": msg["offset"] + len(items),
+                "has_more": has_more,
+            }
+        )
+
+    async def read(self, id: UUID, offset: int, limit: int = None) -> List[Tuple[UUID, int]]:
         raise NotImplementedError()
 
     async def update(
         self, id: UUID, src_id: UUID, src_version: int, author: DeviceID = None
     ) -> None:
+        """
+        The `beacon.updated` signal's index is the offset of the item following
+        the new one (i.e. the number of items in the beacon, starting at 1),
+        hence a client can resume reading the beacon from it.
+        """
         raise NotImplementedError()
@@ -2,7 +2,14 @@ from uuid import UUID
 from typing import Tuple
 
 from parsec.types import DeviceID
-from parsec.api.protocole import blockstore_create_serializer, blockstore_read_serializer
+from parsec.api.protocole import (
+    read_stream,
+    blockstore_create_serializer,
+    blockstore_create_stream_serializer,
+    blockstore_read_serializer,
+    blockstore_read_stream_serializer,
+)
+from parsec.api.protocole.blockstore import BLOCKSTORE_MAX_BLOCK_SIZE
 from parsec.backend.config import BaseBlockstoreConfig
 from parsec.backend.utils import catch_protocole_errors
 
@@ -26,25 +33,40 @@ class BlockstoreTimeoutError(BlockstoreError):
 class BaseBlockstoreComponent:
     @catch_protocole_errors
     async def api_blockstore_read(self, client_ctx, msg):
-        msg = blockstore_read_serializer.req_load(msg)
+        if msg.get("stream"):
+            # Block is sent right after the reply on the connection
+            serializer = blockstore_read_stream_serializer
+        else:
+            serializer = blockstore_read_serializer
+        msg = serializer.req_load(msg)
 
         try:
             block = await self.read(msg["id"])
 
         except BlockstoreNotFoundError:
-            return blockstore_read_serializer.rep_dump({"status": "not_found"})
+            return serializer.rep_dump({"status": "not_found"})
 
         except BlockstoreTimeoutError:
-            return blockstore_read_serializer.rep_dump({"status": "timeout"})
+            return serializer.rep_dump({"status": "timeout"})
 
-        return blockstore_read_serializer.rep_dump({"status": "ok", "block": block})
+        if serializer is blockstore_read_stream_serializer:
+            rep = serializer.rep_dump({"status": "ok", "stream_size": len(block)})
+            return {**rep, "stream": block}
+        return serializer.rep_dump({"status": "ok", "block": block})
 
     @catch_protocole_errors
     async def api_blockstore_create(self, client_ctx, msg):
-        msg = blockstore_create_serializer.req_load(msg)
+        if "stream" in msg:
+            # Block follows the request on the connection
+            stream = msg.pop("stream")
+            msg = blockstore_create_stream_serializer.req_load(msg)
+            block = await read_stream(stream, msg["stream_size"], BLOCKSTORE_MAX_BLOCK_SIZE)
+        else:
+            msg = blockstore_create_serializer.req_load(msg)
+            block = msg["block"]
 
         try:
-            await self.create(**msg, author=client_ctx.device_id)
+            await self.create(msg["id"], block, author=client_ctx.device_id)
 
         except BlockstoreAlreadyExistsError:
             return blockstore_read_serializer.rep_dump({"status": "already_exists"})
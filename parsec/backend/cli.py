@@ -1,11 +1,17 @@
 import os
+import attr
+import socket
 import trio
 import trio_asyncio
 import click
+import multiprocessing
+import multiprocessing.connection
 from structlog import get_logger
 
 from parsec.cli_utils import spinner, cli_exception_handler
 from parsec.logging import configure_logging, configure_sentry_logging
+from parsec.crypto import generate_secret_key
+from parsec.api.trace import configure_protocol_trace
 from parsec.backend import BackendApp, config_factory
 from parsec.backend.drivers.postgresql import init_db
 
@@ -16,6 +22,9 @@ __all__ = ("backend_cmd", "init_cmd", "run_cmd")
 logger = get_logger()
 
 
+LISTEN_BACKLOG = 0xFFFF  # Truncated by the kernel to its own maximum
+
+
 @click.command(short_help="init the database")
 @click.option("--db", required=True, help="PostgreSQL database url")
 @click.option("--force", "-f", is_flag=True)
@@ -66,6 +75,19 @@ def init_cmd(db, force):
 @click.option("--log-format", "-f", default="CONSOLE", type=click.Choice(("CONSOLE", "JSON")))
 @click.option("--log-file", "-o")
 @click.option("--log-filter", default=None)
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of processes serving the clients (default: 1), requires PostgreSQL if more than one",
+)
+@click.option(
+    "--log-trace-rate",
+    default=None,
+    type=click.FloatRange(0, 1),
+    help="Sample rate of the protocol trace logged at DEBUG level (e.g. 0.01, default: disabled)",
+)
 def run_cmd(
     host,
     port,
@@ -77,8 +99,11 @@ def run_cmd(
     log_format,
     log_file,
     log_filter,
+    workers,
+    log_trace_rate,
 ):
     configure_logging(log_level, log_format, log_file, log_filter)
+    tracer = configure_protocol_trace(log_trace_rate)
 
     debug = "DEBUG" in os.environ
     with cli_exception_handler(debug):
@@ -91,11 +116,18 @@ def run_cmd(
         except ValueError as exc:
             raise ValueError(f"Invalid configuration: {exc}")
 
+        if workers > 1:
+            if config.db_type == "MOCKED" or config.blockstore_config.type == "MOCKED":
+                raise ValueError(
+                    "Multiple workers require PostgreSQL and a non-mocked blockstore"
+                    " (mocked data cannot be shared between processes)"
+                )
+            if not hasattr(socket, "SO_REUSEPORT"):
+                raise ValueError("Multiple workers are not supported on this platform")
+
         if config.sentry_url:
             configure_sentry_logging(config.sentry_url)
 
-        backend = BackendApp(config)
-
         if ssl_certfile or ssl_keyfile:
             ssl_context = trio.ssl.create_default_context(trio.ssl.Purpose.SERVER_AUTH)
             if ssl_certfile:
@@ -105,35 +137,106 @@ def run_cmd(
         else:
             ssl_context = None
 
-        async def _serve_client(stream):
-            if ssl_context:
-                stream = trio.ssl.SSLStream(stream, ssl_context, server_side=True)
-
+        print(
+            f"Starting Parsec Backend on {host}:{port} (db={config.db_type}, blockstore={config.blockstore_config.type}, workers={workers})"
+        )
+        if workers == 1:
             try:
-                await backend.handle_client(stream)
+                _run_worker(config, host, port, ssl_context, tracer)
+            except KeyboardInterrupt:
+                print("bye ;-)")
+            return
+
+        # Workers must be able to resume the sessions opened by each other
+        config = attr.evolve(config, handshake_session_key=generate_secret_key())
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(
+                target=_run_worker, args=(config, host, port, ssl_context, tracer, True)
+            )
+            for _ in range(workers)
+        ]
+        try:
+            for process in processes:
+                process.start()
+            # A worker only stops if it has crashed, hence stop the others
+            multiprocessing.connection.wait([process.sentinel for process in processes])
+            raise RuntimeError("A worker has stopped unexpectedly")
 
-            except Exception as exc:
-                # If we are here, something unexpected happened...
-                logger.error("Unexpected crash", exc_info=exc)
-                await stream.aclose()
+        except KeyboardInterrupt:
+            print("bye ;-)")
 
-        async def _run_backend():
-            async with trio.open_nursery() as nursery:
-                await backend.init(nursery)
+        finally:
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join()
+
+
+async def _open_reuse_port_listeners(host, port):
+    # Same as `trio.open_tcp_listeners`, but each worker listens on the port
+    # (the kernel balancing the connections between them)
+    addresses = await trio.socket.getaddrinfo(
+        host, port, type=trio.socket.SOCK_STREAM, flags=trio.socket.AI_PASSIVE
+    )
+    socks = []
+    try:
+        for family, type, proto, _, sockaddr in addresses:
+            sock = trio.socket.socket(family, type, proto)
+            socks.append(sock)
+            sock.setsockopt(trio.socket.SOL_SOCKET, trio.socket.SO_REUSEADDR, 1)
+            sock.setsockopt(trio.socket.SOL_SOCKET, trio.socket.SO_REUSEPORT, 1)
+            if family == trio.socket.AF_INET6:
+                sock.setsockopt(trio.socket.IPPROTO_IPV6, trio.socket.IPV6_V6ONLY, 1)
+            await sock.bind(sockaddr)
+            sock.listen(LISTEN_BACKLOG)
+
+    except BaseException:
+        for sock in socks:
+            sock.close()
+        raise
+
+    return [trio.SocketListener(sock) for sock in socks]
+
+
+def _run_worker(config, host, port, ssl_context, tracer, reuse_port=False):
+    backend = BackendApp(config)
+
+    async def _serve_client(stream):
+        if ssl_context:
+            stream = trio.ssl.SSLStream(stream, ssl_context, server_side=True)
+
+        try:
+            await backend.handle_client(stream)
 
-                try:
+        except Exception as exc:
+            # If we are here, something unexpected happened...
+            logger.error("Unexpected crash", exc_info=exc)
+            await stream.aclose()
+
+    async def _run_backend():
+        async with trio.open_nursery() as nursery:
+            await backend.init(nursery)
+
+            try:
+                if reuse_port:
+                    listeners = await _open_reuse_port_listeners(host, port)
+                    await trio.serve_listeners(_serve_client, listeners)
+                else:
                     await trio.serve_tcp(_serve_client, port, host=host)
 
-                finally:
-                    await backend.teardown()
+            finally:
+                await backend.teardown()
+                if tracer:
+                    tracer.log_summary()
 
-        print(
-            f"Starting Parsec Backend on {host}:{port} (db={config.db_type}, blockstore={config.blockstore_config.type})"
-        )
-        try:
-            trio_asyncio.run(_run_backend)
-        except KeyboardInterrupt:
-            print("bye ;-)")
+    try:
+        trio_asyncio.run(_run_backend)
+
+    except KeyboardInterrupt:
+        # Main process is in charge of the goodbyes when running workers
+        if not reuse_port:
+            raise
 
 
 @click.group()
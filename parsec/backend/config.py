@@ -1,9 +1,11 @@
 import re
 import attr
 import itertools
-from typing import List
+from typing import List, Tuple
 from collections import defaultdict
 
+from parsec.compression import COMPRESSION_ALGORITHMS
+
 
 __all__ = ("config_factory", "BackendConfig", "BaseBlockstoreConfig")
 
@@ -165,6 +167,25 @@ class BackendConfig:
 
     handshake_challenge_size: int = 48
 
+    # Number of devices whose keys are cached for the handshakes, and for how
+    # many seconds (bounding how long a missed revocation goes unnoticed)
+    handshake_cache_size: int = 1000
+    handshake_cache_ttl: float = 60
+
+    # Clients can resume their session without answering the challenge for
+    # `handshake_session_lifetime` seconds, the session tokens being encrypted
+    # with `handshake_session_key` (random if not provided, hence the sessions
+    # don't survive a restart)
+    handshake_session_lifetime: int = 3600
+    handshake_session_key: bytes = None
+
+    # Bound of the requests processed concurrently on a multiplexed connection
+    max_requests_per_connection: int = 8
+
+    # Compression algorithms the clients can use for their payloads, by order
+    # of preference (no compression if empty)
+    compressions: Tuple[str, ...] = COMPRESSION_ALGORITHMS
+
 
 def config_factory(
     db_url: str = "MOCKED", blockstore_type: str = "MOCKED", debug: bool = False, environ: dict = {}
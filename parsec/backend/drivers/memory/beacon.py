@@ -12,13 +12,16 @@ class MemoryBeaconComponent(BaseBeaconComponent):
         self.event_bus = event_bus
         self.beacons = defaultdict(list)
 
-    async def read(self, id: UUID, offset: int) -> List[Tuple[UUID, int]]:
-        return self.beacons[id][offset:]
+    async def read(self, id: UUID, offset: int, limit: int = None) -> List[Tuple[UUID, int]]:
+        if limit is None:
+            return self.beacons[id][offset:]
+        return self.beacons[id][offset : offset + limit]
 
     async def update(
         self, id: UUID, src_id: UUID, src_version: int, author: DeviceID = None
     ) -> None:
         self.beacons[id].append((src_id, src_version))
+        # Offset of the next item, same as the PostgreSQL driver's beacon_index
         index = len(self.beacons[id])
         if author:
             self.event_bus.send(
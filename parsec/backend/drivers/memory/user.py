@@ -183,3 +183,4 @@ class MemoryUserComponent(BaseUserComponent):
             patched_devices.append(device)
 
         self._users[device_id.user_id] = user.evolve(devices=DevicesMapping(*patched_devices))
+        self.event_bus.send("device.revoked", device_id=device_id)
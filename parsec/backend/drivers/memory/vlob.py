@@ -1,5 +1,6 @@
+import pendulum
 from uuid import UUID
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 
 from parsec.types import DeviceID
 from parsec.event_bus import EventBus
@@ -37,7 +38,7 @@ class MemoryVlobComponent(BaseVlobComponent):
                 changed.append({"id": id, "version": version})
             else:
                 try:
-                    current_version, _ = await self.read(id, rts)
+                    current_version, *_ = await self.read(id, rts)
                 except (VlobNotFoundError, VlobTrustSeedError):
                     continue
                 if current_version != version:
@@ -54,7 +55,7 @@ class MemoryVlobComponent(BaseVlobComponent):
         notify_beacon: UUID = None,
     ) -> None:
         vlob = MemoryVlob(id, rts, wts)
-        vlob.blob_versions.append((blob, author))
+        vlob.blob_versions.append((blob, author, pendulum.now(), False))
         if vlob.id in self.vlobs:
             raise VlobAlreadyExistsError()
         self.vlobs[vlob.id] = vlob
@@ -62,7 +63,14 @@ class MemoryVlobComponent(BaseVlobComponent):
         if notify_beacon:
             await self.beacon_component.update(notify_beacon, id, 1, author)
 
-    async def read(self, id: UUID, rts: str, version: int = None) -> Tuple[int, bytes]:
+    async def read(
+        self,
+        id: UUID,
+        rts: str,
+        version: int = None,
+        timestamp: pendulum.Pendulum = None,
+        known_version: int = None,
+    ) -> Tuple[int, Optional[bytes], List[bytes]]:
         try:
             vlob = self.vlobs[id]
             if vlob.rts != rts:
@@ -72,13 +80,32 @@ class MemoryVlobComponent(BaseVlobComponent):
             raise VlobNotFoundError()
 
         if version is None:
-            version = len(vlob.blob_versions)
-        try:
-            return (version, vlob.blob_versions[version - 1][0])
-
-        except IndexError:
+            if timestamp is None:
+                version = len(vlob.blob_versions)
+            else:
+                # Versions are created in chronological order
+                for version in range(len(vlob.blob_versions), 0, -1):
+                    if vlob.blob_versions[version - 1][2] <= timestamp:
+                        break
+                else:
+                    raise VlobVersionError()
+        if version > len(vlob.blob_versions):
             raise VlobVersionError()
 
+        # First version is always a snapshot
+        snapshot_version = version
+        while vlob.blob_versions[snapshot_version - 1][3]:
+            snapshot_version -= 1
+
+        if known_version is not None and snapshot_version <= known_version <= version:
+            blob = None
+            deltas_start = known_version
+        else:
+            blob = vlob.blob_versions[snapshot_version - 1][0]
+            deltas_start = snapshot_version
+        deltas = [x[0] for x in vlob.blob_versions[deltas_start:version]]
+        return (version, blob, deltas)
+
     async def update(
         self,
         id: UUID,
@@ -86,6 +113,7 @@ class MemoryVlobComponent(BaseVlobComponent):
         version: int,
         blob: bytes,
         author: DeviceID,
+        is_delta: bool = False,
         notify_beacon: UUID = None,
     ) -> None:
         try:
@@ -97,7 +125,7 @@ class MemoryVlobComponent(BaseVlobComponent):
             raise VlobNotFoundError()
 
         if version - 1 == len(vlob.blob_versions):
-            vlob.blob_versions.append((blob, author))
+            vlob.blob_versions.append((blob, author, pendulum.now(), is_delta))
         else:
             raise VlobVersionError()
 
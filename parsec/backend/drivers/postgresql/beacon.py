@@ -10,12 +10,22 @@ class PGBeaconComponent(BaseBeaconComponent):
     def __init__(self, dbh: PGHandler):
         self.dbh = dbh
 
-    async def read(self, id: UUID, offset: int) -> List[Tuple[UUID, int]]:
+    async def read(self, id: UUID, offset: int, limit: int = None) -> List[Tuple[UUID, int]]:
+        # Items are retrieved by index (the item at `offset` having index
+        # `offset + 1`) instead of skipping the previous ones, hence the cost
+        # doesn't grow with the beacon history
         async with self.dbh.pool.acquire() as conn:
             results = await conn.fetch(
-                "SELECT src_id, src_version FROM beacons WHERE beacon_id = $1 ORDER BY _id ASC OFFSET $2",
+                """
+                SELECT src_id, src_version
+                FROM beacons
+                WHERE beacon_id = $1 AND beacon_index > $2
+                ORDER BY beacon_index ASC
+                LIMIT $3
+                """,
                 id,
                 offset,
+                limit,
             )
             return results
 
@@ -43,7 +53,7 @@ class PGBeaconComponent(BaseBeaconComponent):
                 (
                     -- Retrieve last index of this beacon, or default to 1
                     SELECT COALESCE(
-                        (SELECT  beacon_index + 1 FROM beacons WHERE beacon_id=$1 ORDER BY _id DESC LIMIT 1),
+                        (SELECT MAX(beacon_index) + 1 FROM beacons WHERE beacon_id=$1),
                         1
                     )
                 ),
@@ -129,10 +129,16 @@ async def _create_db_tables(conn):
             rts TEXT NOT NULL,
             wts TEXT NOT NULL,
             blob BYTEA NOT NULL,
+            -- Blob only contains the changes since the previous version
+            is_delta BOOLEAN NOT NULL,
             author VARCHAR(65) REFERENCES devices (device_id) NOT NULL,
+            created_on TIMESTAMP NOT NULL,
             UNIQUE(vlob_id, version)
         );
 
+        -- Used to retrieve the version of a vlob at a given time
+        CREATE INDEX vlobs_created_on_idx ON vlobs (vlob_id, created_on);
+
         CREATE TABLE beacons (
             _id SERIAL PRIMARY KEY,
             beacon_id UUID NOT NULL,
@@ -142,6 +148,9 @@ async def _create_db_tables(conn):
             src_version INTEGER NOT NULL
         );
 
+        -- Used to page through the changes of a beacon
+        CREATE INDEX beacons_beacon_index_idx ON beacons (beacon_id, beacon_index);
+
         CREATE TABLE blockstore (
             _id SERIAL PRIMARY KEY,
             block_id UUID UNIQUE NOT NULL,
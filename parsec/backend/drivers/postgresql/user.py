@@ -471,3 +471,5 @@ class PGUserComponent(BaseUserComponent):
 
                     else:
                         raise UserError(f"Update error: {result}")
+
+                await send_signal(conn, "device.revoked", device_id=device_id)
@@ -1,6 +1,7 @@
+import pendulum
 from triopg import UniqueViolationError
 from uuid import UUID
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 
 from parsec.types import DeviceID
 from parsec.backend.beacon import BaseBeaconComponent
@@ -63,14 +64,15 @@ class PGVlobComponent(BaseVlobComponent):
                     result = await conn.execute(
                         """
                         INSERT INTO vlobs (
-                            vlob_id, rts, wts, version, blob, author
-                        ) VALUES ($1, $2, $3, 1, $4, $5)
+                            vlob_id, rts, wts, version, blob, is_delta, author, created_on
+                        ) VALUES ($1, $2, $3, 1, $4, false, $5, $6)
                         """,
                         id,
                         rts,
                         wts,
                         blob,
                         author,
+                        pendulum.now(),
                     )
                 except UniqueViolationError:
                     raise VlobAlreadyExistsError()
@@ -81,44 +83,89 @@ class PGVlobComponent(BaseVlobComponent):
                 if notify_beacon:
                     await self.beacon_component.ll_update(conn, notify_beacon, id, 1, author)
 
-    async def read(self, id: UUID, rts: str, version: int = None) -> Tuple[int, bytes]:
+    async def read(
+        self,
+        id: UUID,
+        rts: str,
+        version: int = None,
+        timestamp: pendulum.Pendulum = None,
+        known_version: int = None,
+    ) -> Tuple[int, Optional[bytes], List[bytes]]:
         async with self.dbh.pool.acquire() as conn:
             async with conn.transaction():
-                if version is None:
+                if version is None and timestamp is not None:
+                    data = await conn.fetchrow(
+                        """
+                        SELECT rts, version
+                        FROM vlobs WHERE vlob_id = $1 AND created_on <= $2
+                        ORDER BY version DESC LIMIT 1
+                        """,
+                        id,
+                        timestamp,
+                    )
+
+                elif version is None:
                     data = await conn.fetchrow(
                         """
-                        SELECT rts, version, blob
+                        SELECT rts, version
                         FROM vlobs WHERE vlob_id = $1 ORDER BY version DESC LIMIT 1
                         """,
                         id,
                     )
-                    if not data:
-                        raise VlobNotFoundError()
 
                 else:
                     data = await conn.fetchrow(
                         """
-                        SELECT rts, version, blob
+                        SELECT rts, version
                         FROM vlobs WHERE vlob_id = $1 AND version = $2
                         """,
                         id,
                         version,
                     )
-                    if not data:
-                        # TODO: not cool to need 2nd request to know the error...
-                        exists = await conn.fetchrow(
-                            "SELECT true FROM vlobs WHERE vlob_id = $1", id
-                        )
-                        if exists:
-                            raise VlobVersionError()
 
-                        else:
-                            raise VlobNotFoundError()
+                if not data:
+                    # TODO: not cool to need 2nd request to know the error...
+                    exists = await conn.fetchrow("SELECT true FROM vlobs WHERE vlob_id = $1", id)
+                    if exists:
+                        raise VlobVersionError()
+
+                    else:
+                        raise VlobNotFoundError()
+
+                if data["rts"] != rts:
+                    raise VlobTrustSeedError()
+                version = data["version"]
+
+                # First version is always a snapshot
+                snapshot_version = await conn.fetchval(
+                    """
+                    SELECT MAX(version)
+                    FROM vlobs WHERE vlob_id = $1 AND version <= $2 AND NOT is_delta
+                    """,
+                    id,
+                    version,
+                )
+                if known_version is not None and snapshot_version <= known_version <= version:
+                    start_version = known_version + 1
+                else:
+                    start_version = snapshot_version
 
-            if data["rts"] != rts:
-                raise VlobTrustSeedError()
+                rows = await conn.fetch(
+                    """
+                    SELECT version, blob
+                    FROM vlobs WHERE vlob_id = $1 AND version >= $2 AND version <= $3
+                    ORDER BY version
+                    """,
+                    id,
+                    start_version,
+                    version,
+                )
 
-        return data[1:]
+        blobs = [row["blob"] for row in rows]
+        if start_version == snapshot_version:
+            return version, blobs[0], blobs[1:]
+        else:
+            return version, None, blobs
 
     async def update(
         self,
@@ -127,6 +174,7 @@ class PGVlobComponent(BaseVlobComponent):
         version: int,
         blob: bytes,
         author: DeviceID,
+        is_delta: bool = False,
         notify_beacon: UUID = None,
     ) -> None:
         async with self.dbh.pool.acquire() as conn:
@@ -150,15 +198,17 @@ class PGVlobComponent(BaseVlobComponent):
                     result = await conn.execute(
                         """
                         INSERT INTO vlobs (
-                            vlob_id, rts, wts, version, blob, author
-                        ) VALUES ($1, $2, $3, $4, $5, $6)
+                            vlob_id, rts, wts, version, blob, is_delta, author, created_on
+                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
                         """,
                         id,
                         rts,
                         wts,
                         version,
                         blob,
+                        is_delta,
                         author,
+                        pendulum.now(),
                     )
                 except UniqueViolationError:
                     # Should not occurs in theory given we are in a transaction
@@ -1,13 +1,20 @@
 import trio
 
 from parsec.event_bus import EventBus
-from parsec.api.protocole import events_subscribe_serializer, events_listen_serializer
+from parsec.api.protocole import (
+    events_subscribe_serializer,
+    events_subscribe_add_serializer,
+    events_subscribe_remove_serializer,
+    events_listen_serializer,
+)
 from parsec.backend.utils import catch_protocole_errors
 
 
-def _pinged_callback_factory(client_ctx, pings):
-    pings = set(pings)
+# Note the callbacks keep a reference on the set of pings/beacons they filter
+# on, this way subscriptions can be modified in place.
+
 
+def _pinged_callback_factory(client_ctx, pings):
     def _on_pinged(event, author, ping):
         if author == client_ctx.device_id or ping not in pings:
             return
@@ -21,8 +28,6 @@ def _pinged_callback_factory(client_ctx, pings):
 
 
 def _beacon_updated_callback_factory(client_ctx, beacons_ids):
-    beacons_ids = set(beacons_ids)
-
     def _on_beacon_updated(event, author, beacon_id, index, src_id, src_version):
         if author == client_ctx.device_id or beacon_id not in beacons_ids:
             return
@@ -59,32 +64,89 @@ class EventsComponent:
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
 
+    def _subscribe(self, client_ctx, event, params):
+        try:
+            _, subscribed_params = client_ctx.subscribed_events[event]
+        except KeyError:
+            pass
+        else:
+            if subscribed_params is not None:
+                subscribed_params.update(params)
+            return
+
+        if event == "pinged":
+            params = set(params)
+            callback = _pinged_callback_factory(client_ctx, params)
+        elif event == "beacon.updated":
+            params = set(params)
+            callback = _beacon_updated_callback_factory(client_ctx, params)
+        else:
+            params = None
+            callback = _message_received_callback_factory(client_ctx)
+        client_ctx.subscribed_events[event] = (callback, params)
+        self.event_bus.connect(event, callback, weak=True)
+
+    def _unsubscribe(self, client_ctx, event, params=None):
+        try:
+            _, subscribed_params = client_ctx.subscribed_events[event]
+        except KeyError:
+            return
+        if subscribed_params is not None:
+            subscribed_params.difference_update(params)
+            if subscribed_params:
+                return
+        # Callbacks are weakly connected, dropping them is enough to disconnect
+        del client_ctx.subscribed_events[event]
+
     @catch_protocole_errors
     async def api_events_subscribe(self, client_ctx, msg):
         msg = events_subscribe_serializer.req_load(msg)
 
-        new_subscribed_events = []
+        # Previous subscribed events are replaced (callbacks are weakly
+        # connected, dropping them is enough to disconnect)
+        client_ctx.subscribed_events.clear()
 
         if msg["pinged"]:
-            on_pinged = _pinged_callback_factory(client_ctx, msg["pinged"])
-            new_subscribed_events.append(on_pinged)
-            self.event_bus.connect("pinged", on_pinged, weak=True)
+            self._subscribe(client_ctx, "pinged", msg["pinged"])
 
         if msg["beacon_updated"]:
-            on_beacon_updated = _beacon_updated_callback_factory(client_ctx, msg["beacon_updated"])
-            new_subscribed_events.append(on_beacon_updated)
-            self.event_bus.connect("beacon.updated", on_beacon_updated, weak=True)
+            self._subscribe(client_ctx, "beacon.updated", msg["beacon_updated"])
 
         if msg["message_received"]:
-            on_message_received = _message_received_callback_factory(client_ctx)
-            new_subscribed_events.append(on_message_received)
-            self.event_bus.connect("message.received", on_message_received, weak=True)
-
-        # Note: previous subscribed events should be disconnected by doing this
-        client_ctx.subscribed_events = tuple(new_subscribed_events)
+            self._subscribe(client_ctx, "message.received", None)
 
         return events_subscribe_serializer.rep_dump({"status": "ok"})
 
+    @catch_protocole_errors
+    async def api_events_subscribe_add(self, client_ctx, msg):
+        msg = events_subscribe_add_serializer.req_load(msg)
+
+        if msg["pinged"]:
+            self._subscribe(client_ctx, "pinged", msg["pinged"])
+
+        if msg["beacon_updated"]:
+            self._subscribe(client_ctx, "beacon.updated", msg["beacon_updated"])
+
+        if msg["message_received"]:
+            self._subscribe(client_ctx, "message.received", None)
+
+        return events_subscribe_add_serializer.rep_dump({"status": "ok"})
+
+    @catch_protocole_errors
+    async def api_events_subscribe_remove(self, client_ctx, msg):
+        msg = events_subscribe_remove_serializer.req_load(msg)
+
+        if msg["pinged"]:
+            self._unsubscribe(client_ctx, "pinged", msg["pinged"])
+
+        if msg["beacon_updated"]:
+            self._unsubscribe(client_ctx, "beacon.updated", msg["beacon_updated"])
+
+        if msg["message_received"]:
+            self._unsubscribe(client_ctx, "message.received")
+
+        return events_subscribe_remove_serializer.rep_dump({"status": "ok"})
+
     @catch_protocole_errors
     async def api_events_listen(self, client_ctx, msg):
         msg = events_listen_serializer.req_load(msg)
@@ -105,8 +167,10 @@ class EventsComponent:
             async def _keep_transport_breathing(cancel_scope):
                 # If a command is received, the client is violating the
                 # request/reply pattern. We consider this as an order to stop
-                # listening events.
-                await client_ctx.transport.recv()
+                # listening events, the command is then processed once the
+                # listening has been replied (this is how the client modify
+                # its subscriptions while listening).
+                client_ctx.pending_raw_req = await client_ctx.transport.recv()
                 cancel_scope.cancel()
 
             async with trio.open_nursery() as nursery:
@@ -1,9 +1,12 @@
 import trio
 import attr
 from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 import pendulum
+from pendulum import Pendulum
 
 from parsec.types import UserID, DeviceID
+from parsec.crypto import PublicKey, VerifyKey
 from parsec.trustchain import (
     unsecure_certified_device_extract_verify_key,
     unsecure_certified_user_extract_public_key,
@@ -186,6 +189,66 @@ class DeviceInvitation:
         return (pendulum.now() - self.created_on).total_seconds() < INVITATION_VALIDITY
 
 
+class DeviceKeysCache:
+    """
+    Cache of the keys and revocation of the devices (i.e. all the handshake
+    needs), so that the reconnection of many clients doesn't overload the
+    database. Only existing devices are cached, hence an entry only becomes
+    outdated when its device is revoked (the other backends notifying it
+    through PostgreSQL). Given such a notification can be missed (e.g. if
+    the listening connection is lost), entries also expire after `ttl`
+    seconds.
+    """
+
+    def __init__(self, user_component, event_bus, max_size: int = 1000, ttl: float = 60):
+        self.user_component = user_component
+        self.max_size = max_size
+        self.ttl = ttl
+        # Device id to (expiration time, entry), by order of last use
+        self._entries = OrderedDict()
+        # Incremented on each invalidation so that a lookup concurrent with a
+        # revocation doesn't store outdated data
+        self._generation = 0
+        event_bus.connect("device.revoked", self._on_device_revoked, weak=True)
+
+    def _on_device_revoked(self, event, device_id):
+        self._generation += 1
+        self._entries.pop(device_id, None)
+
+    async def get(self, device_id: DeviceID) -> Tuple[PublicKey, VerifyKey, Optional[Pendulum]]:
+        """
+        Returns: The public key of the user, the verify key and the
+        revocation date of the device.
+
+        Raises:
+            UserNotFoundError
+        """
+        try:
+            expires_on, entry = self._entries[device_id]
+            if trio.current_time() < expires_on:
+                self._entries.move_to_end(device_id)
+                return entry
+            del self._entries[device_id]
+
+        except KeyError:
+            pass
+
+        generation = self._generation
+        user = await self.user_component.get_user(device_id.user_id)
+        try:
+            device = user.devices[device_id.device_name]
+
+        except KeyError:
+            raise UserNotFoundError(device_id)
+
+        entry = (user.public_key, device.verify_key, device.revocated_on)
+        if generation == self._generation and self.max_size:
+            self._entries[device_id] = (trio.current_time() + self.ttl, entry)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+
 class BaseUserComponent:
     #### Access user API ####
 
@@ -1,4 +1,5 @@
-from typing import List, Tuple
+import pendulum
+from typing import List, Tuple, Optional
 from uuid import UUID
 
 from parsec.types import DeviceID
@@ -54,7 +55,7 @@ class BaseVlobComponent:
         msg = vlob_read_serializer.req_load(msg)
 
         try:
-            version, blob = await self.read(**msg)
+            version, blob, deltas = await self.read(**msg)
 
         except (VlobNotFoundError, VlobTrustSeedError) as exc:
             # Don't leak existence information if trust seed is invalid
@@ -63,7 +64,13 @@ class BaseVlobComponent:
         except VlobVersionError as exc:
             return vlob_create_serializer.rep_dump({"status": "bad_version"})
 
-        return vlob_read_serializer.rep_dump({"status": "ok", "blob": blob, "version": version})
+        rep = {"status": "ok", "version": version, "blob": blob}
+        # Clients not asking for deltas (i.e. older ones) don't know about
+        # this field, however a version uploaded as delta cannot be read
+        # without it
+        if msg["known_version"] is not None or deltas:
+            rep["deltas"] = deltas
+        return vlob_read_serializer.rep_dump(rep)
 
     @catch_protocole_errors
     async def api_vlob_update(self, client_ctx, msg):
@@ -103,8 +110,23 @@ class BaseVlobComponent:
         """
         raise NotImplementedError()
 
-    async def read(self, id: UUID, rts: str, version: int = None) -> Tuple[int, bytes]:
+    async def read(
+        self,
+        id: UUID,
+        rts: str,
+        version: int = None,
+        timestamp: pendulum.Pendulum = None,
+        known_version: int = None,
+    ) -> Tuple[int, Optional[bytes], List[bytes]]:
         """
+        Without `version`, the last version created at `timestamp` (or the
+        last version at all if no timestamp is provided) is returned.
+
+        Versions can be stored as deltas of the previous one, so the returned
+        blob is the last snapshot up to the requested version followed by the
+        deltas since this snapshot. If `known_version` is more recent than
+        this snapshot, only the deltas since `known_version` are returned.
+
         Raises:
             VlobTrustSeedError
             VlobVersionError
@@ -119,6 +141,7 @@ class BaseVlobComponent:
         version: int,
         blob: bytes,
         author: DeviceID,
+        is_delta: bool = False,
         notify_beacon: UUID = None,
     ) -> None:
         """
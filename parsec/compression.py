@@ -0,0 +1,107 @@
+import zlib
+from typing import Iterable, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+__all__ = (
+    "CompressionError",
+    "COMPRESSION_ALGORITHMS",
+    "choose_compression",
+    "compress",
+    "decompress",
+)
+
+
+class CompressionError(Exception):
+    pass
+
+
+def _zlib_decompress(data: bytes) -> bytes:
+    try:
+        return zlib.decompress(data)
+
+    except zlib.error as exc:
+        raise CompressionError(str(exc)) from exc
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    try:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+    except zstandard.ZstdError as exc:
+        raise CompressionError(str(exc)) from exc
+
+
+# Compressed data starts with the tag of the algorithm used, hence it can be
+# decompressed without knowing which one it was
+_ALGORITHMS = {"zlib": (b"\x01", zlib.compress, _zlib_decompress)}
+if zstandard:
+    _ALGORITHMS["zstd"] = (b"\x02", _zstd_compress, _zstd_decompress)
+_TAGS = {tag: decompress for tag, _, decompress in _ALGORITHMS.values()}
+
+# Available algorithms, by order of preference
+COMPRESSION_ALGORITHMS = tuple(x for x in ("zstd", "zlib") if x in _ALGORITHMS)
+
+# Big data is first sampled to cheaply skip the incompressible one (e.g.
+# media files or archives)
+_SAMPLE_SIZE = 2 ** 13
+
+
+def choose_compression(supported: Iterable[str], peer_supported: Iterable[str]) -> Optional[str]:
+    """
+    Returns: The first of the `supported` algorithms the peer supports as
+    well, None if there is none.
+    """
+    peer_supported = set(peer_supported)
+    for algorithm in supported:
+        if algorithm in peer_supported and algorithm in _ALGORITHMS:
+            return algorithm
+    return None
+
+
+def compress(data: bytes, algorithm: str, min_ratio: float = 1) -> Optional[bytes]:
+    """
+    Returns: The compressed data or None if its size is not below
+    `min_ratio` times the size of the original data (e.g. given the data is
+    already compressed or encrypted).
+
+    Raises:
+        CompressionError: if `algorithm` is not available
+    """
+    try:
+        tag, compress_fn, _ = _ALGORITHMS[algorithm]
+
+    except KeyError as exc:
+        raise CompressionError(f"Unknown compression algorithm `{algorithm}`") from exc
+
+    if len(data) > 2 * _SAMPLE_SIZE:
+        sample = compress_fn(data[:_SAMPLE_SIZE])
+        if len(sample) >= _SAMPLE_SIZE * min_ratio:
+            return None
+
+    compressed = tag + compress_fn(data)
+    if len(compressed) >= len(data) * min_ratio:
+        return None
+    return compressed
+
+
+def decompress(data: bytes) -> bytes:
+    """
+    Raises:
+        CompressionError
+    """
+    try:
+        decompress_fn = _TAGS[data[:1]]
+
+    except KeyError as exc:
+        raise CompressionError("Unknown compression algorithm") from exc
+
+    return decompress_fn(data[1:])
@@ -12,6 +12,7 @@ from parsec.core.backend_connection.transport import (
     anonymous_transport_factory,
     transport_pool_factory,
     TransportPool,
+    TransportPoolStats,
 )
 from parsec.core.backend_connection.event_listener import backend_listen_events
 from parsec.core.backend_connection.monitor import monitor_backend_connection
@@ -35,6 +36,7 @@ __all__ = (
     "anonymous_transport_factory",
     "transport_pool_factory",
     "TransportPool",
+    "TransportPoolStats",
     "backend_listen_events",
     "monitor_backend_connection",
     "BackendCmdsInvalidRequest",
@@ -1,17 +1,26 @@
-from typing import Tuple, List, Dict, Iterable
+import trio
+from typing import Tuple, List, Dict, Iterable, Optional
 from uuid import UUID
+from pendulum import Pendulum
 
 from parsec.types import DeviceID, UserID, DeviceName
 from parsec.crypto import VerifyKey
+from parsec.api import trace
 from parsec.api.transport import Transport, TransportError
 from parsec.api.protocole import (
+    packb,
+    unpackb,
     ProtocoleError,
+    read_stream,
     ping_serializer,
     organization_create_serializer,
     organization_bootstrap_serializer,
     events_subscribe_serializer,
+    events_subscribe_add_serializer,
+    events_subscribe_remove_serializer,
     events_listen_serializer,
     beacon_read_serializer,
+    beacon_get_changes_serializer,
     message_send_serializer,
     message_get_serializer,
     vlob_group_check_serializer,
@@ -19,7 +28,9 @@ from parsec.api.protocole import (
     vlob_create_serializer,
     vlob_update_serializer,
     blockstore_create_serializer,
+    blockstore_create_stream_serializer,
     blockstore_read_serializer,
+    blockstore_read_stream_serializer,
     user_get_serializer,
     user_find_serializer,
     user_invite_serializer,
@@ -34,7 +45,9 @@ from parsec.api.protocole import (
     device_create_serializer,
     device_revoke_serializer,
 )
+from parsec.api.protocole.blockstore import BLOCKSTORE_MAX_BLOCK_SIZE
 from parsec.core.types import RemoteDevice, RemoteUser, RemoteDevicesMapping
+from parsec.core.backend_connection.transport import MultiplexedTransport
 from parsec.core.backend_connection.exceptions import (
     BackendNotAvailable,
     BackendCmdsInvalidRequest,
@@ -43,34 +56,51 @@ from parsec.core.backend_connection.exceptions import (
 )
 
 
-async def _send_cmd(transport, serializer, **req):
+async def _send_cmd(transport, serializer, req_stream=None, **req):
+    """
+    If provided, `req_stream` is sent as the payload of a streamed request. In the
+    same way, the payload of a streamed reply is provided as `stream` field in
+    the returned reply.
+    """
     transport.logger.info("Request", cmd=req["cmd"])
-
-    def _shorten_data(data):
-        if len(req) > 300:
-            return data[:150] + b"[...]" + data[-150:]
-        else:
-            return data
+    tracer = trace.tracer
+    started = tracer.request_start() if tracer else None
+    raw_rep = None
 
     try:
-        raw_req = serializer.req_dumps(req)
+        req = serializer.req_dump(req)
+        raw_req = packb(req)
 
     except ProtocoleError as exc:
         raise BackendCmdsInvalidRequest() from exc
 
-    transport.logger.debug("send req", req=_shorten_data(raw_req))
     try:
-        await transport.send(raw_req)
-        raw_rep = await transport.recv()
+        if isinstance(transport, MultiplexedTransport):
+            # Reply is already unpacked to retrieve it request id
+            rep = await transport.send_req(req, req_stream)
+        else:
+            if req_stream is None:
+                await transport.send(raw_req)
+            else:
+                await transport.send_stream(raw_req, req_stream)
+            raw_rep = await transport.recv()
+            rep = unpackb(raw_rep)
+            if isinstance(rep, dict) and "stream_size" in rep:
+                rep["stream"] = await read_stream(
+                    transport.recv_stream(), rep["stream_size"], BLOCKSTORE_MAX_BLOCK_SIZE
+                )
 
     except TransportError as exc:
         transport.logger.info("Request failed (backend not available)", cmd=req["cmd"])
         raise BackendNotAvailable(exc) from exc
 
-    transport.logger.debug("recv rep", req=_shorten_data(raw_rep))
+    except ProtocoleError as exc:
+        transport.logger.warning("Request failed (bad protocol)", cmd=req["cmd"], error=exc)
+        raise BackendCmdsInvalidResponse(exc) from exc
 
     try:
-        rep = serializer.rep_loads(raw_rep)
+        rep_stream = rep.pop("stream", None) if isinstance(rep, dict) else None
+        rep = serializer.rep_load(rep)
 
     except ProtocoleError as exc:
         transport.logger.warning("Request failed (bad protocol)", cmd=req["cmd"], error=exc)
@@ -79,6 +109,18 @@ async def _send_cmd(transport, serializer, **req):
     if rep["status"] == "invalid_msg_format":
         raise BackendCmdsInvalidRequest(rep)
 
+    if rep_stream is not None:
+        rep["stream"] = rep_stream
+
+    if started is not None:
+        tracer.request_done(
+            transport.logger,
+            req["cmd"],
+            started,
+            rep["status"],
+            req_size=len(raw_req),
+            rep_size=len(raw_rep) if raw_rep is not None else None,
+        )
     return rep
 
 
@@ -121,6 +163,100 @@ async def events_listen(transport: Transport, wait: bool = True) -> dict:
     return rep
 
 
+async def events_subscribe_add(
+    transport: Transport,
+    message_received: bool = False,
+    beacon_updated: Iterable[UUID] = (),
+    pinged: Iterable[str] = (),
+) -> None:
+    rep = await _send_cmd(
+        transport,
+        events_subscribe_add_serializer,
+        cmd="events_subscribe_add",
+        message_received=message_received,
+        beacon_updated=beacon_updated,
+        pinged=pinged,
+    )
+    if rep["status"] != "ok":
+        raise BackendCmdsBadResponse(rep)
+
+
+async def events_subscribe_remove(
+    transport: Transport,
+    message_received: bool = False,
+    beacon_updated: Iterable[UUID] = (),
+    pinged: Iterable[str] = (),
+) -> None:
+    rep = await _send_cmd(
+        transport,
+        events_subscribe_remove_serializer,
+        cmd="events_subscribe_remove",
+        message_received=message_received,
+        beacon_updated=beacon_updated,
+        pinged=pinged,
+    )
+    if rep["status"] != "ok":
+        raise BackendCmdsBadResponse(rep)
+
+
+async def events_listen_interruptible(
+    transport: Transport, interrupt: trio.Event
+) -> Optional[dict]:
+    """
+    Same as `events_listen`, but stop listening as soon as `interrupt` is set.
+
+    Backend stops listening when receiving a new request, hence a noop
+    `events_subscribe_add` is used to interrupt it. Its reply comes after
+    the listening's one which is either `cancelled` or an event that was
+    already on its way.
+
+    Returns: The event, or None if interrupted before any event arrived.
+    """
+    transport.logger.info("Request", cmd="events_listen")
+    raw_req = events_listen_serializer.req_dumps({"cmd": "events_listen", "wait": True})
+    raw_interrupt_req = events_subscribe_add_serializer.req_dumps({"cmd": "events_subscribe_add"})
+    raw_rep = raw_interrupt_rep = None
+    try:
+        await transport.send(raw_req)
+        async with trio.open_nursery() as nursery:
+
+            async def _wait_interrupt():
+                await interrupt.wait()
+                nursery.cancel_scope.cancel()
+
+            nursery.start_soon(_wait_interrupt)
+            raw_rep = await transport.recv()
+            nursery.cancel_scope.cancel()
+
+        if raw_rep is None:
+            transport.logger.info("Request", cmd="events_subscribe_add")
+            await transport.send(raw_interrupt_req)
+            raw_rep = await transport.recv()
+            raw_interrupt_rep = await transport.recv()
+
+    except TransportError as exc:
+        transport.logger.info("Request failed (backend not available)", cmd="events_listen")
+        raise BackendNotAvailable(exc) from exc
+
+    try:
+        rep = events_listen_serializer.rep_loads(raw_rep)
+        if raw_interrupt_rep is not None:
+            interrupt_rep = events_subscribe_add_serializer.rep_loads(raw_interrupt_rep)
+            if interrupt_rep["status"] != "ok":
+                raise BackendCmdsBadResponse(interrupt_rep)
+
+    except ProtocoleError as exc:
+        transport.logger.warning("Request failed (bad protocol)", cmd="events_listen", error=exc)
+        raise BackendCmdsInvalidResponse(exc) from exc
+
+    if rep["status"] == "cancelled":
+        return None
+    elif rep["status"] != "ok":
+        raise BackendCmdsBadResponse(rep)
+    rep.pop("status")
+    return rep
+
+
 # Beacon
 
 
@@ -133,6 +269,19 @@ async def beacon_read(transport: Transport, id: UUID, offset: int) -> List[Tuple
     return [(item["src_id"], item["src_version"]) for item in rep["items"]]
 
 
+async def beacon_get_changes(
+    transport: Transport, id: UUID, offset: int, limit: int = None
+) -> Tuple[List[Tuple[UUID, int]], int, bool]:
+    req = {"cmd": "beacon_get_changes", "id": id, "offset": offset}
+    if limit is not None:
+        req["limit"] = limit
+    rep = await _send_cmd(transport, beacon_get_changes_serializer, **req)
+    if rep["status"] != "ok":
+        raise BackendCmdsBadResponse(rep)
+    changes = [(item["src_id"], item["src_version"]) for item in rep["changes"]]
+    return changes, rep["offset"], rep["has_more"]
+
+
 # Message
 
 
@@ -181,29 +330,46 @@ async def vlob_create(
 
 
 async def vlob_read(
-    transport: Transport, id: UUID, rts: str, version: int = None
-) -> Tuple[int, bytes]:
-    rep = await _send_cmd(
-        transport, vlob_read_serializer, cmd="vlob_read", id=id, rts=rts, version=version
-    )
+    transport: Transport,
+    id: UUID,
+    rts: str,
+    version: int = None,
+    timestamp: Pendulum = None,
+    known_version: int = None,
+) -> Tuple[int, Optional[bytes], List[bytes]]:
+    req = {"cmd": "vlob_read", "id": id, "rts": rts, "version": version}
+    # Older backends reject these fields, hence they are only sent when needed
+    if timestamp is not None:
+        req["timestamp"] = timestamp
+    if known_version is not None:
+        req["known_version"] = known_version
+    rep = await _send_cmd(transport, vlob_read_serializer, **req)
     if rep["status"] != "ok":
         raise BackendCmdsBadResponse(rep)
-    return rep["version"], rep["blob"]
+    return rep["version"], rep["blob"], rep["deltas"]
 
 
 async def vlob_update(
-    transport: Transport, id: UUID, wts: str, version: int, blob: bytes, notify_beacon: UUID
+    transport: Transport,
+    id: UUID,
+    wts: str,
+    version: int,
+    blob: bytes,
+    notify_beacon: UUID,
+    is_delta: bool = False,
 ) -> None:
-    rep = await _send_cmd(
-        transport,
-        vlob_update_serializer,
-        cmd="vlob_update",
-        id=id,
-        version=version,
-        wts=wts,
-        blob=blob,
-        notify_beacon=notify_beacon,
-    )
+    req = {
+        "cmd": "vlob_update",
+        "id": id,
+        "version": version,
+        "wts": wts,
+        "blob": blob,
+        "notify_beacon": notify_beacon,
+    }
+    # Older backends reject this field
+    if is_delta:
+        req["is_delta"] = True
+    rep = await _send_cmd(transport, vlob_update_serializer, **req)
     if rep["status"] != "ok":
         raise BackendCmdsBadResponse(rep)
 
@@ -211,15 +377,39 @@ async def vlob_update(
 ### Blockstore API ###
 
 
-async def blockstore_create(transport: Transport, id: UUID, block: bytes) -> None:
-    rep = await _send_cmd(
-        transport, blockstore_create_serializer, cmd="blockstore_create", id=id, block=block
-    )
+# Blocks can be streamed to avoid copying them back and forth into the
+# messages, this requires a backend supporting it
+
+
+async def blockstore_create(
+    transport: Transport, id: UUID, block: bytes, stream: bool = False
+) -> None:
+    if stream:
+        rep = await _send_cmd(
+            transport,
+            blockstore_create_stream_serializer,
+            req_stream=block,
+            cmd="blockstore_create",
+            id=id,
+            stream_size=len(block),
+        )
+    else:
+        rep = await _send_cmd(
+            transport, blockstore_create_serializer, cmd="blockstore_create", id=id, block=block
+        )
     if rep["status"] != "ok":
         raise BackendCmdsBadResponse(rep)
 
 
-async def blockstore_read(transport: Transport, id: UUID) -> bytes:
+async def blockstore_read(transport: Transport, id: UUID, stream: bool = False) -> bytes:
+    if stream:
+        rep = await _send_cmd(
+            transport, blockstore_read_stream_serializer, cmd="blockstore_read", id=id, stream=True
+        )
+        if rep["status"] != "ok":
+            raise BackendCmdsBadResponse(rep)
+        return rep["stream"]
+
     rep = await _send_cmd(transport, blockstore_read_serializer, cmd="blockstore_read", id=id)
     if rep["status"] != "ok":
         raise BackendCmdsBadResponse(rep)
@@ -11,7 +11,8 @@ from parsec.core.backend_connection.exceptions import (
     BackendCmdsInvalidResponse,
     BackendCmdsBadResponse,
 )
-from parsec.core.backend_connection.porcelain import backend_cmds_factory
+from parsec.core.backend_connection.transport import authenticated_transport_factory
+from parsec.core.backend_connection import cmds
 
 
 MAX_COOLDOWN = 30
@@ -59,6 +60,12 @@ class BackendEventsManager:
             self.event_bus.send("backend.online")
         self.event_bus.send("backend.listener.restarted")
 
+    def _event_pump_subscriptions_updated(self):
+        # Subscriptions are modified without restarting the event listener,
+        # but from the outside point of view this is the same thing: events
+        # on the new subscriptions can be missed until this point.
+        self.event_bus.send("backend.listener.restarted")
+
     async def run(self, *, task_status=trio.TASK_STATUS_IGNORED):
         closed_event = trio.Event()
         try:
@@ -85,19 +92,10 @@ class BackendEventsManager:
 
                 async with trio.open_nursery() as nursery:
                     logger.info("Try to connect to backend...")
-                    self._subscribed_beacons_changed.clear()
-                    event_pump_cancel_scope = await nursery.start(self._event_pump)
+                    await nursery.start(self._event_pump)
                     backend_connection_failures = 0
                     logger.info("Backend online")
                     self._event_pump_ready()
-                    while True:
-                        await self._subscribed_beacons_changed.wait()
-                        self._subscribed_beacons_changed.clear()
-                        new_cancel_scope = await nursery.start(self._event_pump)
-                        self._event_pump_ready()
-                        event_pump_cancel_scope.cancel()
-                        event_pump_cancel_scope = new_cancel_scope
-                        logger.info("Event listener restarted")
 
             except (TransportError, BackendNotAvailable) as exc:
                 # In case of connection failure, wait a bit and restart
@@ -122,25 +120,45 @@ class BackendEventsManager:
                 return
 
     async def _event_pump(self, *, task_status=trio.TASK_STATUS_IGNORED):
-        with trio.open_cancel_scope() as cancel_scope:
-            async with backend_cmds_factory(
-                self.device.backend_addr, self.device.device_id, self.device.signing_key, max_pool=1
-            ) as cmds:
-                # Copy `self._subscribed_beacons` to avoid concurrent modifications
-                await cmds.events_subscribe(
-                    message_received=True, beacon_updated=self._subscribed_beacons.copy()
-                )
-
-                # Given the backend won't notify us for messages that arrived while
-                # we were offline, we must actively check this ourself.
-                self.event_bus.send("backend.message.polling_needed")
-
-                task_status.started(cancel_scope)
-                await self._event_pump_do(cmds)
-
-    async def _event_pump_do(self, cmds):
+        async with authenticated_transport_factory(
+            self.device.backend_addr, self.device.device_id, self.device.signing_key
+        ) as transport:
+            # Copy `self._subscribed_beacons` to avoid concurrent modifications
+            self._subscribed_beacons_changed.clear()
+            subscribed_beacons = self._subscribed_beacons.copy()
+            await cmds.events_subscribe(
+                transport, message_received=True, beacon_updated=subscribed_beacons
+            )
+
+            # Given the backend won't notify us for messages that arrived while
+            # we were offline, we must actively check this ourself.
+            self.event_bus.send("backend.message.polling_needed")
+
+            task_status.started()
+            await self._event_pump_do(transport, subscribed_beacons)
+
+    async def _event_pump_do(self, transport, subscribed_beacons):
         while True:
-            rep = await cmds.events_listen()
+            # Update the subscriptions in place instead of restarting the
+            # whole connection each time a beacon is (un)listened
+            self._subscribed_beacons_changed.clear()
+            if subscribed_beacons != self._subscribed_beacons:
+                to_add = self._subscribed_beacons - subscribed_beacons
+                to_remove = subscribed_beacons - self._subscribed_beacons
+                subscribed_beacons = self._subscribed_beacons.copy()
+                if to_add:
+                    await cmds.events_subscribe_add(transport, beacon_updated=to_add)
+                if to_remove:
+                    await cmds.events_subscribe_remove(transport, beacon_updated=to_remove)
+                self._event_pump_subscriptions_updated()
+                logger.info("Event listener subscriptions updated")
+
+            rep = await cmds.events_listen_interruptible(
+                transport, self._subscribed_beacons_changed
+            )
+            if not rep:
+                # Interrupted by a subscriptions change
+                continue
 
             if rep["event"] == "message.received":
                 self.event_bus.send("backend.message.received", index=rep["index"])
@@ -3,6 +3,7 @@ from async_generator import asynccontextmanager
 
 from parsec.types import DeviceID, BackendOrganizationAddr
 from parsec.crypto import SigningKey
+from parsec.compression import COMPRESSION_ALGORITHMS
 from parsec.core.backend_connection.exceptions import BackendNotAvailable
 from parsec.core.backend_connection.transport import (
     transport_pool_factory,
@@ -24,9 +25,19 @@ logger = get_logger()
 
 
 class BackendCmdsPool:
-    def __init__(self, addr, transport_pool):
+    def __init__(self, addr, transport_pool, streaming=False):
         self.addr = addr
         self.transport_pool = transport_pool
+        # Blocks are only streamed if enabled given older backends reject it
+        self.streaming = streaming
+
+    @property
+    def compression(self):
+        """
+        Compression algorithm to use for the payloads (None until connected
+        to the backend or if there is no common algorithm)
+        """
+        return self.transport_pool.compression
 
     def _expose_cmds_with_retrier(name):
         cmd = getattr(cmds, name)
@@ -47,8 +58,11 @@ class BackendCmdsPool:
     ping = _expose_cmds_with_retrier("ping")
 
     events_subscribe = _expose_cmds_with_retrier("events_subscribe")
+    events_subscribe_add = _expose_cmds_with_retrier("events_subscribe_add")
+    events_subscribe_remove = _expose_cmds_with_retrier("events_subscribe_remove")
     events_listen = _expose_cmds_with_retrier("events_listen")
     beacon_read = _expose_cmds_with_retrier("beacon_read")
+    beacon_get_changes = _expose_cmds_with_retrier("beacon_get_changes")
     message_send = _expose_cmds_with_retrier("message_send")
     message_get = _expose_cmds_with_retrier("message_get")
 
@@ -57,8 +71,14 @@ class BackendCmdsPool:
     vlob_read = _expose_cmds_with_retrier("vlob_read")
     vlob_update = _expose_cmds_with_retrier("vlob_update")
 
-    blockstore_create = _expose_cmds_with_retrier("blockstore_create")
-    blockstore_read = _expose_cmds_with_retrier("blockstore_read")
+    _blockstore_create = _expose_cmds_with_retrier("blockstore_create")
+    _blockstore_read = _expose_cmds_with_retrier("blockstore_read")
+
+    async def blockstore_create(self, id, block):
+        return await self._blockstore_create(id, block, stream=self.streaming)
+
+    async def blockstore_read(self, id):
+        return await self._blockstore_read(id, stream=self.streaming)
 
     user_get = _expose_cmds_with_retrier("user_get")
     user_find = _expose_cmds_with_retrier("user_find")
@@ -101,10 +121,42 @@ class BackendAnonymousCmds:
 
 @asynccontextmanager
 async def backend_cmds_factory(
-    addr: BackendOrganizationAddr, device_id: DeviceID, signing_key: SigningKey, max_pool: int = 4
+    addr: BackendOrganizationAddr,
+    device_id: DeviceID,
+    signing_key: SigningKey,
+    max_pool: int = 4,
+    multiplexed: bool = False,
+    min_pool: int = 0,
+    keepalive: float = None,
+    idle_timeout: float = None,
+    max_lifetime: float = None,
+    compression: bool = False,
+    session_resumption: bool = False,
+    streaming: bool = False,
 ) -> BackendCmdsPool:
-    async with transport_pool_factory(addr, device_id, signing_key, max_pool) as transport_pool:
-        yield BackendCmdsPool(addr, transport_pool)
+    """
+    Args:
+        compression: compress the payloads if the backend supports it, the
+                     clients not supporting it being then unable to read them
+        session_resumption: resume the previous session when reconnecting
+                            instead of answering the challenge (TLS only)
+        streaming: stream the blocks over the connection instead of packing
+                   them into the messages, the backend must support it
+    """
+    async with transport_pool_factory(
+        addr,
+        device_id,
+        signing_key,
+        max_pool,
+        multiplexed,
+        min=min_pool,
+        keepalive=keepalive,
+        idle_timeout=idle_timeout,
+        max_lifetime=max_lifetime,
+        compressions=COMPRESSION_ALGORITHMS if compression else (),
+        session_resumption=session_resumption,
+    ) as transport_pool:
+        yield BackendCmdsPool(addr, transport_pool, streaming=streaming)
 
 
 @asynccontextmanager
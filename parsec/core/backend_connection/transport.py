@@ -1,5 +1,9 @@
 import os
 import trio
+import attr
+from typing import Optional, Iterable
+from functools import lru_cache
+from itertools import count
 from async_generator import asynccontextmanager
 from structlog import get_logger
 
@@ -7,11 +11,16 @@ from parsec.types import DeviceID, BackendAddr
 from parsec.crypto import SigningKey
 from parsec.api.transport import Transport, TransportError, TransportClosedByPeer
 from parsec.api.protocole import (
+    packb,
+    unpackb,
     ProtocoleError,
+    read_stream,
     HandshakeRevokedDevice,
+    HandshakeBadSession,
     AnonymousClientHandshake,
     ClientHandshake,
 )
+from parsec.api.protocole.blockstore import BLOCKSTORE_MAX_BLOCK_SIZE
 from parsec.core.backend_connection.exceptions import (
     BackendNotAvailable,
     BackendHandshakeError,
@@ -24,13 +33,28 @@ __all__ = (
     "anonymous_transport_factory",
     "transport_pool_factory",
     "TransportPool",
+    "TransportPoolStats",
+    "MultiplexedTransport",
 )
 
 
 logger = get_logger()
 
 
-async def _connect(addr: BackendAddr, device_id: DeviceID = None, signing_key: SigningKey = None):
+# Sessions of the previous connections, so that reconnecting (e.g. when the
+# pool renews its connections or the event listener restarts) skips most of
+# the TLS and Parsec handshakes
+_tls_sessions = {}
+_handshake_sessions = {}
+
+
+async def _connect(
+    addr: BackendAddr,
+    device_id: DeviceID = None,
+    signing_key: SigningKey = None,
+    compressions: Iterable[str] = (),
+    session_resumption: bool = False,
+):
     try:
         stream = await trio.open_tcp_stream(addr.hostname, addr.port)
 
@@ -39,7 +63,7 @@ async def _connect(addr: BackendAddr, device_id: DeviceID = None, signing_key: S
         raise BackendNotAvailable(exc) from exc
 
     if addr.scheme == "wss":
-        stream = _upgrade_stream_to_ssl(stream, addr.hostname)
+        stream = _upgrade_stream_to_ssl(stream, addr.hostname, addr.port)
 
     try:
         transport = await Transport.init_for_client(stream, addr.hostname)
@@ -47,49 +71,130 @@ async def _connect(addr: BackendAddr, device_id: DeviceID = None, signing_key: S
         transport.logger.debug("Connection lost during transport creation", reason=exc)
         raise BackendNotAvailable(exc) from exc
 
+    # Session tokens are bearer credentials, hence they are neither asked for
+    # nor sent over a clear connection
+    if session_resumption and device_id and addr.scheme == "wss":
+        session_id = (addr.hostname, addr.port, device_id)
+    else:
+        session_id = None
     try:
-        await _do_handshade(transport, device_id, signing_key)
+        session_token = await _do_handshade(
+            transport,
+            device_id,
+            signing_key,
+            _handshake_sessions.get(session_id),
+            compressions,
+            new_session=session_id is not None,
+        )
 
     except Exception as exc:
         transport.logger.debug("Connection lost during handshake", reason=exc)
+        _handshake_sessions.pop(session_id, None)
         await transport.aclose()
         raise
 
-    return transport
+    if session_id and session_token:
+        _handshake_sessions[session_id] = session_token
+    else:
+        _handshake_sessions.pop(session_id, None)
+    if addr.scheme == "wss":
+        # Retrieved once the handshake is done given TLS 1.3 provides the
+        # session after it
+        _tls_sessions[(addr.hostname, addr.port)] = stream.session
 
+    return transport
 
-def _upgrade_stream_to_ssl(raw_stream, hostname):
-    # The ssl context should be generated once and stored into the config
-    # however this is tricky (should ssl configuration be stored per device ?)
-    keyfile = os.environ.get("SSL_KEYFILE")
-    certfile = os.environ.get("SSL_CERTFILE")
 
+@lru_cache()
+def _get_ssl_context(certfile, keyfile):
     ssl_context = trio.ssl.create_default_context(trio.ssl.Purpose.CLIENT_AUTH)
     if certfile:
         ssl_context.load_cert_chain(certfile, keyfile)
     else:
         ssl_context.load_default_certs()
+    return ssl_context
 
-    return trio.ssl.SSLStream(raw_stream, ssl_context, server_hostname=hostname)
+
+def _upgrade_stream_to_ssl(raw_stream, hostname, port):
+    # The ssl context should be stored into the config, however this is tricky
+    # (should ssl configuration be stored per device ?), hence it is only built
+    # once per configuration (which is also required to resume the TLS sessions)
+    keyfile = os.environ.get("SSL_KEYFILE")
+    certfile = os.environ.get("SSL_CERTFILE")
+    ssl_context = _get_ssl_context(certfile, keyfile)
+
+    stream = trio.ssl.SSLStream(raw_stream, ssl_context, server_hostname=hostname)
+    session = _tls_sessions.get((hostname, port))
+    if session:
+        try:
+            stream.session = session
+        except ValueError:
+            # Session from another context (i.e. the configuration has changed)
+            pass
+    return stream
 
 
 async def _do_handshade(
-    transport: Transport, device_id: DeviceID = None, signing_key: SigningKey = None
-):
+    transport: Transport,
+    device_id: DeviceID = None,
+    signing_key: SigningKey = None,
+    session_token: bytes = None,
+    compressions: Iterable[str] = (),
+    new_session: bool = False,
+) -> Optional[bytes]:
+    """
+    Args:
+        compressions: compression algorithms to announce to the backend
+        new_session: ask the backend for a token to resume the session, this
+                     must only be done over TLS
+
+    Returns: The token to resume the session in a later handshake, if any.
+    """
     if device_id and not signing_key:
         raise ValueError("Signing key is mandatory for non anonymous authentication")
 
     try:
         if not device_id:
             ch = AnonymousClientHandshake()
+            challenge_req = await transport.recv()
+            answer_req = ch.process_challenge_req(challenge_req)
+            await transport.send(answer_req)
+            result_req = await transport.recv()
+            ch.process_result_req(result_req)
+            transport.logger.debug("Handshake done")
+            return None
+
+        ch = ClientHandshake(
+            device_id,
+            signing_key,
+            supported_compressions=compressions,
+            session_token=session_token,
+            new_session=new_session,
+        )
+        if session_token:
+            # Resuming the session doesn't require to wait for the challenge
+            await transport.send(ch.build_session_answer_req())
+            challenge_req = await transport.recv()
+            result_req = await transport.recv()
+            try:
+                ch.process_result_req(result_req)
+
+            except HandshakeBadSession:
+                transport.logger.debug("Session rejected, answering the challenge")
+                await transport.send(ch.process_challenge_req(challenge_req))
+                result_req = await transport.recv()
+                ch.process_result_req(result_req)
+
         else:
-            ch = ClientHandshake(device_id, signing_key)
-        challenge_req = await transport.recv()
-        answer_req = ch.process_challenge_req(challenge_req)
-        await transport.send(answer_req)
-        result_req = await transport.recv()
-        ch.process_result_req(result_req)
+            challenge_req = await transport.recv()
+            answer_req = ch.process_challenge_req(challenge_req)
+            await transport.send(answer_req)
+            result_req = await transport.recv()
+            ch.process_result_req(result_req)
+
+        transport.compression = ch.compression
         transport.logger.debug("Handshake done")
+        return ch.session_token
 
     except TransportError as exc:
         raise BackendNotAvailable(exc) from exc
@@ -127,56 +232,406 @@ async def anonymous_transport_factory(addr: BackendAddr) -> Transport:
         await transport.aclose()
 
 
+class _PendingRequest:
+    def __init__(self):
+        self.event = trio.Event()
+        self.rep = None
+        self.exc = None
+
+
+class MultiplexedTransport:
+    """
+    Transport shared by concurrent commands: requests are sent with an id the
+    backend puts back in the reply, the replies being dispatched to the
+    waiting commands by the `run` task.
+    """
+
+    def __init__(self, transport: Transport, max_in_flight: int):
+        self.transport = transport
+        self.logger = transport.logger
+        self.compression = transport.compression
+        self.closed = False
+        self._req_ids = count(1)
+        self._pending_requests = {}
+        self._in_flight_limiter = trio.Semaphore(max_in_flight)
+        self._cancel_scope = None
+
+    @property
+    def in_use(self) -> bool:
+        return bool(self._pending_requests)
+
+    async def run(self, *, task_status=trio.TASK_STATUS_IGNORED):
+        with trio.open_cancel_scope() as self._cancel_scope:
+            task_status.started()
+            try:
+                while True:
+                    rep = unpackb(await self.transport.recv())
+                    if not isinstance(rep, dict):
+                        raise ProtocoleError(f"Invalid reply: {rep!r}")
+                    req_id = rep.pop("req_id", None)
+                    if "stream_size" in rep:
+                        # Payload of a streamed reply directly follows it
+                        rep["stream"] = await read_stream(
+                            self.transport.recv_stream(),
+                            rep["stream_size"],
+                            BLOCKSTORE_MAX_BLOCK_SIZE,
+                        )
+                    if req_id is None and rep.get("status") == "invalid_msg_format":
+                        # Backend is going to close the connection
+                        self._close(rep=rep)
+                        return
+                    pending = self._pending_requests.pop(req_id, None)
+                    if not pending:
+                        self.logger.warning("Reply to an unknown request", req_id=req_id)
+                        continue
+                    pending.rep = rep
+                    pending.event.set()
+
+            except (TransportError, ProtocoleError) as exc:
+                self.logger.info("Multiplexed connection lost", reason=exc)
+                self._close(exc=TransportError(*exc.args))
+                await self.transport.aclose()
+
+    def _close(self, rep=None, exc=None):
+        self.closed = True
+        for pending in self._pending_requests.values():
+            pending.rep = rep
+            pending.exc = exc
+            pending.event.set()
+        self._pending_requests.clear()
+
+    async def aclose(self) -> None:
+        self._close(exc=TransportError("Transport has been closed"))
+        if self._cancel_scope:
+            self._cancel_scope.cancel()
+        await self.transport.aclose()
+
+    async def send_req(self, req: dict, req_stream: bytes = None) -> dict:
+        """
+        Raises:
+            TransportError
+        """
+        async with self._in_flight_limiter:
+            if self.closed:
+                raise TransportError("Transport has been closed")
+            req_id = next(self._req_ids)
+            pending = self._pending_requests[req_id] = _PendingRequest()
+            try:
+                # Being cancelled in the middle of the send would corrupt the
+                # connection for the other requests
+                with trio.open_cancel_scope(shield=True):
+                    raw_req = packb({**req, "req_id": req_id})
+                    if req_stream is None:
+                        await self.transport.send(raw_req)
+                    else:
+                        await self.transport.send_stream(raw_req, req_stream)
+                await pending.event.wait()
+
+            except TransportError:
+                await self.aclose()
+                raise
+
+            finally:
+                self._pending_requests.pop(req_id, None)
+
+            if pending.exc:
+                raise pending.exc
+            return pending.rep
+
+
+@attr.s(slots=True, auto_attribs=True)
+class TransportPoolStats:
+    connections_created: int = 0
+    connections_destroyed: int = 0
+    acquired: int = 0
+    # Time spent waiting for a connection to be available (in seconds)
+    acquire_wait_total: float = 0.0
+    acquire_wait_max: float = 0.0
+
+    @property
+    def acquire_wait_mean(self) -> float:
+        return self.acquire_wait_total / self.acquired if self.acquired else 0.0
+
+
 class TransportPool:
-    def __init__(self, addr, device_id, signing_key, max):
+    """
+    In multiplexed mode, a single connection is shared by the commands, `max`
+    being then the number of concurrent requests on it.
+
+    Idle connections are pinged every `keepalive` seconds, which both detects
+    the dead ones and prevents NAT/firewall timeouts. Connections are closed
+    once unused for `idle_timeout` seconds or opened for `max_lifetime`
+    seconds, while `min` connections are opened ahead of the requests.
+    """
+
+    # Time to wait for the pong before considering a connection dead
+    PING_TIMEOUT = 5
+
+    def __init__(
+        self,
+        addr,
+        device_id,
+        signing_key,
+        max,
+        multiplexed=False,
+        min=0,
+        keepalive=None,
+        idle_timeout=None,
+        max_lifetime=None,
+        compressions=(),
+        session_resumption=False,
+    ):
         self.addr = addr
         self.device_id = device_id
         self.signing_key = signing_key
         self.transports = []
+        self.multiplexed = multiplexed
+        self.multiplexed_transport = None
+        self.keepalive = keepalive
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.stats = TransportPoolStats()
+        # Compression negotiated with the backend among `compressions`, known
+        # once connected
+        self.compressions = compressions
+        self.compression = None
+        self.session_resumption = session_resumption
+        self._min = min
+        self._max = max
         self._closed = False
         self._lock = trio.Semaphore(max)
+        self._connect_lock = trio.Lock()
+        self._nursery = None
+        self._maintenance_cancel_scope = None
+
+    async def _create_transport(self) -> Transport:
+        transport = await _connect(
+            self.addr,
+            self.device_id,
+            self.signing_key,
+            self.compressions,
+            session_resumption=self.session_resumption,
+        )
+        transport.logger = transport.logger.bind(device_id=self.device_id)
+        self.compression = transport.compression
+        self.stats.connections_created += 1
+        return transport
+
+    async def _destroy_transport(self, transport) -> None:
+        self.stats.connections_destroyed += 1
+        await transport.aclose()
+
+    def _is_stale(self, transport: Transport) -> bool:
+        now = trio.current_time()
+        if self.max_lifetime is not None and now - transport.created_on >= self.max_lifetime:
+            return True
+        if self.idle_timeout is not None and now - transport.last_recv >= self.idle_timeout:
+            return True
+        return False
+
+    async def _check_transport(self, transport: Transport) -> bool:
+        """
+        Ping the connection if it has been idle for too long.
+
+        Returns: False if the connection is stale or dead, in which case it is closed.
+        """
+        if not self._is_stale(transport):
+            if self.keepalive is None or trio.current_time() - transport.last_recv < self.keepalive:
+                return True
+
+            with trio.move_on_after(self.PING_TIMEOUT):
+                try:
+                    await transport.ping()
+                    return True
+
+                except TransportError as exc:
+                    transport.logger.info("Idle connection lost", reason=exc)
+
+        await self._destroy_transport(transport)
+        return False
+
+    async def _get_multiplexed_transport(self) -> MultiplexedTransport:
+        async with self._connect_lock:
+            transport = self.multiplexed_transport
+            if not transport or transport.closed:
+                if self._closed:
+                    raise trio.ClosedResourceError()
+                if transport:
+                    self.stats.connections_destroyed += 1
+
+                raw_transport = await self._create_transport()
+                transport = MultiplexedTransport(raw_transport, self._max)
+                await self._nursery.start(transport.run)
+                self.multiplexed_transport = transport
+
+            return transport
+
+    def _record_acquire(self, started: float) -> None:
+        wait = trio.current_time() - started
+        self.stats.acquired += 1
+        self.stats.acquire_wait_total += wait
+        self.stats.acquire_wait_max = max(self.stats.acquire_wait_max, wait)
 
     @asynccontextmanager
     async def acquire(self, force_fresh=False):
+        started = trio.current_time()
+        if self.multiplexed:
+            # The connection is shared, hence it is only replaced once it is
+            # closed (no matter `force_fresh`)
+            transport = await self._get_multiplexed_transport()
+            self._record_acquire(started)
+            yield transport
+            return
+
         async with self._lock:
             transport = None
             if not force_fresh:
-                try:
-                    transport = self.transports.pop()
-                except IndexError:
-                    pass
+                # Most recently used connections are the most likely to be alive
+                while self.transports and not transport:
+                    candidate = self.transports.pop()
+                    if await self._check_transport(candidate):
+                        transport = candidate
 
             if not transport:
                 if self._closed:
                     raise trio.ClosedResourceError()
 
-                transport = await _connect(self.addr, self.device_id, self.signing_key)
-                transport.logger = transport.logger.bind(device_id=self.device_id)
+                transport = await self._create_transport()
+            self._record_acquire(started)
 
             try:
                 yield transport
 
             except TransportClosedByPeer:
+                self.stats.connections_destroyed += 1
                 raise
 
             except Exception:
-                await transport.aclose()
+                await self._destroy_transport(transport)
                 raise
 
             else:
                 self.transports.append(transport)
 
+    async def _warm_up(self) -> None:
+        try:
+            if self.multiplexed:
+                if self._min > 0:
+                    await self._get_multiplexed_transport()
+                return
+
+            in_use = self._max - self._lock.value
+            while not self._closed and len(self.transports) + in_use < self._min:
+                self.transports.insert(0, await self._create_transport())
+
+        except (BackendNotAvailable, BackendHandshakeError) as exc:
+            # Will retry at next maintenance
+            logger.debug("Cannot warm up connections", reason=exc)
+
+    async def _check_idle_transports(self) -> None:
+        if self.multiplexed:
+            transport = self.multiplexed_transport
+            # A connection with requests in progress is obviously not idle
+            if not transport or transport.closed or transport.in_use:
+                return
+
+            if self._is_stale(transport.transport):
+                await transport.aclose()
+                return
+
+            if (
+                self.keepalive is not None
+                and trio.current_time() - transport.transport.last_recv >= self.keepalive
+            ):
+                pinged_on = trio.current_time()
+                try:
+                    await transport.transport.send_ping()
+                except TransportError:
+                    await transport.aclose()
+                    return
+
+                # The pong is received by the task reading the replies
+                await trio.sleep(self.PING_TIMEOUT)
+                if transport.transport.last_recv < pinged_on and not transport.closed:
+                    transport.logger.info("Idle connection lost (no pong received)")
+                    await transport.aclose()
+            return
+
+        # Connections being checked are taken out of the pool so that they
+        # cannot be acquired in the meantime
+        idle, self.transports = self.transports, []
+        alive = []
+        try:
+            while idle:
+                transport = idle.pop(0)
+                if await self._check_transport(transport):
+                    alive.append(transport)
+
+        finally:
+            # Oldest connections first, as in the pool
+            self.transports = alive + idle + self.transports
+        while len(self.transports) > self._max:
+            await self._destroy_transport(self.transports.pop(0))
+
+    async def maintain(self, *, task_status=trio.TASK_STATUS_IGNORED) -> None:
+        """
+        Warm up the connections, then periodically check the idle ones.
+        """
+        with trio.open_cancel_scope() as self._maintenance_cancel_scope:
+            task_status.started()
+            intervals = [x for x in (self.keepalive, self.idle_timeout, self.max_lifetime) if x]
+            await self._warm_up()
+            if not intervals:
+                return
+
+            while True:
+                await trio.sleep(min(intervals))
+                await self._check_idle_transports()
+                await self._warm_up()
+
 
 @asynccontextmanager
 async def transport_pool_factory(
-    addr: BackendAddr, device_id: DeviceID, signing_key: SigningKey, max: int = 4
+    addr: BackendAddr,
+    device_id: DeviceID,
+    signing_key: SigningKey,
+    max: int = 4,
+    multiplexed: bool = False,
+    min: int = 0,
+    keepalive: float = None,
+    idle_timeout: float = None,
+    max_lifetime: float = None,
+    compressions: Iterable[str] = (),
+    session_resumption: bool = False,
 ) -> TransportPool:
-    pool = TransportPool(addr, device_id, signing_key, max)
-    try:
-        yield pool
-
-    finally:
-        pool._closed = True
-        async with trio.open_nursery() as nursery:
-            for transport in pool.transports:
-                nursery.start_soon(transport.aclose)
+    pool = TransportPool(
+        addr,
+        device_id,
+        signing_key,
+        max,
+        multiplexed,
+        min=min,
+        keepalive=keepalive,
+        idle_timeout=idle_timeout,
+        max_lifetime=max_lifetime,
+        compressions=compressions,
+        session_resumption=session_resumption,
+    )
+    # Nursery for the tasks reading the replies of the multiplexed connections
+    # and maintaining the connections
+    async with trio.open_nursery() as nursery:
+        pool._nursery = nursery
+        try:
+            if min or keepalive or idle_timeout or max_lifetime:
+                await nursery.start(pool.maintain)
+            yield pool
+
+        finally:
+            pool._closed = True
+            if pool._maintenance_cancel_scope:
+                pool._maintenance_cancel_scope.cancel()
+            async with trio.open_nursery() as close_nursery:
+                for transport in pool.transports:
+                    close_nursery.start_soon(transport.aclose)
+                if pool.multiplexed_transport:
+                    close_nursery.start_soon(pool.multiplexed_transport.aclose)
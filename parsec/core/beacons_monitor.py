@@ -1,6 +1,8 @@
 import trio
 from structlog import get_logger
 
+from parsec.core.backend_connection import BackendNotAvailable
+
 
 logger = get_logger()
 
@@ -10,17 +12,58 @@ logger = get_logger()
 
 
 async def monitor_beacons(device, fs, event_bus, *, task_status=trio.TASK_STATUS_IGNORED):
+    # Index of the last beacon item processed for each listened beacon, this
+    # allow to only replay the items missed while the event listener was
+    # down instead of checking the whole tree on reconnection.
+    beacons_offsets = {}
+    listener_restarted = trio.Event()
+
+    def _listen_beacon(beacon_id):
+        if beacon_id not in beacons_offsets:
+            # Start from the items already processed by the last full sync
+            # TODO: stop using private attribute `fs._local_folder_fs`
+            sync_journal = fs._local_folder_fs.sync_journal
+            beacons_offsets[beacon_id] = sync_journal.get_beacon_offset(beacon_id)
+        event_bus.send("backend.beacon.listen", beacon_id=beacon_id)
+
+    async def _catch_up_beacons():
+        for beacon_id, offset in list(beacons_offsets.items()):
+            try:
+                outdated_entries, new_offset = await fs.get_beacon_outdated_entries(
+                    beacon_id, offset
+                )
+            except BackendNotAvailable:
+                # Listener is going to be restarted once the backend is back
+                return
+            if beacon_id not in beacons_offsets:
+                # Beacon has been unlistened in the meantime
+                continue
+            beacons_offsets[beacon_id] = max(beacons_offsets[beacon_id], new_offset)
+            for entry_id in outdated_entries:
+                logger.debug(
+                    "Beacon catch up notifies entry update", beacon_id=beacon_id, src_id=entry_id
+                )
+                event_bus.send("fs.entry.updated", id=entry_id)
+
     # TODO: stop using private attribute `fs._local_folder_fs`
     for beacon_id in fs._local_folder_fs.get_local_beacons():
-        event_bus.send("backend.beacon.listen", beacon_id=beacon_id)
+        _listen_beacon(beacon_id)
 
     def _on_workspace_loaded(sender, path, id):
-        event_bus.send("backend.beacon.listen", beacon_id=id)
+        _listen_beacon(id)
 
     def _on_workspace_unloaded(sender, path, id):
+        beacons_offsets.pop(id, None)
         event_bus.send("backend.beacon.unlisten", beacon_id=id)
 
+    def _on_listener_restarted(sender):
+        listener_restarted.set()
+
     def _on_beacon_updated(sender, beacon_id, index, src_id, src_version):
+        if beacon_id in beacons_offsets:
+            # Index is the offset of the item following this one
+            beacons_offsets[beacon_id] = max(beacons_offsets[beacon_id], index)
+
         workspace_path = _retreive_workspace_from_beacon(device, fs, beacon_id)
         if not workspace_path:
             # This workspace is not present in our local cache, nothing
@@ -39,9 +82,13 @@ async def monitor_beacons(device, fs, event_bus, *, task_status=trio.TASK_STATUS
     event_bus.connect("fs.workspace.loaded", _on_workspace_loaded, weak=True)
     event_bus.connect("fs.workspace.unloaded", _on_workspace_unloaded, weak=True)
     event_bus.connect("backend.beacon.updated", _on_beacon_updated, weak=True)
+    event_bus.connect("backend.listener.restarted", _on_listener_restarted, weak=True)
 
     task_status.started()
-    await trio.sleep_forever()
+    while True:
+        await listener_restarted.wait()
+        listener_restarted.clear()
+        await _catch_up_beacons()
 
 
 def _retreive_workspace_from_beacon(device, fs, beacon_id):
@@ -6,6 +6,7 @@ from pathlib import Path
 
 from parsec.types import DeviceID
 from parsec.logging import configure_logging, configure_sentry_logging
+from parsec.api.trace import configure_protocol_trace
 from parsec.core.config import get_default_config_dir, load_config
 from parsec.core.devices_manager import (
     get_cipher_info,
@@ -38,6 +39,12 @@ def core_config_options(fn):
     @click.option("--log-format", "-f", default="CONSOLE", type=click.Choice(("CONSOLE", "JSON")))
     @click.option("--log-file", "-o")
     @click.option("--log-filter", default=None)
+    @click.option(
+        "--log-trace-rate",
+        default=None,
+        type=click.FloatRange(0, 1),
+        help="Sample rate of the protocol trace logged at DEBUG level (e.g. 0.01, default: disabled)",
+    )
     @wraps(fn)
     def wrapper(config_dir, *args, **kwargs):
         assert "config" not in kwargs
@@ -56,6 +63,7 @@ def core_config_options(fn):
         configure_logging(
             kwargs["log_level"], kwargs["log_format"], kwargs["log_file"], kwargs["log_filter"]
         )
+        configure_protocol_trace(kwargs["log_trace_rate"])
 
         config_dir = Path(config_dir) if config_dir else get_default_config_dir(os.environ)
         config = load_config(config_dir, debug="DEBUG" in os.environ)
@@ -53,11 +53,45 @@ class CoreConfig:
     debug: bool = False
     backend_watchdog: int = 0
     backend_max_connections: int = 4
+    # Share a single connection between the commands instead of a pool of
+    # connections (`backend_max_connections` being then the number of
+    # concurrent requests on it), this requires a backend supporting it
+    backend_multiplexed: bool = False
+    # Connections opened ahead of the requests
+    backend_min_connections: int = 1
+    # Idle connections are pinged every `backend_connection_keepalive` seconds
+    # (detecting the dead ones and preventing NAT timeouts), then closed after
+    # `backend_connection_idle_timeout` seconds, while connections older than
+    # `backend_connection_max_lifetime` seconds are renewed (None to disable)
+    backend_connection_keepalive: Optional[int] = 30
+    backend_connection_idle_timeout: Optional[int] = 600
+    backend_connection_max_lifetime: Optional[int] = 3600
+    # Compress the manifests and blocks if the backend supports it, clients
+    # not supporting compression being unable to read them
+    backend_compression: bool = False
+    # Resume the previous session when reconnecting to a wss backend instead of
+    # answering its challenge, this requires a backend supporting it
+    backend_session_resumption: bool = False
+    # Stream the blocks over the connection instead of packing them into the
+    # messages, this requires a backend supporting it
+    backend_streaming: bool = False
 
     invitation_token_size: int = 8
 
     mountpoint_enabled: bool = False
 
+    # Only re-upload the modified parts of the files instead of whole aligned blocks
+    delta_sync: bool = False
+
+    # Split the manifests of the big folders into shards when uploading them,
+    # clients not supporting it being unable to read those folders
+    folder_sharding: bool = False
+
+    # Upload the changes of the big folders as deltas of their previous
+    # version, this requires a backend supporting it and clients not
+    # supporting it are unable to read those folders
+    manifest_deltas: bool = False
+
     sentry_url: Optional[str] = None
 
     ssl_keyfile: Optional[str] = None
@@ -75,6 +109,17 @@ def config_factory(
     mountpoint_enabled: bool = False,
     backend_watchdog: int = 0,
     backend_max_connections: int = 4,
+    backend_multiplexed: bool = False,
+    backend_min_connections: int = 1,
+    backend_connection_keepalive: Optional[int] = 30,
+    backend_connection_idle_timeout: Optional[int] = 600,
+    backend_connection_max_lifetime: Optional[int] = 3600,
+    backend_compression: bool = False,
+    backend_session_resumption: bool = False,
+    backend_streaming: bool = False,
+    delta_sync: bool = False,
+    folder_sharding: bool = False,
+    manifest_deltas: bool = False,
     debug: bool = False,
     ssl_keyfile: str = None,
     ssl_certfile: str = None,
@@ -87,6 +132,18 @@ def config_factory(
         mountpoint_base_dir=mountpoint_base_dir or get_default_mountpoint_base_dir(environ),
         debug=debug,
         backend_watchdog=backend_watchdog,
+        backend_max_connections=backend_max_connections,
+        backend_multiplexed=backend_multiplexed,
+        backend_min_connections=backend_min_connections,
+        backend_connection_keepalive=backend_connection_keepalive,
+        backend_connection_idle_timeout=backend_connection_idle_timeout,
+        backend_connection_max_lifetime=backend_connection_max_lifetime,
+        backend_compression=backend_compression,
+        backend_session_resumption=backend_session_resumption,
+        backend_streaming=backend_streaming,
+        delta_sync=delta_sync,
+        folder_sharding=folder_sharding,
+        manifest_deltas=manifest_deltas,
         ssl_keyfile=ssl_keyfile,
         ssl_certfile=ssl_certfile,
         sentry_url=environ.get("SENTRY_URL") or None,
@@ -139,6 +196,12 @@ def save_config(config: CoreConfig):
                 "cache_base_dir": str(config.cache_base_dir),
                 "mountpoint_base_dir": str(config.mountpoint_base_dir),
                 "backend_watchdog": config.backend_watchdog,
+                "backend_compression": config.backend_compression,
+                "backend_session_resumption": config.backend_session_resumption,
+                "backend_streaming": config.backend_streaming,
+                "delta_sync": config.delta_sync,
+                "folder_sharding": config.folder_sharding,
+                "manifest_deltas": config.manifest_deltas,
                 "sentry_url": config.sentry_url,
             }
         )
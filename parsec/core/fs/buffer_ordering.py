@@ -334,6 +334,77 @@ def merge_buffers_with_limits_and_alignment(buffers, start, end, block_size):
     return UncontiguousSpace(start, end, splitted_spaces)
 
 
+def merge_buffers_with_limits_and_reuse(buffers, start, end, block_size, is_reusable):
+    """
+    Flatten multiple (possibly overlapping) buffers between the given bounds,
+    keeping verbatim the reusable buffers that are still fully visible and
+    splitting the remaining data in multiples :class:`ContiguousSpace` of at
+    most block_size size.
+
+    Unlike :func:`merge_buffers_with_limits_and_alignment`, the returned
+    spaces are not aligned on block_size, this allows to only repack the
+    parts that really changed. However reusable buffers smaller than a
+    quarter of block_size are repacked along with the data next to them if
+    it has to be repacked anyway, otherwise small modifications (typically
+    appends) would end up as many tiny buffers.
+
+    Args:
+        buffers: list of :class:`Buffer` to merge. Gaps between those buffers
+                 are padded with :class:`NullFillerBuffer` buffers.
+        start: starting offset, everything before will be ignored.
+        end: ending offset, everything after will be ignored.
+        block_size: maximum size of a repacked :class:`ContiguousSpace`
+        is_reusable: predicate telling if a buffer can be kept verbatim
+
+    Returns:
+        An :class:`UncontiguousSpace` where each reused buffer has it own
+        single-buffer :class:`ContiguousSpace`.
+    """
+    unaligned = merge_buffers(buffers)
+    trimmed = _trim_uncontiguous_space(unaligned, new_start=start, new_end=end)
+
+    # List the buffer spaces in order along with whether they can be reused
+    buffer_spaces = []
+    curr_pos = start
+    for cs in trimmed.spaces:
+        if curr_pos != cs.start:
+            filler = NullFillerBuffer(curr_pos, cs.start)
+            buffer_spaces.append([InBufferSpace(curr_pos, cs.start, filler), False])
+        for bs in cs.buffers:
+            buffer_spaces.append([bs, not bs.slice_needed() and is_reusable(bs.buffer)])
+        curr_pos = cs.end
+
+    # Small reusable buffers next to repacked data (or to other small buffers
+    # next to it) get repacked too
+    min_reused_size = block_size // 4
+    for ordered in (buffer_spaces, reversed(buffer_spaces)):
+        previous_repacked = False
+        for item in ordered:
+            bs, reusable = item
+            if reusable and previous_repacked and bs.size < min_reused_size:
+                item[1] = reusable = False
+            previous_repacked = not reusable
+
+    spaces = []
+    to_repack = []
+
+    def _flush_to_repack():
+        if to_repack:
+            cs = ContiguousSpace(to_repack[0].start, to_repack[-1].end, to_repack.copy())
+            spaces.extend(_split_aligned_contiguous_space(cs, block_size))
+            to_repack.clear()
+
+    for bs, reusable in buffer_spaces:
+        if reusable:
+            _flush_to_repack()
+            spaces.append(ContiguousSpace(bs.start, bs.end, [bs]))
+        else:
+            to_repack.append(bs)
+    _flush_to_repack()
+
+    return UncontiguousSpace(start, end, spaces)
+
+
 def quick_filter_block_accesses(block_entries, start, end):
     """
     Filter a list of block accesses to only return the ones fitting in the
@@ -0,0 +1,82 @@
+from random import Random
+from typing import List, Tuple
+
+
+__all__ = ("FIXED_CHUNKING", "CONTENT_DEFINED_CHUNKING", "CHUNKINGS", "content_defined_chunks")
+
+
+FIXED_CHUNKING = "fixed"
+CONTENT_DEFINED_CHUNKING = "content_defined"
+CHUNKINGS = (FIXED_CHUNKING, CONTENT_DEFINED_CHUNKING)
+
+
+# Gear table must be the same for all the clients, otherwise they would
+# end up with different boundaries for the same data
+_GEAR_RANDOM = Random(0x9A25EC)
+_GEAR = tuple(_GEAR_RANDOM.getrandbits(64) for _ in range(256))
+del _GEAR_RANDOM
+_MASK_64 = 2 ** 64 - 1
+
+
+def _build_mask(bits: int) -> int:
+    # Spread the mask bits over the upper part of the fingerprint given
+    # those are the ones depending on the more bytes in the gear hash
+    return ((1 << bits) - 1) << (64 - bits)
+
+
+def content_defined_chunks(data: bytes, avg_size: int) -> List[Tuple[int, int]]:
+    """
+    Split data into chunks whose boundaries depends on the data itself
+    (FastCDC-style gear rolling hash with normalized chunking).
+
+    Given a boundary only depends on the few bytes preceding it, inserting
+    or removing data only modifies the chunks around the modification.
+
+    Args:
+        data: data to split
+        avg_size: expected average size of the chunks, chunks are at
+                  least a quarter and at most four times this size.
+
+    Returns:
+        A list of (start, end) tuples covering the whole data.
+    """
+    min_size = max(avg_size // 4, 1)
+    max_size = avg_size * 4
+    bits = max(avg_size.bit_length() - 1, 1)
+    # Harder to cut before average size, easier after it
+    mask_small = _build_mask(bits + 1)
+    mask_large = _build_mask(max(bits - 1, 1))
+    gear = _GEAR
+
+    chunks = []
+    start = 0
+    data_size = len(data)
+    while start < data_size:
+        remaining = data_size - start
+        if remaining <= min_size:
+            chunks.append((start, data_size))
+            break
+
+        normal_end = start + min(avg_size, remaining)
+        hard_end = start + min(max_size, remaining)
+        end = hard_end
+        fingerprint = 0
+        i = start + min_size
+        while i < normal_end:
+            fingerprint = ((fingerprint << 1) + gear[data[i]]) & _MASK_64
+            i += 1
+            if not fingerprint & mask_small:
+                end = i
+                break
+        else:
+            while i < hard_end:
+                fingerprint = ((fingerprint << 1) + gear[data[i]]) & _MASK_64
+                i += 1
+                if not fingerprint & mask_large:
+                    end = i
+                    break
+
+        chunks.append((start, end))
+        start = end
+
+    return chunks
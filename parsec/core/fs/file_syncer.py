@@ -4,11 +4,16 @@ from typing import List
 from structlog import get_logger
 
 from parsec.core.fs.merge_folders import find_conflicting_name_for_child_entry
-from parsec.core.fs.buffer_ordering import merge_buffers_with_limits_and_alignment
+from parsec.core.fs.buffer_ordering import (
+    merge_buffers_with_limits_and_alignment,
+    merge_buffers_with_limits_and_reuse,
+    ContiguousSpace,
+)
 from parsec.core.fs.local_folder_fs import mark_manifest_modified
 from parsec.core.fs.local_file_fs import Buffer, DirtyBlockBuffer, BlockBuffer, NullFillerBuffer
 from parsec.core.fs.sync_base import SyncConcurrencyError, BaseSyncer
-from parsec.core.fs.types import LocalFileManifest, RemoteFileManifest, Path, Access
+from parsec.core.fs.chunking import CONTENT_DEFINED_CHUNKING, content_defined_chunks
+from parsec.core.fs.types import LocalFileManifest, RemoteFileManifest, Path, Access, BlockAccess
 from parsec.core.fs.utils import (
     is_file_manifest,
     new_access,
@@ -45,7 +50,7 @@ def fast_forward_file(
     return LocalFileManifest(merged)
 
 
-def get_sync_map(manifest, block_size: int) -> List[Buffer]:
+def get_sync_map(manifest, block_size: int, delta: bool = False) -> List[Buffer]:
     dirty_blocks: List[Buffer] = [
         DirtyBlockBuffer(x["offset"], x["offset"] + x["size"], x) for x in manifest["dirty_blocks"]
     ]
@@ -53,11 +58,30 @@ def get_sync_map(manifest, block_size: int) -> List[Buffer]:
         BlockBuffer(x["offset"], x["offset"] + x["size"], x) for x in manifest["blocks"]
     ]
 
+    if delta:
+        # Keep remote blocks untouched by the dirty blocks no matter their
+        # alignment, only the modified ranges will be repacked
+        return merge_buffers_with_limits_and_reuse(
+            blocks + dirty_blocks, 0, manifest["size"], block_size, _is_block_buffer
+        )
+
     return merge_buffers_with_limits_and_alignment(
         blocks + dirty_blocks, 0, manifest["size"], block_size
     )
 
 
+def _is_block_buffer(buffer: Buffer) -> bool:
+    return isinstance(buffer, BlockBuffer)
+
+
+def _is_reusable_space(cs: ContiguousSpace) -> bool:
+    # A remote block is reusable if it is taken entirely and at the same offset
+    if len(cs.buffers) != 1:
+        return False
+    bs = cs.buffers[0]
+    return isinstance(bs.buffer, BlockBuffer) and not bs.slice_needed()
+
+
 class FileSyncerMixin(BaseSyncer):
     async def _build_data_from_contiguous_space(self, cs):
         data = bytearray(cs.size)
@@ -111,7 +135,7 @@ class FileSyncerMixin(BaseSyncer):
         diverged_manifest["is_placeholder"] = True
 
         self.local_folder_fs.set_manifest(moved_access, diverged_manifest)
-        self.local_folder_fs.set_manifest(parent_access, parent_manifest)
+        self.local_folder_fs.set_manifest(parent_access, parent_manifest, [moved_name])
         target_manifest = remote_to_local_manifest(target_remote_manifest)
         self.local_folder_fs.set_manifest(access, target_manifest)
 
@@ -150,17 +174,8 @@ class FileSyncerMixin(BaseSyncer):
             self.local_folder_fs.set_manifest(access, target_local_manifest)
         return True
 
-    async def _sync_file_actual_sync(
-        self, path: Path, access: Access, manifest: LocalFileManifest
-    ) -> None:
-        assert is_file_manifest(manifest)
-
-        to_sync_manifest = local_to_remote_manifest(manifest)
-        to_sync_manifest["version"] += 1
-
-        # Compute the file's blocks and upload the new ones
-        blocks = []
-        sync_map = get_sync_map(manifest, self.block_size)
+    async def _sync_file_upload_blocks(self, manifest: LocalFileManifest) -> List[BlockAccess]:
+        sync_map = get_sync_map(manifest, self.block_size, self.delta_sync)
 
         # Upload the new blocks
         spaces = sync_map.spaces
@@ -170,14 +185,15 @@ class FileSyncerMixin(BaseSyncer):
             nonlocal blocks
             while spaces:
                 cs = spaces.pop()
-                data = await self._build_data_from_contiguous_space(cs)
-                if not data:
-                    # Already existing blocks taken verbatim
-                    blocks += [bs.buffer.data for bs in cs.buffers]
+                if _is_reusable_space(cs):
+                    # Already existing block taken verbatim
+                    blocks.append(cs.buffers[0].buffer.access)
                 else:
+                    data = await self._build_data_from_contiguous_space(cs)
                     # Create a new block from existing data
                     block_access = new_block_access(data, cs.start)
-                    await self._backend_block_create(block_access, data)
+                    payload = self._build_block_payload(block_access, data)
+                    await self._backend_block_create(block_access, payload)
                     blocks.append(block_access)
 
         if len(spaces) < 2:
@@ -190,8 +206,96 @@ class FileSyncerMixin(BaseSyncer):
                 nursery.start_soon(_process_spaces)
                 nursery.start_soon(_process_spaces)
 
-        to_sync_manifest["blocks"] = blocks
-        to_sync_manifest["size"] = sync_map.size  # TODO: useful ?
+        return blocks
+
+    async def _sync_file_upload_content_defined_blocks(
+        self, manifest: LocalFileManifest
+    ) -> List[BlockAccess]:
+        # Remote blocks untouched by the modifications are kept verbatim,
+        # then the modified ranges are chunked according to their content.
+        # This way data that has only been shifted (e.g. by an insertion) ends
+        # up in the same chunks that can be found back among the remote blocks.
+        sync_map = get_sync_map(manifest, self.block_size, delta=True)
+        known_blocks = {x["digest"]: x for x in manifest["blocks"]}
+        blocks = []
+        ranges_to_chunk = []
+        for cs in sync_map.spaces:
+            if _is_reusable_space(cs):
+                blocks.append(cs.buffers[0].buffer.access)
+            elif ranges_to_chunk and ranges_to_chunk[-1][-1].end == cs.start:
+                ranges_to_chunk[-1].append(cs)
+            else:
+                ranges_to_chunk.append([cs])
+
+        # Chunk boundaries only depend on the data from the start of the chunk
+        # up to the maximum chunk size, hence each modified range is chunked
+        # through a bounded window and the chunks are uploaded as soon as they
+        # are complete instead of loading the whole range in memory
+        max_chunk_size = 4 * self.block_size
+        send_channel, receive_channel = trio.open_memory_channel(4)
+
+        async def _process_uploads():
+            async for block_access, payload in receive_channel:
+                await self._backend_block_create(block_access, payload)
+
+        async def _process_chunk(chunk, offset):
+            block_access = new_block_access(chunk, offset)
+            known_access = known_blocks.get(block_access["digest"])
+            if known_access and known_access["size"] == block_access["size"]:
+                # Same data already in the backend, possibly at another offset
+                block_access = BlockAccess({**known_access, "offset": offset})
+            else:
+                known_blocks[block_access["digest"]] = block_access
+                payload = self._build_block_payload(block_access, chunk)
+                await send_channel.send((block_access, payload))
+            blocks.append(block_access)
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(_process_uploads)
+            nursery.start_soon(_process_uploads)
+            nursery.start_soon(_process_uploads)
+            nursery.start_soon(_process_uploads)
+
+            for contiguous_spaces in ranges_to_chunk:
+                window = bytearray()
+                window_start = contiguous_spaces[0].start
+                last_cs = contiguous_spaces[-1]
+                for cs in contiguous_spaces:
+                    window += await self._build_data_from_contiguous_space(cs)
+                    if cs is not last_cs and len(window) < max_chunk_size:
+                        continue
+
+                    consumed = 0
+                    for chunk_start, chunk_end in content_defined_chunks(window, self.block_size):
+                        # Boundary may still move with the data yet to come
+                        if cs is not last_cs and chunk_start + max_chunk_size > len(window):
+                            break
+                        chunk = window[chunk_start:chunk_end]
+                        await _process_chunk(chunk, window_start + chunk_start)
+                        consumed = chunk_end
+                    del window[:consumed]
+                    window_start += consumed
+
+            await send_channel.aclose()
+
+        return blocks
+
+    async def _sync_file_actual_sync(
+        self, path: Path, access: Access, manifest: LocalFileManifest
+    ) -> None:
+        assert is_file_manifest(manifest)
+
+        to_sync_manifest = local_to_remote_manifest(manifest)
+        to_sync_manifest["version"] += 1
+
+        # Compute the file's blocks and upload the new ones
+        if self.local_folder_fs.get_chunking(path) == CONTENT_DEFINED_CHUNKING:
+            blocks = await self._sync_file_upload_content_defined_blocks(manifest)
+        else:
+            blocks = await self._sync_file_upload_blocks(manifest)
+
+        to_sync_manifest["blocks"] = sorted(blocks, key=lambda x: x["offset"])
+        to_sync_manifest["size"] = manifest["size"]
 
         # Upload the file manifest as new vlob version
         notify_beacons = self.local_folder_fs.get_beacon(path)
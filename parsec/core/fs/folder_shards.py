@@ -0,0 +1,50 @@
+from hashlib import sha256
+from typing import List, Dict, Iterable, Optional
+
+from parsec.core.fs.types import Access, BlockAccess
+
+
+# Number of children a shard is expected to hold
+SHARD_SIZE = 4096
+# Smaller folders are stored as a single manifest
+SHARDING_MIN_CHILDREN = 2 * SHARD_SIZE
+
+
+def get_shards_count(children_count: int) -> int:
+    """
+    Returns: The number of shards to split the children into, or 0 if the
+    folder should not be sharded.
+    """
+    if children_count < SHARDING_MIN_CHILDREN:
+        return 0
+    # Power of two to only change the layout when the size of the folder
+    # changes significantly
+    shards_count = 1
+    while shards_count * SHARD_SIZE < children_count:
+        shards_count *= 2
+    return shards_count
+
+
+def get_shard_index(name: str, shards_count: int) -> int:
+    digest = sha256(name.encode("utf8")).digest()
+    return int.from_bytes(digest[:4], "big") % shards_count
+
+
+def split_children(children: Dict[str, Access], shards_count: int) -> List[Dict[str, Access]]:
+    shards = [{} for _ in range(shards_count)]
+    for name, access in children.items():
+        shards[get_shard_index(name, shards_count)][name] = access
+    return shards
+
+
+def invalidate_shards(
+    shards: List[Optional[BlockAccess]], names: Iterable[str]
+) -> List[Optional[BlockAccess]]:
+    """
+    Returns: The shards with the ones containing `names` set to None, given
+    they no longer match the children.
+    """
+    shards = shards.copy()
+    for name in names:
+        shards[get_shard_index(name, len(shards))] = None
+    return shards
@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, Dict, Set
 from structlog import get_logger
 
 from parsec.core.fs.types import Access, Path, LocalFolderManifest, RemoteFolderManifest
@@ -11,7 +11,6 @@ from parsec.core.fs.utils import (
 )
 from parsec.core.fs.sync_base import SyncConcurrencyError, BaseSyncer
 from parsec.core.fs.merge_folders import merge_local_folder_manifests, merge_remote_folder_manifests
-from parsec.core.fs.local_folder_fs import FSManifestLocalMiss
 
 
 logger = get_logger()
@@ -30,21 +29,32 @@ class FolderSyncerMixin(BaseSyncer):
             return None
         return target_remote_manifest
 
-    def _strip_placeholders(self, children: List[Access]):
-        synced_children = {}
-        for child_name, child_access in children.items():
-            try:
-                child_manifest = self.local_folder_fs.get_manifest(child_access)
-            except FSManifestLocalMiss:
-                # Child not in local, cannot be a placeholder then !
-                synced_children[child_name] = child_access
-            else:
-                if not is_placeholder_manifest(child_manifest):
-                    synced_children[child_name] = child_access
+    def _strip_placeholders(
+        self, access: Access, children: Dict[str, Access], children_changes: Set[str] = None
+    ):
+        # Placeholders are created by local operations, so only the children
+        # modified since the base version have to be checked when known
+        if children_changes is not None:
+            candidates = {name: children[name] for name in children_changes if name in children}
+        else:
+            candidates = children
+        # Rely on the children status table to avoid loading (and copying)
+        # each child manifest just to check it placeholder flag
+        children_status = self.local_folder_fs.get_children_status(access, candidates)
+        synced_children = children.copy()
+        for child_name, child_access in candidates.items():
+            # Child not in local cannot be a placeholder
+            is_placeholder, _ = children_status.get(child_access["id"], (False, False))
+            if is_placeholder:
+                del synced_children[child_name]
         return synced_children
 
     async def _sync_folder_actual_sync(
-        self, path: Path, access: Access, manifest: LocalFolderManifest
+        self,
+        path: Path,
+        access: Access,
+        manifest: LocalFolderManifest,
+        children_changes: Set[str] = None,
     ) -> RemoteFolderManifest:
         to_sync_manifest = local_to_remote_manifest(manifest)
         to_sync_manifest["version"] += 1
@@ -57,7 +67,9 @@ class FolderSyncerMixin(BaseSyncer):
                 if is_placeholder_manifest(manifest) and not force_update:
                     await self._backend_vlob_create(access, to_sync_manifest, notify_beacons)
                 else:
-                    await self._backend_vlob_update(access, to_sync_manifest, notify_beacons)
+                    await self._backend_vlob_update(
+                        access, to_sync_manifest, notify_beacons, children_changes
+                    )
                 break
 
             except SyncConcurrencyError:
@@ -92,9 +104,20 @@ class FolderSyncerMixin(BaseSyncer):
                 target = await self._backend_vlob_read(access)
 
                 # 3-ways merge between base, modified and target versions
+                diverged_changes = children_changes if base else None
                 to_sync_manifest, sync_needed, conflicts = merge_remote_folder_manifests(
-                    base, to_sync_manifest, target
+                    base, to_sync_manifest, target, diverged_changes
                 )
+                # On the next retry, the merge result differs from its base (i.e.
+                # the current target) by the local changes and by the copies of
+                # the conflicted entries, unless they were not known to begin with
+                if diverged_changes is None:
+                    children_changes = None
+                else:
+                    children_changes = {
+                        *diverged_changes,
+                        *(diverged_name for _, _, diverged_name, _ in conflicts),
+                    }
                 for original_name, original_id, diverged_name, diverged_id in conflicts:
                     self.event_bus.send(
                         "fs.entry.name_conflicted",
@@ -125,7 +148,11 @@ class FolderSyncerMixin(BaseSyncer):
         #   may have been updated in the meantime)
 
         # Synchronizing children
+        resolved_entries = []
         if recursive:
+            # Resolving the placeholders in bulk avoid to re-sync this folder
+            # each time one of it children gets resolved
+            resolved_entries = await self._resolve_placeholders_in_children(path, access, manifest)
             for child_name, child_access in sorted(
                 manifest["children"].items(), key=lambda x: x[0]
             ):
@@ -142,7 +169,11 @@ class FolderSyncerMixin(BaseSyncer):
             manifest = self.local_folder_fs.get_manifest(access)
             assert is_folder_manifest(manifest)
 
-        manifest["children"] = self._strip_placeholders(manifest["children"])
+        # Local changes since base version, used to speed up the merges
+        children_changes = self.local_folder_fs.get_children_changes(access)
+        manifest["children"] = self._strip_placeholders(
+            access, manifest["children"], children_changes
+        )
 
         # Now we can synchronize the folder if needed
         if not manifest["need_sync"]:
@@ -151,17 +182,23 @@ class FolderSyncerMixin(BaseSyncer):
             )
             # Quick exit if nothing's new
             if not target_remote_manifest:
+                self._send_resolved_entries_synced(resolved_entries)
                 return
             event_type = "fs.entry.remote_changed"
         else:
-            target_remote_manifest = await self._sync_folder_actual_sync(path, access, manifest)
+            target_remote_manifest = await self._sync_folder_actual_sync(
+                path, access, manifest, children_changes
+            )
             event_type = "fs.entry.synced"
         assert is_folder_manifest(target_remote_manifest)
 
         # Merge the synchronized version with the current one
-        self._sync_folder_merge_back(path, access, manifest, target_remote_manifest)
+        self._sync_folder_merge_back(
+            path, access, manifest, target_remote_manifest, children_changes
+        )
 
         self.event_bus.send(event_type, path=str(path), id=access["id"])
+        self._send_resolved_entries_synced(resolved_entries)
 
     async def _minimal_sync_folder(
         self, path: Path, access: Access, manifest: LocalFolderManifest
@@ -175,7 +212,7 @@ class FolderSyncerMixin(BaseSyncer):
         if not is_placeholder_manifest(manifest):
             return manifest["need_sync"]
 
-        synced_children = self._strip_placeholders(manifest["children"])
+        synced_children = self._strip_placeholders(access, manifest["children"])
         need_more_sync = synced_children.keys() != manifest["children"].keys()
         manifest["children"] = synced_children
 
@@ -191,6 +228,7 @@ class FolderSyncerMixin(BaseSyncer):
         access: Access,
         base_manifest: LocalFolderManifest,
         target_remote_manifest: RemoteFolderManifest,
+        children_changes: Set[str] = None,
     ) -> None:
         # Merge with the current version of the manifest which may have
         # been modified in the meantime
@@ -198,9 +236,15 @@ class FolderSyncerMixin(BaseSyncer):
         current_manifest = self.local_folder_fs.get_manifest(access)
         assert is_folder_manifest(current_manifest)
 
+        # Base manifest is a snapshot without the placeholders, both those
+        # and the changes done since then are part of the changes since base
+        # version (unless the folder has been set as a whole in the meantime)
+        if children_changes is not self.local_folder_fs.get_children_changes(access):
+            children_changes = None
+
         target_manifest = remote_to_local_manifest(target_remote_manifest)
         final_manifest, conflicts = merge_local_folder_manifests(
-            base_manifest, current_manifest, target_manifest
+            base_manifest, current_manifest, target_manifest, children_changes
         )
         for original_name, original_id, diverged_name, diverged_id in conflicts:
             self.event_bus.send(
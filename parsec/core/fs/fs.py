@@ -1,5 +1,6 @@
 import math
 import inspect
+import pendulum
 from uuid import UUID
 
 from parsec.event_bus import EventBus
@@ -15,6 +16,7 @@ from parsec.core.fs.local_file_fs import LocalFileFS, FSBlocksLocalMiss
 from parsec.core.fs.syncer import Syncer
 from parsec.core.fs.sharing import Sharing
 from parsec.core.fs.remote_loader import RemoteLoader
+from parsec.core.fs.history import History
 from parsec.core.fs.types import Path
 
 
@@ -26,6 +28,9 @@ class FS:
         backend_cmds: BackendCmdsPool,
         encryption_manager,
         event_bus: EventBus,
+        delta_sync: bool = False,
+        folder_sharding: bool = False,
+        manifest_deltas: bool = False,
     ):
         self.device = device
         self.local_db = local_db
@@ -34,15 +39,24 @@ class FS:
 
         self._local_folder_fs = LocalFolderFS(device, local_db, event_bus)
         self._local_file_fs = LocalFileFS(device, local_db, self._local_folder_fs, event_bus)
-        self._remote_loader = RemoteLoader(backend_cmds, encryption_manager, local_db)
+        self._remote_loader = RemoteLoader(
+            backend_cmds,
+            encryption_manager,
+            local_db,
+            folder_sharding=folder_sharding,
+            manifest_deltas=manifest_deltas,
+        )
         self._syncer = Syncer(
             device,
             backend_cmds,
             encryption_manager,
+            self._remote_loader,
             self._local_folder_fs,
             self._local_file_fs,
             event_bus,
+            delta_sync=delta_sync,
         )
+        self._history = History(self._local_folder_fs, self._remote_loader, local_db)
         self._sharing = Sharing(
             device,
             backend_cmds,
@@ -124,6 +138,32 @@ class FS:
     async def file_fd_read(self, fd: int, size: int = -1, offset: int = None):
         return await self._load_and_retry(self._local_file_fs.read, fd, size, offset)
 
+    async def history_stat(
+        self, path: str, version: int = None, timestamp: pendulum.Pendulum = None
+    ):
+        cooked_path = Path(path)
+        return await self._load_and_retry(
+            self._history.stat, cooked_path, version=version, timestamp=timestamp
+        )
+
+    async def history_file_read(
+        self,
+        path: str,
+        version: int = None,
+        timestamp: pendulum.Pendulum = None,
+        size: int = math.inf,
+        offset: int = 0,
+    ):
+        cooked_path = Path(path)
+        return await self._load_and_retry(
+            self._history.file_read,
+            cooked_path,
+            version=version,
+            timestamp=timestamp,
+            size=size,
+            offset=offset,
+        )
+
     async def touch(self, path: str):
         cooked_path = Path(path)
         await self._load_and_retry(self._local_folder_fs.touch, cooked_path)
@@ -147,6 +187,12 @@ class FS:
         cooked_dst = Path(dst)
         await self._load_and_retry(self._local_folder_fs.workspace_rename, cooked_src, cooked_dst)
 
+    async def workspace_set_chunking(self, path: str, chunking: str):
+        cooked_path = Path(path)
+        await self._load_and_retry(
+            self._local_folder_fs.workspace_set_chunking, cooked_path, chunking
+        )
+
     async def move(self, src: str, dst: str):
         cooked_src = Path(src)
         cooked_dst = Path(dst)
@@ -174,6 +220,12 @@ class FS:
     async def full_sync(self):
         await self._load_and_retry(self._syncer.full_sync)
 
+    async def get_beacon_outdated_entries(self, beacon_id: UUID, offset: int):
+        assert isinstance(beacon_id, UUID)
+        return await self._load_and_retry(
+            self._syncer.get_beacon_outdated_entries, beacon_id, offset
+        )
+
     async def get_entry_path(self, id: UUID):
         assert isinstance(id, UUID)
         path, _, _ = await self._load_and_retry(self._local_folder_fs.get_entry_path, id)
@@ -0,0 +1,135 @@
+import pendulum
+from math import inf
+
+from parsec.core.local_db import LocalDB, LocalDBMissingEntry
+from parsec.core.backend_connection import BackendCmdsBadResponse
+from parsec.core.fs.utils import is_file_manifest, is_folder_manifest, is_workspace_manifest
+from parsec.core.fs.buffer_ordering import quick_filter_block_accesses, merge_buffers_with_limits
+from parsec.core.fs.local_file_fs import BlockBuffer
+from parsec.core.fs.local_folder_fs import LocalFolderFS
+from parsec.core.fs.remote_loader import RemoteLoader
+from parsec.core.fs.types import Path, Access, RemoteManifest
+
+
+class History:
+    """
+    Read only access to the previous versions of the entries.
+
+    Historical versions of a manifest never change, hence they are kept in
+    the local storage once fetched from the backend. Retrieving the version
+    of a manifest at a given time is done by the backend.
+    """
+
+    def __init__(
+        self, local_folder_fs: LocalFolderFS, remote_loader: RemoteLoader, local_db: LocalDB
+    ):
+        self.local_folder_fs = local_folder_fs
+        self.remote_loader = remote_loader
+        self.local_db = local_db
+
+    async def load_manifest(
+        self, access: Access, version: int = None, timestamp: pendulum.Pendulum = None
+    ) -> RemoteManifest:
+        """
+        Raises:
+            FileNotFoundError: if the entry has no such version
+            BackendConnectionError
+        """
+        try:
+            return await self.remote_loader.read_manifest(access, version, timestamp, cache=True)
+        except BackendCmdsBadResponse as exc:
+            if exc.status in ("not_found", "bad_version"):
+                raise FileNotFoundError(2, "No such file or directory") from exc
+            raise
+
+    async def _retrieve_entry(
+        self, path: Path, version: int = None, timestamp: pendulum.Pendulum = None
+    ) -> RemoteManifest:
+        if timestamp is None:
+            # Only the entry is versioned, the path is resolved in the current tree
+            access = self.local_folder_fs.get_access(path)
+            return await self.load_manifest(access, version)
+
+        # Each entry in the path is retrieved as it was at the given time
+        access = self.local_folder_fs.root_access
+        manifest = await self.load_manifest(access, timestamp=timestamp)
+        _, *hops = path.walk_to_path()
+        for hop in hops:
+            if not is_folder_manifest(manifest):
+                raise NotADirectoryError(20, "Not a directory", str(hop.parent))
+            try:
+                access = manifest["children"][hop.name]
+            except KeyError:
+                raise FileNotFoundError(2, "No such file or directory", str(hop))
+            manifest = await self.load_manifest(access, timestamp=timestamp)
+
+        if version is not None and manifest["version"] != version:
+            manifest = await self.load_manifest(access, version)
+        return manifest
+
+    async def stat(
+        self, path: Path, version: int = None, timestamp: pendulum.Pendulum = None
+    ) -> dict:
+        manifest = await self._retrieve_entry(path, version, timestamp)
+        if is_file_manifest(manifest):
+            return {
+                "type": "file",
+                "is_folder": False,
+                "created": manifest["created"],
+                "updated": manifest["updated"],
+                "version": manifest["version"],
+                "author": manifest["author"],
+                "size": manifest["size"],
+            }
+        else:
+            if is_workspace_manifest(manifest):
+                entry_type = "workspace"
+            else:
+                entry_type = "root" if path.is_root() else "folder"
+            return {
+                "type": entry_type,
+                "is_folder": True,
+                "created": manifest["created"],
+                "updated": manifest["updated"],
+                "version": manifest["version"],
+                "author": manifest["author"],
+                "children": list(sorted(manifest["children"].keys())),
+            }
+
+    async def file_read(
+        self,
+        path: Path,
+        version: int = None,
+        timestamp: pendulum.Pendulum = None,
+        size: int = inf,
+        offset: int = 0,
+    ) -> bytes:
+        manifest = await self._retrieve_entry(path, version, timestamp)
+        if not is_file_manifest(manifest):
+            raise IsADirectoryError(21, "Is a directory", str(path))
+
+        start = offset
+        end = min(offset + size, manifest["size"])
+        if start >= end:
+            return b""
+
+        blocks = [
+            BlockBuffer(*x) for x in quick_filter_block_accesses(manifest["blocks"], start, end)
+        ]
+        merged = merge_buffers_with_limits(blocks, start, end)
+
+        data = bytearray(end - start)
+        for cs in merged.spaces:
+            for bs in cs.buffers:
+                if not isinstance(bs.buffer, BlockBuffer):
+                    continue
+                access = bs.buffer.access
+                try:
+                    buff = self.local_db.get(access)
+                except LocalDBMissingEntry:
+                    await self.remote_loader.load_block(access)
+                    buff = self.local_db.get(access)
+                data[bs.start - start : bs.end - start] = buff[
+                    bs.buffer_slice_start : bs.buffer_slice_end
+                ]
+        return data
@@ -1,11 +1,17 @@
 from uuid import UUID
-from typing import List, Tuple
+from hashlib import sha256
+from typing import List, Tuple, Optional, Dict, Set, Iterable
 import pendulum
 
 from parsec.event_bus import EventBus
 from parsec.core.types import LocalDevice
 from parsec.core.local_db import LocalDB, LocalDBMissingEntry
-from parsec.core.schemas import dumps_manifest, loads_manifest
+from parsec.core.schemas import (
+    dumps_manifest,
+    loads_manifest,
+    dumps_manifest_shard,
+    loads_manifest_shard,
+)
 from parsec.core.fs.utils import (
     is_file_manifest,
     is_folder_manifest,
@@ -18,6 +24,10 @@ from parsec.core.fs.utils import (
     copy_manifest,
 )
 from parsec.core.fs.types import Path, Access, LocalManifest, LocalUserManifest
+from parsec.core.fs.chunking import FIXED_CHUNKING, CHUNKINGS
+from parsec.core.fs.sync_journal import SyncJournal
+from parsec.core.fs.merge_folders import get_children_changes
+from parsec.core.fs.folder_shards import get_shards_count, get_shard_index, split_children
 
 
 def mark_manifest_modified(manifest: LocalManifest):
@@ -48,6 +58,25 @@ class LocalFolderFS:
         self._local_db = local_db
         self.event_bus = event_bus
         self._manifests_cache = {}
+        self.sync_journal = SyncJournal(device, local_db)
+        # Reverse index used to retrieve an entry's path from it id. It is
+        # built from the folder manifests present in the cache, children of
+        # those which are not in the cache yet are kept as entries to explore.
+        self._entries_parent = {}
+        self._folders_children = {}
+        self._entries_to_explore = {}
+        # Placeholder and need sync flags of the children of each folder,
+        # this way checking the children doesn't require to load them.
+        self._children_status = {}
+        # Names of the children modified by local operations since the base
+        # version of each folder, None if unknown (e.g. folder merged while
+        # containing local changes). This allows to merge big folders without
+        # comparing all their children.
+        self._children_changes = {}
+        # Children of the big folders are stored in shards (see
+        # `parsec.core.fs.folder_shards`), those are kept to only rewrite
+        # the ones containing the modified children.
+        self._local_shards = {}
 
     def get_local_beacons(self) -> List[UUID]:
         # beacon_id is either the id of the user manifest or of a workpace manifest
@@ -98,7 +127,15 @@ class LocalFolderFS:
                 raise FSManifestLocalMiss(access) from exc
         else:
             manifest = loads_manifest(raw)
+            shards_count = manifest.pop("shards", None)
+            if shards_count:
+                self._load_local_shards(access, manifest, shards_count)
+        # Manifest may have been fetched from the backend
+        self.sync_journal.update_entry(access, manifest)
         self._manifests_cache[access["id"]] = manifest
+        self._update_children_changes(access, manifest)
+        self._index_manifest(access, manifest)
+        self._update_entry_status(access, manifest)
         # TODO: shouldn't be processed in multiple places like this...
         if is_workspace_manifest(manifest):
             path, *_ = self.get_entry_path(access["id"])
@@ -118,19 +155,278 @@ class LocalFolderFS:
     def get_manifest(self, access: Access) -> LocalManifest:
         return copy_manifest(self._get_manifest_read_only(access))
 
-    def set_manifest(self, access: Access, manifest: LocalManifest):
-        raw = dumps_manifest(manifest)
-        self._local_db.set(access, raw, False)
+    def set_manifest(
+        self, access: Access, manifest: LocalManifest, changed_children: Iterable[str] = None
+    ):
+        """
+        Args:
+            changed_children: names of the children modified since the previous
+                              version of the manifest, None if it is set as a
+                              whole (e.g. merged by the sync)
+        """
+        old_manifest = self._manifests_cache.get(access["id"])
+        modified_children = None
+        if (
+            is_folder_manifest(manifest)
+            and old_manifest is not None
+            and old_manifest is not manifest
+            and is_folder_manifest(old_manifest)
+        ):
+            if changed_children is None:
+                modified_children = get_children_changes(
+                    old_manifest["children"], manifest["children"]
+                )
+            else:
+                modified_children = set(changed_children)
+        self._store_manifest(access, manifest, modified_children)
         self._manifests_cache[access["id"]] = copy_manifest(manifest)
+        self._update_children_changes(access, manifest, changed_children)
+        self._index_manifest(access, manifest, old_manifest, modified_children)
+        self._update_entry_status(access, manifest)
+        self.sync_journal.update_entry(access, manifest)
+
+    def _build_shard_access(self, access: Access, index: int) -> Access:
+        shard_id = sha256(f"{access['id']}:shard:{index}".encode("utf8")).hexdigest()
+        return {"id": shard_id, "key": access["key"]}
+
+    def _load_local_shards(self, access: Access, manifest: LocalManifest, shards_count: int):
+        shards = []
+        for index in range(shards_count):
+            try:
+                raw = self._local_db.get(self._build_shard_access(access, index))
+            except LocalDBMissingEntry as exc:
+                raise FSManifestLocalMiss(access) from exc
+            shards.append(loads_manifest_shard(raw)["children"])
+        manifest["children"] = {name: x for shard in shards for name, x in shard.items()}
+        self._local_shards[access["id"]] = shards
+
+    def _store_manifest(
+        self, access: Access, manifest: LocalManifest, modified_children: Set[str] = None
+    ):
+        shards_count = (
+            get_shards_count(len(manifest["children"])) if is_folder_manifest(manifest) else 0
+        )
+        shards = self._local_shards.pop(access["id"], None)
+        old_shards_count = len(shards) if shards else 0
+        if not shards_count:
+            raw = dumps_manifest(manifest)
+            self._local_db.set(access, raw, False)
+            self._clear_local_shards(access, 0, old_shards_count)
+            return
+
+        if shards and len(shards) == shards_count and modified_children is not None:
+            # Only rewrite the shards containing the modified children
+            children = manifest["children"]
+            modified_shards = set()
+            for name in modified_children:
+                index = get_shard_index(name, shards_count)
+                try:
+                    shards[index][name] = children[name]
+                except KeyError:
+                    shards[index].pop(name, None)
+                modified_shards.add(index)
+        else:
+            shards = split_children(manifest["children"], shards_count)
+            modified_shards = range(shards_count)
+        self._local_shards[access["id"]] = shards
+
+        # Shards are written first so that the manifest never references
+        # missing ones
+        for index in modified_shards:
+            raw = dumps_manifest_shard(
+                {"format": 1, "type": "folder_manifest_shard", "children": shards[index]}
+            )
+            self._local_db.set(self._build_shard_access(access, index), raw, False)
+        raw = dumps_manifest({**manifest, "children": {}, "shards": shards_count})
+        self._local_db.set(access, raw, False)
+        self._clear_local_shards(access, shards_count, old_shards_count)
+
+    def _clear_local_shards(self, access: Access, start: int, stop: int):
+        for index in range(start, stop):
+            try:
+                self._local_db.clear(self._build_shard_access(access, index))
+            except LocalDBMissingEntry:
+                pass
 
-    def update_manifest(self, access: Access, manifest: LocalManifest):
+    def update_manifest(
+        self, access: Access, manifest: LocalManifest, changed_children: Iterable[str] = None
+    ):
         mark_manifest_modified(manifest)
-        self.set_manifest(access, manifest)
+        self.set_manifest(access, manifest, changed_children)
         self._manifests_cache[access["id"]] = copy_manifest(manifest)
 
     def mark_outdated_manifest(self, access: Access):
         self._local_db.clear(access)
+        self._clear_local_shards(access, 0, len(self._local_shards.pop(access["id"], ())))
         self._manifests_cache.pop(access["id"], None)
+        self._children_changes.pop(access["id"], None)
+        self._unindex_manifest(access)
+        try:
+            parent_id, *_ = self._entries_parent[access["id"]]
+            self._children_status[parent_id].pop(access["id"], None)
+        except KeyError:
+            pass
+        self.sync_journal.remove_entry(access["id"])
+
+    def _index_manifest(
+        self,
+        access: Access,
+        manifest: LocalManifest,
+        old_manifest: LocalManifest = None,
+        modified_children: Set[str] = None,
+    ):
+        entry_id = access["id"]
+        self._entries_to_explore.pop(entry_id, None)
+        if not is_folder_manifest(manifest):
+            return
+        if modified_children is not None and entry_id in self._folders_children:
+            self._update_manifest_index(access, manifest, old_manifest, modified_children)
+            return
+
+        children_ids = {x["id"] for x in manifest["children"].values()}
+        old_children_ids = self._folders_children.get(entry_id, set())
+        children_status = self._children_status.setdefault(entry_id, {})
+        for child_id in old_children_ids - children_ids:
+            # Given the order of the updates is not guaranteed during a move,
+            # child may already have been inserted into it new parent
+            if self._entries_parent.get(child_id, (None,))[0] == entry_id:
+                del self._entries_parent[child_id]
+            self._entries_to_explore.pop(child_id, None)
+            children_status.pop(child_id, None)
+
+        for child_name, child_access in manifest["children"].items():
+            child_id = child_access["id"]
+            self._entries_parent[child_id] = (entry_id, child_name, child_access)
+            try:
+                child_manifest = self._manifests_cache[child_id]
+            except KeyError:
+                self._entries_to_explore[child_id] = child_access
+            else:
+                children_status[child_id] = (
+                    child_manifest["is_placeholder"],
+                    child_manifest["need_sync"],
+                )
+        self._folders_children[entry_id] = children_ids
+
+    def _update_manifest_index(
+        self,
+        access: Access,
+        manifest: LocalManifest,
+        old_manifest: LocalManifest,
+        modified_children: Set[str],
+    ):
+        # Same as `_index_manifest`, but only considering the modified children
+        entry_id = access["id"]
+        children_ids = self._folders_children[entry_id]
+        children_status = self._children_status.setdefault(entry_id, {})
+        old_children = old_manifest["children"]
+        children = manifest["children"]
+        added_children = []
+        for child_name in modified_children:
+            old_child_access = old_children.get(child_name)
+            child_access = children.get(child_name)
+            if old_child_access == child_access:
+                continue
+            if old_child_access:
+                old_child_id = old_child_access["id"]
+                children_ids.discard(old_child_id)
+                if self._entries_parent.get(old_child_id, (None,))[0] == entry_id:
+                    del self._entries_parent[old_child_id]
+                self._entries_to_explore.pop(old_child_id, None)
+                children_status.pop(old_child_id, None)
+            if child_access:
+                added_children.append((child_name, child_access))
+
+        # Children removals must be processed first given an entry can be
+        # renamed (i.e. removed then added with the same id)
+        for child_name, child_access in added_children:
+            child_id = child_access["id"]
+            children_ids.add(child_id)
+            self._entries_parent[child_id] = (entry_id, child_name, child_access)
+            try:
+                child_manifest = self._manifests_cache[child_id]
+            except KeyError:
+                self._entries_to_explore[child_id] = child_access
+            else:
+                children_status[child_id] = (
+                    child_manifest["is_placeholder"],
+                    child_manifest["need_sync"],
+                )
+
+    def _update_entry_status(self, access: Access, manifest: LocalManifest):
+        try:
+            parent_id, *_ = self._entries_parent[access["id"]]
+        except KeyError:
+            # Parent not loaded yet, status will be set when indexing it
+            return
+        self._children_status[parent_id][access["id"]] = (
+            manifest["is_placeholder"],
+            manifest["need_sync"],
+        )
+
+    def _update_children_changes(
+        self, access: Access, manifest: LocalManifest, changed_children: Iterable[str] = None
+    ):
+        if not is_folder_manifest(manifest):
+            return
+        if changed_children is None:
+            # Children are the ones of the base version if there is no local changes
+            self._children_changes[access["id"]] = None if manifest["need_sync"] else set()
+        else:
+            children_changes = self._children_changes.get(access["id"])
+            if children_changes is not None:
+                children_changes.update(changed_children)
+
+    def get_children_changes(self, access: Access) -> Optional[Set[str]]:
+        """
+        Returns: The names of the children modified by local operations since
+        the base version of the folder (it may contain unmodified children),
+        None if unknown. The set keeps being updated by the following
+        operations until the folder is set as a whole.
+
+        Raises:
+            FSManifestLocalMiss: if the folder is not present locally
+        """
+        self._get_manifest_read_only(access)
+        return self._children_changes.get(access["id"])
+
+    def _unindex_manifest(self, access: Access):
+        self._children_status.pop(access["id"], None)
+        for child_id in self._folders_children.pop(access["id"], ()):
+            if self._entries_parent.get(child_id, (None,))[0] == access["id"]:
+                del self._entries_parent[child_id]
+            self._entries_to_explore.pop(child_id, None)
+
+    def get_children_status(
+        self, access: Access, children: Dict[str, Access]
+    ) -> Dict[UUID, Tuple[bool, bool]]:
+        """
+        Args:
+            access: access of the folder
+            children: children of the folder (possibly from an older version
+                      of its manifest)
+
+        Returns: A mapping of the children ids to their placeholder and
+        need sync flags. Children not present locally are omitted.
+
+        Raises:
+            FSManifestLocalMiss: if the folder is not present locally
+        """
+        self._get_manifest_read_only(access)
+        children_status = self._children_status[access["id"]]
+        status = {}
+        for child_access in children.values():
+            child_id = child_access["id"]
+            try:
+                status[child_id] = children_status[child_id]
+            except KeyError:
+                # Child not loaded yet (or no longer part of the folder)
+                try:
+                    child_manifest = self._get_manifest_read_only(child_access)
+                except FSManifestLocalMiss:
+                    continue
+                status[child_id] = (child_manifest["is_placeholder"], child_manifest["need_sync"])
+        return status
 
     def get_beacon(self, path: Path) -> UUID:
         # The beacon is used to notify other clients that we modified an entry.
@@ -146,6 +442,17 @@ class LocalFolderFS:
         assert is_workspace_manifest(manifest)
         return access["id"]
 
+    def get_chunking(self, path: Path) -> str:
+        # Chunking is configured at the workspace level, entries outside of
+        # any workspace (i.e. the user manifest) always use fixed-size blocks
+        try:
+            _, workspace_name, *_ = path.parts
+        except ValueError:
+            return FIXED_CHUNKING
+
+        _, manifest = self._retrieve_entry_read_only(Path(f"/{workspace_name}"))
+        return manifest.get("chunking", FIXED_CHUNKING)
+
     def get_entry(self, path: Path) -> Tuple[Access, LocalManifest]:
         return self._retrieve_entry(path)
 
@@ -157,25 +464,44 @@ class LocalFolderFS:
         if entry_id == self.root_access["id"]:
             return Path("/"), self.root_access, self.get_manifest(self.root_access)
 
-        # Brute force style
-        def _recursive_search(access, path):
+        # Make sure the root manifest is indexed
+        self._get_manifest_read_only(self.root_access)
+
+        found = self._resolve_entry_path(entry_id)
+        # Entry may be part of a folder present in local but not loaded yet
+        while not found and self._entries_to_explore:
+            _, access = self._entries_to_explore.popitem()
             try:
-                manifest = self._get_manifest_read_only(access)
+                self._get_manifest_read_only(access)
             except FSManifestLocalMiss:
-                return
-            if access["id"] == entry_id:
-                return path, access, copy_manifest(manifest)
+                continue
+            found = self._resolve_entry_path(entry_id)
 
-            if is_folder_manifest(manifest):
-                for child_name, child_access in manifest["children"].items():
-                    found = _recursive_search(child_access, path / child_name)
-                    if found:
-                        return found
-
-        found = _recursive_search(self.root_access, Path("/"))
         if not found:
             raise FSEntryNotFound(entry_id)
-        return found
+        path, access = found
+        try:
+            return path, access, self.get_manifest(access)
+        except FSManifestLocalMiss:
+            raise FSEntryNotFound(entry_id)
+
+    def _resolve_entry_path(self, entry_id: UUID) -> Optional[Tuple[Path, Access]]:
+        hops = []
+        access = None
+        curr_id = entry_id
+        while curr_id != self.root_access["id"]:
+            try:
+                parent_id, name, curr_access = self._entries_parent[curr_id]
+            except KeyError:
+                return None
+            if parent_id not in self._folders_children:
+                return None
+            if not access:
+                access = curr_access
+            hops.append(name)
+            curr_id = parent_id
+
+        return Path("/", *reversed(hops)), access
 
     def _retrieve_entry(self, path: Path, collector=None) -> Tuple[Access, LocalManifest]:
         access, read_only_manifest = self._retrieve_entry_read_only(path, collector)
@@ -297,7 +623,7 @@ class LocalFolderFS:
         child_manifest = new_local_file_manifest(self.local_author)
         manifest["children"][path.name] = child_access
         mark_manifest_modified(manifest)
-        self.set_manifest(access, manifest)
+        self.set_manifest(access, manifest, [path.name])
         self.set_manifest(child_access, child_manifest)
         self.event_bus.send("fs.entry.updated", id=access["id"])
         self.event_bus.send("fs.entry.updated", id=child_access["id"])
@@ -323,7 +649,7 @@ class LocalFolderFS:
         manifest["children"][path.name] = child_access
         mark_manifest_modified(manifest)
 
-        self.set_manifest(access, manifest)
+        self.set_manifest(access, manifest, [path.name])
         self.set_manifest(child_access, child_manifest)
         self.event_bus.send("fs.entry.updated", id=access["id"])
         self.event_bus.send("fs.entry.updated", id=child_access["id"])
@@ -344,7 +670,7 @@ class LocalFolderFS:
         root_manifest["children"][path.name] = child_access
         mark_manifest_modified(root_manifest)
 
-        self.set_manifest(self.root_access, root_manifest)
+        self.set_manifest(self.root_access, root_manifest, [path.name])
         self.set_manifest(child_access, child_manifest)
         self.event_bus.send("fs.entry.updated", id=self.root_access["id"])
         self.event_bus.send("fs.entry.updated", id=child_access["id"])
@@ -375,10 +701,30 @@ class LocalFolderFS:
         # Just move the workspace's access from one place to another
         root_manifest["children"][dst.name] = root_manifest["children"].pop(src.name)
         mark_manifest_modified(root_manifest)
-        self.set_manifest(self.root_access, root_manifest)
+        self.set_manifest(self.root_access, root_manifest, [src.name, dst.name])
 
         self.event_bus.send("fs.entry.updated", id=self.root_access["id"])
 
+    def workspace_set_chunking(self, path: Path, chunking: str) -> None:
+        """
+        Only the files synchronized afterward are concerned, already
+        synchronized blocks are not modified.
+        """
+        if chunking not in CHUNKINGS:
+            raise ValueError(f"Unknown chunking `{chunking}`")
+
+        access, manifest = self._retrieve_entry(path)
+        if not is_workspace_manifest(manifest):
+            raise PermissionError(13, "Permission denied (not a workspace)", str(path))
+        if manifest.get("chunking", FIXED_CHUNKING) == chunking:
+            return
+
+        manifest["chunking"] = chunking
+        mark_manifest_modified(manifest)
+        self.set_manifest(access, manifest, ())
+
+        self.event_bus.send("fs.entry.updated", id=access["id"])
+
     def _delete(self, path: Path, expect=None) -> None:
         if path.is_root():
             raise PermissionError(13, "Permission denied", str(path))
@@ -401,7 +747,7 @@ class LocalFolderFS:
             raise NotADirectoryError(20, "Not a directory", str(path))
 
         mark_manifest_modified(parent_manifest)
-        self.set_manifest(parent_access, parent_manifest)
+        self.set_manifest(parent_access, parent_manifest, [path.name])
         self.event_bus.send("fs.entry.updated", id=parent_access["id"])
 
     def delete(self, path: Path) -> None:
@@ -506,7 +852,7 @@ class LocalFolderFS:
 
             mark_manifest_modified(parent_manifest)
 
-            self.set_manifest(parent_access, parent_manifest)
+            self.set_manifest(parent_access, parent_manifest, [src.name, dst.name])
             self.event_bus.send("fs.entry.updated", id=parent_access["id"])
 
         else:
@@ -557,14 +903,14 @@ class LocalFolderFS:
             parent_dst_manifest["children"][dst.name] = moved_access
             mark_manifest_modified(parent_dst_manifest)
 
-            self.set_manifest(parent_dst_access, parent_dst_manifest)
+            self.set_manifest(parent_dst_access, parent_dst_manifest, [dst.name])
             self.event_bus.send("fs.entry.updated", id=parent_dst_access["id"])
 
             if delete_src:
                 del parent_src_manifest["children"][src.name]
                 mark_manifest_modified(parent_src_manifest)
 
-                self.set_manifest(parent_src_access, parent_src_manifest)
+                self.set_manifest(parent_src_access, parent_src_manifest, [src.name])
                 self.event_bus.send("fs.entry.updated", id=parent_src_access["id"])
 
     def _recursive_manifest_copy(self, access, manifest):
@@ -0,0 +1,85 @@
+from typing import Optional, Iterable
+
+from parsec.core.fs.types import RemoteManifest, RemoteFolderManifest, FolderManifestDelta
+
+
+# Small folders are cheap enough to upload as a whole
+DELTA_MIN_CHILDREN = 256
+# Periodic snapshots bound the number of deltas a reader has to apply
+SNAPSHOT_INTERVAL = 32
+
+_DELTA_FIELDS = ("version", "author", "updated", "children")
+
+
+def build_folder_manifest_delta(
+    base: RemoteManifest, manifest: RemoteManifest, changed_children: Iterable[str] = None
+) -> Optional[FolderManifestDelta]:
+    """
+    Args:
+        changed_children: names of the children modified since `base` (may
+                          contain unmodified ones), all the children are
+                          compared if not provided
+
+    Returns: The delta between `base` and the version following it, or None if
+    `manifest` should be uploaded as a snapshot.
+    """
+    if manifest["type"] not in ("folder_manifest", "workspace_manifest"):
+        return None
+    if base["type"] != manifest["type"] or base["version"] != manifest["version"] - 1:
+        return None
+    if manifest["version"] % SNAPSHOT_INTERVAL == 0:
+        return None
+    if len(base["children"]) < DELTA_MIN_CHILDREN:
+        return None
+    # Only children and bookkeeping fields are part of the delta
+    for key in base.keys() | manifest.keys():
+        if key not in _DELTA_FIELDS and base.get(key) != manifest.get(key):
+            return None
+
+    # Moved entries get new accesses, so renaming a child is simply
+    # removing the old name and adding the new one
+    base_children = base["children"]
+    children = manifest["children"]
+    if changed_children is None:
+        changed_children = base_children.keys() | children.keys()
+    children_added = {}
+    children_removed = []
+    for name in changed_children:
+        access = children.get(name)
+        if access is None:
+            if name in base_children:
+                children_removed.append(name)
+        elif base_children.get(name) != access:
+            children_added[name] = access
+    # Not worth it if most of the folder has changed
+    if (len(children_added) + len(children_removed)) * 2 > len(children):
+        return None
+
+    return FolderManifestDelta(
+        {
+            "format": 1,
+            "type": "folder_manifest_delta",
+            "author": manifest["author"],
+            "version": manifest["version"],
+            "updated": manifest["updated"],
+            "children_added": children_added,
+            "children_removed": children_removed,
+        }
+    )
+
+
+def apply_folder_manifest_delta(
+    manifest: RemoteFolderManifest, delta: FolderManifestDelta
+) -> RemoteFolderManifest:
+    assert delta["version"] == manifest["version"] + 1
+    children = manifest["children"].copy()
+    for name in delta["children_removed"]:
+        children.pop(name, None)
+    children.update(delta["children_added"])
+
+    new_manifest = manifest.copy()
+    new_manifest["version"] = delta["version"]
+    new_manifest["author"] = delta["author"]
+    new_manifest["updated"] = delta["updated"]
+    new_manifest["children"] = children
+    return new_manifest
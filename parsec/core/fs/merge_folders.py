@@ -23,15 +23,36 @@ def find_conflicting_name_for_child_entry(original_name: str, check_candidate_na
     assert False  # Should never be here
 
 
-def merge_children(base, diverged, target):
+def get_children_changes(base, diverged):
+    """
+    Returns: The names of the children modified between `base` and `diverged`.
+    """
+    changes = base.keys() - diverged.keys()
+    for entry_name, entry in diverged.items():
+        if base.get(entry_name) != entry:
+            changes.add(entry_name)
+    return changes
+
+
+def merge_children(base, diverged, target, diverged_changes=None):
+    """
+    Args:
+        diverged_changes: names of the children modified on diverged side since
+                          base (may contain unmodified ones), computed from the
+                          children if not provided
+
+    Given only the diverged changes have to be applied on top of target, the
+    cost of the merge is proportional to their number.
+    """
+    if diverged_changes is None:
+        diverged_changes = get_children_changes(base, diverged)
     # If entry is in base but not in diverged and target, it is then already
-    # resolved.
-    all_entries = diverged.keys() | target.keys()
+    # resolved. Entries not modified on diverged side are resolved as well.
     conflicts = []
-    resolved = {}
+    resolved = target.copy()
     need_sync = False
 
-    for entry_name in all_entries:
+    for entry_name in diverged_changes:
         base_entry = base.get(entry_name)
         target_entry = target.get(entry_name)
         diverged_entry = diverged.get(entry_name)
@@ -39,8 +60,6 @@ def merge_children(base, diverged, target):
         if diverged_entry == target_entry:
             # No modifications or same modification on both sides, either case
             # just keep things like this
-            if target_entry:
-                resolved[entry_name] = target_entry
             continue
 
         elif target_entry == base_entry:
@@ -48,11 +67,12 @@ def merge_children(base, diverged, target):
             need_sync = True
             if diverged_entry:
                 resolved[entry_name] = diverged_entry
+            else:
+                del resolved[entry_name]
 
         elif diverged_entry == base_entry:
             # Entry has been modified en target side only
-            if target_entry:
-                resolved[entry_name] = target_entry
+            continue
 
         else:
             # Entry modified on both side...
@@ -68,7 +88,6 @@ def merge_children(base, diverged, target):
                 # Entry removed on diverged side and modified (no remove) on
                 # target side, just apply them
                 # TODO: rename entry to `<name>.deleted` ?
-                resolved[entry_name] = target_entry
 
             else:
                 need_sync = True
@@ -80,7 +99,6 @@ def merge_children(base, diverged, target):
                 conflict_entry_name = find_conflicting_name_for_child_entry(
                     entry_name, check_candidate_name
                 )
-                resolved[entry_name] = target_entry
                 conflict_entry_entry = resolved[conflict_entry_name] = diverged[entry_name]
                 conflicts.append(
                     (
@@ -94,7 +112,7 @@ def merge_children(base, diverged, target):
     return resolved, need_sync, conflicts
 
 
-def merge_remote_folder_manifests(base, diverged, target):
+def merge_remote_folder_manifests(base, diverged, target, diverged_changes=None):
     if base is None:
         base_version = 0
         base_children = {}
@@ -107,7 +125,7 @@ def merge_remote_folder_manifests(base, diverged, target):
     # assert diverged["created"] == target["created"]
 
     children, need_sync, conflicts = merge_children(
-        base_children, diverged["children"], target["children"]
+        base_children, diverged["children"], target["children"], diverged_changes
     )
 
     if not need_sync:
@@ -130,10 +148,15 @@ def merge_remote_folder_manifests(base, diverged, target):
     if "participants" in target:
         merged["participants"] = list(set(target["participants"] + diverged["participants"]))
 
+    # Only workspace manifest has this field, local modification takes precedence
+    if "chunking" in diverged and diverged["chunking"] != (base or {}).get("chunking"):
+        merged["chunking"] = diverged["chunking"]
+        need_sync = True
+
     return merged, need_sync, conflicts
 
 
-def merge_local_folder_manifests(base, diverged, target):
+def merge_local_folder_manifests(base, diverged, target, diverged_changes=None):
     if base is None:
         base_version = 0
         base_children = {}
@@ -146,7 +169,7 @@ def merge_local_folder_manifests(base, diverged, target):
     # assert diverged["created"] == target["created"]
 
     children, need_sync, conflicts = merge_children(
-        base_children, diverged["children"], target["children"]
+        base_children, diverged["children"], target["children"], diverged_changes
     )
 
     if not need_sync:
@@ -172,4 +195,9 @@ def merge_local_folder_manifests(base, diverged, target):
             sorted(set(target["participants"] + diverged["participants"]))
         )
 
+    # Only workspace manifest has this field, local modification takes precedence
+    if "chunking" in diverged and diverged["chunking"] != (base or {}).get("chunking"):
+        merged["chunking"] = diverged["chunking"]
+        merged["need_sync"] = True
+
     return merged, conflicts
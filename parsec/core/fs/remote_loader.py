@@ -1,22 +1,51 @@
 from hashlib import sha256
+from typing import Optional, List
 
-from parsec.crypto import decrypt_raw_with_secret_key
-from parsec.core.schemas import loads_manifest, dumps_manifest
-from parsec.core.fs.utils import remote_to_local_manifest
-from parsec.core.fs.types import BlockAccess, Access
+from parsec.crypto import decrypt_raw_with_secret_key, encrypt_raw_with_secret_key
+from parsec.compression import decompress
+from parsec.core.local_db import LocalDBMissingEntry
+from parsec.core.schemas import (
+    loads_manifest,
+    dumps_manifest,
+    loads_manifest_delta,
+    dumps_manifest_delta,
+    loads_manifest_shard,
+    dumps_manifest_shard,
+)
+from parsec.core.fs.utils import remote_to_local_manifest, is_folder_manifest, new_block_access
+from parsec.core.fs.manifest_delta import build_folder_manifest_delta, apply_folder_manifest_delta
+from parsec.core.fs.folder_shards import get_shards_count, split_children, invalidate_shards
+from parsec.core.fs.types import BlockAccess, Access, RemoteManifest
 
 
 class RemoteLoader:
-    def __init__(self, backend_cmds, encryption_manager, local_db):
+    def __init__(
+        self,
+        backend_cmds,
+        encryption_manager,
+        local_db,
+        folder_sharding=False,
+        manifest_deltas=False,
+    ):
         self.backend_cmds = backend_cmds
         self.encryption_manager = encryption_manager
         self.local_db = local_db
+        # Sharded folder manifests are always read, but only written when
+        # enabled given older clients reject them
+        self.folder_sharding = folder_sharding
+        # Same thing for the deltas, which must additionally be supported by
+        # the backend to be written or asked for
+        self.manifest_deltas = manifest_deltas
+        # Last version of each manifest kept in the versions cache, this is
+        # the base the backend can send us deltas from
+        self._cached_versions = {}
 
     async def load_block(self, access: BlockAccess) -> None:
         """
         Raises:
             BackendConnectionError
             CryptoError
+            CompressionError
         """
         ciphered_block = await self.backend_cmds.blockstore_read(access["id"])
         # TODO: let encryption manager do the digest check ?
@@ -25,18 +54,218 @@ class RemoteLoader:
         # has an unique key, valid blocks cannot be switched together.
         # TODO: better exceptions
         block = decrypt_raw_with_secret_key(access["key"], ciphered_block)
+        if access.get("compressed"):
+            block = decompress(block)
         assert sha256(block).hexdigest() == access["digest"], access
 
         self.local_db.set(access, block)
 
-    async def load_manifest(self, access: Access) -> None:
-        _, blob = await self.backend_cmds.vlob_read(access["id"], access["rts"])
-        raw_remote_manifest = await self.encryption_manager.decrypt_with_secret_key(
-            access["key"], blob
+    def _build_version_access(self, access: Access, version: int):
+        name = f"{access['id']}:version:{version}"
+        return {"id": sha256(name.encode("utf8")).hexdigest(), "key": access["key"]}
+
+    def _get_cached_manifest(self, access: Access, version: int) -> Optional[RemoteManifest]:
+        # Cached manifests of sharded folders keep the accesses of their
+        # shards along with the assembled children (None for the shards
+        # outdated by a delta)
+        try:
+            raw = self.local_db.get(self._build_version_access(access, version))
+        except LocalDBMissingEntry:
+            return None
+        return loads_manifest(raw)
+
+    def get_cached_manifest(self, access: Access, version: int) -> Optional[RemoteManifest]:
+        """
+        Returns: The given version of the manifest if it is available locally
+        """
+        manifest = self._get_cached_manifest(access, version)
+        if manifest:
+            manifest.pop("shards", None)
+        return manifest
+
+    def _cache_manifest(self, access: Access, manifest: RemoteManifest) -> None:
+        # Previous versions of a manifest never change, so they can be kept
+        # for as long as the local storage allows it
+        raw = dumps_manifest(manifest)
+        self.local_db.set(self._build_version_access(access, manifest["version"]), raw)
+        if manifest["version"] > self._cached_versions.get(access["id"], 0):
+            self._cached_versions[access["id"]] = manifest["version"]
+
+    async def _load_shards(self, manifest: RemoteManifest) -> RemoteManifest:
+        children = {}
+        for shard_access in manifest["shards"]:
+            try:
+                raw = self.local_db.get(shard_access)
+            except LocalDBMissingEntry:
+                await self.load_block(shard_access)
+                raw = self.local_db.get(shard_access)
+            children.update(loads_manifest_shard(raw)["children"])
+        return {**manifest, "children": children}
+
+    async def _store_shards(self, access: Access, manifest: RemoteManifest) -> List[BlockAccess]:
+        """
+        Returns: The accesses of the shards the children are split into.
+        """
+        shards_count = get_shards_count(len(manifest["children"]))
+        shards = split_children(manifest["children"], shards_count)
+        base_shards = base_accesses = None
+        base = self._get_cached_manifest(access, manifest["version"] - 1)
+        if base and len(base.get("shards", ())) == shards_count:
+            base_shards = split_children(base["children"], shards_count)
+            base_accesses = base["shards"]
+
+        shard_accesses = []
+        for i, shard_children in enumerate(shards):
+            # Shards are immutable blocks, unchanged ones are shared with the
+            # previous version of the manifest
+            if base_shards and base_accesses[i] and base_shards[i] == shard_children:
+                shard_accesses.append(base_accesses[i])
+                continue
+            raw = dumps_manifest_shard(
+                {"format": 1, "type": "folder_manifest_shard", "children": shard_children},
+                self.backend_cmds.compression,
+            )
+            shard_access = new_block_access(raw, 0)
+            ciphered = encrypt_raw_with_secret_key(shard_access["key"], raw)
+            await self.backend_cmds.blockstore_create(shard_access["id"], ciphered)
+            self.local_db.set(shard_access, raw)
+            shard_accesses.append(shard_access)
+
+        return shard_accesses
+
+    def _should_shard(self, manifest: RemoteManifest) -> bool:
+        return (
+            self.folder_sharding
+            and manifest["type"] in ("folder_manifest", "workspace_manifest")
+            and bool(get_shards_count(len(manifest["children"])))
         )
+
+    async def read_manifest(
+        self, access: Access, version: int = None, timestamp=None, cache: bool = False
+    ) -> RemoteManifest:
+        """
+        Folder manifests (and any manifest if `cache` is set) are kept in
+        the versions cache, given they can be used as base for the deltas.
+
+        Raises:
+            BackendConnectionError
+            BackendCmdsBadResponse
+        """
+        if version is not None:
+            manifest = self.get_cached_manifest(access, version)
+            if manifest:
+                return manifest
+
+        if self.manifest_deltas:
+            known_version = self._cached_versions.get(access["id"])
+        else:
+            known_version = None
+        version, blob, deltas = await self.backend_cmds.vlob_read(
+            access["id"], access["rts"], version, timestamp, known_version
+        )
+        if blob is None:
+            manifest = self._get_cached_manifest(access, known_version)
+            if not manifest:
+                # Base version is no longer in cache, fallback to a full read
+                self._cached_versions.pop(access["id"], None)
+                return await self.read_manifest(access, version, cache=cache)
+        else:
+            raw = await self.encryption_manager.decrypt_with_secret_key(access["key"], blob)
+            manifest = loads_manifest(raw)
+            if manifest.get("shards"):
+                manifest = await self._load_shards(manifest)
+
+        for ciphered_delta in deltas:
+            raw = await self.encryption_manager.decrypt_with_secret_key(
+                access["key"], ciphered_delta
+            )
+            delta = loads_manifest_delta(raw)
+            manifest = apply_folder_manifest_delta(manifest, delta)
+            if manifest.get("shards"):
+                manifest["shards"] = invalidate_shards(
+                    manifest["shards"], [*delta["children_added"], *delta["children_removed"]]
+                )
+
+        if cache or is_folder_manifest(manifest):
+            self._cache_manifest(access, manifest)
+        manifest.pop("shards", None)
+        return manifest
+
+    async def load_manifest(self, access: Access) -> None:
         # TODO: handle and/or document exceptions
-        remote_manifest = loads_manifest(raw_remote_manifest)
+        remote_manifest = await self.read_manifest(access)
         local_manifest = remote_to_local_manifest(remote_manifest)
         raw_local_manifest = dumps_manifest(local_manifest)
 
         self.local_db.set(access, raw_local_manifest)
+
+    async def create_manifest(
+        self, access: Access, manifest: RemoteManifest, notify_beacon=None
+    ) -> None:
+        """
+        Raises:
+            BackendConnectionError
+            BackendCmdsBadResponse
+        """
+        assert manifest["version"] == 1
+        compression = self.backend_cmds.compression
+        if self._should_shard(manifest):
+            manifest = {**manifest, "shards": await self._store_shards(access, manifest)}
+            raw = dumps_manifest({**manifest, "children": {}}, compression)
+        else:
+            raw = dumps_manifest(manifest, compression)
+        ciphered = self.encryption_manager.encrypt_with_secret_key(access["key"], raw)
+        await self.backend_cmds.vlob_create(
+            access["id"], access["rts"], access["wts"], ciphered, notify_beacon
+        )
+        if is_folder_manifest(manifest):
+            self._cache_manifest(access, manifest)
+
+    async def update_manifest(
+        self, access: Access, manifest: RemoteManifest, notify_beacon=None, changed_children=None
+    ) -> None:
+        """
+        Folder manifests are uploaded as a delta of their previous version
+        if enabled and when it is available locally, big ones are otherwise
+        split into shards if enabled.
+
+        Args:
+            changed_children: names of the children modified since the
+                              previous version (may contain unmodified ones),
+                              None if unknown
+
+        Raises:
+            BackendConnectionError
+            BackendCmdsBadResponse
+        """
+        assert manifest["version"] > 1
+        compression = self.backend_cmds.compression
+        delta = base_shards = None
+        if self.manifest_deltas and is_folder_manifest(manifest):
+            base = self._get_cached_manifest(access, manifest["version"] - 1)
+            if base:
+                base_shards = base.pop("shards", None)
+                delta = build_folder_manifest_delta(base, manifest, changed_children)
+        if delta:
+            raw = dumps_manifest_delta(delta, compression)
+            if base_shards:
+                shards = invalidate_shards(
+                    base_shards, [*delta["children_added"], *delta["children_removed"]]
+                )
+                manifest = {**manifest, "shards": shards}
+        elif self._should_shard(manifest):
+            manifest = {**manifest, "shards": await self._store_shards(access, manifest)}
+            raw = dumps_manifest({**manifest, "children": {}}, compression)
+        else:
+            raw = dumps_manifest(manifest, compression)
+        ciphered = self.encryption_manager.encrypt_with_secret_key(access["key"], raw)
+        await self.backend_cmds.vlob_update(
+            access["id"],
+            access["wts"],
+            manifest["version"],
+            ciphered,
+            notify_beacon,
+            is_delta=bool(delta),
+        )
+        if is_folder_manifest(manifest):
+            self._cache_manifest(access, manifest)
@@ -108,7 +108,7 @@ class Sharing:
         if recipient not in manifest["participants"]:
             manifest["participants"].append(recipient)
             manifest["participants"].sort()
-            self.local_folder_fs.update_manifest(access, manifest)
+            self.local_folder_fs.update_manifest(access, manifest, ())
 
         # Make sure there is no placeholder in the path and the entry
         # is up to date
@@ -181,7 +181,7 @@ class Sharing:
         user_manifest_access, user_manifest = await self._get_user_manifest()
         if user_manifest["last_processed_message"] < new_last_processed_message:
             user_manifest["last_processed_message"] = new_last_processed_message
-            self.local_folder_fs.update_manifest(user_manifest_access, user_manifest)
+            self.local_folder_fs.update_manifest(user_manifest_access, user_manifest, ())
 
     async def _process_message(self, sender_id: DeviceID, ciphered: bytes):
         """
@@ -222,7 +222,9 @@ class Sharing:
                 if sharing_name not in user_manifest["children"]:
                     break
             user_manifest["children"][sharing_name] = msg["access"]
-            self.local_folder_fs.update_manifest(user_manifest_access, user_manifest)
+            self.local_folder_fs.update_manifest(
+                user_manifest_access, user_manifest, [sharing_name]
+            )
 
             path = f"/{sharing_name}"
             self.event_bus.send("sharing.new", path=path, access=msg["access"])
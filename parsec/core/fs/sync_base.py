@@ -1,9 +1,11 @@
 import trio
 from uuid import UUID
+from collections import defaultdict
+from typing import List, Tuple
 
 from parsec.crypto import decrypt_raw_with_secret_key, encrypt_raw_with_secret_key
+from parsec.compression import compress, decompress
 from parsec.core.backend_connection import BackendCmdsBadResponse
-from parsec.core.schemas import dumps_manifest, loads_manifest
 from parsec.core.fs.utils import is_file_manifest, is_folder_manifest, is_placeholder_manifest
 from parsec.core.fs.types import Path, Access, LocalFolderManifest, LocalFileManifest, LocalManifest
 from parsec.core.fs.local_folder_fs import FSManifestLocalMiss, FSEntryNotFound
@@ -14,6 +16,8 @@ class SyncConcurrencyError(Exception):
 
 
 DEFAULT_BLOCK_SIZE = 2 ** 16  # 64Kio
+# Blocks are only stored compressed if it saves at least 10% of their size
+BLOCK_COMPRESSION_MIN_RATIO = 0.9
 
 
 class BaseSyncer:
@@ -22,10 +26,12 @@ class BaseSyncer:
         device,
         backend_cmds,
         encryption_manager,
+        remote_loader,
         local_folder_fs,
         local_file_fs,
         event_bus,
         block_size=DEFAULT_BLOCK_SIZE,
+        delta_sync=False,
     ):
         self._lock = trio.Lock()
         self.device = device
@@ -33,15 +39,17 @@ class BaseSyncer:
         self.local_file_fs = local_file_fs
         self.backend_cmds = backend_cmds
         self.encryption_manager = encryption_manager
+        self.remote_loader = remote_loader
         self.event_bus = event_bus
         self.block_size = block_size
+        self.delta_sync = delta_sync
 
-    def _get_group_check_local_entries(self):
-        entries = []
+    def _initialize_sync_journal(self):
+        # Register the entries stored in local before the journal existed
 
-        def _recursive_get_local_entries_ids(access):
+        def _recursive_register_local_entries(access):
             try:
-
+                # Loading a manifest register it into the journal
                 manifest = self.local_folder_fs.get_manifest(access)
             except FSManifestLocalMiss:
                 # TODO: make the assert true...
@@ -51,29 +59,60 @@ class BaseSyncer:
 
             if is_folder_manifest(manifest):
                 for child_access in manifest["children"].values():
-                    _recursive_get_local_entries_ids(child_access)
-
-            entries.append(
-                {"id": access["id"], "rts": access["rts"], "version": manifest["base_version"]}
-            )
+                    _recursive_register_local_entries(child_access)
 
-        _recursive_get_local_entries_ids(self.device.user_manifest_access)
-        return entries
+        _recursive_register_local_entries(self.device.user_manifest_access)
+        self.local_folder_fs.sync_journal.mark_initialized()
 
     async def full_sync(self) -> None:
-        local_entries = self._get_group_check_local_entries()
+        sync_journal = self.local_folder_fs.sync_journal
+        if not sync_journal.initialized:
+            self._initialize_sync_journal()
+
+        # Entries modified in local (possibly before a restart) and entries
+        # modified remotely since the last processed beacons items
+        need_sync_entries = sync_journal.get_dirty_entries()
+        need_sync_entries_set = set(need_sync_entries)
+        beacons_offsets = {}
+        for beacon_id in self.local_folder_fs.get_local_beacons():
+            offset = sync_journal.get_beacon_offset(beacon_id)
+            outdated_entries, beacons_offsets[beacon_id] = await self.get_beacon_outdated_entries(
+                beacon_id, offset
+            )
+            for entry_id in outdated_entries:
+                if entry_id not in need_sync_entries_set:
+                    need_sync_entries.append(entry_id)
+                    need_sync_entries_set.add(entry_id)
 
-        if not local_entries:
-            # Nothing in local, so everything is synced ! ;-)
+        if not need_sync_entries:
+            # Nothing to sync, so everything is synced ! ;-)
             self.event_bus.send(
                 "fs.entry.synced", path="/", id=self.device.user_manifest_access["id"]
             )
-            return
 
-        need_sync_entries = await self._backend_vlob_group_check(local_entries)
         for need_sync_entry_id in need_sync_entries:
             await self.sync_by_id(need_sync_entry_id)
 
+        # Only move forward once the changes have been processed
+        sync_journal.set_beacons_offsets(beacons_offsets)
+
+    async def get_beacon_outdated_entries(
+        self, beacon_id: UUID, offset: int
+    ) -> Tuple[List[UUID], int]:
+        """
+        Returns: The local entries modified remotely according to the beacon
+        items starting at `offset`, and the offset of the next beacon item.
+        """
+        sync_journal = self.local_folder_fs.sync_journal
+        changes, offset = await self._backend_beacon_get_changes(beacon_id, offset)
+        outdated_entries = []
+        for entry_id, version in changes:
+            remote_version = sync_journal.get_remote_version(entry_id)
+            # Entries not present in local are not concerned
+            if remote_version is not None and remote_version < version:
+                outdated_entries.append(entry_id)
+        return outdated_entries, offset
+
     async def sync_by_id(self, entry_id: UUID) -> None:
         # TODO: we won't stricly sync this id, but the corresponding path
         # (which may end up being a different id in case of concurrent change)
@@ -110,7 +149,19 @@ class BaseSyncer:
         # In case of placeholder, we must resolve it first (and make sure
         # none of it parents are placeholders themselves)
         if manifest["is_placeholder"]:
+            resolved_entries = []
+            if recursive and is_folder_manifest(manifest):
+                # Children first, this way the folder is uploaded only once
+                resolved_entries = await self._resolve_placeholders_in_children(
+                    path, access, manifest
+                )
+                try:
+                    manifest = self.local_folder_fs.get_manifest(access)
+                except FSManifestLocalMiss:
+                    # Nothing to do if entry is no present locally
+                    return
             need_more_sync = await self._resolve_placeholders_in_path(path, access, manifest)
+            self._send_resolved_entries_synced(resolved_entries)
             # If the entry to sync is actually empty the minimal sync was enough
             if not need_more_sync and not recursive:
                 return
@@ -179,6 +230,90 @@ class BaseSyncer:
 
             return need_more_sync
 
+    async def _resolve_placeholders_in_children(
+        self, path: Path, access: Access, manifest: LocalFolderManifest
+    ) -> List[Tuple[Path, UUID]]:
+        """
+        Resolve all at once the placeholders among the children of a folder
+        (and their own children given a placeholder only contains placeholders).
+
+        Leaves (files and empty folders) are minimal synced concurrently, then
+        the folders are minimal synced level by level starting from the deepest
+        one, hence each folder is uploaded exactly once.
+
+        Returns: The entries that are synced once the folder itself is. It is
+        up to the caller to notify them given they are not visible before that.
+        """
+        leaves = []
+        folders_by_depth = defaultdict(list)
+
+        def _collect_placeholders(path, access, manifest, depth):
+            children_status = self.local_folder_fs.get_children_status(access, manifest["children"])
+            for child_name, child_access in manifest["children"].items():
+                # Only placeholder children need to be loaded, child not in
+                # local cannot be a placeholder then !
+                is_placeholder, _ = children_status.get(child_access["id"], (False, False))
+                if not is_placeholder:
+                    continue
+                try:
+                    child_manifest = self.local_folder_fs.get_manifest(child_access)
+                except FSManifestLocalMiss:
+                    continue
+                child_path = path / child_name
+                if is_folder_manifest(child_manifest) and child_manifest["children"]:
+                    folders_by_depth[depth].append((child_path, child_access))
+                    _collect_placeholders(child_path, child_access, child_manifest, depth + 1)
+                else:
+                    leaves.append((child_path, child_access))
+
+        _collect_placeholders(path, access, manifest, 0)
+        resolved_entries = await self._minimal_sync_entries(leaves)
+        for depth in sorted(folders_by_depth.keys(), reverse=True):
+            resolved_entries += await self._minimal_sync_entries(folders_by_depth[depth])
+        return resolved_entries
+
+    def _send_resolved_entries_synced(self, resolved_entries: List[Tuple[Path, UUID]]) -> None:
+        for path, entry_id in resolved_entries:
+            self.event_bus.send("fs.entry.synced", path=str(path), id=entry_id)
+
+    async def _minimal_sync_entries(
+        self, entries: List[Tuple[Path, Access]]
+    ) -> List[Tuple[Path, UUID]]:
+        resolved_entries = []
+
+        async def _process_entries():
+            while entries:
+                path, access = entries.pop()
+                # Retrieve the manifest now given the children may have been
+                # resolved since the entry has been collected
+                try:
+                    manifest = self.local_folder_fs.get_manifest(access)
+                except FSManifestLocalMiss:
+                    # Nothing to do if entry is no present locally
+                    continue
+                if not is_placeholder_manifest(manifest):
+                    continue
+
+                if is_file_manifest(manifest):
+                    need_more_sync = await self._minimal_sync_file(path, access, manifest)
+                else:
+                    need_more_sync = await self._minimal_sync_folder(path, access, manifest)
+                if not need_more_sync:
+                    resolved_entries.append((path, access["id"]))
+
+        if len(entries) < 2:
+            await _process_entries()
+
+        else:
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(_process_entries)
+                nursery.start_soon(_process_entries)
+                nursery.start_soon(_process_entries)
+                nursery.start_soon(_process_entries)
+
+        # Entries are processed concurrently, keep a deterministic order anyway
+        return sorted(resolved_entries, key=lambda x: str(x[0]))
+
     async def _minimal_sync_file(
         self, path: Path, access: Access, manifest: LocalFileManifest
     ) -> None:
@@ -197,8 +332,24 @@ class BaseSyncer:
     ) -> None:
         raise NotImplementedError()
 
-    async def _backend_block_create(self, access, blob):
-        ciphered = encrypt_raw_with_secret_key(access["key"], bytes(blob))
+    def _build_block_payload(self, access, blob):
+        """
+        Compression is decided per block (e.g. media files are not worth it),
+        `access` being flagged if it is used. Hence this must be called before
+        `access` is copied.
+        """
+        blob = bytes(blob)
+        if self.backend_cmds.compression:
+            compressed = compress(
+                blob, self.backend_cmds.compression, min_ratio=BLOCK_COMPRESSION_MIN_RATIO
+            )
+            if compressed:
+                access["compressed"] = True
+                return compressed
+        return blob
+
+    async def _backend_block_create(self, access, payload):
+        ciphered = encrypt_raw_with_secret_key(access["key"], payload)
         try:
             await self.backend_cmds.blockstore_create(access["id"], ciphered)
         except BackendCmdsBadResponse as exc:
@@ -211,39 +362,35 @@ class BaseSyncer:
 
     async def _backend_block_read(self, access):
         ciphered = await self.backend_cmds.blockstore_read(access["id"])
-        return decrypt_raw_with_secret_key(access["key"], ciphered)
-
-    async def _backend_vlob_group_check(self, to_check):
-        changed = await self.backend_cmds.vlob_group_check(to_check)
-        return [entry["id"] for entry in changed]
+        block = decrypt_raw_with_secret_key(access["key"], ciphered)
+        if access.get("compressed"):
+            block = decompress(block)
+        return block
+
+    async def _backend_beacon_get_changes(self, beacon_id, offset):
+        changes = {}
+        has_more = True
+        while has_more:
+            page, offset, has_more = await self.backend_cmds.beacon_get_changes(beacon_id, offset)
+            for entry_id, version in page:
+                changes[entry_id] = max(version, changes.get(entry_id, 0))
+        return changes.items(), offset
 
     async def _backend_vlob_read(self, access, version=None):
-        _, blob = await self.backend_cmds.vlob_read(access["id"], access["rts"], version)
-        raw = await self.encryption_manager.decrypt_with_secret_key(access["key"], blob)
-        return loads_manifest(raw)
+        return await self.remote_loader.read_manifest(access, version)
 
     async def _backend_vlob_create(self, access, manifest, notify_beacon):
-        assert manifest["version"] == 1
-        ciphered = self.encryption_manager.encrypt_with_secret_key(
-            access["key"], dumps_manifest(manifest)
-        )
         try:
-            await self.backend_cmds.vlob_create(
-                access["id"], access["rts"], access["wts"], ciphered, notify_beacon
-            )
+            await self.remote_loader.create_manifest(access, manifest, notify_beacon)
         except BackendCmdsBadResponse as exc:
             if exc.status == "already_exists":
                 raise SyncConcurrencyError(access)
             raise
 
-    async def _backend_vlob_update(self, access, manifest, notify_beacon):
-        assert manifest["version"] > 1
-        ciphered = self.encryption_manager.encrypt_with_secret_key(
-            access["key"], dumps_manifest(manifest)
-        )
+    async def _backend_vlob_update(self, access, manifest, notify_beacon, changed_children=None):
         try:
-            await self.backend_cmds.vlob_update(
-                access["id"], access["wts"], manifest["version"], ciphered, notify_beacon
+            await self.remote_loader.update_manifest(
+                access, manifest, notify_beacon, changed_children=changed_children
             )
         except BackendCmdsBadResponse as exc:
             if exc.status == "bad_version":
@@ -0,0 +1,173 @@
+import hashlib
+from uuid import UUID
+from typing import List, Dict, Optional
+
+from parsec.utils import ejson_dumps, ejson_loads
+from parsec.core.types import LocalDevice
+from parsec.core.local_db import LocalDB, LocalDBMissingEntry
+from parsec.core.fs.types import Access, LocalManifest
+
+
+# Dirty entries and remote versions are split in multiple buckets to avoid
+# rewritting the whole table each time an entry gets modified or synchronized
+DIRTY_ENTRIES_BUCKETS = 64
+REMOTE_VERSIONS_BUCKETS = 64
+
+
+class SyncJournal:
+    """
+    Keep track (persistently) of the entries that need to be synchronized
+    and of the last known remote version of each entry present in local.
+
+    This is what allows to resume synchronization after a restart or a
+    reconnection without having to walk the whole local tree.
+    """
+
+    def __init__(self, device: LocalDevice, local_db: LocalDB):
+        self.device = device
+        self._local_db = local_db
+        self._initialized = None
+        self._dirty_entries_buckets = {}
+        self._remote_versions_buckets = {}
+        self._beacons_offsets = None
+
+    def _build_local_access(self, name: str):
+        # Local key is part of the id so a device recreated with the same
+        # device id doesn't end up with the records of the previous one
+        name = f"{self.device.device_id}:sync_journal:{name}"
+        return {
+            "id": hashlib.sha256(self.device.local_symkey + name.encode("utf8")).hexdigest(),
+            "key": self.device.local_symkey,
+        }
+
+    def _load_record(self, name: str):
+        try:
+            raw = self._local_db.get(self._build_local_access(name))
+        except LocalDBMissingEntry:
+            return None
+        return ejson_loads(raw.decode("utf8"))
+
+    def _save_record(self, name: str, data) -> None:
+        raw = ejson_dumps(data).encode("utf8")
+        self._local_db.set(self._build_local_access(name), raw, False)
+
+    def _load_dirty_entries_bucket(self, index: int):
+        try:
+            return self._dirty_entries_buckets[index]
+        except KeyError:
+            pass
+        bucket = set(self._load_record(f"dirty_{index}") or ())
+        self._dirty_entries_buckets[index] = bucket
+        return bucket
+
+    def _save_dirty_entries_bucket(self, index: int):
+        self._save_record(f"dirty_{index}", list(self._dirty_entries_buckets[index]))
+
+    def _load_remote_versions_bucket(self, index: int):
+        try:
+            return self._remote_versions_buckets[index]
+        except KeyError:
+            pass
+        bucket = {
+            entry_id: (rts, version)
+            for entry_id, rts, version in self._load_record(f"remote_versions_{index}") or ()
+        }
+        self._remote_versions_buckets[index] = bucket
+        return bucket
+
+    def _save_remote_versions_bucket(self, index: int):
+        bucket = self._remote_versions_buckets[index]
+        self._save_record(
+            f"remote_versions_{index}",
+            [[entry_id, rts, version] for entry_id, (rts, version) in bucket.items()],
+        )
+
+    @property
+    def initialized(self) -> bool:
+        """
+        Journal is only initialized once all the local entries have been
+        registered (entries written before the journal existed are unknown)
+        """
+        if self._initialized is None:
+            self._initialized = bool(self._load_record("initialized"))
+        return self._initialized
+
+    def mark_initialized(self) -> None:
+        if not self.initialized:
+            self._initialized = True
+            self._save_record("initialized", True)
+
+    def update_entry(self, access: Access, manifest: LocalManifest) -> None:
+        entry_id = access["id"]
+
+        index = entry_id.int % DIRTY_ENTRIES_BUCKETS
+        dirty_entries = self._load_dirty_entries_bucket(index)
+        if manifest["need_sync"] != (entry_id in dirty_entries):
+            if manifest["need_sync"]:
+                dirty_entries.add(entry_id)
+            else:
+                dirty_entries.discard(entry_id)
+            self._save_dirty_entries_bucket(index)
+
+        index = entry_id.int % REMOTE_VERSIONS_BUCKETS
+        bucket = self._load_remote_versions_bucket(index)
+        # Placeholder has no remote version to compare with
+        if manifest["is_placeholder"]:
+            remote_version = None
+        else:
+            remote_version = (access["rts"], manifest["base_version"])
+        if bucket.get(entry_id) != remote_version:
+            if remote_version:
+                bucket[entry_id] = remote_version
+            else:
+                del bucket[entry_id]
+            self._save_remote_versions_bucket(index)
+
+    def remove_entry(self, entry_id: UUID) -> None:
+        index = entry_id.int % DIRTY_ENTRIES_BUCKETS
+        dirty_entries = self._load_dirty_entries_bucket(index)
+        if entry_id in dirty_entries:
+            dirty_entries.discard(entry_id)
+            self._save_dirty_entries_bucket(index)
+
+        index = entry_id.int % REMOTE_VERSIONS_BUCKETS
+        bucket = self._load_remote_versions_bucket(index)
+        if bucket.pop(entry_id, None):
+            self._save_remote_versions_bucket(index)
+
+    def get_remote_version(self, entry_id: UUID) -> Optional[int]:
+        bucket = self._load_remote_versions_bucket(entry_id.int % REMOTE_VERSIONS_BUCKETS)
+        try:
+            _, version = bucket[entry_id]
+            return version
+        except KeyError:
+            return None
+
+    def _load_beacons_offsets(self):
+        if self._beacons_offsets is None:
+            self._beacons_offsets = dict(self._load_record("beacons_offsets") or ())
+        return self._beacons_offsets
+
+    def get_beacon_offset(self, beacon_id: UUID) -> int:
+        """
+        Returns: The number of beacon items already processed
+        """
+        return self._load_beacons_offsets().get(beacon_id, 0)
+
+    def set_beacons_offsets(self, offsets: Dict[UUID, int]) -> None:
+        self._load_beacons_offsets().update(offsets)
+        self._save_record("beacons_offsets", list(self._beacons_offsets.items()))
+
+    def get_dirty_entries(self) -> List[UUID]:
+        entries = []
+        for index in range(DIRTY_ENTRIES_BUCKETS):
+            entries += self._load_dirty_entries_bucket(index)
+        return entries
+
+    def get_remote_versions(self) -> List[dict]:
+        entries = []
+        for index in range(REMOTE_VERSIONS_BUCKETS):
+            bucket = self._load_remote_versions_bucket(index)
+            for entry_id, (rts, version) in bucket.items():
+                entries.append({"id": entry_id, "rts": rts, "version": version})
+        return entries
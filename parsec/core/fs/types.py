@@ -55,6 +55,8 @@ RemoteWorkspaceManifest = NewType("RemoteWorkspaceManifest", dict)
 RemoteFolderManifest = NewType("RemoteFolderManifest", dict)
 RemoteFileManifest = NewType("RemoteFileManifest", dict)
 
+FolderManifestDelta = NewType("FolderManifestDelta", dict)
+
 
 LocalManifest = Union[
     LocalUserManifest, LocalWorkspaceManifest, LocalFolderManifest, LocalFileManifest
@@ -23,7 +23,8 @@ from parsec.core.fs.types import (
 
 def copy_manifest(manifest: LocalManifest):
     """
-    Basically an optimized version of deepcopy
+    Basically an optimized version of deepcopy, except the accesses of the
+    children which are never modified in place and hence shared.
     """
 
     def _recursive_copy(old):
@@ -40,7 +41,10 @@ def copy_manifest(manifest: LocalManifest):
             # Occurs when dealing with list of strings
             return old
 
-    return _recursive_copy(manifest)
+    children = manifest.get("children") if isinstance(manifest, dict) else None
+    if children is None:
+        return _recursive_copy(manifest)
+    return {**_recursive_copy({**manifest, "children": {}}), "children": children.copy()}
 
 
 def new_access() -> Access:
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/devices_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_DevicesWidget(object):
+    def setupUi(self, DevicesWidget):
+        DevicesWidget.setObjectName("DevicesWidget")
+        DevicesWidget.resize(400, 300)
+        DevicesWidget.setStyleSheet("QWidget#DevicesWidget\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(DevicesWidget)
+        self.verticalLayout.setContentsMargins(0, 15, 0, 15)
+        self.verticalLayout.setObjectName("verticalLayout")
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem1)
+        self.button_add_device = QtWidgets.QPushButton(DevicesWidget)
+        self.button_add_device.setMinimumSize(QtCore.QSize(80, 64))
+        self.button_add_device.setMaximumSize(QtCore.QSize(80, 64))
+        self.button_add_device.setStyleSheet("QPushButton#button_add_device\n"
+"{\n"
+"border-top-left-radius: 32px;\n"
+"border-bottom-left-radius: 32px;\n"
+"background-color: rgb(12, 65, 157);\n"
+"padding-left: 10px;\n"
+"}")
+        self.button_add_device.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/add-plus-button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_add_device.setIcon(icon)
+        self.button_add_device.setIconSize(QtCore.QSize(50, 50))
+        self.button_add_device.setObjectName("button_add_device")
+        self.horizontalLayout_2.addWidget(self.button_add_device)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+
+        self.retranslateUi(DevicesWidget)
+        QtCore.QMetaObject.connectSlotsByName(DevicesWidget)
+
+    def retranslateUi(self, DevicesWidget):
+        _translate = QtCore.QCoreApplication.translate
+        DevicesWidget.setWindowTitle(_translate("DevicesWidget", "Form"))
+
+from parsec.core.gui import resources_rc
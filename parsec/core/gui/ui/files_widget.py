@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/files_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_FilesWidget(object):
+    def setupUi(self, FilesWidget):
+        FilesWidget.setObjectName("FilesWidget")
+        FilesWidget.resize(713, 489)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(FilesWidget.sizePolicy().hasHeightForWidth())
+        FilesWidget.setSizePolicy(sizePolicy)
+        FilesWidget.setStyleSheet("QWidget#FilesWidget\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QListWidget\n"
+"{\n"
+"border: 1px solid rgb(28, 78, 163);\n"
+"}\n"
+"\n"
+"QListView::item\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"color: rgb(0, 0, 0);\n"
+"}\n"
+"\n"
+"QListView::item:selected\n"
+"{\n"
+"background-color: rgb(45, 144, 209);\n"
+"}\n"
+"\n"
+"QScrollBar:vertical\n"
+"{\n"
+"background: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical\n"
+"{\n"
+"background: rgb(12, 65, 157);\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical\n"
+"{\n"
+"border: none;\n"
+"background: none;\n"
+"}\n"
+"\n"
+"QToolTip\n"
+"{\n"
+"background-color: rgb(46, 146, 208);\n"
+"border: 1px solid rgb(12, 65, 157);\n"
+"color: rgb(255, 255, 255);\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(FilesWidget)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.widget_files = QtWidgets.QWidget(FilesWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget_files.sizePolicy().hasHeightForWidth())
+        self.widget_files.setSizePolicy(sizePolicy)
+        self.widget_files.setObjectName("widget_files")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.widget_files)
+        self.verticalLayout_2.setContentsMargins(0, 10, 30, 0)
+        self.verticalLayout_2.setSpacing(10)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setContentsMargins(-1, -1, 10, -1)
+        self.horizontalLayout.setSpacing(5)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label_current_workspace = QtWidgets.QLabel(self.widget_files)
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_current_workspace.setFont(font)
+        self.label_current_workspace.setStyleSheet("color: rgb(123, 134, 164);")
+        self.label_current_workspace.setText("")
+        self.label_current_workspace.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        self.label_current_workspace.setObjectName("label_current_workspace")
+        self.horizontalLayout.addWidget(self.label_current_workspace)
+        self.label_caret = QtWidgets.QLabel(self.widget_files)
+        self.label_caret.setMaximumSize(QtCore.QSize(18, 18))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.label_caret.setFont(font)
+        self.label_caret.setText("")
+        self.label_caret.setPixmap(QtGui.QPixmap(":/icons/images/icons/right-chevron_black.png"))
+        self.label_caret.setScaledContents(True)
+        self.label_caret.setObjectName("label_caret")
+        self.horizontalLayout.addWidget(self.label_caret)
+        self.label_current_directory = QtWidgets.QLabel(self.widget_files)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_current_directory.sizePolicy().hasHeightForWidth())
+        self.label_current_directory.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_current_directory.setFont(font)
+        self.label_current_directory.setStyleSheet("")
+        self.label_current_directory.setText("")
+        self.label_current_directory.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        self.label_current_directory.setObjectName("label_current_directory")
+        self.horizontalLayout.addWidget(self.label_current_directory)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+        self.line_edit_search = QtWidgets.QLineEdit(self.widget_files)
+        self.line_edit_search.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_search.setFont(font)
+        self.line_edit_search.setStyleSheet("background-image: url(:/icons/images/icons/search.png);\n"
+"background-repeat: no-repeat;\n"
+"background-position: right;\n"
+"border: 1px solid rgb(28, 78, 163);\n"
+"padding-left: 10px;\n"
+"color: rgb(28, 78, 163);")
+        self.line_edit_search.setObjectName("line_edit_search")
+        self.verticalLayout_2.addWidget(self.line_edit_search)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.table_files = QtWidgets.QTableWidget(self.widget_files)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.table_files.setFont(font)
+        self.table_files.setStyleSheet("QTableWidget\n"
+"{\n"
+"border: 1px solid rgb(12, 65, 157);\n"
+"}\n"
+"\n"
+"QHeaderView::section\n"
+"{\n"
+"padding-left: 15px;\n"
+"border: 0;\n"
+"background-color: rgb(12, 65, 157);\n"
+"color: white;\n"
+"font-size: 16px;\n"
+"font-weight: bold;\n"
+"height: 32px;\n"
+"text-align: left;\n"
+"}\n"
+"\n"
+"QTableWidget::item\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"border: 0px;\n"
+"padding: 15px;\n"
+"}\n"
+"\n"
+"QTableWidget::item:selected\n"
+"{\n"
+"background-color: rgb(46, 146, 208);\n"
+"}\n"
+"\n"
+"QHeaderView::down-arrow\n"
+"{\n"
+"image: url(\":/icons/images/icons/sort_down_arrow.png\");\n"
+"subcontrol-position: center right;\n"
+"subcontrol-origin: padding;\n"
+"padding-right: 32px;\n"
+"width: 16px;\n"
+"height: 16px;\n"
+"}\n"
+"\n"
+"QHeaderView::up-arrow\n"
+"{\n"
+"image: url(\":/icons/images/icons/sort_up_arrow.png\");\n"
+"subcontrol-position: center right;\n"
+"subcontrol-origin: padding;\n"
+"padding-right: 32px;\n"
+"width: 16px;\n"
+"height: 16px;\n"
+"}\n"
+"")
+        self.table_files.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.table_files.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.table_files.setLineWidth(0)
+        self.table_files.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.table_files.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table_files.setProperty("showDropIndicator", False)
+        self.table_files.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.table_files.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table_files.setIconSize(QtCore.QSize(32, 32))
+        self.table_files.setShowGrid(False)
+        self.table_files.setGridStyle(QtCore.Qt.NoPen)
+        self.table_files.setWordWrap(False)
+        self.table_files.setCornerButtonEnabled(False)
+        self.table_files.setObjectName("table_files")
+        self.table_files.setColumnCount(6)
+        self.table_files.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_files.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_files.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_files.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_files.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_files.setHorizontalHeaderItem(4, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.table_files.setHorizontalHeaderItem(5, item)
+        self.table_files.horizontalHeader().setStretchLastSection(False)
+        self.table_files.verticalHeader().setSortIndicatorShown(False)
+        self.table_files.verticalHeader().setStretchLastSection(False)
+        self.verticalLayout_3.addWidget(self.table_files)
+        self.verticalLayout_2.addLayout(self.verticalLayout_3)
+        self.verticalLayout.addWidget(self.widget_files)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setContentsMargins(-1, 10, -1, 10)
+        self.horizontalLayout_2.setSpacing(0)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.button_back = QtWidgets.QPushButton(FilesWidget)
+        self.button_back.setMinimumSize(QtCore.QSize(80, 64))
+        self.button_back.setMaximumSize(QtCore.QSize(80, 64))
+        self.button_back.setStatusTip("")
+        self.button_back.setWhatsThis("")
+        self.button_back.setAccessibleName("")
+        self.button_back.setAccessibleDescription("")
+        self.button_back.setStyleSheet("QPushButton#button_back\n"
+"{\n"
+"border-top-left-radius: 32px;\n"
+"border-bottom-left-radius: 32px;\n"
+"background-color: rgb(12, 65, 157);\n"
+"padding-left: 10px;\n"
+"}")
+        self.button_back.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/go-back_button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_back.setIcon(icon)
+        self.button_back.setIconSize(QtCore.QSize(50, 50))
+        self.button_back.setObjectName("button_back")
+        self.horizontalLayout_2.addWidget(self.button_back)
+        self.button_import_folder = QtWidgets.QPushButton(FilesWidget)
+        self.button_import_folder.setMinimumSize(QtCore.QSize(80, 64))
+        self.button_import_folder.setMaximumSize(QtCore.QSize(80, 64))
+        self.button_import_folder.setStyleSheet("QPushButton#button_import_folder\n"
+"{\n"
+"border: 0;\n"
+"background-color: rgb(12, 65, 157);\n"
+"padding-left: 10px;\n"
+"}")
+        self.button_import_folder.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/images/icons/import_folder.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_import_folder.setIcon(icon1)
+        self.button_import_folder.setIconSize(QtCore.QSize(50, 50))
+        self.button_import_folder.setObjectName("button_import_folder")
+        self.horizontalLayout_2.addWidget(self.button_import_folder)
+        self.button_import_files = QtWidgets.QPushButton(FilesWidget)
+        self.button_import_files.setMinimumSize(QtCore.QSize(80, 64))
+        self.button_import_files.setMaximumSize(QtCore.QSize(80, 64))
+        self.button_import_files.setStyleSheet("QPushButton#button_import_files\n"
+"{\n"
+"border: 0;\n"
+"background-color: rgb(12, 65, 157);\n"
+"padding-left: 10px;\n"
+"}")
+        self.button_import_files.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/icons/images/icons/import_file.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_import_files.setIcon(icon2)
+        self.button_import_files.setIconSize(QtCore.QSize(50, 50))
+        self.button_import_files.setObjectName("button_import_files")
+        self.horizontalLayout_2.addWidget(self.button_import_files)
+        self.button_create_folder = QtWidgets.QPushButton(FilesWidget)
+        self.button_create_folder.setMinimumSize(QtCore.QSize(80, 64))
+        self.button_create_folder.setMaximumSize(QtCore.QSize(80, 64))
+        self.button_create_folder.setStyleSheet("QPushButton#button_create_folder\n"
+"{\n"
+"border: 0;\n"
+"background-color: rgb(12, 65, 157);\n"
+"padding-left: 10px;\n"
+"}")
+        self.button_create_folder.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(":/icons/images/icons/add-plus-button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_create_folder.setIcon(icon3)
+        self.button_create_folder.setIconSize(QtCore.QSize(50, 50))
+        self.button_create_folder.setObjectName("button_create_folder")
+        self.horizontalLayout_2.addWidget(self.button_create_folder)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+
+        self.retranslateUi(FilesWidget)
+        QtCore.QMetaObject.connectSlotsByName(FilesWidget)
+
+    def retranslateUi(self, FilesWidget):
+        _translate = QtCore.QCoreApplication.translate
+        FilesWidget.setWindowTitle(_translate("FilesWidget", "Form"))
+        self.line_edit_search.setPlaceholderText(_translate("FilesWidget", "Search files or folders"))
+        self.table_files.setSortingEnabled(True)
+        item = self.table_files.horizontalHeaderItem(1)
+        item.setText(_translate("FilesWidget", "Name"))
+        item = self.table_files.horizontalHeaderItem(2)
+        item.setText(_translate("FilesWidget", "Created"))
+        item = self.table_files.horizontalHeaderItem(3)
+        item.setText(_translate("FilesWidget", "Updated"))
+        item = self.table_files.horizontalHeaderItem(4)
+        item.setText(_translate("FilesWidget", "Size"))
+        self.button_back.setToolTip(_translate("FilesWidget", "Return to the list of workspaces"))
+        self.button_import_folder.setToolTip(_translate("FilesWidget", "Import a folder"))
+        self.button_import_files.setToolTip(_translate("FilesWidget", "Import multiple files"))
+        self.button_create_folder.setToolTip(_translate("FilesWidget", "Add a folder"))
+
+from parsec.core.gui import resources_rc
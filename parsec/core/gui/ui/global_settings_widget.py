@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/global_settings_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_GlobalSettingsWidget(object):
+    def setupUi(self, GlobalSettingsWidget):
+        GlobalSettingsWidget.setObjectName("GlobalSettingsWidget")
+        GlobalSettingsWidget.resize(438, 372)
+        GlobalSettingsWidget.setStyleSheet("QWidget#GlobalSettingsWidget\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QLineEdit\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"padding-left: 10px;\n"
+"}\n"
+"\n"
+"QLineEdit[readOnly=\"true\"]\n"
+"{\n"
+"background-color: rgb(230, 230, 230);\n"
+"}\n"
+"\n"
+"QLineEdit:!enabled\n"
+"{\n"
+"border: 1px solid rgb(180, 180, 180);\n"
+"}\n"
+"\n"
+"QPushButton\n"
+"{\n"
+"background-color: rgb(45, 144, 209);\n"
+"border: 1px solid rgb(11, 56, 166);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:disabled\n"
+"{\n"
+"border: 1px solid rgb(65, 75, 106);\n"
+"background-color: rgb(112, 122, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QCheckBox::indicator\n"
+"{\n"
+"width: 15px;\n"
+"height: 15px;\n"
+"background-color: rgb(255, 255, 255);\n"
+"border: 2px solid rgb(30, 78, 162);\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QCheckBox::indicator:checked\n"
+"{\n"
+"image: url(:/icons/images/icons/checked.png)\n"
+"}\n"
+"\n"
+"QComboBox\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"background-color: white;\n"
+"color: black;\n"
+"padding-left: 5px;\n"
+"}\n"
+"\n"
+"QComboBox::drop-down\n"
+"{\n"
+"border: 0px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow\n"
+"{\n"
+"image: url(:/icons/images/icons/down-arrow.png);\n"
+"width: 16px;\n"
+"height: 16px;\n"
+"padding-right: 5px;\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(GlobalSettingsWidget)
+        self.verticalLayout.setContentsMargins(20, 20, 20, 20)
+        self.verticalLayout.setSpacing(20)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.widget_2 = QtWidgets.QWidget(GlobalSettingsWidget)
+        self.widget_2.setObjectName("widget_2")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.widget_2)
+        self.verticalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_8.setSpacing(5)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_2 = QtWidgets.QLabel(self.widget_2)
+        self.label_2.setMinimumSize(QtCore.QSize(16, 16))
+        self.label_2.setMaximumSize(QtCore.QSize(16, 16))
+        self.label_2.setText("")
+        self.label_2.setPixmap(QtGui.QPixmap(":/icons/images/icons/right-chevron_black.png"))
+        self.label_2.setScaledContents(True)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout_2.addWidget(self.label_2)
+        self.label = QtWidgets.QLabel(self.widget_2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setUnderline(False)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.horizontalLayout_2.addWidget(self.label)
+        self.verticalLayout_8.addLayout(self.horizontalLayout_2)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setContentsMargins(20, -1, -1, -1)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.line_edit_mountpoint = QtWidgets.QLineEdit(self.widget_2)
+        self.line_edit_mountpoint.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.line_edit_mountpoint.setFont(font)
+        self.line_edit_mountpoint.setStyleSheet("")
+        self.line_edit_mountpoint.setText("")
+        self.line_edit_mountpoint.setReadOnly(True)
+        self.line_edit_mountpoint.setObjectName("line_edit_mountpoint")
+        self.horizontalLayout.addWidget(self.line_edit_mountpoint)
+        self.button_choose_mountpoint = QtWidgets.QPushButton(self.widget_2)
+        self.button_choose_mountpoint.setEnabled(True)
+        self.button_choose_mountpoint.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setWeight(50)
+        self.button_choose_mountpoint.setFont(font)
+        self.button_choose_mountpoint.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.button_choose_mountpoint.setStyleSheet("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/edit_white.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_choose_mountpoint.setIcon(icon)
+        self.button_choose_mountpoint.setIconSize(QtCore.QSize(24, 24))
+        self.button_choose_mountpoint.setObjectName("button_choose_mountpoint")
+        self.horizontalLayout.addWidget(self.button_choose_mountpoint)
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+        self.checkbox_enable_mountpoint = QtWidgets.QCheckBox(self.widget_2)
+        self.checkbox_enable_mountpoint.setTristate(False)
+        self.checkbox_enable_mountpoint.setObjectName("checkbox_enable_mountpoint")
+        self.verticalLayout_3.addWidget(self.checkbox_enable_mountpoint)
+        self.verticalLayout_8.addLayout(self.verticalLayout_3)
+        self.verticalLayout.addWidget(self.widget_2)
+        self.widget_3 = QtWidgets.QWidget(GlobalSettingsWidget)
+        self.widget_3.setObjectName("widget_3")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.widget_3)
+        self.verticalLayout_9.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_9.setSpacing(5)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label_3 = QtWidgets.QLabel(self.widget_3)
+        self.label_3.setMinimumSize(QtCore.QSize(16, 16))
+        self.label_3.setMaximumSize(QtCore.QSize(16, 16))
+        self.label_3.setText("")
+        self.label_3.setPixmap(QtGui.QPixmap(":/icons/images/icons/right-chevron_black.png"))
+        self.label_3.setScaledContents(True)
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_3.addWidget(self.label_3)
+        self.label_4 = QtWidgets.QLabel(self.widget_3)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_4.setFont(font)
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_3.addWidget(self.label_4)
+        self.verticalLayout_9.addLayout(self.horizontalLayout_3)
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_4.setContentsMargins(20, -1, -1, -1)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.checkbox_tray = QtWidgets.QCheckBox(self.widget_3)
+        self.checkbox_tray.setObjectName("checkbox_tray")
+        self.verticalLayout_4.addWidget(self.checkbox_tray)
+        self.verticalLayout_9.addLayout(self.verticalLayout_4)
+        self.verticalLayout.addWidget(self.widget_3)
+        self.widget_4 = QtWidgets.QWidget(GlobalSettingsWidget)
+        self.widget_4.setObjectName("widget_4")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.widget_4)
+        self.verticalLayout_13.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_13.setSpacing(5)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.label_9 = QtWidgets.QLabel(self.widget_4)
+        self.label_9.setMinimumSize(QtCore.QSize(16, 16))
+        self.label_9.setMaximumSize(QtCore.QSize(16, 16))
+        self.label_9.setText("")
+        self.label_9.setPixmap(QtGui.QPixmap(":/icons/images/icons/right-chevron_black.png"))
+        self.label_9.setScaledContents(True)
+        self.label_9.setObjectName("label_9")
+        self.horizontalLayout_8.addWidget(self.label_9)
+        self.label_8 = QtWidgets.QLabel(self.widget_4)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.horizontalLayout_8.addWidget(self.label_8)
+        self.verticalLayout_13.addLayout(self.horizontalLayout_8)
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_11.setContentsMargins(20, -1, -1, -1)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.label_10 = QtWidgets.QLabel(self.widget_4)
+        self.label_10.setObjectName("label_10")
+        self.horizontalLayout_9.addWidget(self.label_10)
+        self.combo_languages = QtWidgets.QComboBox(self.widget_4)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.combo_languages.sizePolicy().hasHeightForWidth())
+        self.combo_languages.setSizePolicy(sizePolicy)
+        self.combo_languages.setMinimumSize(QtCore.QSize(0, 32))
+        self.combo_languages.setObjectName("combo_languages")
+        self.horizontalLayout_9.addWidget(self.combo_languages)
+        self.verticalLayout_11.addLayout(self.horizontalLayout_9)
+        self.verticalLayout_13.addLayout(self.verticalLayout_11)
+        self.verticalLayout.addWidget(self.widget_4)
+        spacerItem = QtWidgets.QSpacerItem(20, 19, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem1)
+        self.button_save = QtWidgets.QPushButton(GlobalSettingsWidget)
+        self.button_save.setMinimumSize(QtCore.QSize(0, 32))
+        self.button_save.setMaximumSize(QtCore.QSize(16777215, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.button_save.setFont(font)
+        self.button_save.setLayoutDirection(QtCore.Qt.RightToLeft)
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/images/icons/checked_white.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_save.setIcon(icon1)
+        self.button_save.setIconSize(QtCore.QSize(24, 24))
+        self.button_save.setObjectName("button_save")
+        self.horizontalLayout_5.addWidget(self.button_save)
+        self.verticalLayout.addLayout(self.horizontalLayout_5)
+
+        self.retranslateUi(GlobalSettingsWidget)
+        QtCore.QMetaObject.connectSlotsByName(GlobalSettingsWidget)
+
+    def retranslateUi(self, GlobalSettingsWidget):
+        _translate = QtCore.QCoreApplication.translate
+        GlobalSettingsWidget.setWindowTitle(_translate("GlobalSettingsWidget", "Form"))
+        self.label.setText(_translate("GlobalSettingsWidget", "Mountpoint"))
+        self.button_choose_mountpoint.setText(_translate("GlobalSettingsWidget", "Choose mountpoint"))
+        self.checkbox_enable_mountpoint.setText(_translate("GlobalSettingsWidget", "Enable mountpoint"))
+        self.label_4.setText(_translate("GlobalSettingsWidget", "Behavior"))
+        self.checkbox_tray.setText(_translate("GlobalSettingsWidget", "Close button minimizes Parsec in the tray"))
+        self.label_8.setText(_translate("GlobalSettingsWidget", "Localization"))
+        self.label_10.setText(_translate("GlobalSettingsWidget", "Language"))
+        self.button_save.setText(_translate("GlobalSettingsWidget", "Save"))
+
+from parsec.core.gui import resources_rc
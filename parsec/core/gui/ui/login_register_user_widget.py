@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/login_register_user_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_LoginRegisterUserWidget(object):
+    def setupUi(self, LoginRegisterUserWidget):
+        LoginRegisterUserWidget.setObjectName("LoginRegisterUserWidget")
+        LoginRegisterUserWidget.resize(632, 711)
+        LoginRegisterUserWidget.setStyleSheet("QWidget#LoginRegisterUserWidget\n"
+"{\n"
+"background-color: rgb(12, 65, 156);\n"
+"}\n"
+"")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(LoginRegisterUserWidget)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.label_9 = QtWidgets.QLabel(LoginRegisterUserWidget)
+        self.label_9.setMaximumSize(QtCore.QSize(16777215, 55))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_9.setFont(font)
+        self.label_9.setStyleSheet("color: rgb(255, 255, 255);")
+        self.label_9.setAlignment(QtCore.Qt.AlignJustify|QtCore.Qt.AlignVCenter)
+        self.label_9.setWordWrap(True)
+        self.label_9.setObjectName("label_9")
+        self.verticalLayout_4.addWidget(self.label_9)
+        self.widget = QtWidgets.QWidget(LoginRegisterUserWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+        self.widget.setSizePolicy(sizePolicy)
+        self.widget.setMinimumSize(QtCore.QSize(0, 0))
+        self.widget.setStyleSheet("QPushButton:disabled\n"
+"{\n"
+"background-color: rgb(128, 128, 128);\n"
+"}\n"
+"\n"
+"QLabel\n"
+"{\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QLineEdit\n"
+"{\n"
+"border: 2px solid rgb(46, 145, 208);\n"
+"background-color: white;\n"
+"color: black;\n"
+"padding-left: 5px;\n"
+"}\n"
+"\n"
+"QComboBox\n"
+"{\n"
+"border: 2px solid rgb(46, 145, 208);\n"
+"background-color: white;\n"
+"color: black;\n"
+"padding-left: 5px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow\n"
+"{\n"
+"image: url(:/icons/images/icons/down-arrow.png);\n"
+"}\n"
+"\n"
+"QCheckBox\n"
+"{\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QCheckBox::indicator\n"
+"{\n"
+"width: 15px;\n"
+"height: 15px;\n"
+"background-color: rgb(255, 255, 255);\n"
+"border: 2px solid rgb(46, 145, 208);\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QCheckBox::indicator:checked\n"
+"{\n"
+"image: url(:/icons/images/icons/checked.png)\n"
+"}")
+        self.widget.setObjectName("widget")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.widget)
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_6.setSpacing(0)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.widget_2 = QtWidgets.QWidget(self.widget)
+        self.widget_2.setStyleSheet("")
+        self.widget_2.setObjectName("widget_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.widget_2)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(10)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_5.setSpacing(0)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.label = QtWidgets.QLabel(self.widget_2)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label.setFont(font)
+        self.label.setStyleSheet("")
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        self.verticalLayout_5.addWidget(self.label)
+        self.line_edit_login = QtWidgets.QLineEdit(self.widget_2)
+        self.line_edit_login.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_login.setFont(font)
+        self.line_edit_login.setObjectName("line_edit_login")
+        self.verticalLayout_5.addWidget(self.line_edit_login)
+        self.verticalLayout.addLayout(self.verticalLayout_5)
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_7.setSpacing(0)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.label_7 = QtWidgets.QLabel(self.widget_2)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_7.setFont(font)
+        self.label_7.setStyleSheet("")
+        self.label_7.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_7.setObjectName("label_7")
+        self.verticalLayout_7.addWidget(self.label_7)
+        self.line_edit_device = QtWidgets.QLineEdit(self.widget_2)
+        self.line_edit_device.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_device.setFont(font)
+        self.line_edit_device.setObjectName("line_edit_device")
+        self.verticalLayout_7.addWidget(self.line_edit_device)
+        self.verticalLayout.addLayout(self.verticalLayout_7)
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_8.setSpacing(0)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.label_8 = QtWidgets.QLabel(self.widget_2)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_8.setFont(font)
+        self.label_8.setStyleSheet("")
+        self.label_8.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_8.setObjectName("label_8")
+        self.verticalLayout_8.addWidget(self.label_8)
+        self.line_edit_token = QtWidgets.QLineEdit(self.widget_2)
+        self.line_edit_token.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_token.setFont(font)
+        self.line_edit_token.setObjectName("line_edit_token")
+        self.verticalLayout_8.addWidget(self.line_edit_token)
+        self.verticalLayout.addLayout(self.verticalLayout_8)
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_9.setSpacing(0)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.label_10 = QtWidgets.QLabel(self.widget_2)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_10.setFont(font)
+        self.label_10.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_10.setObjectName("label_10")
+        self.verticalLayout_9.addWidget(self.label_10)
+        self.line_edit_url = QtWidgets.QLineEdit(self.widget_2)
+        self.line_edit_url.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_url.setFont(font)
+        self.line_edit_url.setObjectName("line_edit_url")
+        self.verticalLayout_9.addWidget(self.line_edit_url)
+        self.verticalLayout.addLayout(self.verticalLayout_9)
+        self.widget_password = QtWidgets.QWidget(self.widget_2)
+        self.widget_password.setObjectName("widget_password")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.widget_password)
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_2.setSpacing(10)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_10.setSpacing(0)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.label_2 = QtWidgets.QLabel(self.widget_password)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_2.setFont(font)
+        self.label_2.setStyleSheet("")
+        self.label_2.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_10.addWidget(self.label_2)
+        self.line_edit_password = QtWidgets.QLineEdit(self.widget_password)
+        self.line_edit_password.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_password.setFont(font)
+        self.line_edit_password.setStyleSheet("")
+        self.line_edit_password.setText("")
+        self.line_edit_password.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.line_edit_password.setObjectName("line_edit_password")
+        self.verticalLayout_10.addWidget(self.line_edit_password)
+        self.verticalLayout_2.addLayout(self.verticalLayout_10)
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_11.setSpacing(0)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.label_6 = QtWidgets.QLabel(self.widget_password)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_6.setFont(font)
+        self.label_6.setStyleSheet("")
+        self.label_6.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_6.setObjectName("label_6")
+        self.verticalLayout_11.addWidget(self.label_6)
+        self.line_edit_password_check = QtWidgets.QLineEdit(self.widget_password)
+        self.line_edit_password_check.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_password_check.setFont(font)
+        self.line_edit_password_check.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.line_edit_password_check.setObjectName("line_edit_password_check")
+        self.verticalLayout_11.addWidget(self.line_edit_password_check)
+        self.verticalLayout_2.addLayout(self.verticalLayout_11)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label_password_strength = QtWidgets.QLabel(self.widget_password)
+        self.label_password_strength.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_password_strength.setFont(font)
+        self.label_password_strength.setLineWidth(0)
+        self.label_password_strength.setText("")
+        self.label_password_strength.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_password_strength.setObjectName("label_password_strength")
+        self.horizontalLayout.addWidget(self.label_password_strength)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+        self.verticalLayout.addWidget(self.widget_password)
+        self.widget_pkcs11 = QtWidgets.QWidget(self.widget_2)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.widget_pkcs11.setFont(font)
+        self.widget_pkcs11.setStyleSheet("color: rgb(255, 255, 255);")
+        self.widget_pkcs11.setObjectName("widget_pkcs11")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.widget_pkcs11)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setSpacing(15)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_13.setSpacing(0)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.label_4 = QtWidgets.QLabel(self.widget_pkcs11)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_4.setFont(font)
+        self.label_4.setStyleSheet("")
+        self.label_4.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout_13.addWidget(self.label_4)
+        self.combo_pkcs11_token = QtWidgets.QComboBox(self.widget_pkcs11)
+        self.combo_pkcs11_token.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.combo_pkcs11_token.setFont(font)
+        self.combo_pkcs11_token.setStyleSheet("color: black;")
+        self.combo_pkcs11_token.setObjectName("combo_pkcs11_token")
+        self.verticalLayout_13.addWidget(self.combo_pkcs11_token)
+        self.verticalLayout_3.addLayout(self.verticalLayout_13)
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_14.setSpacing(0)
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.label_5 = QtWidgets.QLabel(self.widget_pkcs11)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_5.setFont(font)
+        self.label_5.setStyleSheet("")
+        self.label_5.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_5.setObjectName("label_5")
+        self.verticalLayout_14.addWidget(self.label_5)
+        self.combo_pkcs11_key = QtWidgets.QComboBox(self.widget_pkcs11)
+        self.combo_pkcs11_key.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.combo_pkcs11_key.setFont(font)
+        self.combo_pkcs11_key.setStyleSheet("color: black;")
+        self.combo_pkcs11_key.setObjectName("combo_pkcs11_key")
+        self.verticalLayout_14.addWidget(self.combo_pkcs11_key)
+        self.verticalLayout_3.addLayout(self.verticalLayout_14)
+        self.verticalLayout.addWidget(self.widget_pkcs11)
+        self.check_box_use_pkcs11 = QtWidgets.QCheckBox(self.widget_2)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.check_box_use_pkcs11.setFont(font)
+        self.check_box_use_pkcs11.setStyleSheet("")
+        self.check_box_use_pkcs11.setCheckable(True)
+        self.check_box_use_pkcs11.setChecked(False)
+        self.check_box_use_pkcs11.setObjectName("check_box_use_pkcs11")
+        self.verticalLayout.addWidget(self.check_box_use_pkcs11)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setSpacing(0)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem)
+        self.button_claim = QtWidgets.QPushButton(self.widget_2)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.button_claim.setFont(font)
+        self.button_claim.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.button_claim.setStyleSheet("QPushButton#button_claim\n"
+"{\n"
+"border: 1px solid rgb(255, 255, 255);\n"
+"color: rgb(255, 255, 255);\n"
+"padding: 7px;\n"
+"}")
+        self.button_claim.setIconSize(QtCore.QSize(28, 28))
+        self.button_claim.setFlat(True)
+        self.button_claim.setObjectName("button_claim")
+        self.horizontalLayout_3.addWidget(self.button_claim)
+        self.verticalLayout.addLayout(self.horizontalLayout_3)
+        self.verticalLayout_6.addWidget(self.widget_2)
+        self.verticalLayout_4.addWidget(self.widget)
+
+        self.retranslateUi(LoginRegisterUserWidget)
+        self.check_box_use_pkcs11.toggled['bool'].connect(self.widget_pkcs11.setVisible)
+        self.check_box_use_pkcs11.toggled['bool'].connect(self.widget_password.setHidden)
+        QtCore.QMetaObject.connectSlotsByName(LoginRegisterUserWidget)
+
+    def retranslateUi(self, LoginRegisterUserWidget):
+        _translate = QtCore.QCoreApplication.translate
+        LoginRegisterUserWidget.setWindowTitle(_translate("LoginRegisterUserWidget", "Form"))
+        self.label_9.setText(_translate("LoginRegisterUserWidget", "To register a new user, you need another user to create an account and get a token."))
+        self.label.setText(_translate("LoginRegisterUserWidget", "User name"))
+        self.label_7.setText(_translate("LoginRegisterUserWidget", "Device name"))
+        self.label_8.setText(_translate("LoginRegisterUserWidget", "Token"))
+        self.label_10.setText(_translate("LoginRegisterUserWidget", "URL"))
+        self.label_2.setText(_translate("LoginRegisterUserWidget", "Password"))
+        self.label_6.setText(_translate("LoginRegisterUserWidget", "Password check"))
+        self.label_4.setText(_translate("LoginRegisterUserWidget", "PKCS #11 Token"))
+        self.label_5.setText(_translate("LoginRegisterUserWidget", "PKCS #11 Key"))
+        self.check_box_use_pkcs11.setText(_translate("LoginRegisterUserWidget", "Authenticate using PKCS #11"))
+        self.button_claim.setText(_translate("LoginRegisterUserWidget", "Register"))
+
@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/network_settings_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_NetworkSettingsWidget(object):
+    def setupUi(self, NetworkSettingsWidget):
+        NetworkSettingsWidget.setObjectName("NetworkSettingsWidget")
+        NetworkSettingsWidget.resize(400, 583)
+        NetworkSettingsWidget.setStyleSheet("QWidget#NetworkSettingsWidget\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QLineEdit\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"padding-left: 10px;\n"
+"}\n"
+"\n"
+"QSpinBox\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"padding-right: 10px;\n"
+"}\n"
+"\n"
+"QSpinBox::up-button\n"
+"{\n"
+"border-image: url(:/icons/images/icons/sort_up_arrow.png);\n"
+"width: 20px;\n"
+"}\n"
+"\n"
+"QSpinBox::down-button\n"
+"{\n"
+"border-image: url(:/icons/images/icons/sort_down_arrow.png);\n"
+"width: 20px;\n"
+"}\n"
+"\n"
+"QLineEdit[readOnly=\"true\"]\n"
+"{\n"
+"background-color: rgb(230, 230, 230);\n"
+"}\n"
+"\n"
+"QLineEdit:!enabled\n"
+"{\n"
+"border: 1px solid rgb(180, 180, 180);\n"
+"}\n"
+"\n"
+"QPushButton\n"
+"{\n"
+"background-color: rgb(45, 144, 209);\n"
+"border: 1px solid rgb(11, 56, 166);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:disabled\n"
+"{\n"
+"border: 1px solid rgb(65, 75, 106);\n"
+"background-color: rgb(112, 122, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QCheckBox::indicator\n"
+"{\n"
+"width: 15px;\n"
+"height: 15px;\n"
+"background-color: rgb(255, 255, 255);\n"
+"border: 2px solid rgb(30, 78, 162);\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QCheckBox::indicator:checked\n"
+"{\n"
+"image: url(:/icons/images/icons/checked.png)\n"
+"}\n"
+"\n"
+"QComboBox\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"background-color: white;\n"
+"color: black;\n"
+"padding-left: 5px;\n"
+"}\n"
+"\n"
+"QComboBox::drop-down\n"
+"{\n"
+"border: 0px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow\n"
+"{\n"
+"image: url(:/icons/images/icons/down-arrow.png);\n"
+"width: 16px;\n"
+"height: 16px;\n"
+"padding-right: 5px;\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(NetworkSettingsWidget)
+        self.verticalLayout.setContentsMargins(20, 20, 20, 20)
+        self.verticalLayout.setSpacing(20)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.widget = QtWidgets.QWidget(NetworkSettingsWidget)
+        self.widget.setObjectName("widget")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.widget)
+        self.verticalLayout_7.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_7.setSpacing(5)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label_6 = QtWidgets.QLabel(self.widget)
+        self.label_6.setMinimumSize(QtCore.QSize(16, 16))
+        self.label_6.setMaximumSize(QtCore.QSize(16, 16))
+        self.label_6.setText("")
+        self.label_6.setPixmap(QtGui.QPixmap(":/icons/images/icons/right-chevron_black.png"))
+        self.label_6.setScaledContents(True)
+        self.label_6.setObjectName("label_6")
+        self.horizontalLayout_4.addWidget(self.label_6)
+        self.label_5 = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_5.setFont(font)
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_4.addWidget(self.label_5)
+        self.verticalLayout_7.addLayout(self.horizontalLayout_4)
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_6.setContentsMargins(20, -1, -1, -1)
+        self.verticalLayout_6.setSpacing(10)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.label_7 = QtWidgets.QLabel(self.widget)
+        self.label_7.setObjectName("label_7")
+        self.horizontalLayout_7.addWidget(self.label_7)
+        self.combo_proxy_type = QtWidgets.QComboBox(self.widget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.combo_proxy_type.sizePolicy().hasHeightForWidth())
+        self.combo_proxy_type.setSizePolicy(sizePolicy)
+        self.combo_proxy_type.setMinimumSize(QtCore.QSize(0, 32))
+        self.combo_proxy_type.setObjectName("combo_proxy_type")
+        self.combo_proxy_type.addItem("")
+        self.combo_proxy_type.addItem("")
+        self.combo_proxy_type.addItem("")
+        self.combo_proxy_type.addItem("")
+        self.horizontalLayout_7.addWidget(self.combo_proxy_type)
+        self.verticalLayout_6.addLayout(self.horizontalLayout_7)
+        self.widget_proxy_info = QtWidgets.QWidget(self.widget)
+        self.widget_proxy_info.setEnabled(True)
+        self.widget_proxy_info.setObjectName("widget_proxy_info")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.widget_proxy_info)
+        self.verticalLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_10.setSpacing(10)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.line_edit_proxy_host = QtWidgets.QLineEdit(self.widget_proxy_info)
+        self.line_edit_proxy_host.setEnabled(True)
+        self.line_edit_proxy_host.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_proxy_host.setMaximumSize(QtCore.QSize(16777215, 32))
+        self.line_edit_proxy_host.setText("")
+        self.line_edit_proxy_host.setObjectName("line_edit_proxy_host")
+        self.horizontalLayout_5.addWidget(self.line_edit_proxy_host)
+        self.line_edit_proxy_port = QtWidgets.QLineEdit(self.widget_proxy_info)
+        self.line_edit_proxy_port.setEnabled(True)
+        self.line_edit_proxy_port.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_proxy_port.setMaximumSize(QtCore.QSize(100, 32))
+        self.line_edit_proxy_port.setObjectName("line_edit_proxy_port")
+        self.horizontalLayout_5.addWidget(self.line_edit_proxy_port)
+        self.verticalLayout_10.addLayout(self.horizontalLayout_5)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.line_edit_proxy_username = QtWidgets.QLineEdit(self.widget_proxy_info)
+        self.line_edit_proxy_username.setEnabled(True)
+        self.line_edit_proxy_username.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_proxy_username.setMaximumSize(QtCore.QSize(16777215, 32))
+        self.line_edit_proxy_username.setObjectName("line_edit_proxy_username")
+        self.horizontalLayout_6.addWidget(self.line_edit_proxy_username)
+        self.line_edit_proxy_password = QtWidgets.QLineEdit(self.widget_proxy_info)
+        self.line_edit_proxy_password.setEnabled(True)
+        self.line_edit_proxy_password.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_proxy_password.setMaximumSize(QtCore.QSize(16777215, 32))
+        self.line_edit_proxy_password.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.line_edit_proxy_password.setObjectName("line_edit_proxy_password")
+        self.horizontalLayout_6.addWidget(self.line_edit_proxy_password)
+        self.verticalLayout_10.addLayout(self.horizontalLayout_6)
+        self.verticalLayout_6.addWidget(self.widget_proxy_info)
+        self.verticalLayout_7.addLayout(self.verticalLayout_6)
+        self.verticalLayout.addWidget(self.widget)
+        self.widget_5 = QtWidgets.QWidget(NetworkSettingsWidget)
+        self.widget_5.setObjectName("widget_5")
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.widget_5)
+        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_14.setSpacing(5)
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.label_11 = QtWidgets.QLabel(self.widget_5)
+        self.label_11.setMinimumSize(QtCore.QSize(16, 16))
+        self.label_11.setMaximumSize(QtCore.QSize(16, 16))
+        self.label_11.setText("")
+        self.label_11.setPixmap(QtGui.QPixmap(":/icons/images/icons/right-chevron_black.png"))
+        self.label_11.setScaledContents(True)
+        self.label_11.setObjectName("label_11")
+        self.horizontalLayout_10.addWidget(self.label_11)
+        self.label_12 = QtWidgets.QLabel(self.widget_5)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.horizontalLayout_10.addWidget(self.label_12)
+        self.verticalLayout_14.addLayout(self.horizontalLayout_10)
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_12.setContentsMargins(20, -1, -1, -1)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.label_13 = QtWidgets.QLabel(self.widget_5)
+        self.label_13.setObjectName("label_13")
+        self.verticalLayout_12.addWidget(self.label_13)
+        self.radio_upload_no_limit = QtWidgets.QRadioButton(self.widget_5)
+        self.radio_upload_no_limit.setChecked(True)
+        self.radio_upload_no_limit.setAutoExclusive(False)
+        self.radio_upload_no_limit.setObjectName("radio_upload_no_limit")
+        self.verticalLayout_12.addWidget(self.radio_upload_no_limit)
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.radio_upload_limit = QtWidgets.QRadioButton(self.widget_5)
+        self.radio_upload_limit.setAutoExclusive(False)
+        self.radio_upload_limit.setObjectName("radio_upload_limit")
+        self.horizontalLayout_11.addWidget(self.radio_upload_limit)
+        self.line_edit_upload_limit = QtWidgets.QLineEdit(self.widget_5)
+        self.line_edit_upload_limit.setEnabled(False)
+        self.line_edit_upload_limit.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_upload_limit.setMaximumSize(QtCore.QSize(16777215, 32))
+        self.line_edit_upload_limit.setStyleSheet("QLineEdit#line_edit_upload_limit\n"
+"{\n"
+"padding-right: 10px;\n"
+"}")
+        self.line_edit_upload_limit.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.line_edit_upload_limit.setObjectName("line_edit_upload_limit")
+        self.horizontalLayout_11.addWidget(self.line_edit_upload_limit)
+        self.label_upload_limit = QtWidgets.QLabel(self.widget_5)
+        self.label_upload_limit.setEnabled(False)
+        self.label_upload_limit.setObjectName("label_upload_limit")
+        self.horizontalLayout_11.addWidget(self.label_upload_limit)
+        self.verticalLayout_12.addLayout(self.horizontalLayout_11)
+        self.verticalLayout_14.addLayout(self.verticalLayout_12)
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_15.setContentsMargins(20, -1, -1, -1)
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.label_15 = QtWidgets.QLabel(self.widget_5)
+        self.label_15.setObjectName("label_15")
+        self.verticalLayout_15.addWidget(self.label_15)
+        self.radio_download_no_limit = QtWidgets.QRadioButton(self.widget_5)
+        self.radio_download_no_limit.setChecked(True)
+        self.radio_download_no_limit.setAutoExclusive(False)
+        self.radio_download_no_limit.setObjectName("radio_download_no_limit")
+        self.verticalLayout_15.addWidget(self.radio_download_no_limit)
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        self.radio_download_limit = QtWidgets.QRadioButton(self.widget_5)
+        self.radio_download_limit.setAutoExclusive(False)
+        self.radio_download_limit.setObjectName("radio_download_limit")
+        self.horizontalLayout_12.addWidget(self.radio_download_limit)
+        self.line_edit_download_limit = QtWidgets.QLineEdit(self.widget_5)
+        self.line_edit_download_limit.setEnabled(False)
+        self.line_edit_download_limit.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_download_limit.setMaximumSize(QtCore.QSize(16777215, 32))
+        self.line_edit_download_limit.setStyleSheet("QLineEdit#line_edit_download_limit\n"
+"{\n"
+"padding-right: 10px;\n"
+"}")
+        self.line_edit_download_limit.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.line_edit_download_limit.setObjectName("line_edit_download_limit")
+        self.horizontalLayout_12.addWidget(self.line_edit_download_limit)
+        self.label_download_limit = QtWidgets.QLabel(self.widget_5)
+        self.label_download_limit.setEnabled(False)
+        self.label_download_limit.setObjectName("label_download_limit")
+        self.horizontalLayout_12.addWidget(self.label_download_limit)
+        self.verticalLayout_15.addLayout(self.horizontalLayout_12)
+        self.verticalLayout_14.addLayout(self.verticalLayout_15)
+        self.verticalLayout.addWidget(self.widget_5)
+        self.widget_2 = QtWidgets.QWidget(NetworkSettingsWidget)
+        self.widget_2.setObjectName("widget_2")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.widget_2)
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_2 = QtWidgets.QLabel(self.widget_2)
+        self.label_2.setMinimumSize(QtCore.QSize(16, 16))
+        self.label_2.setMaximumSize(QtCore.QSize(16, 16))
+        self.label_2.setText("")
+        self.label_2.setPixmap(QtGui.QPixmap(":/icons/images/icons/right-chevron_black.png"))
+        self.label_2.setScaledContents(True)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout_2.addWidget(self.label_2)
+        self.label = QtWidgets.QLabel(self.widget_2)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.horizontalLayout_2.addWidget(self.label)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setContentsMargins(20, -1, -1, -1)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label_3 = QtWidgets.QLabel(self.widget_2)
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_3.addWidget(self.label_3)
+        self.spin_sim_connections = QtWidgets.QSpinBox(self.widget_2)
+        self.spin_sim_connections.setMinimumSize(QtCore.QSize(0, 32))
+        self.spin_sim_connections.setMaximumSize(QtCore.QSize(16777215, 32))
+        self.spin_sim_connections.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.spin_sim_connections.setButtonSymbols(QtWidgets.QAbstractSpinBox.UpDownArrows)
+        self.spin_sim_connections.setSuffix("")
+        self.spin_sim_connections.setMinimum(1)
+        self.spin_sim_connections.setMaximum(100)
+        self.spin_sim_connections.setObjectName("spin_sim_connections")
+        self.horizontalLayout_3.addWidget(self.spin_sim_connections)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_3)
+        self.verticalLayout.addWidget(self.widget_2)
+        spacerItem = QtWidgets.QSpacerItem(20, 18, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem1)
+        self.button_save = QtWidgets.QPushButton(NetworkSettingsWidget)
+        self.button_save.setMinimumSize(QtCore.QSize(0, 32))
+        self.button_save.setMaximumSize(QtCore.QSize(16777215, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.button_save.setFont(font)
+        self.button_save.setLayoutDirection(QtCore.Qt.RightToLeft)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/checked_white.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_save.setIcon(icon)
+        self.button_save.setIconSize(QtCore.QSize(24, 24))
+        self.button_save.setObjectName("button_save")
+        self.horizontalLayout.addWidget(self.button_save)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(NetworkSettingsWidget)
+        self.radio_download_no_limit.toggled['bool'].connect(self.line_edit_download_limit.setDisabled)
+        self.radio_download_no_limit.toggled['bool'].connect(self.label_download_limit.setDisabled)
+        self.radio_upload_no_limit.toggled['bool'].connect(self.line_edit_upload_limit.setDisabled)
+        self.radio_upload_no_limit.toggled['bool'].connect(self.label_upload_limit.setDisabled)
+        QtCore.QMetaObject.connectSlotsByName(NetworkSettingsWidget)
+
+    def retranslateUi(self, NetworkSettingsWidget):
+        _translate = QtCore.QCoreApplication.translate
+        NetworkSettingsWidget.setWindowTitle(_translate("NetworkSettingsWidget", "Form"))
+        self.label_5.setText(_translate("NetworkSettingsWidget", "Proxy"))
+        self.label_7.setText(_translate("NetworkSettingsWidget", "Proxy type"))
+        self.combo_proxy_type.setItemText(0, _translate("NetworkSettingsWidget", "No proxy"))
+        self.combo_proxy_type.setItemText(1, _translate("NetworkSettingsWidget", "HTTP"))
+        self.combo_proxy_type.setItemText(2, _translate("NetworkSettingsWidget", "Socks4"))
+        self.combo_proxy_type.setItemText(3, _translate("NetworkSettingsWidget", "Socks5"))
+        self.line_edit_proxy_host.setPlaceholderText(_translate("NetworkSettingsWidget", "Host"))
+        self.line_edit_proxy_port.setPlaceholderText(_translate("NetworkSettingsWidget", "Port"))
+        self.line_edit_proxy_username.setPlaceholderText(_translate("NetworkSettingsWidget", "Username"))
+        self.line_edit_proxy_password.setPlaceholderText(_translate("NetworkSettingsWidget", "Password"))
+        self.label_12.setText(_translate("NetworkSettingsWidget", "Speed limits"))
+        self.label_13.setText(_translate("NetworkSettingsWidget", "Upload"))
+        self.radio_upload_no_limit.setText(_translate("NetworkSettingsWidget", "No limit"))
+        self.radio_upload_limit.setText(_translate("NetworkSettingsWidget", "Limit to"))
+        self.line_edit_upload_limit.setText(_translate("NetworkSettingsWidget", "10"))
+        self.label_upload_limit.setText(_translate("NetworkSettingsWidget", "kb/s"))
+        self.label_15.setText(_translate("NetworkSettingsWidget", "Download"))
+        self.radio_download_no_limit.setText(_translate("NetworkSettingsWidget", "No limit"))
+        self.radio_download_limit.setText(_translate("NetworkSettingsWidget", "Limit to"))
+        self.line_edit_download_limit.setText(_translate("NetworkSettingsWidget", "10"))
+        self.label_download_limit.setText(_translate("NetworkSettingsWidget", "kb/s"))
+        self.label.setText(_translate("NetworkSettingsWidget", "Misc"))
+        self.label_3.setText(_translate("NetworkSettingsWidget", "Number of simultaneous connections"))
+        self.button_save.setText(_translate("NetworkSettingsWidget", "Save"))
+
+from parsec.core.gui import resources_rc
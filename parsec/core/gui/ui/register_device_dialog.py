@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/register_device_dialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_RegisterDeviceDialog(object):
+    def setupUi(self, RegisterDeviceDialog):
+        RegisterDeviceDialog.setObjectName("RegisterDeviceDialog")
+        RegisterDeviceDialog.setWindowModality(QtCore.Qt.ApplicationModal)
+        RegisterDeviceDialog.resize(463, 457)
+        RegisterDeviceDialog.setStyleSheet("QDialog#RegisterDeviceDialog\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QLineEdit\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"padding-left: 10px;\n"
+"}\n"
+"\n"
+"QLineEdit[readOnly=\"true\"]\n"
+"{\n"
+"background-color: rgb(230, 230, 230);\n"
+"}\n"
+"\n"
+"QLineEdit:!enabled\n"
+"{\n"
+"border: 1px solid rgb(180, 180, 180);\n"
+"}\n"
+"\n"
+"QPushButton\n"
+"{\n"
+"background-color: rgb(45, 144, 209);\n"
+"border: 1px solid rgb(11, 56, 166);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:disabled\n"
+"{\n"
+"border: 1px solid rgb(65, 75, 106);\n"
+"background-color: rgb(112, 122, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QCheckBox::indicator\n"
+"{\n"
+"width: 15px;\n"
+"height: 15px;\n"
+"background-color: rgb(255, 255, 255);\n"
+"border: 2px solid rgb(30, 78, 162);\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QCheckBox::indicator:checked\n"
+"{\n"
+"image: url(:/icons/images/icons/checked.png)\n"
+"}\n"
+"\n"
+"QComboBox\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"background-color: white;\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QComboBox::drop-down\n"
+"{\n"
+"border: 0px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow\n"
+"{\n"
+"image: url(:/icons/images/icons/down-arrow.png);\n"
+"width: 16px;\n"
+"height: 16px;\n"
+"padding-right: 5px;\n"
+"}")
+        RegisterDeviceDialog.setModal(True)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(RegisterDeviceDialog)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.device_name = QtWidgets.QLineEdit(RegisterDeviceDialog)
+        self.device_name.setMinimumSize(QtCore.QSize(0, 32))
+        self.device_name.setObjectName("device_name")
+        self.horizontalLayout_2.addWidget(self.device_name)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.password = QtWidgets.QLineEdit(RegisterDeviceDialog)
+        self.password.setMinimumSize(QtCore.QSize(0, 32))
+        self.password.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.password.setObjectName("password")
+        self.horizontalLayout.addWidget(self.password)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.check_box_use_pkcs11 = QtWidgets.QCheckBox(RegisterDeviceDialog)
+        self.check_box_use_pkcs11.setObjectName("check_box_use_pkcs11")
+        self.verticalLayout.addWidget(self.check_box_use_pkcs11)
+        self.widget_pkcs11 = QtWidgets.QWidget(RegisterDeviceDialog)
+        self.widget_pkcs11.setObjectName("widget_pkcs11")
+        self.formLayout = QtWidgets.QFormLayout(self.widget_pkcs11)
+        self.formLayout.setObjectName("formLayout")
+        self.label_2 = QtWidgets.QLabel(self.widget_pkcs11)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.label_3 = QtWidgets.QLabel(self.widget_pkcs11)
+        self.label_3.setObjectName("label_3")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.label_4 = QtWidgets.QLabel(self.widget_pkcs11)
+        self.label_4.setObjectName("label_4")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_4)
+        self.combo_pkcs11_token = QtWidgets.QComboBox(self.widget_pkcs11)
+        self.combo_pkcs11_token.setMinimumSize(QtCore.QSize(0, 32))
+        self.combo_pkcs11_token.setObjectName("combo_pkcs11_token")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.combo_pkcs11_token)
+        self.combo_pkcs11_key = QtWidgets.QComboBox(self.widget_pkcs11)
+        self.combo_pkcs11_key.setMinimumSize(QtCore.QSize(0, 32))
+        self.combo_pkcs11_key.setObjectName("combo_pkcs11_key")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.combo_pkcs11_key)
+        self.line_edit_pkcs11_pin = QtWidgets.QLineEdit(self.widget_pkcs11)
+        self.line_edit_pkcs11_pin.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_pkcs11_pin.setObjectName("line_edit_pkcs11_pin")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.line_edit_pkcs11_pin)
+        self.verticalLayout.addWidget(self.widget_pkcs11)
+        self.outcome_panel = QtWidgets.QWidget(RegisterDeviceDialog)
+        self.outcome_panel.setObjectName("outcome_panel")
+        self.outcome_panel_layout = QtWidgets.QHBoxLayout(self.outcome_panel)
+        self.outcome_panel_layout.setObjectName("outcome_panel_layout")
+        self.outcome_status = QtWidgets.QLabel(self.outcome_panel)
+        self.outcome_status.setText("")
+        self.outcome_status.setWordWrap(True)
+        self.outcome_status.setObjectName("outcome_status")
+        self.outcome_panel_layout.addWidget(self.outcome_status)
+        self.verticalLayout.addWidget(self.outcome_panel)
+        self.config_waiter_panel = QtWidgets.QWidget(RegisterDeviceDialog)
+        self.config_waiter_panel.setObjectName("config_waiter_panel")
+        self.config_waiter_panel_layout = QtWidgets.QVBoxLayout(self.config_waiter_panel)
+        self.config_waiter_panel_layout.setObjectName("config_waiter_panel_layout")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label = QtWidgets.QLabel(self.config_waiter_panel)
+        self.label.setObjectName("label")
+        self.horizontalLayout_4.addWidget(self.label)
+        self.device_token = QtWidgets.QLineEdit(self.config_waiter_panel)
+        self.device_token.setMinimumSize(QtCore.QSize(0, 32))
+        self.device_token.setReadOnly(True)
+        self.device_token.setObjectName("device_token")
+        self.horizontalLayout_4.addWidget(self.device_token)
+        self.config_waiter_panel_layout.addLayout(self.horizontalLayout_4)
+        self.config_waiter_label = QtWidgets.QLabel(self.config_waiter_panel)
+        self.config_waiter_label.setWordWrap(True)
+        self.config_waiter_label.setObjectName("config_waiter_label")
+        self.config_waiter_panel_layout.addWidget(self.config_waiter_label)
+        self.verticalLayout.addWidget(self.config_waiter_panel)
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem)
+        self.button_register_device = QtWidgets.QPushButton(RegisterDeviceDialog)
+        self.button_register_device.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.button_register_device.setFont(font)
+        self.button_register_device.setLayoutDirection(QtCore.Qt.RightToLeft)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/checked_white.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_register_device.setIcon(icon)
+        self.button_register_device.setIconSize(QtCore.QSize(24, 24))
+        self.button_register_device.setObjectName("button_register_device")
+        self.horizontalLayout_3.addWidget(self.button_register_device)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_3)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem1)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem2)
+        self.button_close = QtWidgets.QPushButton(RegisterDeviceDialog)
+        self.button_close.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.button_close.setFont(font)
+        self.button_close.setLayoutDirection(QtCore.Qt.RightToLeft)
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/images/icons/white_cross.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_close.setIcon(icon1)
+        self.button_close.setObjectName("button_close")
+        self.horizontalLayout_5.addWidget(self.button_close)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem3)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_5)
+
+        self.retranslateUi(RegisterDeviceDialog)
+        self.check_box_use_pkcs11.toggled['bool'].connect(self.widget_pkcs11.setVisible)
+        self.check_box_use_pkcs11.toggled['bool'].connect(self.password.setDisabled)
+        self.button_close.clicked.connect(RegisterDeviceDialog.accept)
+        QtCore.QMetaObject.connectSlotsByName(RegisterDeviceDialog)
+
+    def retranslateUi(self, RegisterDeviceDialog):
+        _translate = QtCore.QCoreApplication.translate
+        RegisterDeviceDialog.setWindowTitle(_translate("RegisterDeviceDialog", "Register new device"))
+        self.device_name.setPlaceholderText(_translate("RegisterDeviceDialog", "Device name"))
+        self.password.setPlaceholderText(_translate("RegisterDeviceDialog", "Password"))
+        self.check_box_use_pkcs11.setText(_translate("RegisterDeviceDialog", "Use PKCS #11 authentication instead of password"))
+        self.label_2.setText(_translate("RegisterDeviceDialog", "PKCS #11 PIN"))
+        self.label_3.setText(_translate("RegisterDeviceDialog", "Token ID"))
+        self.label_4.setText(_translate("RegisterDeviceDialog", "Key ID"))
+        self.label.setText(_translate("RegisterDeviceDialog", "Device\'s token"))
+        self.device_token.setPlaceholderText(_translate("RegisterDeviceDialog", "Token"))
+        self.config_waiter_label.setText(_translate("RegisterDeviceDialog", "Waiting for the new device..."))
+        self.button_register_device.setText(_translate("RegisterDeviceDialog", "OK"))
+        self.button_close.setText(_translate("RegisterDeviceDialog", "Close"))
+
+from parsec.core.gui import resources_rc
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/register_user_dialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_RegisterUserDialog(object):
+    def setupUi(self, RegisterUserDialog):
+        RegisterUserDialog.setObjectName("RegisterUserDialog")
+        RegisterUserDialog.resize(420, 285)
+        RegisterUserDialog.setMinimumSize(QtCore.QSize(420, 285))
+        RegisterUserDialog.setMaximumSize(QtCore.QSize(420, 285))
+        RegisterUserDialog.setStyleSheet("QDialog#RegisterUserDialog\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QLineEdit\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"padding-left: 10px;\n"
+"}\n"
+"\n"
+"QLineEdit[readOnly=\"true\"]\n"
+"{\n"
+"background-color: rgb(230, 230, 230);\n"
+"}\n"
+"\n"
+"QLineEdit:!enabled\n"
+"{\n"
+"border: 1px solid rgb(180, 180, 180);\n"
+"}\n"
+"\n"
+"QPushButton\n"
+"{\n"
+"background-color: rgb(45, 144, 209);\n"
+"border: 1px solid rgb(11, 56, 166);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:disabled\n"
+"{\n"
+"border: 1px solid rgb(65, 75, 106);\n"
+"background-color: rgb(112, 122, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QToolButton\n"
+"{\n"
+"border: none;\n"
+"}\n"
+"\n"
+"QCheckBox::indicator\n"
+"{\n"
+"width: 15px;\n"
+"height: 15px;\n"
+"background-color: rgb(255, 255, 255);\n"
+"border: 2px solid rgb(30, 78, 162);\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QCheckBox::indicator:checked\n"
+"{\n"
+"image: url(:/icons/images/icons/checked.png)\n"
+"}\n"
+"\n"
+"QComboBox\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"background-color: white;\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QComboBox::drop-down\n"
+"{\n"
+"border: 0px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow\n"
+"{\n"
+"image: url(:/icons/images/icons/down-arrow.png);\n"
+"width: 16px;\n"
+"height: 16px;\n"
+"padding-right: 5px;\n"
+"}")
+        RegisterUserDialog.setModal(True)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(RegisterUserDialog)
+        self.verticalLayout_2.setContentsMargins(10, 10, 10, 10)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.line_edit_username = QtWidgets.QLineEdit(RegisterUserDialog)
+        self.line_edit_username.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_username.setObjectName("line_edit_username")
+        self.verticalLayout_2.addWidget(self.line_edit_username)
+        self.widget_registration = QtWidgets.QWidget(RegisterUserDialog)
+        self.widget_registration.setObjectName("widget_registration")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.widget_registration)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label_instructions = QtWidgets.QLabel(self.widget_registration)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_instructions.setFont(font)
+        self.label_instructions.setScaledContents(False)
+        self.label_instructions.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_instructions.setWordWrap(True)
+        self.label_instructions.setTextInteractionFlags(QtCore.Qt.TextSelectableByKeyboard|QtCore.Qt.TextSelectableByMouse)
+        self.label_instructions.setObjectName("label_instructions")
+        self.verticalLayout.addWidget(self.label_instructions)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_3 = QtWidgets.QLabel(self.widget_registration)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_3.setFont(font)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
+        self.line_edit_url = QtWidgets.QLineEdit(self.widget_registration)
+        self.line_edit_url.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_url.setReadOnly(True)
+        self.line_edit_url.setObjectName("line_edit_url")
+        self.gridLayout.addWidget(self.line_edit_url, 2, 1, 1, 1)
+        self.label_4 = QtWidgets.QLabel(self.widget_registration)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_4.setFont(font)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout.addWidget(self.label_4, 0, 0, 1, 1)
+        self.label_2 = QtWidgets.QLabel(self.widget_registration)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+        self.line_edit_user = QtWidgets.QLineEdit(self.widget_registration)
+        self.line_edit_user.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_user.setReadOnly(True)
+        self.line_edit_user.setObjectName("line_edit_user")
+        self.gridLayout.addWidget(self.line_edit_user, 0, 1, 1, 1)
+        self.line_edit_token = QtWidgets.QLineEdit(self.widget_registration)
+        self.line_edit_token.setMinimumSize(QtCore.QSize(0, 32))
+        self.line_edit_token.setReadOnly(True)
+        self.line_edit_token.setObjectName("line_edit_token")
+        self.gridLayout.addWidget(self.line_edit_token, 1, 1, 1, 1)
+        self.button_copy_username = QtWidgets.QToolButton(self.widget_registration)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/add-plus-button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_copy_username.setIcon(icon)
+        self.button_copy_username.setIconSize(QtCore.QSize(24, 24))
+        self.button_copy_username.setAutoRaise(True)
+        self.button_copy_username.setObjectName("button_copy_username")
+        self.gridLayout.addWidget(self.button_copy_username, 0, 2, 1, 1)
+        self.button_copy_token = QtWidgets.QToolButton(self.widget_registration)
+        self.button_copy_token.setIcon(icon)
+        self.button_copy_token.setIconSize(QtCore.QSize(24, 24))
+        self.button_copy_token.setAutoRaise(True)
+        self.button_copy_token.setObjectName("button_copy_token")
+        self.gridLayout.addWidget(self.button_copy_token, 1, 2, 1, 1)
+        self.button_copy_url = QtWidgets.QToolButton(self.widget_registration)
+        self.button_copy_url.setIcon(icon)
+        self.button_copy_url.setIconSize(QtCore.QSize(24, 24))
+        self.button_copy_url.setAutoRaise(True)
+        self.button_copy_url.setObjectName("button_copy_url")
+        self.gridLayout.addWidget(self.button_copy_url, 2, 2, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout)
+        self.label = QtWidgets.QLabel(self.widget_registration)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setWordWrap(True)
+        self.label.setObjectName("label")
+        self.verticalLayout.addWidget(self.label)
+        self.verticalLayout_2.addWidget(self.widget_registration)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem1)
+        self.button_cancel = QtWidgets.QPushButton(RegisterUserDialog)
+        self.button_cancel.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.button_cancel.setFont(font)
+        self.button_cancel.setObjectName("button_cancel")
+        self.horizontalLayout.addWidget(self.button_cancel)
+        self.button_register = QtWidgets.QPushButton(RegisterUserDialog)
+        self.button_register.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.button_register.setFont(font)
+        self.button_register.setObjectName("button_register")
+        self.horizontalLayout.addWidget(self.button_register)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem2)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(RegisterUserDialog)
+        QtCore.QMetaObject.connectSlotsByName(RegisterUserDialog)
+
+    def retranslateUi(self, RegisterUserDialog):
+        _translate = QtCore.QCoreApplication.translate
+        RegisterUserDialog.setWindowTitle(_translate("RegisterUserDialog", "Dialog"))
+        self.line_edit_username.setPlaceholderText(_translate("RegisterUserDialog", "User name"))
+        self.label_instructions.setText(_translate("RegisterUserDialog", "Transmit the following information to the user:"))
+        self.label_3.setText(_translate("RegisterUserDialog", "URL"))
+        self.label_4.setText(_translate("RegisterUserDialog", "User name"))
+        self.label_2.setText(_translate("RegisterUserDialog", "Token"))
+        self.button_copy_username.setText(_translate("RegisterUserDialog", "..."))
+        self.button_copy_token.setText(_translate("RegisterUserDialog", "..."))
+        self.button_copy_url.setText(_translate("RegisterUserDialog", "..."))
+        self.label.setText(_translate("RegisterUserDialog", "Do not close this window while the user registers."))
+        self.button_cancel.setText(_translate("RegisterUserDialog", "Cancel"))
+        self.button_register.setText(_translate("RegisterUserDialog", "Register the user"))
+
+from parsec.core.gui import resources_rc
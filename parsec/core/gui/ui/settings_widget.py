@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/settings_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_SettingsWidget(object):
+    def setupUi(self, SettingsWidget):
+        SettingsWidget.setObjectName("SettingsWidget")
+        SettingsWidget.setEnabled(True)
+        SettingsWidget.resize(532, 543)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(SettingsWidget.sizePolicy().hasHeightForWidth())
+        SettingsWidget.setSizePolicy(sizePolicy)
+        SettingsWidget.setStyleSheet("QWidget#SettingsWidget\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QTabWidget::pane\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"}\n"
+"\n"
+"QTabBar::tab\n"
+"{\n"
+"height: 32px;\n"
+"width: 100px;\n"
+"font-size: 14px;\n"
+"font-weight: bold;\n"
+"padding-left: 30px;\n"
+"padding-right: 30px;\n"
+"border-top: 1px solid rgb(30, 78, 162);\n"
+"border-left: 1px solid rgb(30, 78, 162);\n"
+"border-right: 1px solid rgb(30, 78, 162);\n"
+"}\n"
+"\n"
+"QTabBar::tab:selected\n"
+"{\n"
+"color: rgb(12, 65, 159);\n"
+"}\n"
+"\n"
+"QTabBar::tab:!selected\n"
+"{\n"
+"color: rgb(123, 132, 163);\n"
+"}\n"
+"\n"
+"QLineEdit\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"padding-left: 10px;\n"
+"}\n"
+"\n"
+"QLineEdit[readOnly=\"true\"]\n"
+"{\n"
+"background-color: rgb(230, 230, 230);\n"
+"}\n"
+"\n"
+"QLineEdit:!enabled\n"
+"{\n"
+"border: 1px solid rgb(180, 180, 180);\n"
+"}\n"
+"\n"
+"QPushButton\n"
+"{\n"
+"background-color: rgb(45, 144, 209);\n"
+"border: 1px solid rgb(11, 56, 166);\n"
+"color: rgb(255, 255, 255);\n"
+"padding-left: 10px;\n"
+"padding-right: 10px;\n"
+"}\n"
+"\n"
+"QPushButton:disabled\n"
+"{\n"
+"border: 1px solid rgb(65, 75, 106);\n"
+"background-color: rgb(112, 122, 153);\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QCheckBox::indicator\n"
+"{\n"
+"width: 15px;\n"
+"height: 15px;\n"
+"background-color: rgb(255, 255, 255);\n"
+"border: 2px solid rgb(30, 78, 162);\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QCheckBox::indicator:checked\n"
+"{\n"
+"image: url(:/icons/images/icons/checked.png)\n"
+"}\n"
+"\n"
+"QComboBox\n"
+"{\n"
+"border: 1px solid rgb(30, 78, 162);\n"
+"background-color: white;\n"
+"color: black;\n"
+"}\n"
+"\n"
+"QComboBox::drop-down\n"
+"{\n"
+"border: 0px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow\n"
+"{\n"
+"image: url(:/icons/images/icons/down-arrow.png);\n"
+"width: 16px;\n"
+"height: 16px;\n"
+"padding-right: 5px;\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(SettingsWidget)
+        self.verticalLayout.setContentsMargins(0, 15, 30, 20)
+        self.verticalLayout.setSpacing(5)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.tab_settings = QtWidgets.QTabWidget(SettingsWidget)
+        self.tab_settings.setObjectName("tab_settings")
+        self.verticalLayout.addWidget(self.tab_settings)
+
+        self.retranslateUi(SettingsWidget)
+        self.tab_settings.setCurrentIndex(-1)
+        QtCore.QMetaObject.connectSlotsByName(SettingsWidget)
+
+    def retranslateUi(self, SettingsWidget):
+        _translate = QtCore.QCoreApplication.translate
+        SettingsWidget.setWindowTitle(_translate("SettingsWidget", "Form"))
+
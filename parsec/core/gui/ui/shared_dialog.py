@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/shared_dialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_SharedDialog(object):
+    def setupUi(self, SharedDialog):
+        SharedDialog.setObjectName("SharedDialog")
+        SharedDialog.setWindowModality(QtCore.Qt.ApplicationModal)
+        SharedDialog.resize(350, 376)
+        SharedDialog.setStyleSheet("")
+        SharedDialog.setModal(True)
+        self.verticalLayout = QtWidgets.QVBoxLayout(SharedDialog)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.widget = QtWidgets.QWidget(SharedDialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widget.sizePolicy().hasHeightForWidth())
+        self.widget.setSizePolicy(sizePolicy)
+        self.widget.setStyleSheet("QWidget#widget\n"
+"{\n"
+"border: 2px solid rgb(12, 65, 157);\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"")
+        self.widget.setObjectName("widget")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.widget)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.horizontalLayout.setContentsMargins(10, 5, 5, 0)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label_title = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_title.setFont(font)
+        self.label_title.setText("")
+        self.label_title.setObjectName("label_title")
+        self.horizontalLayout.addWidget(self.label_title)
+        self.button_close = QtWidgets.QPushButton(self.widget)
+        self.button_close.setMinimumSize(QtCore.QSize(20, 20))
+        self.button_close.setMaximumSize(QtCore.QSize(20, 20))
+        self.button_close.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/menu_cancel.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_close.setIcon(icon)
+        self.button_close.setIconSize(QtCore.QSize(20, 20))
+        self.button_close.setFlat(True)
+        self.button_close.setObjectName("button_close")
+        self.horizontalLayout.addWidget(self.button_close)
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetMaximumSize)
+        self.horizontalLayout_2.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.list_shared = QtWidgets.QListWidget(self.widget)
+        self.list_shared.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.list_shared.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.list_shared.setLineWidth(0)
+        self.list_shared.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.list_shared.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.list_shared.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.list_shared.setObjectName("list_shared")
+        self.horizontalLayout_2.addWidget(self.list_shared)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_2)
+        self.verticalLayout.addWidget(self.widget)
+
+        self.retranslateUi(SharedDialog)
+        self.button_close.clicked.connect(SharedDialog.close)
+        QtCore.QMetaObject.connectSlotsByName(SharedDialog)
+
+    def retranslateUi(self, SharedDialog):
+        _translate = QtCore.QCoreApplication.translate
+        SharedDialog.setWindowTitle(_translate("SharedDialog", "Dialog"))
+
+from parsec.core.gui import resources_rc
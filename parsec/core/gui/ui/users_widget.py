@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/users_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_UsersWidget(object):
+    def setupUi(self, UsersWidget):
+        UsersWidget.setObjectName("UsersWidget")
+        UsersWidget.resize(501, 549)
+        UsersWidget.setStyleSheet("QWidget#UsersWidget\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QWidget#widget_users\n"
+"{\n"
+"border: 1px solid rgb(28, 78, 163);\n"
+"}\n"
+"\n"
+"QToolTip\n"
+"{\n"
+"background-color: rgb(46, 146, 208);\n"
+"border: 1px solid rgb(12, 65, 157);\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QScrollBar:vertical\n"
+"{\n"
+"background: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical\n"
+"{\n"
+"background: rgb(12, 65, 157);\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical\n"
+"{\n"
+"border: none;\n"
+"background: none;\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(UsersWidget)
+        self.verticalLayout.setContentsMargins(0, 15, 0, 15)
+        self.verticalLayout.setSpacing(10)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.widget_info = QtWidgets.QWidget(UsersWidget)
+        self.widget_info.setObjectName("widget_info")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.widget_info)
+        self.verticalLayout_3.setContentsMargins(0, 0, 30, 0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.label_3 = QtWidgets.QLabel(self.widget_info)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_3.setFont(font)
+        self.label_3.setStyleSheet("color: rgb(28, 78, 163);")
+        self.label_3.setWordWrap(True)
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout_3.addWidget(self.label_3)
+        self.formLayout_2 = QtWidgets.QFormLayout()
+        self.formLayout_2.setObjectName("formLayout_2")
+        self.label = QtWidgets.QLabel(self.widget_info)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label.setFont(font)
+        self.label.setStyleSheet("color: rgb(28, 78, 163);")
+        self.label.setObjectName("label")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.label_2 = QtWidgets.QLabel(self.widget_info)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_2.setFont(font)
+        self.label_2.setStyleSheet("color: rgb(28, 78, 163);")
+        self.label_2.setObjectName("label_2")
+        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.line_edit_user_id = QtWidgets.QLineEdit(self.widget_info)
+        self.line_edit_user_id.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_user_id.setFont(font)
+        self.line_edit_user_id.setStyleSheet("border: 1px solid rgb(28, 78, 163);\n"
+"padding-left: 10px;\n"
+"color: rgb(28, 78, 163);")
+        self.line_edit_user_id.setReadOnly(True)
+        self.line_edit_user_id.setObjectName("line_edit_user_id")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.line_edit_user_id)
+        self.line_edit_token = QtWidgets.QLineEdit(self.widget_info)
+        self.line_edit_token.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_token.setFont(font)
+        self.line_edit_token.setStyleSheet("border: 1px solid rgb(28, 78, 163);\n"
+"padding-left: 10px;\n"
+"color: rgb(28, 78, 163);")
+        self.line_edit_token.setReadOnly(True)
+        self.line_edit_token.setObjectName("line_edit_token")
+        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.line_edit_token)
+        self.verticalLayout_3.addLayout(self.formLayout_2)
+        self.verticalLayout.addWidget(self.widget_info)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setContentsMargins(-1, -1, 30, -1)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.line_edit_search = QtWidgets.QLineEdit(UsersWidget)
+        self.line_edit_search.setMinimumSize(QtCore.QSize(0, 32))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.line_edit_search.setFont(font)
+        self.line_edit_search.setStyleSheet("background-image: url(:/icons/images/icons/search.png);\n"
+"background-repeat: no-repeat;\n"
+"background-position: right;\n"
+"border: 1px solid rgb(28, 78, 163);\n"
+"padding-left: 10px;\n"
+"color: rgb(28, 78, 163);")
+        self.line_edit_search.setText("")
+        self.line_edit_search.setObjectName("line_edit_search")
+        self.horizontalLayout.addWidget(self.line_edit_search)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setContentsMargins(-1, -1, 30, -1)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.pushButton_4 = QtWidgets.QPushButton(UsersWidget)
+        self.pushButton_4.setMinimumSize(QtCore.QSize(0, 32))
+        self.pushButton_4.setStyleSheet("QPushButton#pushButton_4\n"
+"{\n"
+"background-color: rgb(12, 65, 157);\n"
+"border: 0;\n"
+"}")
+        self.pushButton_4.setText("")
+        self.pushButton_4.setFlat(True)
+        self.pushButton_4.setObjectName("pushButton_4")
+        self.verticalLayout_2.addWidget(self.pushButton_4)
+        self.scroll_area = QtWidgets.QScrollArea(UsersWidget)
+        self.scroll_area.setStyleSheet("background-color: rgb(255, 255, 255);")
+        self.scroll_area.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.scroll_area.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.scroll_area.setLineWidth(0)
+        self.scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setObjectName("scroll_area")
+        self.scrollAreaWidgetContents_2 = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents_2.setGeometry(QtCore.QRect(0, 0, 470, 225))
+        self.scrollAreaWidgetContents_2.setObjectName("scrollAreaWidgetContents_2")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.scrollAreaWidgetContents_2)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.layout_users = QtWidgets.QGridLayout()
+        self.layout_users.setObjectName("layout_users")
+        self.verticalLayout_4.addLayout(self.layout_users)
+        self.scroll_area.setWidget(self.scrollAreaWidgetContents_2)
+        self.verticalLayout_2.addWidget(self.scroll_area)
+        self.verticalLayout.addLayout(self.verticalLayout_2)
+        spacerItem = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        self.verticalLayout.addItem(spacerItem)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem1)
+        self.button_add_user = QtWidgets.QPushButton(UsersWidget)
+        self.button_add_user.setMinimumSize(QtCore.QSize(80, 64))
+        self.button_add_user.setMaximumSize(QtCore.QSize(80, 64))
+        self.button_add_user.setStyleSheet("QPushButton#button_add_user\n"
+"{\n"
+"border-top-left-radius: 32px;\n"
+"border-bottom-left-radius: 32px;\n"
+"background-color: rgb(12, 65, 157);\n"
+"padding-left: 10px;\n"
+"}")
+        self.button_add_user.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/add-plus-button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_add_user.setIcon(icon)
+        self.button_add_user.setIconSize(QtCore.QSize(50, 50))
+        self.button_add_user.setObjectName("button_add_user")
+        self.horizontalLayout_2.addWidget(self.button_add_user)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+
+        self.retranslateUi(UsersWidget)
+        QtCore.QMetaObject.connectSlotsByName(UsersWidget)
+
+    def retranslateUi(self, UsersWidget):
+        _translate = QtCore.QCoreApplication.translate
+        UsersWidget.setWindowTitle(_translate("UsersWidget", "Form"))
+        self.label_3.setText(_translate("UsersWidget", "Transmit the following information to the new user so they can set up their account."))
+        self.label.setText(_translate("UsersWidget", "User ID"))
+        self.label_2.setText(_translate("UsersWidget", "Token"))
+        self.line_edit_search.setPlaceholderText(_translate("UsersWidget", "Search users"))
+        self.button_add_user.setToolTip(_translate("UsersWidget", "Add a user"))
+
+from parsec.core.gui import resources_rc
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/workspace_button.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_WorkspaceButton(object):
+    def setupUi(self, WorkspaceButton):
+        WorkspaceButton.setObjectName("WorkspaceButton")
+        WorkspaceButton.resize(400, 280)
+        WorkspaceButton.setMinimumSize(QtCore.QSize(300, 280))
+        WorkspaceButton.setMaximumSize(QtCore.QSize(400, 280))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        WorkspaceButton.setFont(font)
+        WorkspaceButton.setStyleSheet("QWidget#WorkspaceButton\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QToolTip\n"
+"{\n"
+"background-color: rgb(46, 146, 208);\n"
+"border: 1px solid rgb(12, 65, 157);\n"
+"color: rgb(255, 255, 255);\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(WorkspaceButton)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(6)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.widget = QtWidgets.QWidget(WorkspaceButton)
+        self.widget.setStyleSheet("QWidget#widget\n"
+"{\n"
+"border: 2px solid rgb(47, 145, 208);\n"
+"}")
+        self.widget.setObjectName("widget")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.widget)
+        self.verticalLayout_3.setContentsMargins(20, 20, 20, 20)
+        self.verticalLayout_3.setSpacing(10)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label_workspace = QtWidgets.QLabel(self.widget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_workspace.sizePolicy().hasHeightForWidth())
+        self.label_workspace.setSizePolicy(sizePolicy)
+        self.label_workspace.setMinimumSize(QtCore.QSize(0, 45))
+        self.label_workspace.setMaximumSize(QtCore.QSize(16777215, 45))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_workspace.setFont(font)
+        self.label_workspace.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_workspace.setStyleSheet("")
+        self.label_workspace.setLineWidth(0)
+        self.label_workspace.setText("")
+        self.label_workspace.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_workspace.setWordWrap(True)
+        self.label_workspace.setTextInteractionFlags(QtCore.Qt.NoTextInteraction)
+        self.label_workspace.setObjectName("label_workspace")
+        self.horizontalLayout_3.addWidget(self.label_workspace)
+        self.label_owner = QtWidgets.QLabel(self.widget)
+        self.label_owner.setMinimumSize(QtCore.QSize(25, 25))
+        self.label_owner.setMaximumSize(QtCore.QSize(25, 25))
+        self.label_owner.setText("")
+        self.label_owner.setPixmap(QtGui.QPixmap(":/icons/images/icons/owner.png"))
+        self.label_owner.setScaledContents(True)
+        self.label_owner.setObjectName("label_owner")
+        self.horizontalLayout_3.addWidget(self.label_owner)
+        self.label_shared = QtWidgets.QLabel(self.widget)
+        self.label_shared.setMinimumSize(QtCore.QSize(25, 25))
+        self.label_shared.setMaximumSize(QtCore.QSize(25, 25))
+        self.label_shared.setText("")
+        self.label_shared.setPixmap(QtGui.QPixmap(":/icons/images/icons/share_info.png"))
+        self.label_shared.setScaledContents(True)
+        self.label_shared.setObjectName("label_shared")
+        self.horizontalLayout_3.addWidget(self.label_shared)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_3)
+        self.line = QtWidgets.QFrame(self.widget)
+        self.line.setStyleSheet("color: rgb(47, 145, 208);")
+        self.line.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line.setLineWidth(2)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setObjectName("line")
+        self.verticalLayout_3.addWidget(self.line)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label = QtWidgets.QLabel(self.widget)
+        self.label.setMinimumSize(QtCore.QSize(78, 78))
+        self.label.setMaximumSize(QtCore.QSize(78, 78))
+        self.label.setText("")
+        self.label.setPixmap(QtGui.QPixmap(":/icons/images/icons/workspace.png"))
+        self.label.setScaledContents(True)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setContentsMargins(10, 10, -1, -1)
+        self.verticalLayout_2.setSpacing(4)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label_empty = QtWidgets.QLabel(self.widget)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.label_empty.setFont(font)
+        self.label_empty.setObjectName("label_empty")
+        self.verticalLayout_2.addWidget(self.label_empty)
+        self.widget_files = QtWidgets.QWidget(self.widget)
+        self.widget_files.setObjectName("widget_files")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.widget_files)
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_4.setSpacing(5)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.label_file1 = QtWidgets.QLabel(self.widget_files)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_file1.setFont(font)
+        self.label_file1.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_file1.setStyleSheet("")
+        self.label_file1.setLineWidth(0)
+        self.label_file1.setText("")
+        self.label_file1.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_file1.setWordWrap(False)
+        self.label_file1.setTextInteractionFlags(QtCore.Qt.NoTextInteraction)
+        self.label_file1.setObjectName("label_file1")
+        self.verticalLayout_4.addWidget(self.label_file1)
+        self.line_2 = QtWidgets.QFrame(self.widget_files)
+        self.line_2.setStyleSheet("color: rgb(47, 145, 208);")
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line_2.setLineWidth(1)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setObjectName("line_2")
+        self.verticalLayout_4.addWidget(self.line_2)
+        self.label_file2 = QtWidgets.QLabel(self.widget_files)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_file2.setFont(font)
+        self.label_file2.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_file2.setStyleSheet("")
+        self.label_file2.setLineWidth(0)
+        self.label_file2.setText("")
+        self.label_file2.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_file2.setWordWrap(False)
+        self.label_file2.setTextInteractionFlags(QtCore.Qt.NoTextInteraction)
+        self.label_file2.setObjectName("label_file2")
+        self.verticalLayout_4.addWidget(self.label_file2)
+        self.line_3 = QtWidgets.QFrame(self.widget_files)
+        self.line_3.setStyleSheet("color: rgb(47, 145, 208);")
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line_3.setLineWidth(1)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_4.addWidget(self.line_3)
+        self.label_file3 = QtWidgets.QLabel(self.widget_files)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_file3.setFont(font)
+        self.label_file3.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_file3.setStyleSheet("")
+        self.label_file3.setLineWidth(0)
+        self.label_file3.setText("")
+        self.label_file3.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_file3.setWordWrap(False)
+        self.label_file3.setTextInteractionFlags(QtCore.Qt.NoTextInteraction)
+        self.label_file3.setObjectName("label_file3")
+        self.verticalLayout_4.addWidget(self.label_file3)
+        self.line_4 = QtWidgets.QFrame(self.widget_files)
+        self.line_4.setStyleSheet("color: rgb(47, 145, 208);")
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line_4.setLineWidth(1)
+        self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_4.setObjectName("line_4")
+        self.verticalLayout_4.addWidget(self.line_4)
+        self.label_file4 = QtWidgets.QLabel(self.widget_files)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_file4.setFont(font)
+        self.label_file4.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.label_file4.setStyleSheet("")
+        self.label_file4.setLineWidth(0)
+        self.label_file4.setText("")
+        self.label_file4.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_file4.setWordWrap(False)
+        self.label_file4.setTextInteractionFlags(QtCore.Qt.NoTextInteraction)
+        self.label_file4.setObjectName("label_file4")
+        self.verticalLayout_4.addWidget(self.label_file4)
+        self.verticalLayout_2.addWidget(self.widget_files)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setContentsMargins(-1, 10, -1, -1)
+        self.horizontalLayout_2.setSpacing(0)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.button_rename = QtWidgets.QPushButton(self.widget)
+        self.button_rename.setMinimumSize(QtCore.QSize(32, 32))
+        self.button_rename.setMaximumSize(QtCore.QSize(32, 32))
+        self.button_rename.setStyleSheet("QPushButton#button_rename\n"
+"{\n"
+"border: 0;\n"
+"}")
+        self.button_rename.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/edit_blue.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_rename.setIcon(icon)
+        self.button_rename.setIconSize(QtCore.QSize(20, 20))
+        self.button_rename.setFlat(True)
+        self.button_rename.setObjectName("button_rename")
+        self.horizontalLayout_2.addWidget(self.button_rename)
+        self.line_7 = QtWidgets.QFrame(self.widget)
+        self.line_7.setMinimumSize(QtCore.QSize(0, 17))
+        self.line_7.setMaximumSize(QtCore.QSize(16777215, 17))
+        self.line_7.setStyleSheet("Line#line_7\n"
+"{\n"
+"color: rgb(9, 66, 155);\n"
+"}")
+        self.line_7.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_7.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_7.setObjectName("line_7")
+        self.horizontalLayout_2.addWidget(self.line_7)
+        self.button_details = QtWidgets.QPushButton(self.widget)
+        self.button_details.setMinimumSize(QtCore.QSize(32, 32))
+        self.button_details.setMaximumSize(QtCore.QSize(32, 32))
+        self.button_details.setStatusTip("")
+        self.button_details.setStyleSheet("QPushButton#button_details\n"
+"{\n"
+"border: 0;\n"
+"}")
+        self.button_details.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/images/icons/info_workspace.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_details.setIcon(icon1)
+        self.button_details.setIconSize(QtCore.QSize(20, 20))
+        self.button_details.setFlat(True)
+        self.button_details.setObjectName("button_details")
+        self.horizontalLayout_2.addWidget(self.button_details)
+        self.line_5 = QtWidgets.QFrame(self.widget)
+        self.line_5.setMinimumSize(QtCore.QSize(0, 17))
+        self.line_5.setMaximumSize(QtCore.QSize(16777215, 17))
+        self.line_5.setStyleSheet("Line#line_5\n"
+"{\n"
+"color: rgb(9, 66, 155);\n"
+"}")
+        self.line_5.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line_5.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_5.setObjectName("line_5")
+        self.horizontalLayout_2.addWidget(self.line_5)
+        self.button_share = QtWidgets.QPushButton(self.widget)
+        self.button_share.setMinimumSize(QtCore.QSize(32, 32))
+        self.button_share.setMaximumSize(QtCore.QSize(32, 32))
+        self.button_share.setStatusTip("")
+        self.button_share.setStyleSheet("QPushButton#button_share\n"
+"{\n"
+"border: 0;\n"
+"}")
+        self.button_share.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/icons/images/icons/share_workspace.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_share.setIcon(icon2)
+        self.button_share.setIconSize(QtCore.QSize(20, 20))
+        self.button_share.setFlat(True)
+        self.button_share.setObjectName("button_share")
+        self.horizontalLayout_2.addWidget(self.button_share)
+        self.line_6 = QtWidgets.QFrame(self.widget)
+        self.line_6.setMaximumSize(QtCore.QSize(16777215, 17))
+        self.line_6.setStyleSheet("Line#line_6\n"
+"{\n"
+"color: rgb(9, 66, 155);\n"
+"}")
+        self.line_6.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line_6.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_6.setObjectName("line_6")
+        self.horizontalLayout_2.addWidget(self.line_6)
+        self.button_delete = QtWidgets.QPushButton(self.widget)
+        self.button_delete.setMinimumSize(QtCore.QSize(32, 32))
+        self.button_delete.setMaximumSize(QtCore.QSize(32, 32))
+        self.button_delete.setStatusTip("")
+        self.button_delete.setStyleSheet("QPushButton#button_delete\n"
+"{\n"
+"border: 0;\n"
+"}")
+        self.button_delete.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(":/icons/images/icons/garbage_workspace.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_delete.setIcon(icon3)
+        self.button_delete.setIconSize(QtCore.QSize(20, 20))
+        self.button_delete.setFlat(True)
+        self.button_delete.setObjectName("button_delete")
+        self.horizontalLayout_2.addWidget(self.button_delete)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout.addLayout(self.verticalLayout_2)
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+        self.verticalLayout.addWidget(self.widget)
+
+        self.retranslateUi(WorkspaceButton)
+        QtCore.QMetaObject.connectSlotsByName(WorkspaceButton)
+
+    def retranslateUi(self, WorkspaceButton):
+        _translate = QtCore.QCoreApplication.translate
+        WorkspaceButton.setWindowTitle(_translate("WorkspaceButton", "Form"))
+        self.label_owner.setToolTip(_translate("WorkspaceButton", "You are this workspace\'s owner."))
+        self.label_shared.setToolTip(_translate("WorkspaceButton", "This workspace is shared."))
+        self.label_empty.setText(_translate("WorkspaceButton", "This workspace is empty."))
+        self.button_rename.setToolTip(_translate("WorkspaceButton", "Rename the workspace"))
+        self.button_details.setToolTip(_translate("WorkspaceButton", "Workspace information"))
+        self.button_share.setToolTip(_translate("WorkspaceButton", "Share the workspace"))
+        self.button_delete.setToolTip(_translate("WorkspaceButton", "Delete the workspace"))
+
+from parsec.core.gui import resources_rc
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'parsec/core/gui/forms/workspaces_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.11.2
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+class Ui_WorkspacesWidget(object):
+    def setupUi(self, WorkspacesWidget):
+        WorkspacesWidget.setObjectName("WorkspacesWidget")
+        WorkspacesWidget.resize(679, 399)
+        WorkspacesWidget.setStyleSheet("QWidget#WorkspacesWidget\n"
+"{\n"
+"background-color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QToolTip\n"
+"{\n"
+"background-color: rgb(46, 146, 208);\n"
+"border: 1px solid rgb(12, 65, 157);\n"
+"color: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QScrollBar:vertical\n"
+"{\n"
+"background: rgb(255, 255, 255);\n"
+"}\n"
+"\n"
+"QScrollBar::handle:vertical\n"
+"{\n"
+"background: rgb(12, 65, 157);\n"
+"}\n"
+"\n"
+"QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical\n"
+"{\n"
+"border: none;\n"
+"background: none;\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(WorkspacesWidget)
+        self.verticalLayout.setContentsMargins(0, 15, 0, 15)
+        self.verticalLayout.setSpacing(10)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.scrollArea = QtWidgets.QScrollArea(WorkspacesWidget)
+        self.scrollArea.setStyleSheet("background-color: rgb(255, 255, 255);")
+        self.scrollArea.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.scrollArea.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.scrollArea.setLineWidth(0)
+        self.scrollArea.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setAlignment(QtCore.Qt.AlignCenter)
+        self.scrollArea.setObjectName("scrollArea")
+        self.scrollAreaWidgetContents = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 679, 273))
+        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.layout_workspaces = QtWidgets.QGridLayout()
+        self.layout_workspaces.setSizeConstraint(QtWidgets.QLayout.SetMaximumSize)
+        self.layout_workspaces.setContentsMargins(20, 50, 20, 20)
+        self.layout_workspaces.setSpacing(40)
+        self.layout_workspaces.setObjectName("layout_workspaces")
+        self.verticalLayout_2.addLayout(self.layout_workspaces)
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+        self.verticalLayout.addWidget(self.scrollArea)
+        spacerItem = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        self.verticalLayout.addItem(spacerItem)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem1)
+        self.button_add_workspace = QtWidgets.QPushButton(WorkspacesWidget)
+        self.button_add_workspace.setMinimumSize(QtCore.QSize(80, 64))
+        self.button_add_workspace.setMaximumSize(QtCore.QSize(80, 64))
+        self.button_add_workspace.setStatusTip("")
+        self.button_add_workspace.setStyleSheet("QPushButton#button_add_workspace\n"
+"{\n"
+"border-top-left-radius: 32px;\n"
+"border-bottom-left-radius: 32px;\n"
+"background-color: rgb(12, 65, 157);\n"
+"padding-left: 10px;\n"
+"}")
+        self.button_add_workspace.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/images/icons/add-plus-button.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.button_add_workspace.setIcon(icon)
+        self.button_add_workspace.setIconSize(QtCore.QSize(50, 50))
+        self.button_add_workspace.setFlat(True)
+        self.button_add_workspace.setObjectName("button_add_workspace")
+        self.horizontalLayout_2.addWidget(self.button_add_workspace)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+
+        self.retranslateUi(WorkspacesWidget)
+        QtCore.QMetaObject.connectSlotsByName(WorkspacesWidget)
+
+    def retranslateUi(self, WorkspacesWidget):
+        _translate = QtCore.QCoreApplication.translate
+        WorkspacesWidget.setWindowTitle(_translate("WorkspacesWidget", "Form"))
+        self.button_add_workspace.setToolTip(_translate("WorkspacesWidget", "Add a new workspace"))
+
+from parsec.core.gui import resources_rc
@@ -44,10 +44,6 @@ async def logged_core_factory(
 
     # Plenty of nested scope to order components init/teardown
     async with trio.open_nursery() as root_nursery:
-        # TODO: Currently backend_listen_events connect to backend and
-        # switch to listen events mode, then monitors kick in and send it
-        # events about which beacons to listen on, obliging to restart the
-        # listen connection...
         backend_online = await root_nursery.start(backend_listen_events, device, event_bus)
 
         async with backend_cmds_factory(
@@ -55,12 +51,29 @@ async def logged_core_factory(
             device.device_id,
             device.signing_key,
             config.backend_max_connections,
+            config.backend_multiplexed,
+            min_pool=config.backend_min_connections,
+            keepalive=config.backend_connection_keepalive,
+            idle_timeout=config.backend_connection_idle_timeout,
+            max_lifetime=config.backend_connection_max_lifetime,
+            compression=config.backend_compression,
+            session_resumption=config.backend_session_resumption,
+            streaming=config.backend_streaming,
         ) as backend_cmds_pool:
 
             local_db = LocalDB(config.data_base_dir / device.device_id)
 
             encryption_manager = EncryptionManager(device, local_db, backend_cmds_pool)
-            fs = FS(device, local_db, backend_cmds_pool, encryption_manager, event_bus)
+            fs = FS(
+                device,
+                local_db,
+                backend_cmds_pool,
+                encryption_manager,
+                event_bus,
+                delta_sync=config.delta_sync,
+                folder_sharding=config.folder_sharding,
+                manifest_deltas=config.manifest_deltas,
+            )
 
             async with trio.open_nursery() as monitor_nursery:
                 # Finally start monitors
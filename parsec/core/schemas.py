@@ -1,8 +1,11 @@
 from marshmallow import validate
 
 from parsec import schema_fields as fields
-from parsec.schema import UnknownCheckedSchema, OneOfSchema
-from parsec.utils import ejson_dumps, ejson_loads
+from parsec.schema import UnknownCheckedSchema, OneOfSchema, ValidationError
+from parsec.utils import ejson_dumps, ejson_loads, emsgpack_dumps, emsgpack_loads
+from parsec.compression import CompressionError, compress, decompress
+from parsec.api.protocole.compiler import compile_schema_load, compile_schema_dump
+from parsec.core.fs.chunking import CHUNKINGS
 
 
 # Synchronized with backend data
@@ -15,6 +18,9 @@ class _BlockAccessSchema(UnknownCheckedSchema):
     size = fields.Integer(required=True, validate=validate.Range(min=0))
     # TODO: provide digest as hexa string
     digest = fields.String(required=True, validate=validate.Length(min=1, max=64))
+    # Block stored compressed (see `parsec.compression`), digest is still the
+    # one of the uncompressed data
+    compressed = fields.Boolean()
 
 
 BlockAccessSchema = _BlockAccessSchema()
@@ -56,6 +62,8 @@ class _FolderManifestSchema(UnknownCheckedSchema):
         fields.Nested(ManifestAccessSchema),
         required=True,
     )
+    # Big folders have their children split into shards stored as blocks
+    shards = fields.List(fields.Nested(BlockAccessSchema, allow_none=True))
 
 
 FolderManifestSchema = _FolderManifestSchema()
@@ -65,6 +73,8 @@ class _WorkspaceManifestSchema(_FolderManifestSchema):
     type = fields.CheckedConstant("workspace_manifest", required=True)
     creator = fields.String(required=True)  # user_id
     participants = fields.List(fields.String(), required=True)  # list of user_ids
+    # Missing means fixed-size blocks
+    chunking = fields.String(validate=validate.OneOf(CHUNKINGS))
 
 
 WorkspaceManifestSchema = _WorkspaceManifestSchema()
@@ -78,6 +88,38 @@ class _UserManifestSchema(_FolderManifestSchema):
 UserManifestSchema = _UserManifestSchema()
 
 
+class _FolderManifestDeltaSchema(UnknownCheckedSchema):
+    format = fields.CheckedConstant(1, required=True)
+    type = fields.CheckedConstant("folder_manifest_delta", required=True)
+    author = fields.String(required=True)
+    version = fields.Integer(required=True, validate=validate.Range(min=2))
+    updated = fields.DateTime(required=True)
+    children_added = fields.Map(
+        fields.String(validate=validate.Length(min=1, max=256)),
+        fields.Nested(ManifestAccessSchema),
+        required=True,
+    )
+    children_removed = fields.List(
+        fields.String(validate=validate.Length(min=1, max=256)), required=True
+    )
+
+
+FolderManifestDeltaSchema = _FolderManifestDeltaSchema()
+
+
+class _FolderManifestShardSchema(UnknownCheckedSchema):
+    format = fields.CheckedConstant(1, required=True)
+    type = fields.CheckedConstant("folder_manifest_shard", required=True)
+    children = fields.Map(
+        fields.String(validate=validate.Length(min=1, max=256)),
+        fields.Nested(ManifestAccessSchema),
+        required=True,
+    )
+
+
+FolderManifestShardSchema = _FolderManifestShardSchema()
+
+
 # Local data
 
 
@@ -122,6 +164,8 @@ class _LocalFolderManifestSchema(UnknownCheckedSchema):
         fields.Nested(ManifestAccessSchema),
         required=True,
     )
+    # Big folders have their children stored in this number of local shards
+    shards = fields.Integer(validate=validate.Range(min=1))
 
 
 LocalFolderManifestSchema = _LocalFolderManifestSchema()
@@ -131,6 +175,8 @@ class _LocalWorkspaceManifest(_LocalFolderManifestSchema):
     type = fields.CheckedConstant("local_workspace_manifest", required=True)
     creator = fields.String(required=True)  # user_id
     participants = fields.List(fields.String(), required=True)  # list of user_ids
+    # Missing means fixed-size blocks
+    chunking = fields.String(validate=validate.OneOf(CHUNKINGS))
 
 
 LocalWorkspaceManifest = _LocalWorkspaceManifest()
@@ -169,16 +215,101 @@ class SchemaSerializationError(Exception):
     pass
 
 
-def dumps_manifest(manifest: dict):
-    raw, errors = typed_manifest_schema.dump(manifest)
+# Manifests can be serialized in two formats:
+# - format 1: ejson (i.e. JSON text, hence always starting with `{`), with
+#   bytes stored as base64 and UUIDs/datetimes as strings
+# - format 2: version byte followed by msgpack data, with bytes, UUIDs and
+#   datetimes stored as native types
+# Both formats can be read, `MANIFEST_FORMAT` is the one used for writing.
+# It stays format 1 until the clients unable to read format 2 are phased out.
+# Any of them can be compressed, the header byte being then followed by the
+# compressed data (see `parsec.compression`).
+MANIFEST_FORMAT = 1
+_FORMAT_2_HEADER = b"\x02"
+_COMPRESSED_HEADER = b"\x00"
+
+
+def _dumps(schema, native_dump, data: dict, compression: str = None) -> bytes:
+    raw = _dumps_uncompressed(schema, native_dump, data)
+    if compression:
+        # Compression is skipped if it doesn't reduce the size
+        compressed = compress(raw, compression)
+        if compressed:
+            return _COMPRESSED_HEADER + compressed
+    return raw
+
+
+def _dumps_uncompressed(schema, native_dump, data: dict) -> bytes:
+    if MANIFEST_FORMAT == 2 and native_dump:
+        try:
+            return _FORMAT_2_HEADER + emsgpack_dumps(native_dump(data))
+
+        except ValidationError:
+            pass
+
+    raw, errors = schema.dump(data)
     if errors:
         raise SchemaSerializationError(errors)
-    return ejson_dumps(raw).encode("utf8")
+    if MANIFEST_FORMAT == 2:
+        return _FORMAT_2_HEADER + emsgpack_dumps(raw)
+    else:
+        return ejson_dumps(raw).encode("utf8")
 
 
-def loads_manifest(raw: bytes):
-    raw = ejson_loads(raw.decode("utf8"))
-    manifest, errors = typed_manifest_schema.load(raw)
+def _loads(schema, compiled_load, raw: bytes) -> dict:
+    if raw[:1] == _COMPRESSED_HEADER:
+        try:
+            raw = decompress(raw[1:])
+
+        except CompressionError as exc:
+            raise SchemaSerializationError(str(exc)) from exc
+
+    if raw[:1] == _FORMAT_2_HEADER:
+        data = emsgpack_loads(raw[1:])
+    else:
+        data = ejson_loads(raw.decode("utf8"))
+
+    if compiled_load:
+        try:
+            return compiled_load(data)
+
+        except ValidationError:
+            # Marshmallow provides the actual result or errors
+            pass
+
+    loaded, errors = schema.load(data)
     if errors:
         raise SchemaSerializationError(errors)
-    return manifest
+    return loaded
+
+
+_typed_manifest_load = compile_schema_load(typed_manifest_schema)
+_typed_manifest_dump = compile_schema_dump(typed_manifest_schema, native=True)
+_manifest_delta_load = compile_schema_load(FolderManifestDeltaSchema)
+_manifest_delta_dump = compile_schema_dump(FolderManifestDeltaSchema, native=True)
+_manifest_shard_load = compile_schema_load(FolderManifestShardSchema)
+_manifest_shard_dump = compile_schema_dump(FolderManifestShardSchema, native=True)
+
+
+def dumps_manifest(manifest: dict, compression: str = None):
+    return _dumps(typed_manifest_schema, _typed_manifest_dump, manifest, compression)
+
+
+def loads_manifest(raw: bytes):
+    return _loads(typed_manifest_schema, _typed_manifest_load, raw)
+
+
+def dumps_manifest_delta(delta: dict, compression: str = None):
+    return _dumps(FolderManifestDeltaSchema, _manifest_delta_dump, delta, compression)
+
+
+def loads_manifest_delta(raw: bytes):
+    return _loads(FolderManifestDeltaSchema, _manifest_delta_load, raw)
+
+
+def dumps_manifest_shard(shard: dict, compression: str = None):
+    return _dumps(FolderManifestShardSchema, _manifest_shard_dump, shard, compression)
+
+
+def loads_manifest_shard(raw: bytes):
+    return _loads(FolderManifestShardSchema, _manifest_shard_load, raw)
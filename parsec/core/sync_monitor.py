@@ -1,12 +1,17 @@
 import trio
+from heapq import heappush, heappop
+from collections import deque
 from trio.hazmat import current_clock
 
 from parsec.core.base import BaseAsyncComponent
 from parsec.core.backend_connection import BackendNotAvailable
+from parsec.core.fs import FSEntryNotFound
 
 
 MIN_WAIT = 1
 MAX_WAIT = 60
+# Time span (in seconds) over which the drain rate is computed
+DRAIN_RATE_WINDOW = 10
 
 
 def timestamp():
@@ -14,6 +19,37 @@ def timestamp():
     return current_clock().current_time()
 
 
+def _get_deadline(first_updated, last_updated):
+    # Entry is synced once it hasn't been modified for MIN_WAIT, but an entry
+    # continuously modified shouldn't wait more than MAX_WAIT to be synced
+    return min(first_updated + MAX_WAIT, last_updated + MIN_WAIT)
+
+
+def _coalesce_by_ancestor(due_paths):
+    """
+    Group the due entries by their outermost due ancestor (an entry being
+    its own ancestor).
+
+    Args:
+        due_paths: due entries as a path to id mapping
+
+    Returns:
+        A mapping of each outermost due entry to the list of entries its
+        recursive sync covers.
+    """
+    groups = {}
+    for path, id in sorted(due_paths.items(), key=lambda x: len(x[0].parts)):
+        for ancestor in path.walk_from_path():
+            ancestor_id = due_paths.get(ancestor)
+            if ancestor_id in groups:
+                groups[ancestor_id].append(id)
+                break
+        else:
+            groups[id] = [id]
+
+    return groups
+
+
 # TODO: replace by a function
 # TODO: BaseAsyncComponent seems not needed
 class SyncMonitor(BaseAsyncComponent):
@@ -71,9 +107,25 @@ class SyncMonitor(BaseAsyncComponent):
             await self._monitoring_loop()
 
     async def _monitoring_loop(self):
+        # Entries to sync are tracked in `updated_entries` while `deadlines`
+        # is a heap used to quickly retrieve the next entry to sync. Instead
+        # of updating the heap in place each time an entry is modified, a new
+        # deadline is pushed and the outdated ones are skipped when popped.
         updated_entries = {}
+        deadlines = []
+        in_progress = set()
+        synced_timestamps = deque()
         new_event = trio.Event()
 
+        def _push_deadline(id):
+            first_updated, last_updated = updated_entries[id]
+            heappush(deadlines, (_get_deadline(first_updated, last_updated), id))
+
+        def _is_outdated(deadline, id):
+            if id in in_progress or id not in updated_entries:
+                return True
+            return deadline != _get_deadline(*updated_entries[id])
+
         def _on_entry_updated(sender, id):
             try:
                 first_updated, _ = updated_entries[id]
@@ -81,51 +133,94 @@ class SyncMonitor(BaseAsyncComponent):
             except KeyError:
                 first_updated = last_updated = timestamp()
             updated_entries[id] = (first_updated, last_updated)
+            if id not in in_progress:
+                _push_deadline(id)
             new_event.set()
 
-        self.event_bus.connect("fs.entry.updated", _on_entry_updated, weak=True)
-
-        async with trio.open_nursery() as nursery:
-            while True:
-                self.event_bus.send("sync_monitor.ready")
-
-                await new_event.wait()
-                new_event.clear()
-
-                await self._monitoring_tick(updated_entries)
-
-                if updated_entries:
-
-                    async def _wait():
-                        await trio.sleep(MIN_WAIT)
-                        new_event.set()
-
-                    nursery.start_soon(_wait)
+        def _send_backlog_event():
+            now = timestamp()
+            while synced_timestamps and now - synced_timestamps[0] > DRAIN_RATE_WINDOW:
+                synced_timestamps.popleft()
+            self.event_bus.send(
+                "sync_monitor.backlog",
+                backlog=len(updated_entries),
+                in_progress=len(in_progress),
+                drain_rate=len(synced_timestamps) / DRAIN_RATE_WINDOW,
+            )
+
+        async def _sync(id, covered_entries):
+            in_progress.update(covered_entries)
+            try:
+                await self.fs.sync_by_id(id)
+            finally:
+                in_progress.difference_update(covered_entries)
+
+            for covered_id, last_updated in covered_entries.items():
+                _, new_last_updated = updated_entries[covered_id]
+                # This entry has been modified again during the sync
+                if new_last_updated != last_updated:
+                    updated_entries[covered_id] = (last_updated, new_last_updated)
+                    _push_deadline(covered_id)
+                else:
+                    del updated_entries[covered_id]
+                synced_timestamps.append(timestamp())
+            _send_backlog_event()
+            new_event.set()
 
-    async def _monitoring_tick(self, updated_entries):
-        now = timestamp()
+        async def _dispatch(due_ids):
+            # Syncing an entry is recursive, hence there is no need to sync
+            # the due entries that are part of another due entry's subtree.
+            # Only the due entries are resolved, the rest of the backlog can
+            # be arbitrary large (and its paths may change until it's due).
+            due_paths = {}
+            missing_ids = []
+            for id in due_ids:
+                try:
+                    due_paths[await self.fs.get_entry_path(id)] = id
+                except FSEntryNotFound:
+                    missing_ids.append(id)
+            groups = _coalesce_by_ancestor(due_paths)
+            # Entries not locally present anymore are dispatched alone (their
+            # sync is a noop) to have them removed from the updated entries
+            groups.update({id: [id] for id in missing_ids})
+
+            # Syncs are done one at a time given the syncer only allows a
+            # single synchronizing operation anyway
+            for id, covered_ids in groups.items():
+                covered_entries = {x: updated_entries[x][1] for x in covered_ids}
+                await _sync(id, covered_entries)
 
-        for id, (first_updated, last_updated) in updated_entries.items():
-            if now - first_updated > MAX_WAIT:
-                await self.fs.sync_by_id(id)
-                break
+        self.event_bus.connect("fs.entry.updated", _on_entry_updated, weak=True)
 
-        else:
-            for id, (_, last_updated) in updated_entries.items():
-                if now - last_updated > MIN_WAIT:
-                    await self.fs.sync_by_id(id)
+        while True:
+            self.event_bus.send("sync_monitor.ready")
+
+            due_ids = []
+            next_deadline = None
+            now = timestamp()
+            while deadlines:
+                deadline, id = deadlines[0]
+                if _is_outdated(deadline, id):
+                    heappop(deadlines)
+                elif deadline <= now:
+                    heappop(deadlines)
+                    due_ids.append(id)
+                else:
+                    next_deadline = deadline
                     break
 
-            else:
-                id = None
+            if due_ids:
+                await _dispatch(due_ids)
+
+            if updated_entries:
+                _send_backlog_event()
 
-        if id:
-            _, new_last_updated = updated_entries[id]
-            # This entry has been modified again during the sync
-            if new_last_updated != last_updated:
-                updated_entries[id] = (last_updated, new_last_updated)
+            if next_deadline is None:
+                await new_event.wait()
             else:
-                del updated_entries[id]
+                with trio.move_on_at(next_deadline):
+                    await new_event.wait()
+            new_event.clear()
 
 
 async def monitor_sync(backend_online, fs, event_bus, *, task_status=trio.TASK_STATUS_IGNORED):
@@ -142,6 +142,10 @@ class DateTime(Field):
         if value is None:
             return None
 
+        # Binary formats provide the datetime as is
+        if isinstance(value, pendulum.Pendulum):
+            return value
+
         try:
             return pendulum.parse(value)
 
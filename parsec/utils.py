@@ -1,11 +1,15 @@
 import base64
 import json
+import struct
+import calendar
 import attr
 import trio
 import inspect
 from functools import wraps
 from uuid import UUID
-from pendulum import Pendulum, parse as pendulum_parse
+from msgpack import ExtType, packb as msgpack_packb, unpackb as msgpack_unpackb
+from pendulum import Pendulum, parse as pendulum_parse, from_timestamp as pendulum_from_timestamp
+from pendulum.tz.timezone import FixedTimezone
 
 
 def to_jsonb64(raw: bytes):
@@ -60,6 +64,70 @@ def ejson_loads(raw):
     return _recursive_load_special_types(json.loads(raw))
 
 
+# Extension types of the msgpack serialization
+_EMSGPACK_UUID_EXT = 1
+_EMSGPACK_DATETIME_EXT = 2
+# Seconds since epoch, microseconds and UTC offset in seconds
+_EMSGPACK_DATETIME_STRUCT = struct.Struct("!qIi")
+
+
+def _emsgpack_default(obj):
+    if isinstance(obj, Pendulum):
+        seconds = calendar.timegm(obj.utctimetuple())
+        offset = int(obj.utcoffset().total_seconds())
+        raw = _EMSGPACK_DATETIME_STRUCT.pack(seconds, obj.microsecond, offset)
+        return ExtType(_EMSGPACK_DATETIME_EXT, raw)
+
+    if isinstance(obj, UUID):
+        return ExtType(_EMSGPACK_UUID_EXT, obj.bytes)
+
+    raise TypeError("Type %s not serializable" % type(obj))
+
+
+def _emsgpack_ext_hook(code, data):
+    if code == _EMSGPACK_UUID_EXT:
+        return UUID(bytes=data)
+
+    elif code == _EMSGPACK_DATETIME_EXT:
+        seconds, microsecond, offset = _EMSGPACK_DATETIME_STRUCT.unpack(data)
+        return pendulum_from_timestamp(seconds, FixedTimezone(offset)).replace(
+            microsecond=microsecond
+        )
+
+    return ExtType(code, data)
+
+
+def emsgpack_dumps(obj) -> bytes:
+    """
+    Unlike ejson, bytes, UUID and datetime are stored as native msgpack types.
+    """
+    return msgpack_packb(obj, default=_emsgpack_default, use_bin_type=True)
+
+
+def emsgpack_loads(raw: bytes):
+    """
+    Raises:
+        ValueError: if `raw` is not valid msgpack data
+    """
+    # Each item takes at least one byte, hence the size of the data is an
+    # upper bound of the lengths (msgpack's defaults limit maps to 32k items)
+    max_len = len(raw)
+    try:
+        return msgpack_unpackb(
+            raw,
+            ext_hook=_emsgpack_ext_hook,
+            raw=False,
+            max_str_len=max_len,
+            max_bin_len=max_len,
+            max_array_len=max_len,
+            max_map_len=max_len,
+            max_ext_len=max_len,
+        )
+
+    except struct.error as exc:
+        raise ValueError(str(exc)) from exc
+
+
 def _sync_wrap_method(method):
     if inspect.iscoroutinefunction(method):
 
@@ -271,6 +271,8 @@ extra_requirements = {
         "pbr==4.0.2",
         "futures==3.1.1",
     ],
+    # Faster compression of the payloads, zlib is used otherwise
+    "zstd": ["zstandard==0.10.2"],
     "dev": test_requirements,
 }
 extra_requirements["all"] = sum(extra_requirements.values(), [])
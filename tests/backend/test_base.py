@@ -1,4 +1,6 @@
 import pytest
+import trio
+from trio.testing import wait_all_tasks_blocked
 
 from parsec.api.protocole import packb, unpackb
 
@@ -22,3 +24,66 @@ async def test_bad_cmd(alice_backend_sock):
 #     await alice_backend_sock.stream.send_all(b"\x00\x00\x00\x04fooo")
 #     rep = await alice_backend_sock.recv()
 #     assert unpackb(rep) == {"status": "invalid_msg_format", "reason": "Invalid message format"}
+
+
+@pytest.mark.trio
+async def test_multiplexed_requests(alice_backend_sock):
+    await alice_backend_sock.send(packb({"cmd": "ping", "ping": "1", "req_id": 1}))
+    await alice_backend_sock.send(packb({"cmd": "ping", "ping": "2", "req_id": 2}))
+    reps = [unpackb(await alice_backend_sock.recv()) for _ in range(2)]
+    reps.sort(key=lambda rep: rep["req_id"])
+    assert reps == [
+        {"status": "ok", "pong": "1", "req_id": 1},
+        {"status": "ok", "pong": "2", "req_id": 2},
+    ]
+
+
+@pytest.mark.trio
+async def test_multiplexed_replies_out_of_order(backend, alice_backend_sock):
+    first_released = trio.Event()
+    vanilla_ping = backend.ping.ping
+
+    async def _ping(author, ping):
+        if ping == "1":
+            await first_released.wait()
+        await vanilla_ping(author, ping)
+
+    backend.ping.ping = _ping
+    await alice_backend_sock.send(packb({"cmd": "ping", "ping": "1", "req_id": 1}))
+    await alice_backend_sock.send(packb({"cmd": "ping", "ping": "2", "req_id": 2}))
+    rep = await alice_backend_sock.recv()
+    assert unpackb(rep) == {"status": "ok", "pong": "2", "req_id": 2}
+    first_released.set()
+    rep = await alice_backend_sock.recv()
+    assert unpackb(rep) == {"status": "ok", "pong": "1", "req_id": 1}
+
+
+@pytest.mark.trio
+async def test_multiplexed_requests_bound(backend, alice_backend_sock):
+    max_requests = backend.config.max_requests_per_connection
+    released = {str(i): trio.Event() for i in range(max_requests + 1)}
+    started = []
+    vanilla_ping = backend.ping.ping
+
+    async def _ping(author, ping):
+        started.append(ping)
+        await released[ping].wait()
+        await vanilla_ping(author, ping)
+
+    backend.ping.ping = _ping
+    for i in range(max_requests + 1):
+        await alice_backend_sock.send(packb({"cmd": "ping", "ping": str(i), "req_id": i}))
+    await wait_all_tasks_blocked()
+    assert len(started) == max_requests
+
+    # The last request is processed once a slot is available
+    released["0"].set()
+    rep = await alice_backend_sock.recv()
+    assert unpackb(rep) == {"status": "ok", "pong": "0", "req_id": 0}
+    await wait_all_tasks_blocked()
+    assert started == [str(i) for i in range(max_requests + 1)]
+
+    for event in released.values():
+        event.set()
+    reps = [unpackb(await alice_backend_sock.recv()) for _ in range(max_requests)]
+    assert sorted(rep["req_id"] for rep in reps) == list(range(1, max_requests + 1))
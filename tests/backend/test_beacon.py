@@ -2,7 +2,12 @@ import pytest
 from uuid import UUID
 import trio
 
-from parsec.api.protocole import beacon_read_serializer
+from parsec.api.protocole import (
+    packb,
+    unpackb,
+    beacon_read_serializer,
+    beacon_get_changes_serializer,
+)
 
 from tests.backend.test_events import events_subscribe, events_listen_nowait
 
@@ -62,6 +67,79 @@ async def test_beacon_multimessages(backend, alice_backend_sock, vlob_ids):
     assert rep == {"status": "ok", "items": [{"src_id": vlob_ids[2], "src_version": 3}]}
 
 
+async def beacon_get_changes(sock, id, offset, limit=None):
+    req = {"cmd": "beacon_get_changes", "id": id, "offset": offset}
+    if limit is not None:
+        req["limit"] = limit
+    await sock.send(beacon_get_changes_serializer.req_dumps(req))
+    raw_rep = await sock.recv()
+    return beacon_get_changes_serializer.rep_loads(raw_rep)
+
+
+@pytest.mark.trio
+async def test_beacon_get_changes(backend, alice_backend_sock, vlob_ids):
+    rep = await beacon_get_changes(alice_backend_sock, BEACON_ID_1, 0)
+    assert rep == {"status": "ok", "changes": [], "offset": 0, "has_more": False}
+
+    await backend.beacon.update(BEACON_ID_1, src_id=vlob_ids[0], src_version=1, author="alice")
+    await backend.beacon.update(BEACON_ID_1, src_id=vlob_ids[1], src_version=1, author="bob")
+    await backend.beacon.update(BEACON_ID_1, src_id=vlob_ids[0], src_version=2, author="bob")
+    await backend.beacon.update(BEACON_ID_1, src_id=vlob_ids[2], src_version=1, author="bob")
+
+    # Multiple updates of the same vlob are merged
+    rep = await beacon_get_changes(alice_backend_sock, BEACON_ID_1, 0, limit=3)
+    assert rep == {
+        "status": "ok",
+        "changes": [
+            {"src_id": vlob_ids[0], "src_version": 2},
+            {"src_id": vlob_ids[1], "src_version": 1},
+        ],
+        "offset": 3,
+        "has_more": True,
+    }
+
+    rep = await beacon_get_changes(alice_backend_sock, BEACON_ID_1, rep["offset"], limit=3)
+    assert rep == {
+        "status": "ok",
+        "changes": [{"src_id": vlob_ids[2], "src_version": 1}],
+        "offset": 4,
+        "has_more": False,
+    }
+
+
+@pytest.mark.trio
+async def test_beacon_updated_index_is_next_offset(
+    backend, alice_backend_sock, vlob_ids, alice, bob
+):
+    await events_subscribe(alice_backend_sock, beacon_updated=[BEACON_ID_1])
+    for version in (1, 2):
+        await backend.beacon.update(
+            BEACON_ID_1, src_id=vlob_ids[0], src_version=version, author=bob.device_id
+        )
+    with trio.fail_after(1):
+        await backend.event_bus.spy.wait_multiple(["beacon.updated", "beacon.updated"])
+
+    for version in (1, 2):
+        event = await events_listen_nowait(alice_backend_sock)
+        assert event["src_version"] == version
+        # Reading from the index skips the item of this event
+        rep = await beacon_get_changes(alice_backend_sock, BEACON_ID_1, event["index"] - 1)
+        assert rep["changes"] == [{"src_id": vlob_ids[0], "src_version": 2}]
+        assert rep["offset"] == 2
+        rep = await beacon_get_changes(alice_backend_sock, BEACON_ID_1, event["index"])
+        assert rep["offset"] == 2
+        assert len(rep["changes"]) == 2 - version
+
+
+@pytest.mark.trio
+async def test_beacon_get_changes_bad_limit(alice_backend_sock):
+    await alice_backend_sock.send(
+        packb({"cmd": "beacon_get_changes", "id": BEACON_ID_1.hex, "offset": 0, "limit": 0})
+    )
+    rep = unpackb(await alice_backend_sock.recv())
+    assert rep["status"] == "bad_message"
+
+
 @pytest.mark.trio
 async def test_beacon_in_vlob_update(backend, alice_backend_sock, alice):
     await backend.vlob.create(VLOB_ID, VLOB_RTS, VLOB_WTS, blob=b"foo", author=alice.device_id)
@@ -3,7 +3,15 @@ import pytest
 from uuid import uuid4
 
 from parsec.backend.blockstore import BlockstoreTimeoutError
-from parsec.api.protocole import blockstore_create_serializer, blockstore_read_serializer, packb
+from parsec.api.protocole import (
+    blockstore_create_serializer,
+    blockstore_create_stream_serializer,
+    blockstore_read_serializer,
+    blockstore_read_stream_serializer,
+    ping_serializer,
+    packb,
+)
+from parsec.api.protocole.blockstore import BLOCKSTORE_MAX_BLOCK_SIZE
 
 
 BLOCK_ID = uuid4()
@@ -33,6 +41,34 @@ async def read(sock, id, **kwargs):
     return blockstore_read_serializer.rep_loads(raw_rep)
 
 
+async def create_stream(sock, id, block, stream_size=None):
+    await sock.send_stream(
+        blockstore_create_stream_serializer.req_dumps(
+            {
+                "cmd": "blockstore_create",
+                "id": id,
+                "stream_size": len(block) if stream_size is None else stream_size,
+            }
+        ),
+        block,
+    )
+    raw_rep = await sock.recv()
+    return blockstore_create_stream_serializer.rep_loads(raw_rep)
+
+
+async def read_stream(sock, id):
+    await sock.send(
+        blockstore_read_stream_serializer.req_dumps(
+            {"cmd": "blockstore_read", "id": id, "stream": True}
+        )
+    )
+    raw_rep = await sock.recv()
+    rep = blockstore_read_stream_serializer.rep_loads(raw_rep)
+    if rep["status"] == "ok":
+        rep["stream"] = b"".join([chunk async for chunk in sock.recv_stream()])
+    return rep
+
+
 @pytest.mark.trio
 async def test_blockstore_create_and_read(alice_backend_sock, bob_backend_sock):
     rep = await create(alice_backend_sock, BLOCK_ID, BLOCK_DATA)
@@ -153,3 +189,47 @@ async def test_blockstore_conflicting_id(alice_backend_sock):
 
     rep = await read(alice_backend_sock, BLOCK_ID)
     assert rep == {"status": "ok", "block": block_v1}
+
+
+@pytest.mark.trio
+async def test_blockstore_create_and_read_stream(alice_backend_sock, bob_backend_sock):
+    # Spread the block over multiple frames
+    block = bytes(range(256)) * (alice_backend_sock.transport.STREAM_CHUNK_SIZE // 100)
+    rep = await create_stream(alice_backend_sock, BLOCK_ID, block)
+    assert rep == {"status": "ok"}
+
+    rep = await read_stream(bob_backend_sock, BLOCK_ID)
+    assert rep == {"status": "ok", "stream_size": len(block), "stream": block}
+
+    # Streamed and regular commands can be mixed
+    rep = await read(bob_backend_sock, BLOCK_ID)
+    assert rep == {"status": "ok", "block": block}
+
+    rep = await read_stream(bob_backend_sock, uuid4())
+    assert rep == {"status": "not_found"}
+
+
+@pytest.mark.parametrize(
+    "stream_size", [0, len(BLOCK_DATA) - 1, len(BLOCK_DATA) + 1, BLOCKSTORE_MAX_BLOCK_SIZE + 1]
+)
+@pytest.mark.trio
+async def test_blockstore_create_stream_bad_size(alice_backend_sock, stream_size):
+    rep = await create_stream(alice_backend_sock, BLOCK_ID, BLOCK_DATA, stream_size)
+    assert rep["status"] == "bad_message"
+
+    rep = await read(alice_backend_sock, BLOCK_ID)
+    assert rep == {"status": "not_found"}
+
+
+@pytest.mark.trio
+async def test_stream_to_not_streamed_command(alice_backend_sock):
+    await alice_backend_sock.send_stream(
+        packb({"cmd": "ping", "ping": "foo", "stream_size": len(BLOCK_DATA)}), BLOCK_DATA
+    )
+    rep = ping_serializer.rep_loads(await alice_backend_sock.recv())
+    assert rep["status"] == "bad_message"
+
+    # Stream has been skipped
+    await alice_backend_sock.send(ping_serializer.req_dumps({"cmd": "ping", "ping": "bar"}))
+    rep = ping_serializer.rep_loads(await alice_backend_sock.recv())
+    assert rep == {"status": "ok", "pong": "bar"}
@@ -6,6 +6,8 @@ from async_generator import asynccontextmanager
 from parsec.api.protocole import (
     packb,
     events_subscribe_serializer,
+    events_subscribe_add_serializer,
+    events_subscribe_remove_serializer,
     events_listen_serializer,
     ping_serializer,
 )
@@ -146,6 +148,82 @@ async def test_event_resubscribe(backend, alice_backend_sock, alice2_backend_soc
     assert rep == {"status": "no_events"}
 
 
+async def update_subscribed_pinged(sock, cmd, pings):
+    serializer = {
+        "events_subscribe_add": events_subscribe_add_serializer,
+        "events_subscribe_remove": events_subscribe_remove_serializer,
+    }[cmd]
+    await sock.send(serializer.req_dumps({"cmd": cmd, "pinged": pings}))
+    raw_rep = await sock.recv()
+    rep = serializer.rep_loads(raw_rep)
+    assert rep == {"status": "ok"}
+
+
+@pytest.mark.trio
+async def test_events_subscribe_add_remove(backend, alice_backend_sock, alice2_backend_sock):
+    await subscribe_pinged(alice_backend_sock, ["foo"])
+    await update_subscribed_pinged(alice_backend_sock, "events_subscribe_add", ["bar", "spam"])
+    await update_subscribed_pinged(alice_backend_sock, "events_subscribe_remove", ["foo", "spam"])
+
+    with backend.event_bus.listen() as spy:
+        await ping(alice2_backend_sock, "foo")
+        await ping(alice2_backend_sock, "bar")
+        await ping(alice2_backend_sock, "spam")
+
+        with trio.fail_after(1):
+            # No guarantees those events occur before the commands' return
+            await spy.wait_multiple(["pinged", "pinged", "pinged"])
+
+    rep = await events_listen_nowait(alice_backend_sock)
+    assert rep == {"status": "ok", "event": "pinged", "ping": "bar"}
+    rep = await events_listen_nowait(alice_backend_sock)
+    assert rep == {"status": "no_events"}
+
+    # Removing the last ping disables the subscription
+    await update_subscribed_pinged(alice_backend_sock, "events_subscribe_remove", ["bar"])
+    with backend.event_bus.listen() as spy:
+        await ping(alice2_backend_sock, "bar")
+        with trio.fail_after(1):
+            await spy.wait("pinged")
+
+    rep = await events_listen_nowait(alice_backend_sock)
+    assert rep == {"status": "no_events"}
+
+
+@pytest.mark.trio
+async def test_events_subscribe_add_without_previous_subscribe(backend, alice_backend_sock):
+    await update_subscribed_pinged(alice_backend_sock, "events_subscribe_add", ["foo"])
+    await update_subscribed_pinged(alice_backend_sock, "events_subscribe_remove", ["unknown"])
+
+
+@pytest.mark.trio
+async def test_events_subscribe_add_while_listening(
+    backend, alice_backend_sock, alice2_backend_sock
+):
+    await subscribe_pinged(alice_backend_sock, ["foo"])
+
+    await alice_backend_sock.send(
+        events_listen_serializer.req_dumps({"cmd": "events_listen", "wait": True})
+    )
+    # Request sent while listening stops the listening, then gets processed
+    await alice_backend_sock.send(
+        events_subscribe_add_serializer.req_dumps(
+            {"cmd": "events_subscribe_add", "pinged": ["bar"]}
+        )
+    )
+    with trio.fail_after(1):
+        raw_rep = await alice_backend_sock.recv()
+        rep = events_listen_serializer.rep_loads(raw_rep)
+        assert rep["status"] == "cancelled"
+        raw_rep = await alice_backend_sock.recv()
+        rep = events_subscribe_add_serializer.rep_loads(raw_rep)
+        assert rep == {"status": "ok"}
+
+    async with events_listen(alice_backend_sock) as listen:
+        await ping(alice2_backend_sock, "bar")
+    assert listen.rep == {"status": "ok", "event": "pinged", "ping": "bar"}
+
+
 @pytest.mark.trio
 @pytest.mark.postgresql
 async def test_cross_backend_event(backend_factory, backend_sock_factory, alice, bob):
@@ -1,7 +1,9 @@
 import pytest
+from functools import partial
 
 from parsec.api.protocole import packb, unpackb
 from parsec.api.transport import Transport
+from parsec.core.backend_connection.transport import _do_handshade
 
 
 @pytest.mark.trio
@@ -34,3 +36,114 @@ async def test_handshake_invalid_format(backend, server_factory):
         await transport.send(packb(req))
         result_req = await transport.recv()
         assert unpackb(result_req) == {"handshake": "result", "result": "bad_format"}
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("valid_session", [True, False])
+async def test_handshake_resume_session(backend, server_factory, alice, valid_session):
+    async with server_factory(partial(backend.handle_client, secure=True)) as server:
+        stream = server.connection_factory()
+        transport = await Transport.init_for_client(stream, server.addr)
+        session_token = await _do_handshade(
+            transport, alice.device_id, alice.signing_key, new_session=True
+        )
+        assert session_token
+
+        if not valid_session:
+            session_token = b"dummy"
+        stream = server.connection_factory()
+        transport = await Transport.init_for_client(stream, server.addr)
+        new_session_token = await _do_handshade(
+            transport, alice.device_id, alice.signing_key, session_token, new_session=True
+        )
+        assert new_session_token and new_session_token != session_token
+
+        await transport.send(packb({"cmd": "ping", "ping": "foo"}))
+        assert unpackb(await transport.recv()) == {"status": "ok", "pong": "foo"}
+
+
+@pytest.mark.trio
+async def test_handshake_resume_other_device_session(backend, server_factory, alice, bob):
+    async with server_factory(partial(backend.handle_client, secure=True)) as server:
+        stream = server.connection_factory()
+        transport = await Transport.init_for_client(stream, server.addr)
+        session_token = await _do_handshade(
+            transport, alice.device_id, alice.signing_key, new_session=True
+        )
+
+        stream = server.connection_factory()
+        transport = await Transport.init_for_client(stream, server.addr)
+        await transport.recv()  # Get challenge
+        await transport.send(
+            packb(
+                {
+                    "handshake": "answer",
+                    "identity": str(bob.device_id),
+                    "session_token": session_token,
+                }
+            )
+        )
+        result_req = await transport.recv()
+        assert unpackb(result_req) == {"handshake": "result", "result": "bad_session"}
+
+        # Rejected session cannot be provided again
+        await transport.send(
+            packb(
+                {
+                    "handshake": "answer",
+                    "identity": str(bob.device_id),
+                    "session_token": session_token,
+                }
+            )
+        )
+        result_req = await transport.recv()
+        assert unpackb(result_req) == {"handshake": "result", "result": "bad_format"}
+
+
+@pytest.mark.trio
+async def test_handshake_no_session_over_clear_connection(backend, server_factory, alice):
+    async with server_factory(backend.handle_client) as server:
+        stream = server.connection_factory()
+        transport = await Transport.init_for_client(stream, server.addr)
+        session_token = await _do_handshade(
+            transport, alice.device_id, alice.signing_key, new_session=True
+        )
+        assert session_token is None
+
+
+@pytest.mark.trio
+async def test_handshake_device_keys_cached(backend, backend_sock_factory, alice, monkeypatch):
+    get_user_calls = []
+    vanilla_get_user = backend.user.get_user
+
+    async def _get_user(user_id):
+        get_user_calls.append(user_id)
+        return await vanilla_get_user(user_id)
+
+    monkeypatch.setattr(backend.user, "get_user", _get_user)
+    for _ in range(3):
+        async with backend_sock_factory(backend, alice) as sock:
+            await sock.send(packb({"cmd": "ping", "ping": "foo"}))
+            assert unpackb(await sock.recv()) == {"status": "ok", "pong": "foo"}
+    assert get_user_calls == [alice.user_id]
+
+
+@pytest.mark.trio
+async def test_handshake_device_keys_cache_expires(
+    mock_clock, backend, backend_sock_factory, alice, monkeypatch
+):
+    get_user_calls = []
+    vanilla_get_user = backend.user.get_user
+
+    async def _get_user(user_id):
+        get_user_calls.append(user_id)
+        return await vanilla_get_user(user_id)
+
+    monkeypatch.setattr(backend.user, "get_user", _get_user)
+    for _ in range(2):
+        async with backend_sock_factory(backend, alice) as sock:
+            await sock.send(packb({"cmd": "ping", "ping": "foo"}))
+            assert unpackb(await sock.recv()) == {"status": "ok", "pong": "foo"}
+        # A missed revocation notification goes unnoticed at most until then
+        mock_clock.jump(backend.config.handshake_cache_ttl)
+    assert get_user_calls == [alice.user_id, alice.user_id]
@@ -1,15 +1,19 @@
 import pytest
 from uuid import uuid4, UUID
+from pendulum import Pendulum
 from collections import namedtuple
 
 from parsec.api.protocole import (
     packb,
+    unpackb,
     vlob_group_check_serializer,
     vlob_create_serializer,
     vlob_read_serializer,
     vlob_update_serializer,
 )
 
+from tests.common import freeze_time
+
 
 VLOB_ID = uuid4()
 VLOB_RTS = "<rts>"
@@ -37,10 +41,17 @@ async def vlob_create(sock, id, rts, wts, blob, check_rep=True):
     return rep
 
 
-async def vlob_read(sock, id, rts, version=None):
+async def vlob_read(sock, id, rts, version=None, timestamp=None, known_version=None):
     await sock.send(
         vlob_read_serializer.req_dumps(
-            {"cmd": "vlob_read", "id": id, "rts": rts, "version": version}
+            {
+                "cmd": "vlob_read",
+                "id": id,
+                "rts": rts,
+                "version": version,
+                "timestamp": timestamp,
+                "known_version": known_version,
+            }
         )
     )
     raw_rep = await sock.recv()
@@ -67,11 +78,14 @@ async def vlobs(backend, alice):
         Access(UUID("00000000000000000000000000000001"), "<1 rts>", "<1 wts>"),
         Access(UUID("00000000000000000000000000000002"), "<2 rts>", "<2 wts>"),
     )
-    await backend.vlob.create(*accesses[0], b"1 blob v1", author=alice.device_id)
-    await backend.vlob.update(
-        accesses[0].id, accesses[0].wts, 2, b"1 blob v2", author=alice.device_id
-    )
-    await backend.vlob.create(*accesses[1], b"2 blob v1", author=alice.device_id)
+    with freeze_time("2000-01-02"):
+        await backend.vlob.create(*accesses[0], b"1 blob v1", author=alice.device_id)
+    with freeze_time("2000-01-03"):
+        await backend.vlob.update(
+            accesses[0].id, accesses[0].wts, 2, b"1 blob v2", author=alice.device_id
+        )
+    with freeze_time("2000-01-04"):
+        await backend.vlob.create(*accesses[1], b"2 blob v1", author=alice.device_id)
     return accesses
 
 
@@ -87,7 +101,7 @@ async def test_vlob_create_and_read(alice_backend_sock, bob_backend_sock):
     await vlob_create(alice_backend_sock, VLOB_ID, VLOB_RTS, VLOB_WTS, blob)
 
     rep = await vlob_read(bob_backend_sock, VLOB_ID, VLOB_RTS)
-    assert rep == {"status": "ok", "version": 1, "blob": blob}
+    assert rep == {"status": "ok", "version": 1, "blob": blob, "deltas": []}
 
 
 @pytest.mark.parametrize(
@@ -131,7 +145,7 @@ async def test_vlob_read_not_found(alice_backend_sock):
 @pytest.mark.trio
 async def test_vlob_read_ok(alice_backend_sock, vlobs):
     rep = await vlob_read(alice_backend_sock, vlobs[0].id, vlobs[0].rts)
-    assert rep == {"status": "ok", "blob": b"1 blob v2", "version": 2}
+    assert rep == {"status": "ok", "blob": b"1 blob v2", "deltas": [], "version": 2}
 
 
 @pytest.mark.parametrize(
@@ -146,6 +160,13 @@ async def test_vlob_read_ok(alice_backend_sock, vlobs):
         {"id": None, "rts": VLOB_RTS},
         {"id": str(VLOB_ID), "rts": VLOB_RTS, "version": 0},
         {"id": str(VLOB_ID), "rts": VLOB_RTS, "version": "foo"},
+        {"id": str(VLOB_ID), "rts": VLOB_RTS, "timestamp": 42},
+        {
+            "id": str(VLOB_ID),
+            "rts": VLOB_RTS,
+            "version": 1,
+            "timestamp": "2000-01-02T00:00:00+00:00",
+        },
         {},
     ],
 )
@@ -159,6 +180,68 @@ async def test_vlob_read_bad_msg(alice_backend_sock, bad_msg):
     assert rep["status"] == "bad_message"
 
 
+@pytest.mark.trio
+async def test_vlob_read_at_timestamp(alice_backend_sock, vlobs):
+    rep = await vlob_read(
+        alice_backend_sock, vlobs[0].id, vlobs[0].rts, timestamp=Pendulum(2000, 1, 2)
+    )
+    assert rep == {"status": "ok", "blob": b"1 blob v1", "deltas": [], "version": 1}
+
+    rep = await vlob_read(
+        alice_backend_sock, vlobs[0].id, vlobs[0].rts, timestamp=Pendulum(2000, 1, 2, 12)
+    )
+    assert rep == {"status": "ok", "blob": b"1 blob v1", "deltas": [], "version": 1}
+
+    rep = await vlob_read(
+        alice_backend_sock, vlobs[0].id, vlobs[0].rts, timestamp=Pendulum(2000, 1, 5)
+    )
+    assert rep == {"status": "ok", "blob": b"1 blob v2", "deltas": [], "version": 2}
+
+    rep = await vlob_read(
+        alice_backend_sock, vlobs[0].id, vlobs[0].rts, timestamp=Pendulum(2000, 1, 1)
+    )
+    assert rep == {"status": "bad_version"}
+
+
+@pytest.mark.trio
+async def test_vlob_read_with_deltas(alice_backend_sock, backend, alice):
+    await backend.vlob.create(VLOB_ID, VLOB_RTS, VLOB_WTS, b"v1", author=alice.device_id)
+    await backend.vlob.update(VLOB_ID, VLOB_WTS, 2, b"d2", author=alice.device_id, is_delta=True)
+    await backend.vlob.update(VLOB_ID, VLOB_WTS, 3, b"d3", author=alice.device_id, is_delta=True)
+    await backend.vlob.update(VLOB_ID, VLOB_WTS, 4, b"v4", author=alice.device_id)
+    await backend.vlob.update(VLOB_ID, VLOB_WTS, 5, b"d5", author=alice.device_id, is_delta=True)
+
+    # Last snapshot followed by the deltas
+    rep = await vlob_read(alice_backend_sock, VLOB_ID, VLOB_RTS)
+    assert rep == {"status": "ok", "version": 5, "blob": b"v4", "deltas": [b"d5"]}
+    rep = await vlob_read(alice_backend_sock, VLOB_ID, VLOB_RTS, version=3)
+    assert rep == {"status": "ok", "version": 3, "blob": b"v1", "deltas": [b"d2", b"d3"]}
+
+    # Only the deltas if the known version is more recent than the snapshot
+    rep = await vlob_read(alice_backend_sock, VLOB_ID, VLOB_RTS, version=3, known_version=2)
+    assert rep == {"status": "ok", "version": 3, "blob": None, "deltas": [b"d3"]}
+    rep = await vlob_read(alice_backend_sock, VLOB_ID, VLOB_RTS, known_version=4)
+    assert rep == {"status": "ok", "version": 5, "blob": None, "deltas": [b"d5"]}
+    rep = await vlob_read(alice_backend_sock, VLOB_ID, VLOB_RTS, known_version=5)
+    assert rep == {"status": "ok", "version": 5, "blob": None, "deltas": []}
+
+    # Snapshot is needed otherwise
+    rep = await vlob_read(alice_backend_sock, VLOB_ID, VLOB_RTS, known_version=2)
+    assert rep == {"status": "ok", "version": 5, "blob": b"v4", "deltas": [b"d5"]}
+    rep = await vlob_read(alice_backend_sock, VLOB_ID, VLOB_RTS, version=2, known_version=4)
+    assert rep == {"status": "ok", "version": 2, "blob": b"v1", "deltas": [b"d2"]}
+
+
+@pytest.mark.trio
+async def test_vlob_read_without_deltas_field(alice_backend_sock, vlobs):
+    # Older clients reject the unknown fields
+    await alice_backend_sock.send(
+        vlob_read_serializer.req_dumps({"cmd": "vlob_read", "id": vlobs[0].id, "rts": vlobs[0].rts})
+    )
+    rep = unpackb(await alice_backend_sock.recv())
+    assert rep == {"status": "ok", "version": 2, "blob": b"1 blob v2"}
+
+
 @pytest.mark.trio
 async def test_read_bad_version(alice_backend_sock, vlobs):
     rep = await vlob_read(alice_backend_sock, vlobs[0].id, vlobs[0].rts, version=3)
@@ -92,3 +92,19 @@ async def test_device_revoke_certify_too_old(alice_backend_sock, alice, bob):
             "status": "invalid_certification",
             "reason": "Invalid certification data (Timestamp is too old.).",
         }
+
+
+@pytest.mark.trio
+async def test_device_revoke_invalidates_handshake_cache(
+    backend, backend_sock_factory, alice_backend_sock, bob, bob_revocation
+):
+    # Bob's keys are now cached
+    async with backend_sock_factory(backend, bob):
+        pass
+
+    rep = await device_revoke(alice_backend_sock, certified_revocation=bob_revocation)
+    assert rep == {"status": "ok"}
+
+    with pytest.raises(HandshakeRevokedDevice):
+        async with backend_sock_factory(backend, bob):
+            pass
@@ -103,6 +103,23 @@ class FreezeTestOnTransportError(Transport):
             # Wait here until this coroutine is cancelled
             await trio.sleep_forever()
 
+    async def send_stream(self, header, payload):
+        try:
+            return await self.transport.send_stream(header, payload)
+
+        except TransportError as exc:
+            # Wait here until this coroutine is cancelled
+            await trio.sleep_forever()
+
+    async def recv_stream(self):
+        try:
+            async for chunk in self.transport.recv_stream():
+                yield chunk
+
+        except TransportError as exc:
+            # Wait here until this coroutine is cancelled
+            await trio.sleep_forever()
+
 
 @attr.s
 class CallController:
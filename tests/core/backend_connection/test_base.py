@@ -1,6 +1,17 @@
 import pytest
+import trio
+from uuid import uuid4
 
-from parsec.core.backend_connection import backend_cmds_factory, backend_anonymous_cmds_factory
+from parsec.compression import COMPRESSION_ALGORITHMS
+from parsec.api.transport import TransportError
+from parsec.core.backend_connection import (
+    BackendNotAvailable,
+    BackendCmdsInvalidResponse,
+    cmds,
+    backend_cmds_factory,
+    backend_anonymous_cmds_factory,
+    transport_pool_factory,
+)
 
 
 @pytest.mark.trio
@@ -17,3 +28,183 @@ async def test_ping(alice, running_backend):
     ) as cmds:
         pong = await cmds.ping("Hello World !")
         assert pong == "Hello World !"
+
+
+@pytest.mark.trio
+async def test_concurrent_pings_share_connection(alice, running_backend):
+    async with backend_cmds_factory(
+        running_backend.addr, alice.device_id, alice.signing_key, multiplexed=True
+    ) as cmds:
+        results = {}
+
+        async def _ping(i):
+            results[i] = await cmds.ping(str(i))
+
+        async with trio.open_nursery() as nursery:
+            for i in range(10):
+                nursery.start_soon(_ping, i)
+
+        assert results == {i: str(i) for i in range(10)}
+        assert not cmds.transport_pool.transports
+        assert cmds.transport_pool.multiplexed_transport
+
+
+@pytest.mark.trio
+async def test_pool_warm_up(alice, running_backend):
+    async with transport_pool_factory(
+        running_backend.addr, alice.device_id, alice.signing_key, min=2
+    ) as pool:
+        await trio.testing.wait_all_tasks_blocked()
+        assert len(pool.transports) == 2
+        assert pool.stats.connections_created == 2
+
+        async with pool.acquire() as transport:
+            await cmds.ping(transport, "foo")
+        assert pool.stats.connections_created == 2
+        assert pool.stats.acquired == 1
+
+
+@pytest.mark.trio
+async def test_pool_replaces_dead_idle_connection(alice, running_backend):
+    async with transport_pool_factory(
+        running_backend.addr, alice.device_id, alice.signing_key, keepalive=0
+    ) as pool:
+        async with pool.acquire() as transport:
+            await cmds.ping(transport, "foo")
+
+        # Idle connection is checked before being reused
+        async with pool.acquire() as transport2:
+            await cmds.ping(transport2, "foo")
+        assert transport2 is transport
+        assert pool.stats.connections_created == 1
+
+        async def _dead_ping():
+            raise TransportError("Connection lost")
+
+        transport.ping = _dead_ping
+        async with pool.acquire() as transport3:
+            await cmds.ping(transport3, "foo")
+        assert transport3 is not transport
+        assert pool.stats.connections_created == 2
+        assert pool.stats.connections_destroyed == 1
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("expiration", ["idle_timeout", "max_lifetime"])
+async def test_pool_evicts_expired_connections(mock_clock, alice, running_backend, expiration):
+    mock_clock.autojump_threshold = 0.1
+    async with transport_pool_factory(
+        running_backend.addr, alice.device_id, alice.signing_key, **{expiration: 10}
+    ) as pool:
+        async with pool.acquire() as transport:
+            await cmds.ping(transport, "foo")
+        assert pool.transports == [transport]
+
+        await trio.sleep(11)
+        assert not pool.transports
+        assert pool.stats.connections_destroyed == 1
+
+
+@pytest.mark.trio
+async def test_multiplexed_pool_keepalive(mock_clock, alice, running_backend):
+    mock_clock.autojump_threshold = 0.1
+    async with transport_pool_factory(
+        running_backend.addr, alice.device_id, alice.signing_key, multiplexed=True, keepalive=5
+    ) as pool:
+        async with pool.acquire() as transport:
+            await cmds.ping(transport, "foo")
+        last_recv = transport.transport.last_recv
+
+        # Pong keeps the connection alive
+        await trio.sleep(30)
+        assert transport.transport.last_recv > last_recv
+        assert not transport.closed
+
+        async def _no_pong():
+            pass
+
+        transport.transport.send_ping = _no_pong
+        await trio.sleep(30)
+        assert transport.closed
+
+        async with pool.acquire() as transport2:
+            await cmds.ping(transport2, "foo")
+        assert pool.stats.connections_created == 2
+        assert pool.stats.connections_destroyed == 1
+
+
+@pytest.mark.trio
+async def test_multiplexed_replies_out_of_order(alice, running_backend):
+    first_received = trio.Event()
+    first_released = trio.Event()
+    vanilla_ping = running_backend.backend.ping.ping
+
+    async def _ping(author, ping):
+        if ping == "1":
+            first_received.set()
+            await first_released.wait()
+        await vanilla_ping(author, ping)
+
+    running_backend.backend.ping.ping = _ping
+    async with backend_cmds_factory(
+        running_backend.addr, alice.device_id, alice.signing_key, multiplexed=True
+    ) as cmds:
+        results = []
+
+        async def _ping_and_release(ping):
+            results.append(await cmds.ping(ping))
+            first_released.set()
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(_ping_and_release, "1")
+            await first_received.wait()
+            nursery.start_soon(_ping_and_release, "2")
+
+        # Each reply is dispatched to its request no matter the order
+        assert results == ["2", "1"]
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("multiplexed", [False, True])
+async def test_streamed_reply_too_big(monkeypatch, alice, running_backend, multiplexed):
+    async with backend_cmds_factory(
+        running_backend.addr,
+        alice.device_id,
+        alice.signing_key,
+        multiplexed=multiplexed,
+        streaming=True,
+    ) as cmds:
+        block_id = uuid4()
+        await cmds.blockstore_create(block_id, b"<block>")
+        monkeypatch.setattr("parsec.core.backend_connection.cmds.BLOCKSTORE_MAX_BLOCK_SIZE", 4)
+        monkeypatch.setattr("parsec.core.backend_connection.transport.BLOCKSTORE_MAX_BLOCK_SIZE", 4)
+        with pytest.raises((BackendCmdsInvalidResponse, BackendNotAvailable)):
+            await cmds.blockstore_read(block_id)
+
+        # Connection is not reused in a corrupted state
+        monkeypatch.undo()
+        assert await cmds.blockstore_read(block_id) == b"<block>"
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("compression", [False, True])
+async def test_compression_is_opt_in(alice, running_backend, compression):
+    async with backend_cmds_factory(
+        running_backend.addr, alice.device_id, alice.signing_key, compression=compression
+    ) as cmds:
+        await cmds.ping("foo")
+        if compression:
+            assert cmds.compression in COMPRESSION_ALGORITHMS
+        else:
+            assert cmds.compression is None
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("streaming", [False, True])
+async def test_blockstore_streaming(alice, running_backend, streaming):
+    async with backend_cmds_factory(
+        running_backend.addr, alice.device_id, alice.signing_key, streaming=streaming
+    ) as cmds:
+        block_id = uuid4()
+        await cmds.blockstore_create(block_id, b"<block>")
+        assert await cmds.blockstore_read(block_id) == b"<block>"
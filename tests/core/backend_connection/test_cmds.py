@@ -1,7 +1,10 @@
 import pytest
 import trio
+import pendulum
+from uuid import uuid4
+from structlog import get_logger
 
-from parsec.api.protocole import ServerHandshake
+from parsec.api.protocole import ServerHandshake, packb, unpackb
 from parsec.trustchain import certify_device_revocation
 from parsec.api.transport import Transport
 from parsec.core.backend_connection import (
@@ -9,6 +12,7 @@ from parsec.core.backend_connection import (
     BackendHandshakeError,
     BackendDeviceRevokedError,
     backend_cmds_factory,
+    cmds as backend_cmds,
 )
 
 from tests.open_tcp_stream_mock_wrapper import offline
@@ -91,3 +95,48 @@ async def test_backend_disconnect_during_handshake(tcp_stream_spy, alice, backen
                     await cmds.ping()
 
         nursery.cancel_scope.cancel()
+
+
+class RecordingTransport:
+    def __init__(self, rep):
+        self.logger = get_logger()
+        self.reqs = []
+        self.rep = rep
+
+    async def send(self, raw_req):
+        self.reqs.append(unpackb(raw_req))
+
+    async def recv(self):
+        return packb(self.rep)
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("timestamp", [None, pendulum.now()])
+async def test_vlob_read_timestamp_only_sent_if_provided(timestamp):
+    transport = RecordingTransport({"status": "ok", "version": 1, "blob": b"<blob>", "deltas": []})
+    await backend_cmds.vlob_read(transport, uuid4(), "<rts>", timestamp=timestamp)
+    # Older backends reject unknown fields
+    assert ("timestamp" in transport.reqs[0]) is (timestamp is not None)
+
+
+@pytest.mark.trio
+async def test_vlob_optional_fields_not_sent_by_default():
+    transport = RecordingTransport({"status": "ok", "version": 1, "blob": b"<blob>"})
+    assert await backend_cmds.vlob_read(transport, uuid4(), "<rts>") == (1, b"<blob>", [])
+    transport.rep = {"status": "ok"}
+    await backend_cmds.vlob_update(transport, uuid4(), "<wts>", 2, b"<blob>", None)
+    read_req, update_req = transport.reqs
+    assert "known_version" not in read_req
+    assert "is_delta" not in update_req
+
+
+@pytest.mark.trio
+async def test_blockstore_not_streamed_by_default():
+    transport = RecordingTransport({"status": "ok"})
+    await backend_cmds.blockstore_create(transport, uuid4(), b"<block>")
+    transport.rep = {"status": "ok", "block": b"<block>"}
+    assert await backend_cmds.blockstore_read(transport, uuid4()) == b"<block>"
+    create_req, read_req = transport.reqs
+    # Older backends reject the streaming fields
+    assert create_req["block"] == b"<block>" and "stream_size" not in create_req
+    assert "stream" not in read_req
@@ -126,6 +126,45 @@ async def test_listen_already_listened_beacon_id_does_nothing(
     )
 
 
+@pytest.mark.trio
+async def test_listen_beacons_without_reconnection(
+    event_bus, backend, alice, tcp_stream_spy, running_backend_listen_events
+):
+    beacon_ids = [uuid4() for _ in range(3)]
+    src_id = uuid4()
+
+    for beacon_id in beacon_ids:
+        with event_bus.listen() as spy:
+            event_bus.send("backend.beacon.listen", beacon_id=beacon_id)
+            with trio.fail_after(1.0):
+                await spy.wait("backend.listener.restarted")
+    with event_bus.listen() as spy:
+        event_bus.send("backend.beacon.unlisten", beacon_id=beacon_ids[0])
+        with trio.fail_after(1.0):
+            await spy.wait("backend.listener.restarted")
+
+    # Subscriptions are modified on the existing connection
+    assert len(tcp_stream_spy.get_socks(alice.backend_addr)) == 1
+
+    with event_bus.listen() as spy:
+        for beacon_id in beacon_ids:
+            backend.event_bus.send(
+                "beacon.updated",
+                author="bob@test",
+                beacon_id=beacon_id,
+                index=1,
+                src_id=src_id,
+                src_version=42,
+            )
+        with trio.fail_after(1.0):
+            await spy.wait_multiple(["backend.beacon.updated", "backend.beacon.updated"])
+        await wait_all_tasks_blocked(cushion=0.01)
+    assert [e.kwargs["beacon_id"] for e in spy.events if e.event == "backend.beacon.updated"] == [
+        beacon_ids[1],
+        beacon_ids[2],
+    ]
+
+
 @pytest.mark.trio
 async def test_backend_switch_offline(
     mock_clock, event_bus, backend_addr, backend, running_backend_listen_events
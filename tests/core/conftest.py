@@ -86,10 +86,10 @@ def bob_local_db(local_db_factory, bob):
 @pytest.fixture
 def encryption_manager_factory():
     @asynccontextmanager
-    async def _encryption_manager_factory(device, local_db=None):
+    async def _encryption_manager_factory(device, local_db=None, compression=False):
         local_db = local_db or InMemoryLocalDB()
         async with backend_cmds_factory(
-            device.backend_addr, device.device_id, device.signing_key
+            device.backend_addr, device.device_id, device.signing_key, compression=compression
         ) as cmds:
             em = EncryptionManager(device, local_db, cmds)
             async with trio.open_nursery() as nursery:
@@ -111,12 +111,12 @@ async def encryption_manager(running_backend, encryption_manager_factory, alice)
 @pytest.fixture
 def fs_factory(encryption_manager_factory, local_db_factory, event_bus_factory):
     @asynccontextmanager
-    async def _fs_factory(device, local_db=None, event_bus=None):
+    async def _fs_factory(device, local_db=None, event_bus=None, compression=False):
         if not event_bus:
             event_bus = event_bus_factory()
         local_db = local_db or local_db_factory(device)
 
-        async with encryption_manager_factory(device, local_db) as em:
+        async with encryption_manager_factory(device, local_db, compression) as em:
             fs = FS(device, local_db, em.backend_cmds, em, event_bus)
             yield fs
 
@@ -73,8 +73,8 @@ async def test_concurrent_devices_agreed_on_root_manifest(
                 date_sync = Pendulum(2000, 1, 5)
                 spy.assert_events_exactly_occured(
                     [
-                        ("fs.entry.minimal_synced", {"path": "/", "id": spy.ANY}, date_sync),
                         ("fs.entry.minimal_synced", {"path": "/from_1", "id": spy.ANY}, date_sync),
+                        ("fs.entry.minimal_synced", {"path": "/", "id": spy.ANY}, date_sync),
                         ("fs.entry.synced", {"path": "/", "id": spy.ANY}, date_sync),
                         ("fs.entry.synced", {"path": "/from_1", "id": spy.ANY}, date_sync),
                     ]
@@ -86,8 +86,8 @@ async def test_concurrent_devices_agreed_on_root_manifest(
                 date_sync = Pendulum(2000, 1, 6)
                 spy.assert_events_exactly_occured(
                     [
-                        ("fs.entry.minimal_synced", {"path": "/", "id": spy.ANY}, date_sync),
                         ("fs.entry.minimal_synced", {"path": "/from_2", "id": spy.ANY}, date_sync),
+                        ("fs.entry.minimal_synced", {"path": "/", "id": spy.ANY}, date_sync),
                         ("fs.entry.synced", {"path": "/", "id": spy.ANY}, date_sync),
                         ("fs.entry.synced", {"path": "/from_2", "id": spy.ANY}, date_sync),
                     ]
@@ -113,7 +113,7 @@ async def test_concurrent_devices_agreed_on_root_manifest(
             "type": "root",
             "created": Pendulum(2000, 1, 3),
             "updated": Pendulum(2000, 1, 4),
-            "base_version": 3,
+            "base_version": 2,
             "is_folder": True,
             "is_placeholder": False,
             "need_sync": False,
@@ -5,6 +5,7 @@ from parsec.core.fs.buffer_ordering import (
     merge_buffers,
     merge_buffers_with_limits,
     merge_buffers_with_limits_and_alignment,
+    merge_buffers_with_limits_and_reuse,
     Buffer,
 )
 
@@ -144,3 +145,37 @@ def test_merge_buffers_with_limits_and_alignment(buffers, limits, alignment):
     result = _build_data_from_uncontiguous_space(merged)
 
     assert result[start:end] == expected[start:end]
+
+
+@given(
+    buffers=st.lists(elements=buffer_strategy),
+    limits=limits_strategy,
+    block_size=buffer_oversize_strategy.filter(lambda x: x != 0),
+    reusable_flags=st.lists(elements=st.booleans()),
+)
+def test_merge_buffers_with_limits_and_reuse(buffers, limits, block_size, reusable_flags):
+    start, end = limits
+    non_empty_buffers = [b for b in buffers if b.size]
+    reusables = [id(b) for b, flag in zip(buffers, reusable_flags) if flag]
+
+    merged = merge_buffers_with_limits_and_reuse(
+        buffers, start, end, block_size, lambda b: id(b) in reusables
+    )
+
+    assert merged.start == start
+    assert merged.end == end
+    uncontigous_space_sanity_checks(merged, start, end)
+
+    for cs in merged.spaces:
+        if len(cs.buffers) == 1 and id(cs.buffers[0].buffer) in reusables:
+            continue
+        assert cs.size <= block_size
+        for bs in cs.buffers:
+            # Fully visible reusable buffers should never be repacked, unless
+            # they are small enough to be merged with their neighbours
+            assert bs.slice_needed() or id(bs.buffer) not in reusables or bs.size < block_size // 4
+
+    expected = _build_data_from_buffers(non_empty_buffers, end)
+    result = _build_data_from_uncontiguous_space(merged)
+
+    assert result[start:end] == expected[start:end]
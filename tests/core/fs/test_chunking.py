@@ -0,0 +1,39 @@
+import os
+import pytest
+from random import Random
+
+from parsec.core.fs.chunking import content_defined_chunks
+
+
+def _random_data(size, seed=0):
+    return bytes(Random(seed).getrandbits(8) for _ in range(size))
+
+
+@pytest.mark.parametrize("size", [0, 1, 15, 16, 1000, 50000])
+def test_chunks_cover_data(size):
+    data = os.urandom(size)
+    chunks = content_defined_chunks(data, 256)
+    assert b"".join(data[start:end] for start, end in chunks) == data
+    for (_, end), (next_start, _) in zip(chunks, chunks[1:]):
+        assert end == next_start
+    for start, end in chunks[:-1]:
+        assert 64 <= end - start <= 1024
+
+
+def test_chunks_are_deterministic():
+    data = _random_data(20000)
+    assert content_defined_chunks(data, 256) == content_defined_chunks(bytes(data), 256)
+
+
+def test_boundaries_resync_after_insertion():
+    data = _random_data(50000)
+    modified = data[:1000] + b"inserted data" + data[1000:]
+
+    def _chunks_data(data):
+        return {data[start:end] for start, end in content_defined_chunks(data, 256)}
+
+    original_chunks = _chunks_data(data)
+    modified_chunks = _chunks_data(modified)
+    # Only the chunks around the insertion should have changed
+    assert len(modified_chunks - original_chunks) <= 3
+    assert len(original_chunks - modified_chunks) <= 3
@@ -0,0 +1,163 @@
+import pytest
+
+from parsec.core.local_db import LocalDBMissingEntry
+from parsec.core.schemas import loads_manifest
+from parsec.core.fs.local_folder_fs import FSEntryNotFound
+from parsec.core.fs.types import Path
+from parsec.core.fs.utils import new_access
+from parsec.core.fs.folder_shards import (
+    SHARD_SIZE,
+    SHARDING_MIN_CHILDREN,
+    get_shards_count,
+    split_children,
+    invalidate_shards,
+)
+
+from tests.common import create_shared_workspace
+
+
+@pytest.fixture
+def small_shards(monkeypatch):
+    monkeypatch.setattr("parsec.core.fs.folder_shards.SHARD_SIZE", 2)
+    monkeypatch.setattr("parsec.core.fs.folder_shards.SHARDING_MIN_CHILDREN", 4)
+
+
+def test_get_shards_count():
+    assert get_shards_count(SHARDING_MIN_CHILDREN - 1) == 0
+    assert get_shards_count(SHARDING_MIN_CHILDREN) == 2
+    assert get_shards_count(SHARDING_MIN_CHILDREN + 1) == 4
+    assert get_shards_count(SHARD_SIZE * 1000) == 1024
+
+
+def test_split_children_is_stable():
+    children = {f"file{i}.txt": new_access() for i in range(32)}
+    shards = split_children(children, 4)
+    assert sum(len(shard) for shard in shards) == 32
+    assert all(shards)
+
+    # Adding a child only changes the shard it belongs to
+    new_children = {**children, "new.txt": new_access()}
+    new_shards = split_children(new_children, 4)
+    changed = [i for i in range(4) if shards[i] != new_shards[i]]
+    assert len(changed) == 1
+    assert "new.txt" in new_shards[changed[0]]
+
+    assert invalidate_shards(["a", "b", "c", "d"], ["new.txt"]) == [
+        None if i in changed else x for i, x in enumerate("abcd")
+    ]
+
+
+def test_local_sharded_folder(small_shards, local_folder_fs_factory, alice, alice_local_db):
+    local_folder_fs = local_folder_fs_factory(alice, alice_local_db)
+    local_folder_fs.workspace_create(Path("/w"))
+    local_folder_fs.mkdir(Path("/w/d"))
+    for i in range(15):
+        local_folder_fs.touch(Path(f"/w/d/file{i}.txt"))
+    d_access = local_folder_fs.get_access(Path("/w/d"))
+
+    raw = alice_local_db.get(d_access)
+    assert loads_manifest(raw)["children"] == {}
+    assert loads_manifest(raw)["shards"] == 8
+
+    # Only the shard containing the modified child is rewritten
+    shard_ids = {local_folder_fs._build_shard_access(d_access, i)["id"] for i in range(8)}
+    written = []
+    vanilla_set = alice_local_db.set
+
+    def _set(access, *args, **kwargs):
+        written.append(access["id"])
+        vanilla_set(access, *args, **kwargs)
+
+    alice_local_db.set = _set
+    local_folder_fs.touch(Path("/w/d/new.txt"))
+    new_access = local_folder_fs.get_access(Path("/w/d/new.txt"))
+    assert len(shard_ids.intersection(written)) == 1
+    assert {d_access["id"], new_access["id"]} <= set(written)
+    written.clear()
+    local_folder_fs.unlink(Path("/w/d/file0.txt"))
+    assert len(shard_ids.intersection(written)) == 1
+    assert d_access["id"] in written
+    alice_local_db.set = vanilla_set
+
+    # Incremental index of the modified children
+    path, *_ = local_folder_fs.get_entry_path(new_access["id"])
+    assert path == Path("/w/d/new.txt")
+
+    # Children are assembled from the shards when reloading the folder
+    local_folder_fs2 = local_folder_fs_factory(alice, alice_local_db)
+    stat = local_folder_fs2.stat(Path("/w/d"))
+    assert stat["children"] == sorted(["new.txt", *(f"file{i}.txt" for i in range(1, 15))])
+    path, *_ = local_folder_fs2.get_entry_path(new_access["id"])
+    assert path == Path("/w/d/new.txt")
+    file1_access = local_folder_fs2.get_access(Path("/w/d/file1.txt"))
+
+    # Shards are removed once the folder is small again
+    for i in range(1, 15):
+        local_folder_fs2.unlink(Path(f"/w/d/file{i}.txt"))
+    with pytest.raises(FSEntryNotFound):
+        local_folder_fs2.get_entry_path(file1_access["id"])
+    raw = alice_local_db.get(d_access)
+    assert list(loads_manifest(raw)["children"]) == ["new.txt"]
+    with pytest.raises(LocalDBMissingEntry):
+        alice_local_db.get(local_folder_fs2._build_shard_access(d_access, 0))
+
+
+@pytest.mark.trio
+async def test_remote_sharding_disabled_by_default(
+    small_shards, running_backend, alice_fs, alice2_fs
+):
+    await create_shared_workspace("w", alice_fs, alice2_fs)
+    await alice_fs.folder_create("/w/d")
+    for i in range(15):
+        await alice_fs.file_create(f"/w/d/file{i}.txt")
+    await alice_fs.sync("/w")
+
+    d_access = alice_fs._local_folder_fs.get_access(Path("/w/d"))
+    blob_versions = running_backend.backend.vlob.vlobs[d_access["id"]].blob_versions
+    raw = await alice_fs._remote_loader.encryption_manager.decrypt_with_secret_key(
+        d_access["key"], blob_versions[-1][0]
+    )
+    root = loads_manifest(raw)
+    assert len(root["children"]) == 15
+    assert "shards" not in root
+
+
+@pytest.mark.trio
+async def test_sync_sharded_folder(
+    small_shards, running_backend, fs_factory, alice, alice_fs, alice2_fs
+):
+    alice_fs._remote_loader.folder_sharding = True
+    alice2_fs._remote_loader.folder_sharding = True
+    await create_shared_workspace("w", alice_fs, alice2_fs)
+    await alice_fs.folder_create("/w/d")
+    for i in range(15):
+        await alice_fs.file_create(f"/w/d/file{i}.txt")
+    await alice_fs.sync("/w")
+
+    d_access = alice_fs._local_folder_fs.get_access(Path("/w/d"))
+    blob_versions = running_backend.backend.vlob.vlobs[d_access["id"]].blob_versions
+    blocks = running_backend.backend.blockstore.blocks
+    blocks_count = len(blocks)
+
+    # Root manifest only references the shards
+    raw = await alice_fs._remote_loader.encryption_manager.decrypt_with_secret_key(
+        d_access["key"], blob_versions[-1][0]
+    )
+    root = loads_manifest(raw)
+    assert root["children"] == {}
+    assert len(root["shards"]) == 8
+
+    await alice2_fs.sync("/w")
+    stat = await alice2_fs.stat("/w/d")
+    assert stat["children"] == sorted(f"file{i}.txt" for i in range(15))
+
+    # Only the shard containing the new child is uploaded
+    await alice2_fs.file_create("/w/d/new.txt")
+    await alice2_fs.sync("/w")
+    # New file's own manifest has no blocks
+    assert len(blocks) == blocks_count + 1
+
+    async with fs_factory(alice) as alice3_fs:
+        await alice3_fs.sync("/")
+        stat = await alice3_fs.stat("/w/d")
+    assert stat["children"] == sorted(["new.txt", *(f"file{i}.txt" for i in range(15))])
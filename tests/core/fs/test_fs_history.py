@@ -0,0 +1,83 @@
+import pytest
+from pendulum import Pendulum
+
+from tests.common import freeze_time
+
+
+@pytest.fixture
+async def foo_history(running_backend, alice_fs):
+    with freeze_time("2000-01-02"):
+        await alice_fs.workspace_create("/w")
+        await alice_fs.touch("/w/foo.txt")
+        await alice_fs.file_write("/w/foo.txt", b"v1")
+        await alice_fs.sync("/")
+    with freeze_time("2000-01-04"):
+        await alice_fs.file_write("/w/foo.txt", b"v2 content")
+        await alice_fs.sync("/w")
+    with freeze_time("2000-01-06"):
+        await alice_fs.delete("/w/foo.txt")
+        await alice_fs.sync("/w")
+
+
+@pytest.mark.trio
+async def test_history_at_timestamp(alice_fs, foo_history):
+    stat = await alice_fs.history_stat("/w/foo.txt", timestamp=Pendulum(2000, 1, 3))
+    assert stat == {
+        "type": "file",
+        "is_folder": False,
+        "created": Pendulum(2000, 1, 2),
+        "updated": Pendulum(2000, 1, 2),
+        # Version 1 is the empty placeholder uploaded by the minimal sync
+        "version": 2,
+        "author": alice_fs.device.device_id,
+        "size": 2,
+    }
+    data = await alice_fs.history_file_read("/w/foo.txt", timestamp=Pendulum(2000, 1, 3))
+    assert data == b"v1"
+
+    stat = await alice_fs.history_stat("/w/foo.txt", timestamp=Pendulum(2000, 1, 5))
+    assert stat["version"] == 3
+    assert stat["size"] == 10
+    data = await alice_fs.history_file_read(
+        "/w/foo.txt", timestamp=Pendulum(2000, 1, 5), size=4, offset=3
+    )
+    assert data == b"cont"
+
+    stat = await alice_fs.history_stat("/w", timestamp=Pendulum(2000, 1, 5))
+    assert stat["type"] == "workspace"
+    assert stat["children"] == ["foo.txt"]
+
+    with pytest.raises(FileNotFoundError):
+        await alice_fs.history_stat("/w/foo.txt", timestamp=Pendulum(2000, 1, 7))
+    with pytest.raises(FileNotFoundError):
+        await alice_fs.history_stat("/w", timestamp=Pendulum(1999, 12, 31))
+
+    # Version and timestamp can be combined to browse a removed entry
+    data = await alice_fs.history_file_read("/w/foo.txt", version=2, timestamp=Pendulum(2000, 1, 5))
+    assert data == b"v1"
+
+
+@pytest.mark.trio
+async def test_history_at_version(running_backend, alice_fs, monkeypatch):
+    await alice_fs.workspace_create("/w")
+    await alice_fs.touch("/w/foo.txt")
+    await alice_fs.file_write("/w/foo.txt", b"v1")
+    await alice_fs.sync("/w")
+    await alice_fs.file_write("/w/foo.txt", b"v2")
+    await alice_fs.sync("/w")
+
+    assert await alice_fs.history_file_read("/w/foo.txt", version=1) == b""
+    assert await alice_fs.history_file_read("/w/foo.txt", version=2) == b"v1"
+    assert await alice_fs.history_file_read("/w/foo.txt", version=3) == b"v2"
+    assert await alice_fs.history_file_read("/w/foo.txt") == b"v2"
+    with pytest.raises(FileNotFoundError):
+        await alice_fs.history_stat("/w/foo.txt", version=4)
+
+    # Historical manifests are cached once retrieved
+    async def _vlob_read(*args, **kwargs):
+        raise AssertionError("Manifest should have been cached")
+
+    monkeypatch.setattr(alice_fs.backend_cmds, "vlob_read", _vlob_read)
+    assert await alice_fs.history_file_read("/w/foo.txt", version=2) == b"v1"
+    stat = await alice_fs.history_stat("/w/foo.txt", version=3)
+    assert stat["version"] == 3
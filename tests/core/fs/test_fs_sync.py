@@ -1,7 +1,9 @@
 import pytest
+from random import Random
 from pendulum import Pendulum
 
 from parsec.core.fs.types import Path
+from parsec.core.fs.chunking import FIXED_CHUNKING, CONTENT_DEFINED_CHUNKING, content_defined_chunks
 from parsec.core.backend_connection import BackendNotAvailable
 
 from tests.common import freeze_time, create_shared_workspace
@@ -136,8 +138,8 @@ async def test_simple_sync(running_backend, alice_fs, alice2_fs):
                 {"path": "/w/foo.txt", "id": spy.ANY},
                 Pendulum(2000, 1, 4),
             ),
-            ("fs.entry.synced", {"path": "/w", "id": spy.ANY}, Pendulum(2000, 1, 4)),
             ("fs.entry.synced", {"path": "/w/foo.txt", "id": spy.ANY}, Pendulum(2000, 1, 4)),
+            ("fs.entry.synced", {"path": "/w", "id": spy.ANY}, Pendulum(2000, 1, 4)),
         ]
     )
 
@@ -177,24 +179,26 @@ async def test_fs_recursive_sync(running_backend, alice_fs):
     with alice_fs.event_bus.listen() as spy:
         with freeze_time("2000-01-03"):
             await alice_fs.sync("/w")
-    sync_date = Pendulum(2000, 1, 3)
-    spy.assert_events_occured(
-        [
-            # Minimal sync on /w/bar and sync it access into it parent
-            ("fs.entry.minimal_synced", {"path": "/w/bar", "id": spy.ANY}, sync_date),
-            ("fs.entry.synced", {"path": "/w", "id": spy.ANY}, sync_date),
-            # Recursive sync on /w/bar children
-            ("fs.entry.minimal_synced", {"path": "/w/bar/spam", "id": spy.ANY}, sync_date),
-            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, sync_date),
-            ("fs.entry.synced", {"path": "/w/bar/spam", "id": spy.ANY}, sync_date),
-            ("fs.entry.minimal_synced", {"path": "/w/bar/wizz.txt", "id": spy.ANY}, sync_date),
-            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, sync_date),
-            ("fs.entry.synced", {"path": "/w/bar/wizz.txt", "id": spy.ANY}, sync_date),
-            ("fs.entry.minimal_synced", {"path": "/w/foo.txt", "id": spy.ANY}, sync_date),
-            ("fs.entry.synced", {"path": "/w", "id": spy.ANY}, sync_date),
-            ("fs.entry.synced", {"path": "/w/foo.txt", "id": spy.ANY}, sync_date),
-        ]
-    )
+    events = [
+        (e.event, e.kwargs["path"])
+        for e in spy.events
+        if e.event in ("fs.entry.minimal_synced", "fs.entry.synced")
+    ]
+    # Leaves are resolved concurrently, then their parent is resolved once
+    assert sorted(events[:3]) == [
+        ("fs.entry.minimal_synced", "/w/bar/spam"),
+        ("fs.entry.minimal_synced", "/w/bar/wizz.txt"),
+        ("fs.entry.minimal_synced", "/w/foo.txt"),
+    ]
+    assert events[3:] == [
+        ("fs.entry.minimal_synced", "/w/bar"),
+        # Entries are visible to others once the workspace is synced
+        ("fs.entry.synced", "/w"),
+        ("fs.entry.synced", "/w/bar/spam"),
+        ("fs.entry.synced", "/w/bar/wizz.txt"),
+        ("fs.entry.synced", "/w/foo.txt"),
+        ("fs.entry.synced", "/w/bar"),
+    ]
 
     # 2) Now additional sync should not trigger any event
 
@@ -209,6 +213,42 @@ async def test_fs_recursive_sync(running_backend, alice_fs):
         assert not stat["need_sync"]
 
 
+@pytest.mark.trio
+async def test_fs_recursive_sync_uploads_each_placeholder_once(running_backend, alice_fs):
+    await create_shared_workspace("/w", alice_fs)
+
+    await alice_fs.folder_create("/w/d")
+    await alice_fs.folder_create("/w/d/sub")
+    await alice_fs.folder_create("/w/d/sub/empty")
+    for i in range(10):
+        await alice_fs.file_create(f"/w/d/file{i}")
+        await alice_fs.file_create(f"/w/d/sub/file{i}")
+
+    uploaded_ids = []
+    vanilla_vlob_create = alice_fs._syncer._backend_vlob_create
+    vanilla_vlob_update = alice_fs._syncer._backend_vlob_update
+
+    async def _vlob_create(access, *args):
+        uploaded_ids.append(access["id"])
+        await vanilla_vlob_create(access, *args)
+
+    async def _vlob_update(access, *args):
+        uploaded_ids.append(access["id"])
+        await vanilla_vlob_update(access, *args)
+
+    alice_fs._syncer._backend_vlob_create = _vlob_create
+    alice_fs._syncer._backend_vlob_update = _vlob_update
+
+    await alice_fs.sync("/w")
+
+    # 20 files, 3 folders and the workspace, each uploaded exactly once
+    assert len(uploaded_ids) == 24
+    assert len(set(uploaded_ids)) == 24
+    stat = await alice_fs.stat("/w/d/sub")
+    assert not stat["need_sync"]
+    assert len(stat["children"]) == 11
+
+
 # TODO: a complex but interesting test would be to do concurrent changes
 # during sync
 
@@ -250,15 +290,15 @@ async def test_cross_sync(running_backend, alice_fs, alice2_fs):
 
     spy.assert_events_occured(
         [
-            ("fs.entry.minimal_synced", {"path": "/w/bar", "id": spy.ANY}, Pendulum(2000, 1, 5)),
-            ("fs.entry.synced", {"path": "/w", "id": spy.ANY}, Pendulum(2000, 1, 5)),
             (
                 "fs.entry.minimal_synced",
                 {"path": "/w/bar/spam", "id": spy.ANY},
                 Pendulum(2000, 1, 5),
             ),
-            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, Pendulum(2000, 1, 5)),
+            ("fs.entry.minimal_synced", {"path": "/w/bar", "id": spy.ANY}, Pendulum(2000, 1, 5)),
+            ("fs.entry.synced", {"path": "/w", "id": spy.ANY}, Pendulum(2000, 1, 5)),
             ("fs.entry.synced", {"path": "/w/bar/spam", "id": spy.ANY}, Pendulum(2000, 1, 5)),
+            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, Pendulum(2000, 1, 5)),
         ]
     )
 
@@ -278,7 +318,8 @@ async def test_cross_sync(running_backend, alice_fs, alice2_fs):
     assert final_wkps["children"]["bar"]["children"].keys() == {"spam"}
 
     assert final_wkps["base_version"] == 3
-    assert final_wkps["children"]["bar"]["base_version"] == 2
+    # Placeholder folder is uploaded once, together with its children
+    assert final_wkps["children"]["bar"]["base_version"] == 1
     assert final_wkps["children"]["foo.txt"]["base_version"] == 1
 
     data = await alice_fs.file_read("/w/foo.txt")
@@ -308,6 +349,265 @@ async def test_sync_growth_by_truncate_file(running_backend, alice_fs, alice2_fs
     assert data == b"\x00" * 24
 
 
+@pytest.mark.trio
+async def test_delta_sync_only_upload_modified_ranges(running_backend, alice_fs, alice2_fs):
+    await create_shared_workspace("/w", alice_fs, alice2_fs)
+    alice_fs._syncer.delta_sync = True
+    alice_fs._syncer.block_size = 16
+
+    def _get_blocks():
+        access = alice_fs._local_folder_fs.get_access(Path("/w/foo.txt"))
+        return alice_fs._local_folder_fs.get_manifest(access)["blocks"]
+
+    await alice_fs.file_create("/w/foo.txt")
+    await alice_fs.file_write("/w/foo.txt", b"a" * 40)
+    await alice_fs.sync("/w")
+    initial_blocks = _get_blocks()
+    assert [(b["offset"], b["size"]) for b in initial_blocks] == [(0, 16), (16, 16), (32, 8)]
+
+    # Appending data should keep all the existing blocks
+    await alice_fs.file_write("/w/foo.txt", b"b" * 5, offset=40)
+    await alice_fs.sync("/w")
+    appended_blocks = _get_blocks()
+    assert appended_blocks[:3] == initial_blocks
+    assert [(b["offset"], b["size"]) for b in appended_blocks[3:]] == [(40, 5)]
+
+    # Modifying the middle of the file should only repack the touched block
+    await alice_fs.file_write("/w/foo.txt", b"c" * 4, offset=20)
+    await alice_fs.sync("/w")
+    modified_blocks = _get_blocks()
+    assert modified_blocks[0] == initial_blocks[0]
+    assert modified_blocks[1]["id"] != initial_blocks[1]["id"]
+    assert (modified_blocks[1]["offset"], modified_blocks[1]["size"]) == (16, 16)
+    assert modified_blocks[2:] == appended_blocks[2:]
+
+    expected = b"a" * 20 + b"c" * 4 + b"a" * 16 + b"b" * 5
+    await alice2_fs.sync("/w")
+    assert await alice_fs.file_read("/w/foo.txt") == expected
+    assert await alice2_fs.file_read("/w/foo.txt") == expected
+
+
+@pytest.mark.trio
+async def test_delta_sync_repack_small_appends(running_backend, alice_fs):
+    await alice_fs.workspace_create("/w")
+    alice_fs._syncer.delta_sync = True
+    alice_fs._syncer.block_size = 16
+
+    await alice_fs.file_create("/w/foo.txt")
+    await alice_fs.file_write("/w/foo.txt", b"a" * 40)
+    await alice_fs.sync("/w")
+    # Append to the file like a log would do
+    for i in range(10):
+        await alice_fs.file_write("/w/foo.txt", b"b", offset=40 + i)
+        await alice_fs.sync("/w")
+
+    access = alice_fs._local_folder_fs.get_access(Path("/w/foo.txt"))
+    blocks = alice_fs._local_folder_fs.get_manifest(access)["blocks"]
+    # Small blocks have been merged with the appended data
+    assert [(b["offset"], b["size"]) for b in blocks] == [
+        (0, 16),
+        (16, 16),
+        (32, 8),
+        (40, 4),
+        (44, 4),
+        (48, 2),
+    ]
+    assert await alice_fs.file_read("/w/foo.txt") == b"a" * 40 + b"b" * 10
+
+
+@pytest.mark.trio
+async def test_sync_compressed_blocks(
+    running_backend, fs_factory, alice, alice_local_db, alice2_fs
+):
+    # Compression is only used once explicitly enabled
+    async with fs_factory(alice, alice_local_db, compression=True) as alice_fs:
+        await _test_sync_compressed_blocks(alice_fs, alice2_fs)
+
+
+async def _test_sync_compressed_blocks(alice_fs, alice2_fs):
+    await create_shared_workspace("/w", alice_fs, alice2_fs)
+    alice_fs._syncer.block_size = 1024
+
+    def _get_blocks():
+        access = alice_fs._local_folder_fs.get_access(Path("/w/foo.txt"))
+        return alice_fs._local_folder_fs.get_manifest(access)["blocks"]
+
+    # Only the blocks worth it are compressed
+    compressible = b"Hello world ! " * 100
+    incompressible = Random(0).getrandbits(8 * 1024).to_bytes(1024, "big")
+    data = compressible[:1024] + incompressible
+    await alice_fs.file_create("/w/foo.txt")
+    await alice_fs.file_write("/w/foo.txt", data)
+    await alice_fs.sync("/w")
+    assert [b.get("compressed", False) for b in _get_blocks()] == [True, False]
+
+    await alice2_fs.sync("/w")
+    assert await alice2_fs.file_read("/w/foo.txt") == data
+
+
+@pytest.mark.trio
+async def test_sync_uncompressed_by_default(running_backend, alice_fs):
+    await alice_fs.workspace_create("/w")
+    await alice_fs.file_create("/w/foo.txt")
+    await alice_fs.file_write("/w/foo.txt", b"Hello world ! " * 100)
+    await alice_fs.sync("/w")
+
+    access = alice_fs._local_folder_fs.get_access(Path("/w/foo.txt"))
+    blocks = alice_fs._local_folder_fs.get_manifest(access)["blocks"]
+    assert not any(b.get("compressed", False) for b in blocks)
+
+
+@pytest.mark.trio
+async def test_content_defined_chunking_reuse_shifted_blocks(running_backend, alice_fs, alice2_fs):
+    await create_shared_workspace("/w", alice_fs, alice2_fs)
+    await alice_fs.workspace_set_chunking("/w", "content_defined")
+    alice_fs._syncer.block_size = 64
+
+    def _get_blocks():
+        access = alice_fs._local_folder_fs.get_access(Path("/w/foo.txt"))
+        return alice_fs._local_folder_fs.get_manifest(access)["blocks"]
+
+    data = bytes(Random(0).getrandbits(8) for _ in range(4000))
+    await alice_fs.file_create("/w/foo.txt")
+    await alice_fs.file_write("/w/foo.txt", data)
+    await alice_fs.sync("/w")
+    initial_blocks = _get_blocks()
+    assert sum(b["size"] for b in initial_blocks) == len(data)
+
+    # Inserting data shifts the rest of the file, but most of it should be
+    # found back in the already uploaded blocks
+    data = data[:100] + b"inserted" + data[100:]
+    await alice_fs.file_write("/w/foo.txt", data)
+    await alice_fs.sync("/w")
+    modified_blocks = _get_blocks()
+    initial_ids = {b["id"] for b in initial_blocks}
+    new_blocks = [b for b in modified_blocks if b["id"] not in initial_ids]
+    assert sum(b["size"] for b in new_blocks) < len(data) // 4
+
+    await alice2_fs.sync("/w")
+    assert await alice_fs.file_read("/w/foo.txt") == data
+    assert await alice2_fs.file_read("/w/foo.txt") == data
+    assert alice2_fs._local_folder_fs.get_chunking(Path("/w/foo.txt")) == "content_defined"
+
+
+@pytest.mark.trio
+async def test_content_defined_chunking_bounded_window(running_backend, alice_fs):
+    await alice_fs.workspace_create("/w")
+    await alice_fs.workspace_set_chunking("/w", CONTENT_DEFINED_CHUNKING)
+    alice_fs._syncer.block_size = 64
+
+    built_sizes = []
+    vanilla_build_data = alice_fs._syncer._build_data_from_contiguous_space
+
+    async def _build_data_from_contiguous_space(cs):
+        built_sizes.append(cs.size)
+        return await vanilla_build_data(cs)
+
+    alice_fs._syncer._build_data_from_contiguous_space = _build_data_from_contiguous_space
+
+    data = bytes(Random(0).getrandbits(8) for _ in range(4000))
+    await alice_fs.file_create("/w/foo.txt")
+    await alice_fs.file_write("/w/foo.txt", data)
+    await alice_fs.sync("/w")
+
+    # Modified range is built piece by piece...
+    assert max(built_sizes) <= 64
+    # ...while still chunked as a whole
+    access = alice_fs._local_folder_fs.get_access(Path("/w/foo.txt"))
+    blocks = alice_fs._local_folder_fs.get_manifest(access)["blocks"]
+    assert [(b["offset"], b["offset"] + b["size"]) for b in blocks] == content_defined_chunks(
+        data, 64
+    )
+    assert await alice_fs.file_read("/w/foo.txt") == data
+
+
+@pytest.mark.slow
+@pytest.mark.trio
+async def test_content_defined_chunking_uploads_less_after_insert(running_backend, alice_fs):
+    alice_fs._syncer.block_size = 4096
+    random = Random(0)
+    data = bytes(random.getrandbits(8) for _ in range(256 * 1024))
+    # Inserting in the middle shifts all the following fixed size blocks
+    edited_data = data[: len(data) // 2] + b"x" * 10 + data[len(data) // 2 :]
+
+    uploaded = 0
+    vanilla_backend_block_create = alice_fs._syncer._backend_block_create
+
+    async def _backend_block_create(access, blob):
+        nonlocal uploaded
+        uploaded += len(blob)
+        await vanilla_backend_block_create(access, blob)
+
+    alice_fs._syncer._backend_block_create = _backend_block_create
+
+    uploaded_after_insert = {}
+    for chunking in (FIXED_CHUNKING, CONTENT_DEFINED_CHUNKING):
+        await alice_fs.workspace_create(f"/{chunking}")
+        await alice_fs.workspace_set_chunking(f"/{chunking}", chunking)
+        await alice_fs.file_create(f"/{chunking}/foo.txt")
+        await alice_fs.file_write(f"/{chunking}/foo.txt", data)
+        await alice_fs.sync(f"/{chunking}")
+
+        uploaded = 0
+        await alice_fs.file_truncate(f"/{chunking}/foo.txt", 0)
+        await alice_fs.file_write(f"/{chunking}/foo.txt", edited_data)
+        await alice_fs.sync(f"/{chunking}")
+        uploaded_after_insert[chunking] = uploaded
+        assert await alice_fs.file_read(f"/{chunking}/foo.txt") == edited_data
+
+    assert uploaded_after_insert[FIXED_CHUNKING] >= len(data) // 2
+    assert (
+        uploaded_after_insert[CONTENT_DEFINED_CHUNKING] < uploaded_after_insert[FIXED_CHUNKING] // 4
+    )
+
+
+@pytest.mark.trio
+async def test_full_sync_resume_from_journal(
+    running_backend, fs_factory, alice, alice_local_db, alice2_fs
+):
+    async with fs_factory(alice, alice_local_db) as fs:
+        await fs.full_sync()
+        await create_shared_workspace("/w", fs, alice2_fs)
+        await fs.file_create("/w/foo.txt")
+        await fs.sync("/w")
+        # Modification not synced before the restart
+        await fs.file_create("/w/bar.txt")
+
+    await alice2_fs.sync("/w")
+    await alice2_fs.file_write("/w/foo.txt", b"from alice2")
+    await alice2_fs.sync("/w")
+
+    async with fs_factory(alice, alice_local_db) as fs:
+
+        def _initialize_sync_journal():
+            raise AssertionError("Journal should be reused")
+
+        fs._syncer._initialize_sync_journal = _initialize_sync_journal
+        await fs.full_sync()
+
+        assert await fs.file_read("/w/foo.txt") == b"from alice2"
+        stat = await fs.stat("/w")
+        assert not stat["need_sync"]
+
+        # Changes already processed are not fetched again
+        synced_ids = []
+
+        async def _sync_by_id(entry_id):
+            synced_ids.append(entry_id)
+
+        fs._syncer.sync_by_id = _sync_by_id
+        await fs.full_sync()
+        assert synced_ids == []
+
+    await alice2_fs.sync("/w")
+    stat = await alice2_fs.stat("/w")
+    assert stat["children"] == ["bar.txt", "foo.txt"]
+
+
+def _sort_events_by_path(spy, start, end):
+    spy.events[start:end] = sorted(spy.events[start:end], key=lambda e: e.kwargs["path"])
+
+
 @pytest.mark.trio
 async def test_concurrent_update(running_backend, alice_fs, alice2_fs):
     # TODO: break this test down to reduce complexity
@@ -347,19 +647,19 @@ async def test_concurrent_update(running_backend, alice_fs, alice2_fs):
         with freeze_time("2000-01-05"):
             await alice_fs.sync("/")
     date_sync = Pendulum(2000, 1, 5)
+    # `/w/bar`'s placeholders are resolved concurrently
+    _sort_events_by_path(spy, 1, 4)
     spy.assert_events_exactly_occured(
         [
+            ("fs.entry.minimal_synced", {"path": "/z", "id": spy.ANY}, date_sync),
             ("fs.entry.minimal_synced", {"path": "/w/bar/buzz.txt", "id": spy.ANY}, date_sync),
-            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, date_sync),
-            ("fs.entry.synced", {"path": "/w/bar/buzz.txt", "id": spy.ANY}, date_sync),
             ("fs.entry.minimal_synced", {"path": "/w/bar/from_alice", "id": spy.ANY}, date_sync),
-            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, date_sync),
-            ("fs.entry.synced", {"path": "/w/bar/from_alice", "id": spy.ANY}, date_sync),
             ("fs.entry.minimal_synced", {"path": "/w/bar/spam", "id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, date_sync),
+            ("fs.entry.synced", {"path": "/w/bar/buzz.txt", "id": spy.ANY}, date_sync),
+            ("fs.entry.synced", {"path": "/w/bar/from_alice", "id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/w/bar/spam", "id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/w/foo.txt", "id": spy.ANY}, date_sync),
-            ("fs.entry.minimal_synced", {"path": "/z", "id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/", "id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/z", "id": spy.ANY}, date_sync),
         ]
@@ -371,10 +671,15 @@ async def test_concurrent_update(running_backend, alice_fs, alice2_fs):
         with freeze_time("2000-01-06"):
             await alice2_fs.sync("/")
     date_sync = Pendulum(2000, 1, 6)
+    _sort_events_by_path(spy, 1, 4)
+    _sort_events_by_path(spy, 4, 6)
     spy.assert_events_exactly_occured(
         [
+            ("fs.entry.minimal_synced", {"path": "/z", "id": spy.ANY}, date_sync),
             ("fs.entry.minimal_synced", {"path": "/w/bar/buzz.txt", "id": spy.ANY}, date_sync),
-            # Try to sync `/w/bar` with new entry `/w/bar/buzz.txt`, get alice's changes
+            ("fs.entry.minimal_synced", {"path": "/w/bar/from_alice2", "id": spy.ANY}, date_sync),
+            ("fs.entry.minimal_synced", {"path": "/w/bar/spam", "id": spy.ANY}, date_sync),
+            # Try to sync `/w/bar` with the new entries, get alice's changes
             (
                 "fs.entry.name_conflicted",
                 {
@@ -397,10 +702,8 @@ async def test_concurrent_update(running_backend, alice_fs, alice2_fs):
             ),
             ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/w/bar/buzz.txt", "id": spy.ANY}, date_sync),
-            ("fs.entry.minimal_synced", {"path": "/w/bar/from_alice2", "id": spy.ANY}, date_sync),
-            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/w/bar/from_alice2", "id": spy.ANY}, date_sync),
-            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, date_sync),
+            ("fs.entry.synced", {"path": "/w/bar/spam", "id": spy.ANY}, date_sync),
             (
                 "fs.entry.file_update_conflicted",
                 {
@@ -415,7 +718,6 @@ async def test_concurrent_update(running_backend, alice_fs, alice2_fs):
             ("fs.entry.updated", {"id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/w/foo.txt", "id": spy.ANY}, date_sync),
             ("fs.entry.synced", {"path": "/w", "id": spy.ANY}, date_sync),
-            ("fs.entry.minimal_synced", {"path": "/z", "id": spy.ANY}, date_sync),
             (
                 "fs.entry.name_conflicted",
                 {
@@ -441,17 +743,6 @@ async def test_concurrent_update(running_backend, alice_fs, alice2_fs):
     date_sync = Pendulum(2000, 1, 7)
     spy.assert_events_exactly_occured(
         [
-            (
-                "fs.entry.minimal_synced",
-                {"path": "/w/bar/spam (conflict 2000-01-06 00:00:00)", "id": spy.ANY},
-                date_sync,
-            ),
-            ("fs.entry.synced", {"path": "/w/bar", "id": spy.ANY}, date_sync),
-            (
-                "fs.entry.synced",
-                {"path": "/w/bar/spam (conflict 2000-01-06 00:00:00)", "id": spy.ANY},
-                date_sync,
-            ),
             (
                 "fs.entry.minimal_synced",
                 {"path": "/w/foo (conflict 2000-01-06 00:00:00).txt", "id": spy.ANY},
@@ -513,6 +804,50 @@ async def test_concurrent_update(running_backend, alice_fs, alice2_fs):
     assert data == data2 == b"alice2's v2"
 
 
+@pytest.mark.trio
+async def test_concurrent_update_keeps_conflicts_across_retries(
+    running_backend, alice_fs, alice2_fs
+):
+    await create_shared_workspace("/w", alice_fs, alice2_fs)
+    await alice_fs.file_create("/w/a")
+    await alice_fs.sync("/w")
+    await alice2_fs.sync("/w")
+
+    # Both sides replace `a`, hence a name conflict on the first merge
+    for fs in (alice_fs, alice2_fs):
+        await fs.delete("/w/a")
+        await fs.file_create("/w/a")
+    await alice2_fs.sync("/w")
+
+    vanilla_backend_vlob_update = alice_fs._syncer._backend_vlob_update
+    updates = []
+
+    async def _backend_vlob_update(access, manifest, *args):
+        if manifest["type"] == "workspace_manifest":
+            updates.append(set(manifest["children"]))
+            if len(updates) == 2:
+                # Another concurrent change, the retry must keep the conflict
+                await alice2_fs.file_create("/w/b")
+                await alice2_fs.sync("/w")
+        await vanilla_backend_vlob_update(access, manifest, *args)
+
+    alice_fs._syncer._backend_vlob_update = _backend_vlob_update
+    with alice_fs.event_bus.listen() as spy:
+        await alice_fs.sync("/w")
+    conflicted = [e for e in spy.events if e.event == "fs.entry.name_conflicted"]
+    assert len(conflicted) == 1
+    conflict_name = conflicted[0].kwargs["diverged_path"].rsplit("/", 1)[1]
+
+    # Initial upload, first merge creating the conflict, then retry merge
+    assert len(updates) == 3
+    assert updates[2] == {"a", "b", conflict_name}
+
+    await alice2_fs.sync("/w")
+    stat = await alice2_fs.stat("/w")
+    assert stat["children"] == sorted(["a", "b", conflict_name])
+    assert await alice_fs.stat("/w") == stat
+
+
 @pytest.mark.trio
 async def test_create_already_existing_folder_vlob(running_backend, alice_fs, alice2_fs):
     # First create data locally
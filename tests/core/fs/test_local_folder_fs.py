@@ -14,7 +14,12 @@ from hypothesis.stateful import (
 )
 from hypothesis import strategies as st
 
-from parsec.core.fs.local_folder_fs import FSManifestLocalMiss, Path, is_folder_manifest
+from parsec.core.fs.local_folder_fs import (
+    FSManifestLocalMiss,
+    FSEntryNotFound,
+    Path,
+    is_folder_manifest,
+)
 from parsec.core.fs.utils import new_access, new_local_file_manifest
 
 from tests.common import freeze_time
@@ -212,6 +217,94 @@ def test_access_not_loaded_entry(alice, local_folder_fs):
     }
 
 
+def test_get_entry_path(alice, alice_local_db, local_folder_fs, local_folder_fs_factory):
+    local_folder_fs.workspace_create(Path("/w"))
+    local_folder_fs.mkdir(Path("/w/foo"))
+    local_folder_fs.mkdir(Path("/w/foo/bar"))
+    local_folder_fs.touch(Path("/w/foo/bar/spam.txt"))
+    spam_access, _ = local_folder_fs.get_entry(Path("/w/foo/bar/spam.txt"))
+
+    path, access, manifest = local_folder_fs.get_entry_path(spam_access["id"])
+    assert path == Path("/w/foo/bar/spam.txt")
+    assert access == spam_access
+
+    # Moved entries get new ids
+    local_folder_fs.move(Path("/w/foo/bar"), Path("/w/bar2"))
+    with pytest.raises(FSEntryNotFound):
+        local_folder_fs.get_entry_path(spam_access["id"])
+    spam_access, _ = local_folder_fs.get_entry(Path("/w/bar2/spam.txt"))
+
+    local_folder_fs.workspace_rename(Path("/w"), Path("/w2"))
+    path, _, _ = local_folder_fs.get_entry_path(spam_access["id"])
+    assert path == Path("/w2/bar2/spam.txt")
+
+    # Entries not loaded yet are retrieved from the local storage
+    cold_local_folder_fs = local_folder_fs_factory(alice, alice_local_db)
+    path, _, _ = cold_local_folder_fs.get_entry_path(spam_access["id"])
+    assert path == Path("/w2/bar2/spam.txt")
+
+    local_folder_fs.delete(Path("/w2/bar2/spam.txt"))
+    with pytest.raises(FSEntryNotFound):
+        local_folder_fs.get_entry_path(spam_access["id"])
+
+
+def test_get_children_status(alice, alice_local_db, local_folder_fs, local_folder_fs_factory):
+    local_folder_fs.workspace_create(Path("/w"))
+    local_folder_fs.mkdir(Path("/w/foo"))
+    local_folder_fs.touch(Path("/w/bar.txt"))
+    w_access, w_manifest = local_folder_fs.get_entry(Path("/w"))
+    foo_access = w_manifest["children"]["foo"]
+    bar_access = w_manifest["children"]["bar.txt"]
+
+    status = local_folder_fs.get_children_status(w_access, w_manifest["children"])
+    assert status == {foo_access["id"]: (True, True), bar_access["id"]: (True, True)}
+
+    # Status is kept up to date when a child manifest is saved
+    foo_manifest = local_folder_fs.get_manifest(foo_access)
+    foo_manifest["is_placeholder"] = False
+    foo_manifest["need_sync"] = False
+    local_folder_fs.set_manifest(foo_access, foo_manifest)
+    status = local_folder_fs.get_children_status(w_access, w_manifest["children"])
+    assert status == {foo_access["id"]: (False, False), bar_access["id"]: (True, True)}
+
+    # Children not loaded yet are retrieved from the local storage
+    cold_local_folder_fs = local_folder_fs_factory(alice, alice_local_db)
+    w_access, w_manifest = cold_local_folder_fs.get_entry(Path("/w"))
+    status = cold_local_folder_fs.get_children_status(w_access, w_manifest["children"])
+    assert status == {foo_access["id"]: (False, False), bar_access["id"]: (True, True)}
+
+    # Children not available locally are omitted
+    local_folder_fs.mark_outdated_manifest(bar_access)
+    status = local_folder_fs.get_children_status(w_access, w_manifest["children"])
+    assert status == {foo_access["id"]: (False, False)}
+
+
+def test_get_children_changes(local_folder_fs):
+    local_folder_fs.workspace_create(Path("/w"))
+    local_folder_fs.touch(Path("/w/foo.txt"))
+    w_access, w_manifest = local_folder_fs.get_entry(Path("/w"))
+    # Placeholder, hence changes since base version are unknown
+    assert local_folder_fs.get_children_changes(w_access) is None
+
+    # Folder set as a whole without local changes is a new base
+    w_manifest["is_placeholder"] = False
+    w_manifest["need_sync"] = False
+    local_folder_fs.set_manifest(w_access, w_manifest)
+    changes = local_folder_fs.get_children_changes(w_access)
+    assert changes == set()
+
+    local_folder_fs.touch(Path("/w/bar.txt"))
+    local_folder_fs.move(Path("/w/foo.txt"), Path("/w/moved.txt"))
+    local_folder_fs.mkdir(Path("/w/d"))
+    local_folder_fs.delete(Path("/w/d"))
+    assert local_folder_fs.get_children_changes(w_access) is changes
+    assert changes == {"bar.txt", "foo.txt", "moved.txt", "d"}
+
+    w_manifest = local_folder_fs.get_manifest(w_access)
+    local_folder_fs.set_manifest(w_access, w_manifest)
+    assert local_folder_fs.get_children_changes(w_access) is None
+
+
 def test_access_unknown_entry(local_folder_fs):
     with pytest.raises(FileNotFoundError):
         local_folder_fs.stat(Path("/dummy"))
@@ -387,6 +480,13 @@ def test_folder_operations(
 
             _recursive_build_id_to_path(local_folder_fs.root_access, "/")
 
+            for entry_id, entry_path in new_id_to_path:
+                try:
+                    path, _, _ = local_folder_fs.get_entry_path(entry_id)
+                except FSEntryNotFound:
+                    continue
+                assert path == Path(entry_path)
+
             added_items = new_id_to_path - self.last_step_id_to_path
             for added_id, added_path in added_items:
                 for old_id, old_path in self.last_step_id_to_path:
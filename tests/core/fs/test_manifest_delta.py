@@ -0,0 +1,134 @@
+import pytest
+from pendulum import Pendulum
+
+from parsec.core.fs.types import Path
+from parsec.core.fs.utils import new_access
+from parsec.core.fs.manifest_delta import (
+    SNAPSHOT_INTERVAL,
+    build_folder_manifest_delta,
+    apply_folder_manifest_delta,
+)
+
+from tests.common import create_shared_workspace
+
+
+@pytest.fixture
+def no_delta_min_children(monkeypatch):
+    monkeypatch.setattr("parsec.core.fs.manifest_delta.DELTA_MIN_CHILDREN", 0)
+
+
+def _folder_manifest(version, children):
+    return {
+        "format": 1,
+        "type": "folder_manifest",
+        "author": "alice@dev1",
+        "version": version,
+        "created": Pendulum(2000, 1, 1),
+        "updated": Pendulum(2000, 1, 1).add(hours=version),
+        "children": children,
+    }
+
+
+def test_build_and_apply_delta(no_delta_min_children):
+    children = {f"file{i}.txt": new_access() for i in range(8)}
+    base = _folder_manifest(2, children)
+    manifest = _folder_manifest(3, children.copy())
+    manifest["author"] = "bob@dev1"
+    del manifest["children"]["file0.txt"]
+    manifest["children"]["new.txt"] = new_access()
+    # Moved entries get a new access
+    manifest["children"]["file1.txt"] = new_access()
+
+    delta = build_folder_manifest_delta(base, manifest)
+    assert delta == {
+        "format": 1,
+        "type": "folder_manifest_delta",
+        "author": "bob@dev1",
+        "version": 3,
+        "updated": Pendulum(2000, 1, 1, 3),
+        "children_added": {
+            "new.txt": manifest["children"]["new.txt"],
+            "file1.txt": manifest["children"]["file1.txt"],
+        },
+        "children_removed": ["file0.txt"],
+    }
+    assert apply_folder_manifest_delta(base, delta) == manifest
+
+
+def test_build_delta_fallback_to_snapshot(no_delta_min_children):
+    children = {f"file{i}.txt": new_access() for i in range(8)}
+    base = _folder_manifest(2, children)
+    assert build_folder_manifest_delta(base, _folder_manifest(3, children)) is not None
+
+    # Not the next version
+    assert build_folder_manifest_delta(base, _folder_manifest(4, children)) is None
+
+    # Periodic snapshot
+    snapshot_base = _folder_manifest(SNAPSHOT_INTERVAL - 1, children)
+    manifest = _folder_manifest(SNAPSHOT_INTERVAL, children)
+    assert build_folder_manifest_delta(snapshot_base, manifest) is None
+
+    # Most of the children changed
+    manifest = _folder_manifest(3, {f"other{i}.txt": new_access() for i in range(8)})
+    assert build_folder_manifest_delta(base, manifest) is None
+
+
+def test_build_delta_only_for_big_folders():
+    children = {f"file{i}.txt": new_access() for i in range(8)}
+    base = _folder_manifest(2, children)
+    assert build_folder_manifest_delta(base, _folder_manifest(3, children)) is None
+
+
+@pytest.mark.trio
+async def test_sync_folder_as_deltas(
+    no_delta_min_children, running_backend, fs_factory, alice, alice_fs, alice2_fs
+):
+    alice_fs._remote_loader.manifest_deltas = True
+    alice2_fs._remote_loader.manifest_deltas = True
+    await create_shared_workspace("w", alice_fs, alice2_fs)
+    await alice_fs.folder_create("/w/d")
+    for i in range(8):
+        await alice_fs.file_create(f"/w/d/file{i}.txt")
+    await alice_fs.sync("/w")
+    await alice2_fs.sync("/w")
+
+    await alice_fs.file_create("/w/d/new.txt")
+    await alice_fs.delete("/w/d/file0.txt")
+    await alice_fs.move("/w/d/file1.txt", "/w/d/moved.txt")
+    await alice_fs.sync("/w")
+
+    d_access = alice_fs._local_folder_fs.get_access(Path("/w/d"))
+    blob_versions = running_backend.backend.vlob.vlobs[d_access["id"]].blob_versions
+    assert [is_delta for *_, is_delta in blob_versions] == [False, True]
+
+    expected_children = ["moved.txt", "new.txt"] + [f"file{i}.txt" for i in range(2, 8)]
+    expected_children.sort()
+
+    # Device knowing the previous version only retrieves the delta
+    await alice2_fs.sync("/w")
+    stat = await alice2_fs.stat("/w/d")
+    assert stat["base_version"] == 2
+    assert stat["children"] == expected_children
+
+    # New device retrieves the snapshot and apply the delta (even if it
+    # doesn't upload deltas itself)
+    async with fs_factory(alice) as alice3_fs:
+        await alice3_fs.sync("/")
+        stat = await alice3_fs.stat("/w/d")
+    assert stat["base_version"] == 2
+    assert stat["children"] == expected_children
+
+
+@pytest.mark.trio
+async def test_deltas_are_opt_in(no_delta_min_children, running_backend, alice_fs):
+    await alice_fs.workspace_create("/w")
+    for i in range(8):
+        await alice_fs.file_create(f"/w/file{i}.txt")
+    await alice_fs.sync("/w")
+    await alice_fs.file_create("/w/new.txt")
+    await alice_fs.sync("/w")
+
+    w_access = alice_fs._local_folder_fs.get_access(Path("/w"))
+    blob_versions = running_backend.backend.vlob.vlobs[w_access["id"]].blob_versions
+    # Older clients cannot read the deltas
+    assert [is_delta for *_, is_delta in blob_versions] == [False, False]
@@ -0,0 +1,104 @@
+import pytest
+from pendulum import Pendulum
+
+from parsec.core.fs.utils import new_access
+from parsec.core.fs.merge_folders import (
+    get_children_changes,
+    merge_children,
+    merge_local_folder_manifests,
+)
+
+
+def test_get_children_changes():
+    base = {f"file{i}.txt": new_access() for i in range(4)}
+    diverged = base.copy()
+    assert get_children_changes(base, diverged) == set()
+
+    del diverged["file0.txt"]
+    diverged["file1.txt"] = new_access()
+    diverged["new.txt"] = new_access()
+    assert get_children_changes(base, diverged) == {"file0.txt", "file1.txt", "new.txt"}
+
+
+@pytest.mark.parametrize("with_changes", [False, True])
+def test_merge_children(with_changes):
+    base = {f"file{i}.txt": new_access() for i in range(8)}
+
+    diverged = base.copy()
+    del diverged["file0.txt"]
+    diverged["file1.txt"] = new_access()
+    diverged["file2.txt"] = new_access()
+    diverged["new.txt"] = new_access()
+
+    target = base.copy()
+    del target["file1.txt"]
+    target["file2.txt"] = new_access()
+    target["file3.txt"] = new_access()
+    target["other.txt"] = new_access()
+
+    # Change set may contain unmodified children
+    diverged_changes = {"file0.txt", "file1.txt", "file2.txt", "new.txt", "file4.txt"}
+    children, need_sync, conflicts = merge_children(
+        base, diverged, target, diverged_changes if with_changes else None
+    )
+
+    assert need_sync
+    (conflict,) = conflicts
+    conflict_name = conflict[2]
+    assert conflict == (
+        "file2.txt",
+        target["file2.txt"]["id"],
+        conflict_name,
+        diverged["file2.txt"]["id"],
+    )
+    assert children == {
+        # Modified on both sides
+        "file1.txt": diverged["file1.txt"],
+        "file2.txt": target["file2.txt"],
+        conflict_name: diverged["file2.txt"],
+        # Modified on one side
+        "file3.txt": target["file3.txt"],
+        "new.txt": diverged["new.txt"],
+        "other.txt": target["other.txt"],
+        # Unmodified
+        **{f"file{i}.txt": base[f"file{i}.txt"] for i in range(4, 8)},
+    }
+
+
+def test_merge_local_folder_manifests_with_changes():
+    base_children = {f"file{i}.txt": new_access() for i in range(8)}
+    base = {
+        "format": 1,
+        "type": "local_folder_manifest",
+        "author": "alice@dev1",
+        "base_version": 2,
+        "need_sync": False,
+        "is_placeholder": False,
+        "created": Pendulum(2000, 1, 1),
+        "updated": Pendulum(2000, 1, 1),
+        "children": base_children,
+    }
+    diverged = {
+        **base,
+        "need_sync": True,
+        "updated": Pendulum(2000, 1, 2),
+        "children": {**base_children, "new.txt": new_access()},
+    }
+    target = {
+        **base,
+        "base_version": 3,
+        "updated": Pendulum(2000, 1, 3),
+        "children": {**base_children, "other.txt": new_access()},
+    }
+
+    merged, conflicts = merge_local_folder_manifests(base, diverged, target, {"new.txt"})
+    assert not conflicts
+    assert merged == {
+        **target,
+        "need_sync": True,
+        "children": {**target["children"], "new.txt": diverged["children"]["new.txt"]},
+    }
+
+    # Diverged side only has changes already present in target
+    merged, conflicts = merge_local_folder_manifests(base, base, target, set())
+    assert merged == target
@@ -0,0 +1,78 @@
+from parsec.utils import ejson_loads
+from parsec.crypto import generate_secret_key
+from parsec.core.local_db import LocalDB
+from parsec.core.fs.sync_journal import SyncJournal, DIRTY_ENTRIES_BUCKETS
+from parsec.core.fs.utils import new_access, new_local_file_manifest
+
+from tests.common import InMemoryLocalDB
+
+
+def test_sync_journal_persistence(alice):
+    local_db = InMemoryLocalDB()
+    journal = SyncJournal(alice, local_db)
+    assert not journal.initialized
+    journal.mark_initialized()
+
+    placeholder_access = new_access()
+    placeholder_manifest = new_local_file_manifest(alice.device_id)
+    journal.update_entry(placeholder_access, placeholder_manifest)
+
+    synced_access = new_access()
+    synced_manifest = new_local_file_manifest(alice.device_id)
+    synced_manifest.update(base_version=2, is_placeholder=False, need_sync=False)
+    journal.update_entry(synced_access, synced_manifest)
+
+    journal = SyncJournal(alice, local_db)
+    assert journal.initialized
+    assert journal.get_dirty_entries() == [placeholder_access["id"]]
+    assert journal.get_remote_versions() == [
+        {"id": synced_access["id"], "rts": synced_access["rts"], "version": 2}
+    ]
+
+    placeholder_manifest.update(base_version=1, is_placeholder=False, need_sync=False)
+    journal.update_entry(placeholder_access, placeholder_manifest)
+    journal.remove_entry(synced_access["id"])
+
+    journal = SyncJournal(alice, local_db)
+    assert journal.get_dirty_entries() == []
+    assert journal.get_remote_versions() == [
+        {"id": placeholder_access["id"], "rts": placeholder_access["rts"], "version": 1}
+    ]
+
+
+def test_sync_journal_dirty_entry_rewrites_only_its_bucket(alice):
+    local_db = InMemoryLocalDB()
+    journal = SyncJournal(alice, local_db)
+    for _ in range(DIRTY_ENTRIES_BUCKETS * 10):
+        journal.update_entry(new_access(), new_local_file_manifest(alice.device_id))
+
+    written = []
+    vanilla_set = local_db.set
+
+    def _set(access, raw, *args, **kwargs):
+        written.append(raw)
+        return vanilla_set(access, raw, *args, **kwargs)
+
+    local_db.set = _set
+    access = new_access()
+    journal.update_entry(access, new_local_file_manifest(alice.device_id))
+
+    # Placeholder has no remote version, only its dirty entries bucket is saved
+    assert len(written) == 1
+    bucket = ejson_loads(written[0].decode("utf8"))
+    assert access["id"] in bucket
+    assert len(bucket) < DIRTY_ENTRIES_BUCKETS * 10 // 4
+    assert len(journal.get_dirty_entries()) == DIRTY_ENTRIES_BUCKETS * 10 + 1
+
+
+def test_sync_journal_ignores_records_of_recreated_device(alice, tmpdir):
+    local_db = LocalDB(tmpdir)
+    journal = SyncJournal(alice, local_db)
+    journal.mark_initialized()
+    journal.update_entry(new_access(), new_local_file_manifest(alice.device_id))
+
+    # Same device id, but the local data belongs to the previous device
+    recreated_alice = alice.evolve(local_symkey=generate_secret_key())
+    journal = SyncJournal(recreated_alice, local_db)
+    assert not journal.initialized
+    assert journal.get_dirty_entries() == []
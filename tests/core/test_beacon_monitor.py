@@ -1,7 +1,11 @@
 import trio
 import pytest
+from trio.testing import wait_all_tasks_blocked
 
 
+from parsec.core.beacons_monitor import monitor_beacons
+from parsec.core.fs.types import Path
+
 from tests.common import create_shared_workspace
 
 
@@ -64,6 +68,66 @@ async def test_beacon_notif_on_new_workspace_sync(running_backend, alice_core, a
             )
 
 
+@pytest.mark.trio
+async def test_beacon_catch_up_on_listener_restarted(running_backend, alice, alice_fs, alice2_fs):
+    await create_shared_workspace("/w", alice_fs, alice2_fs)
+    await alice_fs.full_sync()
+
+    # No event listener is running, hence beacon notifications are missed
+    async with trio.open_nursery() as nursery:
+        await nursery.start(monitor_beacons, alice, alice_fs, alice_fs.event_bus)
+
+        await alice2_fs.file_create("/w/foo")
+        await alice2_fs.sync("/w")
+        await alice2_fs.file_write("/w/foo", b"data")
+        await alice2_fs.sync("/w")
+        w_id = alice2_fs._local_folder_fs.get_access(Path("/w"))["id"]
+
+        with alice_fs.event_bus.listen() as spy:
+            alice_fs.event_bus.send("backend.listener.restarted")
+            with trio.fail_after(1):
+                await spy.wait("fs.entry.updated", kwargs={"id": w_id})
+            await wait_all_tasks_blocked(cushion=0.01)
+        # foo is not present in local, only its parent is outdated
+        assert [e.kwargs for e in spy.events if e.event == "fs.entry.updated"] == [{"id": w_id}]
+
+        # Missed items have been processed, nothing more to catch up
+        with alice_fs.event_bus.listen() as spy:
+            alice_fs.event_bus.send("backend.listener.restarted")
+            await wait_all_tasks_blocked(cushion=0.01)
+        assert not [e for e in spy.events if e.event == "fs.entry.updated"]
+
+        nursery.cancel_scope.cancel()
+
+
+@pytest.mark.trio
+async def test_beacon_no_catch_up_of_notified_items(running_backend, alice, alice_fs, alice2_fs):
+    await create_shared_workspace("/w", alice_fs, alice2_fs)
+    await alice_fs.full_sync()
+
+    async with trio.open_nursery() as nursery:
+        await nursery.start(monitor_beacons, alice, alice_fs, alice_fs.event_bus)
+
+        # Forward the backend notifications as the event listener would do
+        with running_backend.backend.event_bus.listen() as backend_spy:
+            await alice2_fs.file_create("/w/foo")
+            await alice2_fs.sync("/w")
+            with trio.fail_after(1):
+                await backend_spy.wait("beacon.updated")
+        for event in backend_spy.events:
+            if event.event == "beacon.updated":
+                kwargs = {k: v for k, v in event.kwargs.items() if k != "author"}
+                alice_fs.event_bus.send("backend.beacon.updated", **kwargs)
+
+        # Items already notified must not be replayed on reconnection
+        with alice_fs.event_bus.listen() as spy:
+            alice_fs.event_bus.send("backend.listener.restarted")
+            await wait_all_tasks_blocked(cushion=0.01)
+        assert not [e for e in spy.events if e.event == "fs.entry.updated"]
+
+        nursery.cancel_scope.cancel()
+
+
 # TODO: lazy loading of workspaces make this pretty cumbersome to test...
 @pytest.mark.trio
 @pytest.mark.xfail
@@ -1,13 +1,18 @@
 import pytest
+import pendulum
 from uuid import UUID
 from pendulum import datetime
 
+from parsec.utils import emsgpack_dumps, emsgpack_loads
 from parsec.core.schemas import (
+    SchemaSerializationError,
     BlockAccessSchema,
     FileManifestSchema,
     FolderManifestSchema,
     LocalFileManifestSchema,
     LocalFolderManifestSchema,
+    dumps_manifest,
+    loads_manifest,
 )
 
 
@@ -471,3 +476,62 @@ class TestLocalFolderManifestSchema:
 class TestLocalUserManifestSchema:
     # TODO
     pass
+
+
+@pytest.mark.parametrize("format", (1, 2))
+def test_manifest_formats(monkeypatch, format):
+    monkeypatch.setattr("parsec.core.schemas.MANIFEST_FORMAT", format)
+    manifest = LocalFolderManifestSchema.load(TestLocalFolderManifestSchema.ORIGINAL).data
+    manifest["created"] = pendulum.parse("2017-01-01T01:02:03.456789+02:00")
+
+    raw = dumps_manifest(manifest)
+    if format == 1:
+        assert raw.startswith(b"{")
+    else:
+        assert raw.startswith(b"\x02")
+    loaded = loads_manifest(raw)
+    assert loaded == manifest
+    assert loaded["created"].isoformat() == "2017-01-01T01:02:03.456789+02:00"
+
+    # Both formats can be read no matter the one used for writing
+    monkeypatch.setattr("parsec.core.schemas.MANIFEST_FORMAT", 3 - format)
+    assert loads_manifest(raw) == manifest
+
+
+@pytest.mark.parametrize("format", (1, 2))
+def test_compressed_manifest(monkeypatch, format):
+    monkeypatch.setattr("parsec.core.schemas.MANIFEST_FORMAT", format)
+    manifest = LocalFolderManifestSchema.load(TestLocalFolderManifestSchema.ORIGINAL).data
+    manifest["children"] = {f"file{i}.txt": manifest["children"]["foo"] for i in range(100)}
+
+    raw = dumps_manifest(manifest)
+    compressed = dumps_manifest(manifest, compression="zlib")
+    assert compressed.startswith(b"\x00")
+    assert len(compressed) < len(raw)
+    assert loads_manifest(compressed) == manifest
+
+    with pytest.raises(SchemaSerializationError):
+        loads_manifest(compressed[:-1])
+
+
+def test_manifest_format_2_big_folder(monkeypatch):
+    monkeypatch.setattr("parsec.core.schemas.MANIFEST_FORMAT", 2)
+    manifest = LocalFolderManifestSchema.load(TestLocalFolderManifestSchema.ORIGINAL).data
+    # More children than msgpack's default limit
+    manifest["children"] = {f"file{i}.txt": manifest["children"]["foo"] for i in range(40000)}
+    assert loads_manifest(dumps_manifest(manifest)) == manifest
+
+
+def test_manifest_format_1_by_default():
+    manifest = LocalFolderManifestSchema.load(TestLocalFolderManifestSchema.ORIGINAL).data
+    assert dumps_manifest(manifest).startswith(b"{")
+
+
+def test_manifest_format_2_is_validated(monkeypatch):
+    monkeypatch.setattr("parsec.core.schemas.MANIFEST_FORMAT", 2)
+    manifest = LocalFolderManifestSchema.load(TestLocalFolderManifestSchema.ORIGINAL).data
+    raw = dumps_manifest(manifest)
+    data = emsgpack_loads(raw[1:])
+    data["base_version"] = -1
+    with pytest.raises(SchemaSerializationError):
+        loads_manifest(b"\x02" + emsgpack_dumps(data))
@@ -1,5 +1,9 @@
+import trio
 import pytest
 
+from parsec.core.fs.types import Path
+from parsec.core.sync_monitor import _coalesce_by_ancestor
+
 
 @pytest.mark.trio
 async def test_autosync_on_modification(mock_clock, running_backend, alice_core, alice2_fs):
@@ -17,3 +21,59 @@ async def test_autosync_on_modification(mock_clock, running_backend, alice_core,
     stat = await alice_core.fs.stat("/w/foo")
     stat2 = await alice2_fs.stat("/w/foo")
     assert stat == stat2
+
+
+@pytest.mark.trio
+async def test_autosync_drain_backlog(mock_clock, running_backend, alice_core, alice2_fs):
+    mock_clock.autojump_threshold = 0.1
+
+    await alice_core.event_bus.spy.wait_for_backend_connection_ready()
+    with alice_core.event_bus.listen() as spy:
+        await alice_core.fs.workspace_create("/w")
+        await spy.wait("fs.entry.synced", kwargs={"path": "/w", "id": spy.ANY})
+
+    synced_ids = []
+    vanilla_sync_by_id = alice_core.fs.sync_by_id
+
+    async def _sync_by_id(id):
+        synced_ids.append(id)
+        await vanilla_sync_by_id(id)
+
+    alice_core.fs.sync_by_id = _sync_by_id
+
+    with alice_core.event_bus.listen() as spy:
+        start = trio.current_time()
+        for i in range(20):
+            await alice_core.fs.file_create(f"/w/foo{i}.txt")
+        await spy.wait(
+            "sync_monitor.backlog", kwargs={"backlog": 0, "in_progress": 0, "drain_rate": spy.ANY}
+        )
+        # All the entries are synced at once instead of one per tick
+        assert trio.current_time() - start < 5
+    # Updated files have been synced along with their parent
+    w_path = await alice_core.fs.get_entry_path(synced_ids[0])
+    assert synced_ids == [synced_ids[0]]
+    assert str(w_path) == "/w"
+
+    await alice2_fs.sync("/")
+    stat = await alice2_fs.stat("/w")
+    assert stat["children"] == sorted(f"foo{i}.txt" for i in range(20))
+
+
+def test_coalesce_by_ancestor():
+    paths = {
+        "root": Path("/"),
+        "w": Path("/w"),
+        "foo": Path("/w/foo"),
+        "bar": Path("/w/foo/bar"),
+        "spam": Path("/w/spam"),
+        "z": Path("/z"),
+        "zfoo": Path("/z/foo"),
+    }
+    due = ["bar", "foo", "z", "zfoo", "spam"]
+    groups = _coalesce_by_ancestor({paths[id]: id for id in due})
+    assert groups == {"foo": ["foo", "bar"], "spam": ["spam"], "z": ["z", "zfoo"]}
+
+    groups = _coalesce_by_ancestor({paths[id]: id for id in paths})
+    assert list(groups) == ["root"]
+    assert sorted(groups["root"]) == sorted(paths)
@@ -1,6 +1,7 @@
 import pytest
 import re
 import os
+import sys
 from pathlib import Path
 from contextlib import contextmanager
 from time import sleep
@@ -91,6 +92,30 @@ def test_init_backend(postgresql_url, unused_tcp_port):
     ):
         pass
 
+    # Test backend can run with multiple workers
+    with _running(
+        (
+            "backend run --blockstore=POSTGRESQL "
+            f"--store={postgresql_url} --port={unused_tcp_port} --workers=2"
+        ),
+        wait_for="Starting Parsec Backend",
+    ):
+        pass
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Hard to test on Windows...")
+def test_run_backend_multiple_workers_requires_postgresql(unused_tcp_port):
+    cooked_cmd = (
+        f"{sys.executable} -m parsec.cli backend run --port={unused_tcp_port} --workers=2".split()
+    )
+    # Click refuses to run with an ASCII locale
+    env = {**os.environ.copy(), "LC_ALL": "C.UTF-8", "LANG": "C.UTF-8"}
+    ret = subprocess.run(
+        cooked_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=CWD, env=env
+    )
+    assert ret.returncode != 0
+    assert b"Multiple workers require PostgreSQL" in ret.stdout + ret.stderr
+
 
 @pytest.mark.slow
 @pytest.mark.skipif(os.name == "nt", reason="Hard to test on Windows...")
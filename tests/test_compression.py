@@ -0,0 +1,41 @@
+import pytest
+from random import Random
+
+from parsec.compression import (
+    CompressionError,
+    COMPRESSION_ALGORITHMS,
+    choose_compression,
+    compress,
+    decompress,
+)
+
+
+@pytest.mark.parametrize("algorithm", COMPRESSION_ALGORITHMS)
+def test_compress(algorithm):
+    data = b"Hello world ! " * 1000
+    compressed = compress(data, algorithm)
+    assert len(compressed) < len(data)
+    assert decompress(compressed) == data
+
+
+@pytest.mark.parametrize("size", [100, 2 ** 16])
+def test_compress_incompressible_data(size):
+    data = Random(0).getrandbits(8 * size).to_bytes(size, "big")
+    assert compress(data, "zlib") is None
+    # Data is only compressed if it is worth it
+    assert compress(b"a" * (size // 20) + data, "zlib", min_ratio=0.9) is None
+
+
+def test_choose_compression():
+    assert choose_compression(("zstd", "zlib"), ["zlib", "zstd"]) == COMPRESSION_ALGORITHMS[0]
+    assert choose_compression(("zlib",), ["zstd"]) is None
+    assert choose_compression(("dummy", "zlib"), ["dummy", "zlib"]) == "zlib"
+
+
+def test_bad_compression():
+    with pytest.raises(CompressionError):
+        compress(b"foo", "dummy")
+    with pytest.raises(CompressionError):
+        decompress(b"\xff<dummy>")
+    with pytest.raises(CompressionError):
+        decompress(compress(b"Hello world ! " * 10, "zlib")[:-1])
@@ -1,9 +1,11 @@
 import pytest
 
+from parsec.crypto import generate_secret_key
 from parsec.api.protocole.base import packb, unpackb, ProtocoleError
 from parsec.api.protocole.handshake import (
     HandshakeFormatError,
     HandshakeBadIdentity,
+    HandshakeBadSession,
     ServerHandshake,
     ClientHandshake,
     AnonymousClientHandshake,
@@ -31,6 +33,55 @@ def test_good_handshake(alice):
     ch.process_result_req(result_req)
 
 
+@pytest.mark.parametrize(
+    "server_compressions,client_compressions,expected",
+    [
+        (("zstd", "zlib"), ("zlib",), "zlib"),
+        (("zlib",), ("zstd", "zlib"), "zlib"),
+        (("zlib",), ("zstd",), None),
+        ((), ("zlib",), None),
+        (("zlib",), (), None),
+    ],
+)
+def test_handshake_compression_negotiation(
+    alice, server_compressions, client_compressions, expected
+):
+    sh = ServerHandshake(supported_compressions=server_compressions)
+    ch = ClientHandshake(
+        alice.device_id, alice.signing_key, supported_compressions=client_compressions
+    )
+
+    challenge_req = sh.build_challenge_req()
+    answer_req = ch.process_challenge_req(challenge_req)
+    sh.process_answer_req(answer_req)
+    assert sh.compression == expected
+    result_req = sh.build_result_req(alice.verify_key)
+    ch.process_result_req(result_req)
+    assert ch.compression == expected
+
+
+def test_handshake_compression_not_announced_by_default(alice):
+    sh = ServerHandshake(supported_compressions=("zlib",))
+    ch = ClientHandshake(alice.device_id, alice.signing_key)
+
+    answer_req = ch.process_challenge_req(sh.build_challenge_req())
+    # Older backends reject unknown fields
+    assert "compressions" not in unpackb(answer_req)
+    assert "new_session" not in unpackb(answer_req)
+    sh.process_answer_req(answer_req)
+    assert sh.compression is None
+    ch.process_result_req(sh.build_result_req(alice.verify_key))
+    assert ch.compression is None
+
+
+def test_handshake_compression_unknown_by_client(alice):
+    ch = ClientHandshake(alice.device_id, alice.signing_key, supported_compressions=("zlib",))
+    with pytest.raises(HandshakeFormatError):
+        ch.process_result_req(
+            packb({"handshake": "result", "result": "ok", "compression": "dummy"})
+        )
+
+
 @pytest.mark.parametrize(
     "req",
     [
@@ -174,5 +225,77 @@ def test_good_anonymous_handshake():
     ch.process_result_req(result_req)
 
 
+def test_anonymous_handshake_rejects_compression():
+    ch = AnonymousClientHandshake()
+    ch.process_challenge_req(ServerHandshake().build_challenge_req())
+    result_req = packb({"handshake": "result", "result": "ok", "compression": "zlib"})
+    with pytest.raises(HandshakeFormatError):
+        ch.process_result_req(result_req)
+
+
 # TODO: test with revoked device
 # TODO: test with user with all devices revoked
+
+
+def test_handshake_session_resumption(alice):
+    session_key = generate_secret_key()
+    sh = ServerHandshake(session_key=session_key)
+    ch = ClientHandshake(alice.device_id, alice.signing_key, new_session=True)
+    answer_req = ch.process_challenge_req(sh.build_challenge_req())
+    sh.process_answer_req(answer_req)
+    ch.process_result_req(sh.build_result_req(alice.verify_key))
+    assert ch.session_token
+
+    # Answer is sent without the challenge
+    sh = ServerHandshake(session_key=session_key)
+    sh.build_challenge_req()
+    sh.process_answer_req(ch.build_session_answer_req())
+    assert not sh.is_session_rejected()
+    assert sh.session_resumed
+    assert sh.identity == alice.device_id
+    ch.process_result_req(sh.build_result_req(alice.verify_key))
+    assert ch.session_token
+
+
+@pytest.mark.parametrize("bad_session", ["other_key", "expired", "other_device"])
+def test_handshake_session_rejected(alice, bob, bad_session):
+    session_key = generate_secret_key()
+    sh = ServerHandshake(session_key=session_key)
+    sh.identity = bob.device_id if bad_session == "other_device" else alice.device_id
+    sh.session_lifetime = -1 if bad_session == "expired" else 3600
+    session_token = sh._build_session_token()
+    if bad_session == "other_key":
+        session_key = generate_secret_key()
+
+    sh = ServerHandshake(session_key=session_key)
+    ch = ClientHandshake(
+        alice.device_id, alice.signing_key, session_token=session_token, new_session=True
+    )
+    challenge_req = sh.build_challenge_req()
+    sh.process_answer_req(ch.build_session_answer_req())
+    assert sh.is_session_rejected()
+    with pytest.raises(HandshakeBadSession):
+        ch.process_result_req(sh.build_bad_session_result_req())
+    assert not ch.session_token
+
+    # Fallback on the challenge
+    sh.process_answer_req(ch.process_challenge_req(challenge_req))
+    assert not sh.session_resumed
+    ch.process_result_req(sh.build_result_req(alice.verify_key))
+    assert ch.session_token
+
+
+def test_handshake_without_session_key(alice):
+    sh = ServerHandshake()
+    ch = ClientHandshake(alice.device_id, alice.signing_key, new_session=True)
+    sh.process_answer_req(ch.process_challenge_req(sh.build_challenge_req()))
+    ch.process_result_req(sh.build_result_req(alice.verify_key))
+    assert ch.session_token is None
+
+
+def test_handshake_session_not_asked(alice):
+    sh = ServerHandshake(session_key=generate_secret_key())
+    ch = ClientHandshake(alice.device_id, alice.signing_key)
+    sh.process_answer_req(ch.process_challenge_req(sh.build_challenge_req()))
+    ch.process_result_req(sh.build_result_req(alice.verify_key))
+    assert ch.session_token is None
@@ -0,0 +1,147 @@
+import pytest
+from uuid import uuid4
+from pendulum import Pendulum
+
+from parsec.api.protocole import (
+    InvalidMessageError,
+    ping_serializer,
+    events_listen_serializer,
+    events_subscribe_serializer,
+    vlob_read_serializer,
+    vlob_group_check_serializer,
+    user_find_serializer,
+    ProtocoleError,
+    read_stream,
+)
+from parsec.schema import ValidationError
+
+
+def _marshmallow_load(schema, data):
+    try:
+        return schema.load(data).data, None
+    except ValidationError as exc:
+        return None, exc.messages
+
+
+@pytest.mark.parametrize(
+    "serializer,req,rep",
+    [
+        (ping_serializer, {"cmd": "ping", "ping": "foo"}, {"status": "ok", "pong": "foo"}),
+        (
+            vlob_read_serializer,
+            {"cmd": "vlob_read", "id": uuid4().hex, "rts": "<rts>", "known_version": 2},
+            {"status": "ok", "version": 3, "blob": None, "deltas": [b"<delta>"]},
+        ),
+        (
+            vlob_group_check_serializer,
+            {"cmd": "vlob_group_check", "to_check": [{"id": uuid4().hex, "rts": "", "version": 0}]},
+            {"status": "ok", "changed": [{"id": uuid4().hex, "version": 1}]},
+        ),
+        (
+            events_subscribe_serializer,
+            {"cmd": "events_subscribe", "pinged": ["foo", "bar"]},
+            {"status": "ok"},
+        ),
+        (
+            events_listen_serializer,
+            {"cmd": "events_listen"},
+            {
+                "status": "ok",
+                "event": "beacon.updated",
+                "beacon_id": uuid4().hex,
+                "index": 1,
+                "src_id": uuid4().hex,
+                "src_version": 2,
+            },
+        ),
+        (
+            user_find_serializer,
+            {"cmd": "user_find", "query": None, "page": 2},
+            {"status": "ok", "results": ["alice"], "page": 2, "per_page": 100, "total": 101},
+        ),
+        (ping_serializer, {"cmd": "ping", "ping": "foo"}, {"status": "not_found", "reason": "?"}),
+    ],
+)
+def test_compiled_serializer_matches_marshmallow(serializer, req, rep):
+    for schema, compiled_load, compiled_dump, data in (
+        (serializer.req_schema, serializer._compiled_req_load, serializer._compiled_req_dump, req),
+        (serializer.rep_schema, serializer._compiled_rep_load, serializer._compiled_rep_dump, rep),
+    ):
+        assert compiled_load and compiled_dump
+        loaded = compiled_load(data)
+        assert loaded == schema.load(data).data
+        assert compiled_dump(loaded) == schema.dump(loaded).data
+
+
+@pytest.mark.parametrize(
+    "req",
+    [
+        [],
+        {"ping": "foo"},
+        {"cmd": "vlob_read", "id": "<not an uuid>", "rts": "<rts>"},
+        {"cmd": "vlob_read", "id": uuid4().hex, "rts": "<rts>", "version": 0},
+        {"cmd": "vlob_read", "id": uuid4().hex, "rts": "<rts>", "dummy": 42},
+        {
+            "cmd": "vlob_read",
+            "id": uuid4().hex,
+            "rts": "<rts>",
+            "version": 1,
+            "timestamp": Pendulum(2000, 1, 1).isoformat(),
+        },
+    ],
+)
+def test_compiled_serializer_keeps_errors(req):
+    _, expected_errors = _marshmallow_load(vlob_read_serializer.req_schema, req)
+    assert expected_errors
+    with pytest.raises(InvalidMessageError) as exc:
+        vlob_read_serializer.req_load(req)
+    assert exc.value.errors == expected_errors
+
+
+def test_compiled_serializer_fallback_on_unexpected_types():
+    # Marshmallow is more lenient than the compiled fast path
+    assert vlob_read_serializer.rep_load(
+        {"status": "ok", "version": "3", "blob": b"", "deltas": ()}
+    ) == {"status": "ok", "version": 3, "blob": b"", "deltas": []}
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize(
+    "size,chunks,consumed",
+    [
+        # Bigger than allowed, rejected before reading anything
+        (17, [b"x" * 17], 0),
+        # Bigger than announced, rejected as soon as it is detected
+        (4, [b"xxx", b"xxx", b"xxx"], 2),
+        # Smaller than announced
+        (8, [b"xxx", b"xxx"], 2),
+    ],
+)
+async def test_read_stream_bad_size(size, chunks, consumed):
+    read = []
+
+    async def _stream():
+        for chunk in chunks:
+            read.append(chunk)
+            yield chunk
+
+    with pytest.raises(ProtocoleError):
+        await read_stream(_stream(), size, max_size=16)
+    assert len(read) == consumed
+
+
+@pytest.mark.trio
+async def test_read_stream():
+    async def _stream():
+        yield b"foo"
+        yield b"bar"
+
+    assert await read_stream(_stream(), 6, max_size=16) == b"foobar"
+
+
+def test_compiled_serializer_fallback_on_callable_values():
+    # Marshmallow calls the values provided as callables (e.g. bound methods)
+    req = {"cmd": "ping", "ping": lambda: "foo"}
+    assert ping_serializer._compiled_req_dump
+    assert ping_serializer.req_schema.dump(req).data == {"cmd": "ping", "ping": "foo"}
+    assert ping_serializer.req_dump(req) == {"cmd": "ping", "ping": "foo"}
@@ -0,0 +1,55 @@
+import pytest
+
+from parsec.api import trace
+from parsec.api.protocole import packb, unpackb
+
+
+@pytest.fixture
+def tracer():
+    tracer = trace.configure_protocol_trace(1)
+    try:
+        yield tracer
+    finally:
+        trace.configure_protocol_trace(None)
+
+
+def test_trace_disabled_by_default():
+    assert trace.tracer is None
+    assert trace.configure_protocol_trace(0) is None
+    assert trace.tracer is None
+
+
+@pytest.mark.parametrize("sample_rate", [-0.5, 1.5])
+def test_bad_sample_rate(sample_rate):
+    with pytest.raises(ValueError):
+        trace.ProtocolTracer(sample_rate)
+
+
+def test_sampling(monkeypatch):
+    tracer = trace.ProtocolTracer(0.5)
+    monkeypatch.setattr(trace, "random", lambda: 0.7)
+    assert tracer.request_start() is None
+    monkeypatch.setattr(trace, "random", lambda: 0.2)
+    started = tracer.request_start()
+    assert started is not None
+
+    tracer.request_done(trace.logger, "ping", None, "ok")
+    tracer.request_done(trace.logger, "ping", started, "ok")
+    assert tracer.commands["ping"].count == 1
+    assert tracer.commands["ping"].mean_duration == tracer.commands["ping"].max_duration
+
+
+@pytest.mark.trio
+async def test_trace_backend_requests(tracer, alice_backend_sock):
+    bytes_received = tracer.bytes_received
+    for ping in ("1", "2"):
+        await alice_backend_sock.send(packb({"cmd": "ping", "ping": ping}))
+        rep = await alice_backend_sock.recv()
+        assert unpackb(rep) == {"status": "ok", "pong": ping}
+    await alice_backend_sock.send(packb({"cmd": "dummy"}))
+    await alice_backend_sock.recv()
+
+    assert tracer.bytes_received > bytes_received
+    assert tracer.commands["ping"].count == 2
+    assert tracer.commands["dummy"].count == 1
+    tracer.log_summary()